@@ -0,0 +1,232 @@
+"""Benchmarks of the read/write hot paths against the local device simulator.
+
+Covers cold and warm refresh, single and batched writes, evaluation of every
+entity attribute, concurrent refreshes of several simulated units and a fleet
+of units polled through the FleetScheduler.
+Results are printed (or written with --output) as JSON so runs can be
+compared between releases.
+
+Run from the repository root:
+
+    python benchmarks/hot_paths.py --rounds 20 --latency 0.005 --output results.json
+"""
+import sys
+import json
+import time
+import asyncio
+import argparse
+import platform
+import statistics
+
+from pathlib import Path
+from typing import Awaitable, Callable, Dict, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / 'custom_components' / 'flexit_bacnet'))
+
+from lib.device import ATTRIBUTE_PROPERTIES, FlexitBACnet  # noqa: E402
+from lib.fleet import FleetScheduler  # noqa: E402
+from lib.nordic import COMFORT_BUTTON, DEVICE_PROPERTIES, ELECTRICAL_HEATER, VENTILATION_MODE  # noqa: E402
+from lib.session import TRANSPORT_NATIVE  # noqa: E402
+from lib.simulator import DeviceSimulator, load_dump  # noqa: E402
+
+DEVICE_ID = 2
+SCALING_UNITS = (1, 4, 16)
+FLEET_UNITS = 50
+
+
+class Hass:
+    """The part of HomeAssistant the library uses."""
+
+    def __init__(self, loop: asyncio.AbstractEventLoop):
+        self.loop = loop
+
+    async def async_add_executor_job(self, target, *args):
+        return await self.loop.run_in_executor(None, target, *args)
+
+
+def summarize(samples: List[float]) -> dict:
+    ordered = sorted(samples)
+    return {
+        'rounds': len(samples),
+        'mean': statistics.mean(samples),
+        'median': statistics.median(samples),
+        'min': ordered[0],
+        'max': ordered[-1],
+        'p95': ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))],
+    }
+
+
+async def measure(func: Callable[[], Awaitable], rounds: int) -> dict:
+    await func()  # warm up
+    samples = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        await func()
+        samples.append(time.perf_counter() - start)
+    return summarize(samples)
+
+
+class Bench:
+    def __init__(self, args: argparse.Namespace):
+        self.args = args
+        self.hass: Hass | None = None
+        self.simulators: List[DeviceSimulator] = []
+
+    async def start_simulator(self) -> DeviceSimulator:
+        simulator = DeviceSimulator(
+            load_dump(),
+            device_id=DEVICE_ID,
+            latency=self.args.latency,
+            max_apdu=self.args.max_apdu,
+        )
+        simulator.ensure_objects(dp.object_identifier for dp in DEVICE_PROPERTIES)
+        await simulator.async_start()
+        self.simulators.append(simulator)
+        return simulator
+
+    def create_device(self, simulator: DeviceSimulator) -> FlexitBACnet:
+        return FlexitBACnet(self.hass, simulator.address, DEVICE_ID, write_debounce=0, transport=self.args.transport)
+
+    async def cold_refresh(self, simulator: DeviceSimulator) -> dict:
+        """New device: attach session, read limits, read everything, detach."""
+        async def run():
+            device = self.create_device(simulator)
+            await device.refresh(full=True)
+            await device.async_close()
+
+        return await measure(run, self.args.rounds)
+
+    async def warm_refresh(self, device: FlexitBACnet) -> dict:
+        return await measure(lambda: device.refresh(full=True), self.args.rounds)
+
+    async def single_write(self, device: FlexitBACnet) -> dict:
+        modes = iter(range(10 ** 6))
+        return await measure(
+            lambda: device._async_set_values([(VENTILATION_MODE, 3 + next(modes) % 2)]),
+            self.args.rounds,
+        )
+
+    async def batched_write(self, device: FlexitBACnet) -> dict:
+        return await measure(
+            lambda: device._async_set_values([
+                (VENTILATION_MODE, 3),
+                (COMFORT_BUTTON, COMFORT_BUTTON.ACTIVE),
+                (ELECTRICAL_HEATER, ELECTRICAL_HEATER.INACTIVE),
+            ]),
+            self.args.rounds,
+        )
+
+    @staticmethod
+    def failing_attributes(device: FlexitBACnet) -> Dict[str, str]:
+        """Return the attributes entities read that raise, with their error."""
+        failed = {}
+        for name in ATTRIBUTE_PROPERTIES:
+            try:
+                getattr(device, name)
+            except Exception as e:
+                failed[name] = f"{type(e).__name__}: {e}"
+        return failed
+
+    async def entity_evaluation(self, device: FlexitBACnet) -> dict:
+        """Evaluate every entity attribute that does not raise, and report the ones that do."""
+        failed = self.failing_attributes(device)
+        names = [name for name in ATTRIBUTE_PROPERTIES if name not in failed]
+
+        async def run():
+            for name in names:
+                getattr(device, name)
+
+        result = await measure(run, self.args.rounds * 10)
+        result['attributes'] = len(names)
+        result['failed'] = failed
+        return result
+
+    async def scaling(self) -> Dict[str, dict]:
+        """Concurrent full refresh of N units, each behind its own simulator."""
+        results = {}
+        for units in SCALING_UNITS:
+            while len(self.simulators) < units:
+                await self.start_simulator()
+            devices = [self.create_device(simulator) for simulator in self.simulators[:units]]
+
+            async def run():
+                await asyncio.gather(*(device.refresh(full=True) for device in devices))
+
+            results[str(units)] = await measure(run, self.args.rounds)
+            for device in devices:
+                await device.async_close()
+        return results
+
+    async def fleet(self) -> dict:
+        """Full refresh of FLEET_UNITS units through a FleetScheduler."""
+        while len(self.simulators) < FLEET_UNITS:
+            await self.start_simulator()
+        fleet = FleetScheduler(self.args.fleet_concurrency, stagger=0)
+        devices = [self.create_device(simulator) for simulator in self.simulators[:FLEET_UNITS]]
+        for device in devices:
+            fleet.add(device)
+
+        async def run():
+            await asyncio.gather(*(fleet.async_refresh(device, full=True) for device in devices))
+
+        result = await measure(run, self.args.rounds)
+        metrics = fleet.as_dict()
+        del metrics['per_unit']
+        result['fleet'] = metrics
+        for device in devices:
+            await device.async_close()
+        return result
+
+    async def run(self) -> dict:
+        self.hass = Hass(asyncio.get_running_loop())
+        simulator = await self.start_simulator()
+
+        results = {'cold_refresh': await self.cold_refresh(simulator)}
+
+        device = self.create_device(simulator)
+        await device.refresh(full=True)
+        results['warm_refresh'] = await self.warm_refresh(device)
+        results['single_write'] = await self.single_write(device)
+        results['batched_write'] = await self.batched_write(device)
+        results['entity_evaluation'] = await self.entity_evaluation(device)
+        results['session'] = device.session.as_dict()
+        await device.async_close()
+
+        results['scaling'] = await self.scaling()
+        results['fleet'] = await self.fleet()
+
+        for simulator in self.simulators:
+            await simulator.async_stop()
+
+        return {
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'transport': self.args.transport,
+            'latency': self.args.latency,
+            'max_apdu': self.args.max_apdu,
+            'properties': len(DEVICE_PROPERTIES),
+            'results': results,
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rounds', type=int, default=20)
+    parser.add_argument('--latency', type=float, default=0.0, help="simulated device latency in seconds")
+    parser.add_argument('--max-apdu', type=int, default=480)
+    parser.add_argument('--transport', default=TRANSPORT_NATIVE)
+    parser.add_argument('--fleet-concurrency', type=int, default=8)
+    parser.add_argument('--output', type=Path, help="write JSON here instead of stdout")
+    args = parser.parse_args()
+
+    report = asyncio.run(Bench(args).run())
+
+    if args.output is None:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+    else:
+        args.output.write_text(json.dumps(report, indent=2) + '\n')
+
+
+if __name__ == '__main__':
+    main()
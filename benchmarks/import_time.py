@@ -0,0 +1,100 @@
+"""Import-time benchmark of the library modules.
+
+Every module is imported in a fresh interpreter under `python -X importtime`,
+several times, and the median cumulative import time is reported along with
+the time spent in the library's own modules and whether the BACnet stack
+(BAC0, bacpypes) was imported. Loading the integration must not import
+BAC0; it is imported by the session when the first BAC0 stack starts.
+Results are printed (or written with --output) as JSON.
+
+Run from the repository root:
+
+    python benchmarks/import_time.py --rounds 5 --output imports.json
+"""
+import sys
+import json
+import argparse
+import platform
+import statistics
+import subprocess
+
+from pathlib import Path
+from typing import Dict, List
+
+PACKAGE_DIR = Path(__file__).resolve().parents[1] / 'custom_components' / 'flexit_bacnet'
+
+MODULES = ('lib', 'lib.device', 'lib.session', 'lib.codec', 'lib.transport', 'lib.points', 'lib.simulator')
+
+# Top-level packages of the BACnet stack BAC0 is built on
+STACK_PACKAGES = ('BAC0', 'bacpypes', 'bacpypes3')
+
+
+def parse_importtime(stderr: str) -> Dict[str, Dict[str, int]]:
+    """Return {module: {'self': us, 'cumulative': us}} from -X importtime output."""
+    modules = {}
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'imported package' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        modules[name.strip()] = {'self': int(self_us), 'cumulative': int(cumulative_us)}
+    return modules
+
+
+def import_once(module: str) -> Dict[str, Dict[str, int]]:
+    completed = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        cwd=PACKAGE_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return parse_importtime(completed.stderr)
+
+
+def measure(module: str, rounds: int) -> dict:
+    cumulative: List[int] = []
+    own: List[int] = []
+    stack = set()
+    for _ in range(rounds):
+        modules = import_once(module)
+        cumulative.append(modules[module]['cumulative'])
+        own.append(sum(times['self'] for name, times in modules.items() if name == 'lib' or name.startswith('lib.')))
+        stack.update(name for name in modules if name.split('.')[0] in STACK_PACKAGES)
+    return {
+        'rounds': rounds,
+        'cumulative_ms': statistics.median(cumulative) / 1000,
+        'own_ms': statistics.median(own) / 1000,
+        'imports_bacnet_stack': bool(stack),
+    }
+
+
+def measure_stack(rounds: int) -> dict | None:
+    """Time the deferred BAC0 import, if BAC0 is installed."""
+    try:
+        return measure('BAC0', rounds)
+    except subprocess.CalledProcessError:
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rounds', type=int, default=5)
+    parser.add_argument('--output', type=Path, help="write JSON here instead of stdout")
+    args = parser.parse_args()
+
+    report = {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'results': {module: measure(module, args.rounds) for module in MODULES},
+        'deferred_bac0': measure_stack(args.rounds),
+    }
+
+    if args.output is None:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+    else:
+        args.output.write_text(json.dumps(report, indent=2) + '\n')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,61 @@
+"""Micro-benchmark: property lookups on the indexed state store vs. the old list-of-tuples state.
+
+Run from the repository root:
+
+    python benchmarks/state_store.py
+"""
+import json
+import sys
+import timeit
+import tracemalloc
+
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / 'custom_components' / 'flexit_bacnet'))
+
+from lib.device_property import PRESENT_VALUE  # noqa: E402
+from lib.nordic import DEVICE_PROPERTIES  # noqa: E402
+from lib.state import DeviceStateStore  # noqa: E402
+
+ROUNDS = 1000
+
+
+def list_of_tuples_lookup(state):
+    for dp in DEVICE_PROPERTIES:
+        dict(state[dp.object_identifier])[PRESENT_VALUE]
+
+
+def store_lookup(store):
+    for dp in DEVICE_PROPERTIES:
+        store.get(dp.object_identifier, PRESENT_VALUE)
+
+
+def measure(func, arg):
+    seconds = min(timeit.repeat(lambda: func(arg), number=ROUNDS, repeat=5)) / ROUNDS
+
+    tracemalloc.start()
+    func(arg)
+    _, peak_bytes = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {'seconds_per_refresh': seconds, 'peak_bytes_per_refresh': peak_bytes}
+
+
+def run() -> dict:
+    state = {
+        dp.object_identifier: [(PRESENT_VALUE, 1.0), ('statusFlags', [0, 0, 0, 0])]
+        for dp in DEVICE_PROPERTIES
+    }
+    store = DeviceStateStore()
+    store.update(state)
+
+    return {
+        'properties': len(DEVICE_PROPERTIES),
+        'list_of_tuples': measure(list_of_tuples_lookup, state),
+        'state_store': measure(store_lookup, store),
+    }
+
+
+if __name__ == '__main__':
+    json.dump(run(), sys.stdout, indent=2)
+    print()
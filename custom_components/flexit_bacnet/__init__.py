@@ -1,3 +1,5 @@
+import time
+
 from datetime import timedelta
 
 from homeassistant.config_entries import ConfigEntry
@@ -5,19 +7,35 @@ from homeassistant.core import Config, HomeAssistant
 from homeassistant.const import CONF_NAME
 from homeassistant.exceptions import ConfigEntryNotReady
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
 from .const import (
     DOMAIN, 
+    DATA_FLEET,
+    DATA_CATALOGUE,
+    SIGNAL_CATALOGUE_LOADED,
     LOGGER, 
     PLATFORMS, 
     CONF_ADDRESS, 
     CONF_DEVICE_ID,
+    CONF_INTERFACE,
     CONF_INTERVAL,
+    CONF_COV,
+    CONF_TRANSPORT,
     DEFAULT_INTERVAL,
+    DEFAULT_COV,
+    DEFAULT_TRANSPORT,
+    FAST_POLL_INTERVAL,
+    SLOW_POLL_INTERVAL,
+    FLEET_CONCURRENCY,
+    FLEET_STAGGER,
 )
+from .cache import CatalogueCache, DeviceCache
 from .coordinator import FlexitDataUpdateCoordinator
 from .lib import FlexitBACnet
+from .lib.fleet import FleetScheduler
+from .lib.device_property import POLL_TIER_FAST, POLL_TIER_NORMAL, POLL_TIER_SLOW
 
 async def async_setup(hass: HomeAssistant, config: Config):
     """Set up this integration using YAML is not supported."""
@@ -26,10 +44,15 @@ async def async_setup(hass: HomeAssistant, config: Config):
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
     """Set up this integration using UI."""
+    start = time.monotonic()
     if hass.data.get(DOMAIN) is None:
         hass.data.setdefault(DOMAIN, {})
         LOGGER.debug("Flexit Bacnet startup")
 
+    fleet: FleetScheduler = hass.data.setdefault(
+        DATA_FLEET, FleetScheduler(FLEET_CONCURRENCY, FLEET_STAGGER)
+    )
+
     if not entry.options:
         hass.config_entries.async_update_entry(
             entry,
@@ -41,30 +64,93 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
     device = FlexitBACnet(
         hass,
         entry.data[CONF_ADDRESS], 
-        entry.data[CONF_DEVICE_ID]
+        entry.data[CONF_DEVICE_ID],
+        poll_intervals={
+            POLL_TIER_FAST: FAST_POLL_INTERVAL,
+            POLL_TIER_NORMAL: entry.options[CONF_INTERVAL] * 60,
+            POLL_TIER_SLOW: max(SLOW_POLL_INTERVAL, entry.options[CONF_INTERVAL]) * 60,
+        },
+        transport=entry.options.get(CONF_TRANSPORT, DEFAULT_TRANSPORT),
+        interface=entry.data.get(CONF_INTERFACE) or None,
     )
-    is_valid = await hass.async_add_executor_job(device.is_valid)
-    if not is_valid:
-        return False
+
+    # With a cached identity entities are set up right away and the first
+    # live refresh runs in the background.
+    cache = DeviceCache(hass, entry.entry_id)
+    restored = await cache.async_restore(device)
+
+    if not restored and not await device.async_read_identity():
+        await device.async_close()
+        raise ConfigEntryNotReady(f"No answer from {entry.data[CONF_ADDRESS]}")
 
     coordinator = FlexitDataUpdateCoordinator(
         hass,
         name=entry.data[CONF_NAME],
         device=device,
-        update_interval=entry.options[CONF_INTERVAL],
+        fleet=fleet,
+        cache=cache,
+        use_cov=entry.options.get(CONF_COV, DEFAULT_COV),
     )
+    coordinator.restored_from_cache = restored
+
+    fleet.add(device)
+    if restored:
+        coordinator.data = device._state
+        hass.async_create_task(_async_first_refresh(hass, entry, coordinator))
+    else:
+        refresh_start = time.monotonic()
+        try:
+            await coordinator.async_config_entry_first_refresh()
+        except ConfigEntryNotReady:
+            fleet.remove(device)
+            await device.async_close()
+            raise
+        coordinator.first_refresh_duration = time.monotonic() - refresh_start
 
-    await coordinator.async_config_entry_first_refresh()
+        hass.async_create_task(_async_load_catalogue(hass, entry, coordinator))
 
     hass.data[DOMAIN][entry.entry_id] = coordinator
     hass.config_entries.async_setup_platforms(entry, PLATFORMS)
 
+    coordinator.setup_duration = time.monotonic() - start
+    LOGGER.debug("Set up %s in %.3fs (from cache: %s)", entry.title, coordinator.setup_duration, restored)
+
     return True
 
+async def _async_first_refresh(hass: HomeAssistant, entry: ConfigEntry, coordinator: FlexitDataUpdateCoordinator) -> None:
+    """Replace cached state with live state. COV starts with the first refresh the device answers."""
+    start = time.monotonic()
+    await coordinator.async_refresh()
+    coordinator.first_refresh_duration = time.monotonic() - start
+
+    await _async_load_catalogue(hass, entry, coordinator)
+
+async def _async_load_catalogue(hass: HomeAssistant, entry: ConfigEntry, coordinator: FlexitDataUpdateCoordinator) -> None:
+    """Load the object catalogue, discovering it if the firmware is new, and announce it."""
+    catalogue_cache: CatalogueCache = hass.data.setdefault(DATA_CATALOGUE, CatalogueCache(hass))
+    try:
+        catalogue = await coordinator.device.async_load_catalogue(await catalogue_cache.async_load())
+    except Exception as error:
+        LOGGER.warning("Could not discover objects of %s, %s", entry.title, error)
+        return
+
+    await catalogue_cache.async_save(catalogue)
+    async_dispatcher_send(hass, SIGNAL_CATALOGUE_LOADED.format(entry.entry_id))
+
 async def async_unload_entry(hass, entry):
     """Unload entry."""
 
-    return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+    unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+    if unload_ok:
+        coordinator = hass.data[DOMAIN].pop(entry.entry_id)
+        coordinator.fleet.remove(coordinator.device)
+        await coordinator.device.async_close()
+
+    return unload_ok
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove the cache of a deleted entry."""
+    await DeviceCache(hass, entry.entry_id).async_remove()
 
 async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Reload config entry."""
@@ -53,7 +53,10 @@ class FlexitBinarySensor(CoordinatorEntity, BinarySensorEntity):
     ) -> None:
         """Initialize a Flexit binary sensor."""
 
-        super().__init__(coordinator)
+        super().__init__(
+            coordinator,
+            context=coordinator.property_context(description.key),
+        )
 
         self.entity_description = description
         self.coordinator = coordinator
@@ -1,7 +1,5 @@
 """Button for Flexit."""
 
-import time
-
 from homeassistant.components.button import (
     ButtonEntity,
     ButtonEntityDescription,
@@ -51,7 +49,8 @@ class FlexitButton(CoordinatorEntity, ButtonEntity):
     ) -> None:
         """Initialize."""
 
-        super().__init__(coordinator)
+        # Buttons show no device state, only availability
+        super().__init__(coordinator, context=frozenset())
         self.coordinator = coordinator
         self.entity_description = description
 
@@ -64,9 +63,9 @@ class FlexitButton(CoordinatorEntity, ButtonEntity):
         return self.coordinator.device.available
 
 class FlexitActivateCookerhoodButton(FlexitButton):
-    def press(self) -> None:
-        self.coordinator.device.activate_cooker_hood()
+    async def async_press(self) -> None:
+        await self.coordinator.async_write(self.coordinator.device.activate_cooker_hood())
 
 class FlexitDeactivateCookerhoodButton(FlexitButton):
-    def press(self) -> None:
-        self.coordinator.device.deactivate_cooker_hood()
\ No newline at end of file
+    async def async_press(self) -> None:
+        await self.coordinator.async_write(self.coordinator.device.deactivate_cooker_hood())
\ No newline at end of file
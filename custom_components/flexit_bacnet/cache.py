@@ -0,0 +1,69 @@
+"""Persisted device identity, last known state and object catalogues."""
+
+from __future__ import annotations
+
+import time
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN
+from .lib import FlexitBACnet
+from .lib.discovery import Catalogue
+
+STORAGE_VERSION = 1
+
+# Seconds a save is postponed so that consecutive refreshes write once
+SAVE_DELAY = 60
+
+
+class DeviceCache:
+    """Stores what a device reported so that setup does not wait for it."""
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        self._store: Store = Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}")
+        self._save_due: float | None = None
+
+    async def async_restore(self, device: FlexitBACnet) -> bool:
+        """Load the cache into device. Returns True if its identity is known."""
+        data = await self._store.async_load()
+        if not data:
+            return False
+        return device.restore_cache(data)
+
+    @callback
+    def async_schedule_save(self, device: FlexitBACnet) -> None:
+        """Save within SAVE_DELAY seconds.
+
+        A pending save is not postponed again, refreshes come more often
+        than SAVE_DELAY and would otherwise keep it from ever running. The
+        state is taken when the save runs, so it is the latest either way.
+        """
+        now = time.monotonic()
+        if self._save_due is not None and now < self._save_due:
+            return
+        self._save_due = now + SAVE_DELAY
+        self._store.async_delay_save(device.cache_data, SAVE_DELAY)
+
+    async def async_remove(self) -> None:
+        await self._store.async_remove()
+
+
+class CatalogueCache:
+    """Object catalogues shared by all entries, keyed by firmware revision."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        self._store: Store = Store(hass, STORAGE_VERSION, f"{DOMAIN}.catalogue")
+        self._data: dict | None = None
+
+    async def async_load(self) -> dict:
+        if self._data is None:
+            self._data = await self._store.async_load() or {}
+        return self._data
+
+    async def async_save(self, catalogue: Catalogue) -> None:
+        data = await self.async_load()
+        if catalogue.firmware_revision in data:
+            return
+        data[catalogue.firmware_revision] = catalogue.as_dict()
+        await self._store.async_save(data)
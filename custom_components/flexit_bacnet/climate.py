@@ -2,8 +2,6 @@
 
 from __future__ import annotations
 
-import time
-
 from dataclasses import dataclass
 from typing import Any
 
@@ -72,16 +70,20 @@ class FlexitClimateEntity(CoordinatorEntity, ClimateEntity):
     ) -> None:
         """Initialize the unit."""
 
-        super().__init__(coordinator)
+        super().__init__(
+            coordinator,
+            context=coordinator.property_context(
+                'room_temperature',
+                'ventilation_mode',
+                'air_temp_setpoint_away',
+                'air_temp_setpoint_home',
+                'electric_heater',
+            ),
+        )
         self.coordinator = coordinator
         self._attr_unique_id = f"{DOMAIN}.{self.coordinator.device.serial_number}"
         self._attr_device_info = coordinator._attr_device_info
 
-    def _update(self) -> None:
-        """Refresh unit state."""
-        time.sleep(1)
-        self.schedule_update_ha_state()
-
     @property
     def name(self) -> str:
         """Name of the entity."""
@@ -104,15 +106,15 @@ class FlexitClimateEntity(CoordinatorEntity, ClimateEntity):
             return float(self.coordinator.device.air_temp_setpoint_away)
         return float(self.coordinator.device.air_temp_setpoint_home)
 
-    def set_temperature(self, **kwargs: Any) -> None:
+    async def async_set_temperature(self, **kwargs: Any) -> None:
         """Set new target temperature."""
         if (temperature := kwargs.get(ATTR_TEMPERATURE)) is None:
             return
         if self.coordinator.device.ventilation_mode == VENTILATION_MODES[VENTILATION_MODE.AWAY]:
-            self.coordinator.device.set_air_temp_setpoint_away(temperature)
+            write = self.coordinator.device.set_air_temp_setpoint_away(temperature)
         else:
-            self.coordinator.device.set_air_temp_setpoint_home(temperature)
-        self._update()
+            write = self.coordinator.device.set_air_temp_setpoint_home(temperature)
+        await self.coordinator.async_write(write)
 
     @property
     def preset_mode(self) -> str:
@@ -126,7 +128,7 @@ class FlexitClimateEntity(CoordinatorEntity, ClimateEntity):
             VENTILATION_MODES[VENTILATION_MODE.HIGH]: PRESET_BOOST,
         }[self.coordinator.device.ventilation_mode]
 
-    def set_preset_mode(self, preset_mode: str) -> None:
+    async def async_set_preset_mode(self, preset_mode: str) -> None:
         """Set new preset mode."""
         ventilation_mode = {
             PRESET_NONE: VENTILATION_MODE.STOP,
@@ -135,8 +137,9 @@ class FlexitClimateEntity(CoordinatorEntity, ClimateEntity):
             PRESET_BOOST: VENTILATION_MODE.HIGH,
         }[preset_mode]
 
-        self.coordinator.device.set_ventilation_mode(ventilation_mode)
-        self._update()
+        await self.coordinator.async_write(
+            self.coordinator.device.set_ventilation_mode(ventilation_mode)
+        )
 
     @property
     def hvac_mode(self) -> HVACMode:
@@ -149,18 +152,19 @@ class FlexitClimateEntity(CoordinatorEntity, ClimateEntity):
 
         return HVACMode.FAN_ONLY
 
-    def set_hvac_mode(self, hvac_mode: HVACMode) -> None:
+    async def async_set_hvac_mode(self, hvac_mode: HVACMode) -> None:
         """Set new target hvac mode."""
         if hvac_mode == HVACMode.OFF:
-            self.coordinator.device.set_ventilation_mode(VENTILATION_MODE.STOP)
+            ventilation_mode = VENTILATION_MODE.STOP
         else:
-            self.coordinator.device.set_ventilation_mode(VENTILATION_MODE.HOME)
+            ventilation_mode = VENTILATION_MODE.HOME
 
-        if hvac_mode == HVACMode.HEAT:
-            self.turn_aux_heat_on()
-        else:
-            self.turn_aux_heat_off()
-        self._update()
+        await self.coordinator.async_write(
+            self.coordinator.device.set_ventilation_mode_and_heater(
+                ventilation_mode,
+                hvac_mode == HVACMode.HEAT,
+            )
+        )
 
     @property
     def is_aux_heat(self) -> bool:
@@ -169,12 +173,10 @@ class FlexitClimateEntity(CoordinatorEntity, ClimateEntity):
         """
         return bool(self.coordinator.device.electric_heater)
 
-    def turn_aux_heat_on(self) -> None:
+    async def async_turn_aux_heat_on(self) -> None:
         """Turn auxiliary heater on."""
-        self.coordinator.device.enable_electric_heater()
-        self._update()
+        await self.coordinator.async_write(self.coordinator.device.enable_electric_heater())
 
-    def turn_aux_heat_off(self) -> None:
+    async def async_turn_aux_heat_off(self) -> None:
         """Turn auxiliary heater off."""
-        self.coordinator.device.disable_electric_heater()
-        self._update()
+        await self.coordinator.async_write(self.coordinator.device.disable_electric_heater())
@@ -9,13 +9,26 @@ from homeassistant.core import callback
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
-from .const import DOMAIN, CONF_ADDRESS, CONF_DEVICE_ID, CONF_INTERVAL, DEFAULT_INTERVAL
+from .const import (
+    DOMAIN,
+    CONF_ADDRESS,
+    CONF_DEVICE_ID,
+    CONF_INTERFACE,
+    CONF_INTERVAL,
+    CONF_COV,
+    CONF_TRANSPORT,
+    DEFAULT_INTERVAL,
+    DEFAULT_COV,
+    DEFAULT_TRANSPORT,
+    TRANSPORTS,
+)
 
 CONFIG_SCHEMA = vol.Schema(
     {
         vol.Required(CONF_NAME, default="Flexit Local"): str,
         vol.Required(CONF_ADDRESS): str,
         vol.Required(CONF_DEVICE_ID): int,
+        vol.Optional(CONF_INTERFACE): str,
     }
 )
 
@@ -75,6 +88,10 @@ class FlexitOptionsFlowHandler(OptionsFlow):
         return self.async_show_form(
             step_id="init",
             data_schema=vol.Schema(
-                {vol.Required(CONF_INTERVAL, default=DEFAULT_INTERVAL): int}
+                {
+                    vol.Required(CONF_INTERVAL, default=DEFAULT_INTERVAL): int,
+                    vol.Required(CONF_COV, default=DEFAULT_COV): bool,
+                    vol.Required(CONF_TRANSPORT, default=DEFAULT_TRANSPORT): vol.In(TRANSPORTS),
+                }
             ),
         )
@@ -3,6 +3,8 @@ from typing import List
 
 from homeassistant.const import Platform
 
+from .lib.session import TRANSPORT_BAC0, TRANSPORT_NATIVE
+
 DOMAIN = "flexit_bacnet"
 
 LOGGER: Logger = getLogger(__package__)
@@ -10,8 +12,38 @@ LOGGER: Logger = getLogger(__package__)
 CONF_ADDRESS="address"
 CONF_DEVICE_ID="device_id"
 CONF_INTERVAL="update_interval"
+CONF_COV="cov"
+CONF_TRANSPORT="transport"
+CONF_INTERFACE="interface"
 
 DEFAULT_INTERVAL = 1
+DEFAULT_COV = False
+
+# BAC0 runs every request in the executor, native speaks BACnet/IP on the event loop
+TRANSPORTS = [TRANSPORT_BAC0, TRANSPORT_NATIVE]
+DEFAULT_TRANSPORT = TRANSPORT_BAC0
+
+# Seconds between reads of live sensors
+FAST_POLL_INTERVAL = 10
+
+# Minutes between reads of nearly static configuration
+SLOW_POLL_INTERVAL = 60
+
+# Key of the FleetScheduler shared by all config entries in hass.data
+DATA_FLEET = f"{DOMAIN}_fleet"
+
+# Key of the CatalogueCache shared by all config entries in hass.data
+DATA_CATALOGUE = f"{DOMAIN}_catalogue"
+
+# Dispatcher signal sent when an entry's object catalogue is loaded, format with entry_id
+SIGNAL_CATALOGUE_LOADED = f"{DOMAIN}_catalogue_loaded_{{}}"
+
+# Units polled at the same time, and minimum seconds between poll starts
+FLEET_CONCURRENCY = 8
+FLEET_STAGGER = 0.1
+
+# Minutes between full consistency polls when COV subscriptions are active
+COV_SWEEP_INTERVAL = 15
 
 PLATFORMS: List[str] = [
     Platform.BINARY_SENSOR,
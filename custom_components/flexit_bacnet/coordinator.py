@@ -1,14 +1,23 @@
+import asyncio
+
+from collections import Counter
 from datetime import timedelta
+from typing import Any, Awaitable, Callable
 
 from .const import DOMAIN, LOGGER
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
 
 from homeassistant.helpers.entity import DeviceInfo
-from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
-from .const import DOMAIN, LOGGER
+from .const import DOMAIN, LOGGER, COV_SWEEP_INTERVAL
 from .lib import FlexitBACnet
+from .lib.device import ATTRIBUTE_PROPERTIES
+from .lib.fleet import FleetScheduler
+from .cache import DeviceCache
+from .lib.typing import ObjectIdentifier
 
 class FlexitDataUpdateCoordinator(DataUpdateCoordinator):
     """Class to manage fetching from Flexit data API."""
@@ -18,12 +27,33 @@ class FlexitDataUpdateCoordinator(DataUpdateCoordinator):
         hass: HomeAssistant,
         name: str,
         device: FlexitBACnet,
-        update_interval: int,
+        fleet: FleetScheduler | None = None,
+        cache: DeviceCache | None = None,
+        use_cov: bool = False,
     ) -> None:
         """Initialize."""
 
         self.name = name
         self.device = device
+        self.fleet = fleet if fleet is not None else FleetScheduler()
+        self.cache = cache
+
+        # Startup timings, see diagnostics
+        self.restored_from_cache: bool = False
+        self.setup_duration: float | None = None
+        self.first_refresh_duration: float | None = None
+        self.use_cov = use_cov
+        self._cov_task: asyncio.Task | None = None
+
+        # Objects whose values changed in the last update, None when every
+        # listener must be updated (e.g. availability changed).
+        self.changed_objects: set[ObjectIdentifier] | None = None
+        self._previous_available: bool | None = None
+
+        # Listeners per object and listeners without a context, from which
+        # the objects read on refresh are derived
+        self._context_counts: Counter[ObjectIdentifier] = Counter()
+        self._unbounded_listeners = 0
 
         self._attr_device_info = DeviceInfo(
             name=self.name,
@@ -36,15 +66,144 @@ class FlexitDataUpdateCoordinator(DataUpdateCoordinator):
             hass,
             LOGGER,
             name=DOMAIN,
-            update_interval=timedelta(minutes=update_interval)
+            # Each cycle only reads the properties whose poll tier is due
+            update_interval=timedelta(seconds=device.scheduler.tick_interval)
         )
 
+    @staticmethod
+    def property_context(*keys: str) -> frozenset[ObjectIdentifier] | None:
+        """Return the objects behind the given device attributes, for use as a listener context.
+
+        Returns None, meaning "always update", if any attribute is unknown.
+        """
+        context = set()
+        for key in keys:
+            if key not in ATTRIBUTE_PROPERTIES:
+                return None
+            context.update(dp.object_identifier for dp in ATTRIBUTE_PROPERTIES[key])
+        return frozenset(context)
+
+    @callback
+    def async_add_listener(self, update_callback: CALLBACK_TYPE, context: Any = None) -> Callable[[], None]:
+        """Listen for data updates and read the objects in context on refresh.
+
+        Only enabled entities add listeners, so the objects read are those
+        behind the entities that are displayed.
+        """
+        remove_listener = super().async_add_listener(update_callback, context)
+        self._async_count_context(context, 1)
+
+        @callback
+        def _remove_listener() -> None:
+            remove_listener()
+            self._async_count_context(context, -1)
+
+        return _remove_listener
+
+    @callback
+    def _async_count_context(self, context: Any, delta: int) -> None:
+        if context is None:
+            self._unbounded_listeners += delta
+            self._async_update_read_objects()
+            return
+
+        changed = False
+        for object_identifier in context:
+            count = self._context_counts[object_identifier] + delta
+            changed |= count <= 0 or count == delta
+            if count > 0:
+                self._context_counts[object_identifier] = count
+            else:
+                del self._context_counts[object_identifier]
+
+        if changed:
+            self._async_update_read_objects()
+
+    @callback
+    def _async_update_read_objects(self) -> None:
+        if self._unbounded_listeners or not self._listeners:
+            read_objects = None
+        else:
+            read_objects = set(self._context_counts)
+
+        if self.device.set_read_objects(read_objects) and self.data is not None:
+            self.hass.async_create_task(self.async_request_refresh())
+
+    @callback
+    def _async_diff_state(self) -> set[ObjectIdentifier] | None:
+        changed = self.device._state.pop_changed()
+        available = self.device.available and self.last_update_success
+        everything = available != self._previous_available
+
+        self._previous_available = available
+        return None if everything else changed
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Update only the listeners whose objects changed since the last update."""
+        self.changed_objects = self._async_diff_state()
+        if self.changed_objects is None:
+            super().async_update_listeners()
+            return
+
+        LOGGER.debug("Changed objects %s", self.changed_objects)
+        for update_callback, context in list(self._listeners.values()):
+            if context is None or not context.isdisjoint(self.changed_objects):
+                update_callback()
+
+    async def async_start_cov(self) -> None:
+        """Subscribe to COV notifications and push them to entities."""
+        # Pushed notifications keep state current, polls only catch missed updates
+        await self.device.async_start_cov(sweep_interval=COV_SWEEP_INTERVAL * 60)
+        self.device.add_listener(self._handle_cov_notification)
+
+    @callback
+    def _async_start_cov_when_available(self) -> None:
+        """Start COV after the first refresh the device answered, however late that is."""
+        if not self.use_cov or not self.device.available or self.device.cov is not None or self._cov_task is not None:
+            return
+
+        async def _async_start() -> None:
+            try:
+                await self.async_start_cov()
+            except Exception as error:
+                LOGGER.warning("Could not subscribe to COV, %s", error)
+            finally:
+                self._cov_task = None
+
+        self._cov_task = self.hass.async_create_task(_async_start())
+
+    @callback
+    def _handle_cov_notification(self) -> None:
+        # Not async_set_updated_data, which would keep postponing the sweep
+        self.data = self.device._state
+        self.async_update_listeners()
+
+    async def async_write(self, write: Awaitable[int]) -> None:
+        """Wait for a queued write, update the entities of the written objects, then refresh.
+
+        The device stores the written values read back once the write
+        succeeds, so those entities update right away. The refresh reads
+        the values the device derives from them, which it marks due.
+        """
+        try:
+            await write
+        except Exception as error:
+            raise HomeAssistantError(f"Could not write to {self.name}: {error}") from error
+
+        self.data = self.device._state
+        self.async_update_listeners()
+        await self.async_request_refresh()
+
     async def _async_update_data(self):
         """Update data via library."""
         LOGGER.debug("coordinator updating data")
         
         try:
-            await self.device.refresh()
+            await self.fleet.async_refresh(self.device)
+            self._async_start_cov_when_available()
+            if self.cache is not None and self.device.available:
+                self.cache.async_schedule_save(self.device)
             return self.device._state
         except Exception as error:
             LOGGER.error("Update error %s", error)
@@ -17,6 +17,32 @@ async def async_get_config_entry_diagnostics(
 
     coordinator: FlexitDataUpdateCoordinator = hass.data[DOMAIN][config_entry.entry_id]
 
+    device = coordinator.device
+    session = device.session
+
     return {
-        "flexit_bacnet": str(coordinator.device._state),
+        "flexit_bacnet": device._state.snapshot(),
+        "session": session.as_dict() if session is not None else None,
+        "limits": str(device.limits),
+        "batch_timings": device.batch_timings,
+        "read_properties": len(device.read_properties),
+        "wpm_supported": device.wpm_supported,
+        "write_queue": device.write_queue.as_dict(),
+        "write_overrides": device.write_overrides,
+        "health": device.health.as_dict(),
+        "telemetry": device.telemetry.as_dict(),
+        "priorities": {
+            f"{object_type}:{instance_id}": priorities.as_dict()
+            for (object_type, instance_id), priorities in device.priorities.items()
+        },
+        "fleet": coordinator.fleet.as_dict(),
+        "catalogue": {
+            "firmware_revision": device.catalogue.firmware_revision,
+            "objects": len(device.catalogue),
+        } if device.catalogue is not None else None,
+        "startup": {
+            "restored_from_cache": coordinator.restored_from_cache,
+            "setup_duration": coordinator.setup_duration,
+            "first_refresh_duration": coordinator.first_refresh_duration,
+        },
     }
@@ -1,107 +1,218 @@
-import socket
+import time
 import asyncio
-import async_timeout
 
-from typing import List, Any
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, List, Any, Tuple
 from logging import Logger, getLogger
 
-import BAC0
-from BAC0.scripts import Lite
-from contextlib import asynccontextmanager
-
-from .device_property import DeviceProperty, PRESENT_VALUE
-from .typing import DeviceState
+from .device_property import DeviceProperty, PRESENT_VALUE, raw_value
+from .codec import BACnetError
+from .session import BACnetSession, PropertyWrite
+from .telemetry import COUNT_BUCKETS
+from .typing import DeviceState, ObjectIdentifier
 
 LOGGER: Logger = getLogger(__package__)
 
-BAC0.log_level('silence')
-
-def get_local_ip(device_address: str) -> None | str:
-    """Get the local IP address used to connect to the remote one."""
-    LOGGER.debug("Trying to get_local_ip in bacnet")
-
-    try:
-        LOGGER.debug("Try socket")
-        s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-        LOGGER.debug("Try socket 2")
-        s.connect((device_address, 0))
-        LOGGER.debug("Try socket 3")
-    except socket.error as e:
-        LOGGER.warning("Socket error %s", e)
-        return None
-    except Exception as e:
-        LOGGER.warning("Socket exception %s", e)
-    else:
-        LOGGER.debug("Socket return")
-        return s.getsockname()[0]
-    finally:
-        LOGGER.debug("Socket close")
-        s.close()
-
-@asynccontextmanager
-async def run_bacnet(hass, device_address: str) -> Lite:
-    """Return a running BACnet application to accept read and write requests."""
-    LOGGER.debug("Trying to run_bacnet")
-
-    try:
-        LOGGER.debug("Get local_ip")
-        local_ip = await hass.async_add_executor_job(get_local_ip, device_address)
-        async with async_timeout.timeout(10):
-            LOGGER.debug("Get bacnet_lite")
-            bacnet_lite = await hass.async_add_executor_job(BAC0.lite, local_ip, None, None, None, 0, None, True)
-            LOGGER.debug("Yield bacnet_lite")
-            yield bacnet_lite
-    except asyncio.TimeoutError as e:
-        LOGGER.warning("run_bacnet timeout error %s", e)
-    except Exception as e:
-        LOGGER.warning("run_bacnet exception %s", e)
-    finally:
-        if bacnet_lite is not None:
-            LOGGER.debug("run_bacnet finally disconnect")
-            await hass.async_add_executor_job(bacnet_lite.disconnect)
-        LOGGER.debug("run_bacnet finally finished")
-
-async def read_multiple(hass, device_address: str, device_properties: List[DeviceProperty]) -> DeviceState:
-    LOGGER.debug("Trying to read_multiple in bacnet")
-    request = {
-        'address': device_address,
-        'objects': {
-            f'{dp.object_type}:{dp.instance_id}': dp.read_values
-            for dp in device_properties
-        },
-    }
+# Smallest max APDU a BACnet/IP device may accept, used until the device is asked
+DEFAULT_MAX_APDU = 480
 
-    result: DeviceState
+# Largest APDU a BACnet/IP datagram can carry
+LOCAL_MAX_APDU = 1476
 
-    async with run_bacnet(hass, device_address) as bacnet:
-        try:
-            result = await hass.async_add_executor_job(bacnet.readMultiple, device_address, request)
-            LOGGER.debug("response from read %s", result)
-        except Exception as e: 
-            LOGGER.warning("Error on bacnet.readMultiple, %s", e)
+# Upper bound of batches in flight at once for a single read
+MAX_PIPELINED_REQUESTS = 4
+
+# Estimated encoded sizes (bytes) of a ReadPropertyMultiple-ACK
+RPM_ACK_HEADER_SIZE = 3
+RPM_OBJECT_SIZE = 7
+RPM_PROPERTY_SIZE = 4
+VALUE_SIZE = 6
+STRING_VALUE_SIZE = 67
+STRING_PROPERTIES = ('objectName', 'description', 'modelName', 'vendorName', 'firmwareRevision', 'applicationSoftwareVersion')
+
+SEGMENTED_TRANSMIT = ('segmentedBoth', 'segmentedTransmit')
+
+# Number of property sets whose ReadPropertyMultiple requests are kept
+READ_TEMPLATE_CACHE_SIZE = 64
+
+ReadRequest = Dict[ObjectIdentifier, Tuple[str, ...]]
+ReadTemplate = Tuple[Tuple[Tuple[DeviceProperty, ...], ReadRequest], ...]
+
+
+@dataclass
+class DeviceLimits:
+    """APDU limits advertised by the device object."""
+
+    max_apdu: int = DEFAULT_MAX_APDU
+    segmentation: str = 'noSegmentation'
+
+    @property
+    def can_segment(self) -> bool:
+        return self.segmentation in SEGMENTED_TRANSMIT
+
+
+def estimate_response_size(device_property: DeviceProperty) -> int:
+    """Estimate the bytes one object adds to a ReadPropertyMultiple-ACK."""
+    return RPM_OBJECT_SIZE + sum(
+        RPM_PROPERTY_SIZE + (STRING_VALUE_SIZE if value_name in STRING_PROPERTIES else VALUE_SIZE)
+        for value_name in device_property.read_values
+    )
+
+
+def plan_batches(device_properties: List[DeviceProperty], max_apdu: int) -> List[List[DeviceProperty]]:
+    """Split device_properties into batches whose responses fit in one APDU.
+
+    Responses that fit never need segmentation, which is either unsupported
+    or slow on these controllers.
+    """
+    batches: List[List[DeviceProperty]] = []
+    batch: List[DeviceProperty] = []
+    size = RPM_ACK_HEADER_SIZE
+
+    for dp in device_properties:
+        dp_size = estimate_response_size(dp)
+        if batch and size + dp_size > max_apdu:
+            batches.append(batch)
+            batch, size = [], RPM_ACK_HEADER_SIZE
+        batch.append(dp)
+        size += dp_size
+
+    if batch:
+        batches.append(batch)
+
+    return batches
+
+
+@lru_cache(maxsize=READ_TEMPLATE_CACHE_SIZE)
+def read_template(device_properties: Tuple[DeviceProperty, ...], max_apdu: int) -> ReadTemplate:
+    """Return the batches of device_properties with their ReadPropertyMultiple requests.
+
+    Polls read the same property sets over and over, so the batches and
+    requests are built once per set and APDU limit and shared afterwards.
+    The requests must not be modified.
+    """
+    return tuple(
+        (tuple(batch), {dp.object_identifier: dp.read_values for dp in batch})
+        for batch in plan_batches(list(device_properties), max_apdu)
+    )
 
-    if result == ['']:
-        raise ConnectionError
 
+async def read_device_limits(session: BACnetSession, device_address: str, device_id: int) -> DeviceLimits:
+    """Read maxApduLengthAccepted and segmentationSupported from the device object."""
+    device_property = DeviceProperty(
+        'device',
+        device_id,
+        read_values=['maxApduLengthAccepted', 'segmentationSupported'],
+    )
+    result = await read_multiple(session, device_address, [device_property])
+    values = dict(result[device_property.object_identifier])
+
+    return DeviceLimits(
+        max_apdu=int(values['maxApduLengthAccepted']),
+        segmentation=str(values['segmentationSupported']),
+    )
+
+
+async def _read_batch(session: BACnetSession, device_address: str, request: ReadRequest) -> DeviceState:
+    session.telemetry.observe('objects_per_read', len(request), COUNT_BUCKETS)
+    result = await session.async_read_multiple(device_address, request)
+    LOGGER.debug("response from read %s", result)
     return result
 
 
-async def write(hass, device_address: str, device_property: DeviceProperty, value: Any):
-    LOGGER.debug("Trying to write in bacnet")
-    async with run_bacnet(hass, device_address) as bacnet:
-        args = [
-            device_address,
-            device_property.object_type,
-            device_property.instance_id,
-            PRESENT_VALUE,
-            value
-        ]
-
-        if device_property.priority is not None:
-            args += [f'- {device_property.priority}']
+async def read_multiple(
+    session: BACnetSession,
+    device_address: str,
+    device_properties: List[DeviceProperty],
+    limits: DeviceLimits | None = None,
+    batch_timings: List[float] | None = None,
+) -> DeviceState:
+    """Read device_properties with as few ReadPropertyMultiple requests as the device allows.
+
+    Batches are sent concurrently and merged into one DeviceState. When
+    batch_timings is given, the duration of every batch is appended to it.
+    """
+    LOGGER.debug("Trying to read_multiple in bacnet")
+    if limits is None:
+        limits = DeviceLimits()
+
+    template = read_template(tuple(device_properties), min(limits.max_apdu, LOCAL_MAX_APDU))
+    semaphore = asyncio.Semaphore(MAX_PIPELINED_REQUESTS)
+
+    async def read_batch(request: ReadRequest) -> DeviceState:
+        async with semaphore:
+            start = time.monotonic()
+            result = await _read_batch(session, device_address, request)
+            if batch_timings is not None:
+                batch_timings.append(time.monotonic() - start)
+            return result
+
+    if len(template) == 1:
+        return await read_batch(template[0][1])
+
+    LOGGER.debug("Reading %s objects in %s batches", len(device_properties), len(template))
+    state: DeviceState = {}
+    for result in await asyncio.gather(*(read_batch(request) for _, request in template)):
+        state.update(result)
+
+    return state
 
+
+# Names BAC0 and bacpypes give the answers of a device without WritePropertyMultiple
+UNSUPPORTED_SERVICE_NAMES = ('unrecognizedservice', 'unrecognized-service', 'optionalfunctionalitynotsupported')
+
+
+def _unsupported_service(error: Exception) -> bool:
+    """Return True if error says the device does not implement the service, not that a value was refused."""
+    if isinstance(error, BACnetError):
+        return error.unsupported_service
+    message = str(error).lower()
+    return any(name in message for name in UNSUPPORTED_SERVICE_NAMES)
+
+
+def _property_write(device_property: DeviceProperty, value: Any) -> PropertyWrite:
+    return (device_property.object_identifier, PRESENT_VALUE, raw_value(value), device_property.priority)
+
+
+async def write(session: BACnetSession, device_address: str, device_property: DeviceProperty, value: Any):
+    LOGGER.debug("Trying to write in bacnet")
+    session.telemetry.observe('objects_per_write', 1, COUNT_BUCKETS)
+    await session.async_write(device_address, *_property_write(device_property, value))
+
+
+async def write_multiple(
+    session: BACnetSession,
+    device_address: str,
+    values: List[Tuple[DeviceProperty, Any]],
+    use_wpm: bool = True,
+) -> bool:
+    """Write several values in one WritePropertyMultiple request.
+
+    Each value is written with its device property's priority. If the device
+    rejects WritePropertyMultiple (or use_wpm is False) the values are written
+    one by one, in order. Returns False when the fallback was used. Only
+    an answer that the service is not implemented switches to the fallback,
+    other errors, e.g. a value out of range, are raised.
+    """
+    if len(values) == 1:
+        await write(session, device_address, *values[0])
+        return use_wpm
+
+    if use_wpm:
         try:
-            LOGGER.debug("bacnet.write %s", args)
-            result = await hass.async_add_executor_job(bacnet.write, " ".join(map(lambda arg: str(arg), args)) )            
+            session.telemetry.observe('objects_per_write', len(values), COUNT_BUCKETS)
+            await session.async_write_multiple(
+                device_address,
+                [_property_write(device_property, value) for device_property, value in values],
+            )
+            return True
         except Exception as e:
-            LOGGER.warning("Error on bacnet.write, %s", e)
+            if not _unsupported_service(e):
+                raise
+            LOGGER.info("WritePropertyMultiple not supported, writing values one by one, %s", e)
+
+    for device_property, value in values:
+        await write(session, device_address, device_property, value)
+
+    return False
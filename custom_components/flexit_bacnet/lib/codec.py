@@ -0,0 +1,986 @@
+"""Encoding and decoding of the BACnet/IP frames used by this library.
+
+Covers BVLC/NPDU framing and the APDUs of ReadProperty, ReadPropertyMultiple,
+WriteProperty, WritePropertyMultiple, SubscribeCOV and COV notifications, in
+both directions, so it serves the client transport as well as the simulator.
+"""
+import struct
+
+from dataclasses import dataclass
+from typing import Any, Dict, List, Tuple
+
+from .typing import ObjectIdentifier
+
+BACNET_PORT = 47808
+
+BVLC_TYPE = 0x81
+BVLC_FORWARDED_NPDU = 0x04
+BVLC_ORIGINAL_UNICAST_NPDU = 0x0A
+BVLC_ORIGINAL_BROADCAST_NPDU = 0x0B
+
+NPDU_VERSION = 0x01
+NPDU_EXPECTING_REPLY = 0x04
+
+# APDU types
+CONFIRMED_REQUEST = 0x0
+UNCONFIRMED_REQUEST = 0x1
+SIMPLE_ACK = 0x2
+COMPLEX_ACK = 0x3
+SEGMENT_ACK = 0x4
+ERROR = 0x5
+REJECT = 0x6
+ABORT = 0x7
+
+# Confirmed services
+CONFIRMED_COV_NOTIFICATION = 1
+SUBSCRIBE_COV = 5
+READ_PROPERTY = 12
+READ_PROPERTY_MULTIPLE = 14
+WRITE_PROPERTY = 15
+WRITE_PROPERTY_MULTIPLE = 16
+
+# Unconfirmed services
+UNCONFIRMED_COV_NOTIFICATION = 2
+
+# Answers of a device that does not implement a service
+REJECT_UNRECOGNIZED_SERVICE = 9
+ERROR_CLASS_SERVICES = 5
+ERROR_CODE_OPTIONAL_FUNCTIONALITY_NOT_SUPPORTED = 45
+
+# Application tags
+TAG_NULL = 0
+TAG_BOOLEAN = 1
+TAG_UNSIGNED = 2
+TAG_SIGNED = 3
+TAG_REAL = 4
+TAG_DOUBLE = 5
+TAG_OCTET_STRING = 6
+TAG_CHARACTER_STRING = 7
+TAG_BIT_STRING = 8
+TAG_ENUMERATED = 9
+TAG_DATE = 10
+TAG_TIME = 11
+TAG_OBJECT_IDENTIFIER = 12
+
+# Max APDU length accepted, encoded in the low nibble of a confirmed request
+MAX_APDU_ENCODING = {50: 0, 128: 1, 206: 2, 480: 3, 1024: 4, 1476: 5}
+MAX_APDU_DECODING = {value: key for key, value in MAX_APDU_ENCODING.items()}
+
+OBJECT_TYPES = {
+    'analogInput': 0,
+    'analogOutput': 1,
+    'analogValue': 2,
+    'binaryInput': 3,
+    'binaryOutput': 4,
+    'binaryValue': 5,
+    'calendar': 6,
+    'command': 7,
+    'device': 8,
+    'eventEnrollment': 9,
+    'file': 10,
+    'group': 11,
+    'loop': 12,
+    'multiStateInput': 13,
+    'multiStateOutput': 14,
+    'notificationClass': 15,
+    'program': 16,
+    'schedule': 17,
+    'averaging': 18,
+    'multiStateValue': 19,
+    'trendLog': 20,
+    'lifeSafetyPoint': 21,
+    'lifeSafetyZone': 22,
+    'accumulator': 23,
+    'pulseConverter': 24,
+    'eventLog': 25,
+    'globalGroup': 26,
+    'trendLogMultiple': 27,
+    'loadControl': 28,
+    'structuredView': 29,
+    'accessDoor': 30,
+    'bitstringValue': 39,
+    'characterstringValue': 40,
+    'datePatternValue': 41,
+    'dateValue': 42,
+    'datetimePatternValue': 43,
+    'datetimeValue': 44,
+    'integerValue': 45,
+    'largeAnalogValue': 46,
+    'octetstringValue': 47,
+    'positiveIntegerValue': 48,
+    'timePatternValue': 49,
+    'timeValue': 50,
+    'notificationForwarder': 51,
+    'alertEnrollment': 52,
+    'channel': 53,
+    'lightingOutput': 54,
+}
+OBJECT_TYPE_NAMES = {value: key for key, value in OBJECT_TYPES.items()}
+
+PROPERTY_IDENTIFIERS = {
+    'activeText': 4,
+    'apduTimeout': 11,
+    'applicationSoftwareVersion': 12,
+    'covIncrement': 22,
+    'deadband': 25,
+    'description': 28,
+    'eventState': 36,
+    'firmwareRevision': 44,
+    'highLimit': 45,
+    'inactiveText': 46,
+    'lowLimit': 59,
+    'maxApduLengthAccepted': 62,
+    'maxPresValue': 65,
+    'minPresValue': 69,
+    'modelName': 70,
+    'numberOfApduRetries': 73,
+    'numberOfStates': 74,
+    'objectIdentifier': 75,
+    'objectList': 76,
+    'objectName': 77,
+    'objectType': 79,
+    'outOfService': 81,
+    'polarity': 84,
+    'presentValue': 85,
+    'priorityArray': 87,
+    'protocolVersion': 98,
+    'reliability': 103,
+    'relinquishDefault': 104,
+    'resolution': 106,
+    'segmentationSupported': 107,
+    'stateText': 110,
+    'statusFlags': 111,
+    'systemStatus': 112,
+    'units': 117,
+    'vendorIdentifier': 120,
+    'vendorName': 121,
+    'protocolRevision': 139,
+    'databaseRevision': 155,
+    'maxSegmentsAccepted': 167,
+    'propertyList': 371,
+}
+PROPERTY_NAMES = {value: key for key, value in PROPERTY_IDENTIFIERS.items()}
+
+SEGMENTATION = ['segmentedBoth', 'segmentedTransmit', 'segmentedReceive', 'noSegmentation']
+BINARY_PV = ['inactive', 'active']
+
+ENGINEERING_UNITS = {
+    5: 'volts',
+    19: 'kilowattHours',
+    29: 'percentRelativeHumidity',
+    47: 'watts',
+    48: 'kilowatts',
+    53: 'pascals',
+    62: 'degreesCelsius',
+    63: 'degreesKelvin',
+    64: 'degreesFahrenheit',
+    70: 'days',
+    71: 'hours',
+    72: 'minutes',
+    73: 'seconds',
+    95: 'noUnits',
+    96: 'partsPerMillion',
+    98: 'percent',
+    104: 'revolutionsPerMinute',
+    124: 'millivolts',
+    135: 'cubicMetersPerHour',
+}
+ENGINEERING_UNIT_IDS = {value: key for key, value in ENGINEERING_UNITS.items()}
+
+ANALOG_TYPES = ('analogInput', 'analogOutput', 'analogValue', 'largeAnalogValue')
+BINARY_TYPES = ('binaryInput', 'binaryOutput', 'binaryValue')
+UNSIGNED_TYPES = ('multiStateInput', 'multiStateOutput', 'multiStateValue', 'positiveIntegerValue')
+COMMANDED_PROPERTIES = ('presentValue', 'relinquishDefault', 'priorityArray')
+
+INDEX_SEPARATOR = '@idx:'
+
+
+class BACnetError(Exception):
+    """The device answered with an Error, Reject or Abort PDU."""
+
+    def __init__(
+        self,
+        message: str,
+        error_class: int | None = None,
+        error_code: int | None = None,
+        reason: int | None = None,
+    ):
+        super().__init__(message)
+        self.error_class = error_class
+        self.error_code = error_code
+        self.reason = reason
+
+    @property
+    def unsupported_service(self) -> bool:
+        """Return True if the device does not implement the requested service."""
+        if isinstance(self, BACnetReject):
+            return self.reason == REJECT_UNRECOGNIZED_SERVICE
+        return (self.error_class, self.error_code) == (ERROR_CLASS_SERVICES, ERROR_CODE_OPTIONAL_FUNCTIONALITY_NOT_SUPPORTED)
+
+
+class BACnetReject(BACnetError):
+    pass
+
+
+class BACnetAbort(BACnetError):
+    pass
+
+
+@dataclass
+class APDU:
+    """A decoded application layer PDU."""
+
+    pdu_type: int
+    service: int | None = None
+    invoke_id: int | None = None
+    payload: bytes = b''
+    max_apdu: int = 1476
+    segmented: bool = False
+    reason: int | None = None
+
+
+# Property references
+
+def parse_property(property_name: str) -> Tuple[str, int | None]:
+    """Split 'objectList@idx:3' into ('objectList', 3)."""
+    if INDEX_SEPARATOR in property_name:
+        name, index = property_name.split(INDEX_SEPARATOR)
+        return name, int(index)
+    return property_name, None
+
+
+def format_property(property_name: str, index: int | None) -> str:
+    if index is None:
+        return property_name
+    return f'{property_name}{INDEX_SEPARATOR}{index}'
+
+
+def property_id(property_name: str) -> int:
+    if property_name in PROPERTY_IDENTIFIERS:
+        return PROPERTY_IDENTIFIERS[property_name]
+    return int(property_name)
+
+
+def property_name(identifier: int) -> str:
+    return PROPERTY_NAMES.get(identifier, str(identifier))
+
+
+# Primitive encoding
+
+def _encode_tag(number: int, context: bool, length: int) -> bytes:
+    first = (number << 4) if number < 15 else 0xF0
+    if context:
+        first |= 0x08
+    extended = bytes([number]) if number >= 15 else b''
+
+    if length < 5:
+        return bytes([first | length]) + extended
+    if length < 254:
+        return bytes([first | 5]) + extended + bytes([length])
+    if length < 65536:
+        return bytes([first | 5]) + extended + b'\xfe' + length.to_bytes(2, 'big')
+    return bytes([first | 5]) + extended + b'\xff' + length.to_bytes(4, 'big')
+
+
+def opening_tag(number: int) -> bytes:
+    return bytes([(number << 4) | 0x0E])
+
+
+def closing_tag(number: int) -> bytes:
+    return bytes([(number << 4) | 0x0F])
+
+
+def _unsigned_bytes(value: int) -> bytes:
+    return value.to_bytes(max(1, (value.bit_length() + 7) // 8), 'big')
+
+
+def _signed_bytes(value: int) -> bytes:
+    length = 1
+    while not -(1 << (8 * length - 1)) <= value < (1 << (8 * length - 1)):
+        length += 1
+    return value.to_bytes(length, 'big', signed=True)
+
+
+def _object_identifier_bytes(object_identifier: ObjectIdentifier) -> bytes:
+    object_type, instance_id = object_identifier
+    if isinstance(object_type, str):
+        object_type = OBJECT_TYPES[object_type]
+    return ((object_type << 22) | instance_id).to_bytes(4, 'big')
+
+
+def _bit_string_bytes(bits: List[int]) -> bytes:
+    unused = (8 - len(bits) % 8) % 8
+    data = bytearray(b'\x00' * ((len(bits) + 7) // 8))
+    for i, bit in enumerate(bits):
+        if bit:
+            data[i // 8] |= 0x80 >> (i % 8)
+    return bytes([unused]) + bytes(data)
+
+
+def encode_application(tag: int, value: Any) -> bytes:
+    """Encode one application-tagged primitive value."""
+    if tag == TAG_NULL:
+        return _encode_tag(TAG_NULL, False, 0)
+    if tag == TAG_BOOLEAN:
+        return _encode_tag(TAG_BOOLEAN, False, 1 if value else 0)
+
+    if tag in (TAG_UNSIGNED, TAG_ENUMERATED):
+        content = _unsigned_bytes(value)
+    elif tag == TAG_SIGNED:
+        content = _signed_bytes(value)
+    elif tag == TAG_REAL:
+        content = struct.pack('>f', value)
+    elif tag == TAG_DOUBLE:
+        content = struct.pack('>d', value)
+    elif tag == TAG_OCTET_STRING:
+        content = bytes(value)
+    elif tag == TAG_CHARACTER_STRING:
+        content = b'\x00' + value.encode('utf-8')
+    elif tag == TAG_BIT_STRING:
+        content = _bit_string_bytes(value)
+    elif tag in (TAG_DATE, TAG_TIME):
+        content = bytes(value)
+    elif tag == TAG_OBJECT_IDENTIFIER:
+        content = _object_identifier_bytes(value)
+    else:
+        raise ValueError(f'Unsupported application tag {tag}')
+
+    return _encode_tag(tag, False, len(content)) + content
+
+
+def encode_context_unsigned(number: int, value: int) -> bytes:
+    content = _unsigned_bytes(value)
+    return _encode_tag(number, True, len(content)) + content
+
+
+def encode_context_boolean(number: int, value: bool) -> bytes:
+    return _encode_tag(number, True, 1) + bytes([1 if value else 0])
+
+
+def encode_context_object_identifier(number: int, object_identifier: ObjectIdentifier) -> bytes:
+    return _encode_tag(number, True, 4) + _object_identifier_bytes(object_identifier)
+
+
+def encode_value(value: Any) -> bytes:
+    """Encode a python value with the application tag that fits its type."""
+    if value is None:
+        return encode_application(TAG_NULL, None)
+    if isinstance(value, bool):
+        return encode_application(TAG_BOOLEAN, value)
+    if isinstance(value, int):
+        return encode_application(TAG_UNSIGNED if value >= 0 else TAG_SIGNED, value)
+    if isinstance(value, float):
+        return encode_application(TAG_REAL, value)
+    if isinstance(value, str):
+        return encode_application(TAG_CHARACTER_STRING, value)
+    if isinstance(value, tuple) and len(value) == 2:
+        return encode_application(TAG_OBJECT_IDENTIFIER, value)
+    if isinstance(value, list):
+        return b''.join(encode_value(item) for item in value)
+    raise ValueError(f'Cannot encode {value!r}')
+
+
+def encode_property_value(object_type: str, property_name: str, value: Any) -> bytes:
+    """Encode value with the datatype BACnet defines for the property."""
+    if value is None:
+        return encode_application(TAG_NULL, None)
+
+    if property_name == 'priorityArray':
+        return b''.join(encode_property_value(object_type, 'presentValue', item) for item in value)
+
+    if property_name in COMMANDED_PROPERTIES:
+        if object_type in ANALOG_TYPES:
+            return encode_application(TAG_REAL, float(value))
+        if object_type in BINARY_TYPES:
+            if isinstance(value, str):
+                value = BINARY_PV.index(value)
+            return encode_application(TAG_ENUMERATED, int(value))
+        if object_type in UNSIGNED_TYPES:
+            return encode_application(TAG_UNSIGNED, int(value))
+        if object_type == 'integerValue':
+            return encode_application(TAG_SIGNED, int(value))
+
+    if property_name == 'units':
+        return encode_application(TAG_ENUMERATED, ENGINEERING_UNIT_IDS.get(value, value))
+    if property_name == 'segmentationSupported' and isinstance(value, str):
+        return encode_application(TAG_ENUMERATED, SEGMENTATION.index(value))
+    if property_name == 'statusFlags':
+        return encode_application(TAG_BIT_STRING, value)
+    if property_name in ('objectIdentifier', 'objectType'):
+        if property_name == 'objectType':
+            return encode_application(TAG_ENUMERATED, OBJECT_TYPES[value])
+        return encode_application(TAG_OBJECT_IDENTIFIER, value)
+
+    return encode_value(value)
+
+
+# Primitive decoding
+
+class Reader:
+    """Cursor over tagged BACnet data."""
+
+    def __init__(self, data: bytes, position: int = 0):
+        self.data = data
+        self.position = position
+
+    @property
+    def done(self) -> bool:
+        return self.position >= len(self.data)
+
+    def read_tag(self) -> Tuple[int, bool, int, bool, bool]:
+        """Return (number, context, length/value/type, opening, closing)."""
+        data = self.data
+        first = data[self.position]
+        self.position += 1
+
+        number = first >> 4
+        context = bool(first & 0x08)
+        length = first & 0x07
+
+        if number == 15:
+            number = data[self.position]
+            self.position += 1
+
+        if context and length == 6:
+            return number, context, 0, True, False
+        if context and length == 7:
+            return number, context, 0, False, True
+
+        if length == 5:
+            length = data[self.position]
+            self.position += 1
+            if length == 254:
+                length = int.from_bytes(data[self.position:self.position + 2], 'big')
+                self.position += 2
+            elif length == 255:
+                length = int.from_bytes(data[self.position:self.position + 4], 'big')
+                self.position += 4
+
+        return number, context, length, False, False
+
+    def peek_tag(self) -> Tuple[int, bool, int, bool, bool]:
+        position = self.position
+        try:
+            return self.read_tag()
+        finally:
+            self.position = position
+
+    def is_context(self, number: int) -> bool:
+        """Return True if the next tag is context tag number (not opening or closing)."""
+        if self.done:
+            return False
+        tag_number, context, _, opening, closing = self.peek_tag()
+        return context and tag_number == number and not opening and not closing
+
+    def is_opening(self, number: int) -> bool:
+        if self.done:
+            return False
+        tag_number, context, _, opening, _ = self.peek_tag()
+        return context and opening and tag_number == number
+
+    def is_closing(self, number: int) -> bool:
+        if self.done:
+            return False
+        tag_number, context, _, _, closing = self.peek_tag()
+        return context and closing and tag_number == number
+
+    def read_bytes(self, length: int) -> bytes:
+        content = self.data[self.position:self.position + length]
+        self.position += length
+        return content
+
+    def expect_opening(self, number: int):
+        tag_number, _, _, opening, _ = self.read_tag()
+        if not opening or tag_number != number:
+            raise ValueError(f'Expected opening tag {number}')
+
+    def expect_closing(self, number: int):
+        tag_number, _, _, _, closing = self.read_tag()
+        if not closing or tag_number != number:
+            raise ValueError(f'Expected closing tag {number}')
+
+    def read_context_unsigned(self, number: int) -> int:
+        tag_number, context, length, _, _ = self.read_tag()
+        if not context or tag_number != number:
+            raise ValueError(f'Expected context tag {number}')
+        return int.from_bytes(self.read_bytes(length), 'big')
+
+    def read_context_boolean(self, number: int) -> bool:
+        return bool(self.read_context_unsigned(number))
+
+    def read_context_object_identifier(self, number: int) -> ObjectIdentifier:
+        return _decode_object_identifier(self.read_bytes_for_context(number))
+
+    def read_bytes_for_context(self, number: int) -> bytes:
+        tag_number, context, length, _, _ = self.read_tag()
+        if not context or tag_number != number:
+            raise ValueError(f'Expected context tag {number}')
+        return self.read_bytes(length)
+
+    def read_application(self) -> Tuple[int, Any]:
+        """Read one application-tagged value, returning (tag, value)."""
+        tag, context, length, opening, closing = self.read_tag()
+        if context or opening or closing:
+            raise ValueError('Expected application tag')
+
+        if tag == TAG_NULL:
+            return tag, None
+        if tag == TAG_BOOLEAN:
+            return tag, bool(length)
+
+        content = self.read_bytes(length)
+        if tag in (TAG_UNSIGNED, TAG_ENUMERATED):
+            return tag, int.from_bytes(content, 'big')
+        if tag == TAG_SIGNED:
+            return tag, int.from_bytes(content, 'big', signed=True)
+        if tag == TAG_REAL:
+            return tag, struct.unpack('>f', content)[0]
+        if tag == TAG_DOUBLE:
+            return tag, struct.unpack('>d', content)[0]
+        if tag == TAG_OCTET_STRING:
+            return tag, content
+        if tag == TAG_CHARACTER_STRING:
+            return tag, content[1:].decode('utf-8', errors='replace')
+        if tag == TAG_BIT_STRING:
+            unused = content[0]
+            bits = [
+                (byte >> (7 - i)) & 1
+                for byte in content[1:]
+                for i in range(8)
+            ]
+            return tag, bits[:len(bits) - unused]
+        if tag in (TAG_DATE, TAG_TIME):
+            return tag, tuple(content)
+        if tag == TAG_OBJECT_IDENTIFIER:
+            return tag, _decode_object_identifier(content)
+        return tag, content
+
+    def read_values_until_closing(self, number: int) -> List[Tuple[int, Any]]:
+        """Read application values up to (and including) closing tag number."""
+        values = []
+        while not self.is_closing(number):
+            values.append(self.read_application())
+        self.expect_closing(number)
+        return values
+
+
+def _decode_object_identifier(content: bytes) -> ObjectIdentifier:
+    value = int.from_bytes(content, 'big')
+    object_type = value >> 22
+    return OBJECT_TYPE_NAMES.get(object_type, object_type), value & 0x3FFFFF
+
+
+def decode_property_value(
+    object_type: str,
+    property_name: str,
+    values: List[Tuple[int, Any]],
+    index: int | None = None,
+) -> Any:
+    """Turn decoded application values into the python value BAC0 would return."""
+    def convert(tag: int, value: Any) -> Any:
+        if tag != TAG_ENUMERATED:
+            return value
+        if object_type in BINARY_TYPES and property_name in COMMANDED_PROPERTIES and value < 2:
+            return BINARY_PV[value]
+        if property_name == 'segmentationSupported' and value < len(SEGMENTATION):
+            return SEGMENTATION[value]
+        if property_name == 'units':
+            return ENGINEERING_UNITS.get(value, value)
+        if property_name == 'objectType':
+            return OBJECT_TYPE_NAMES.get(value, value)
+        return value
+
+    converted = [convert(tag, value) for tag, value in values]
+
+    if index is None and property_name in ('priorityArray', 'objectList', 'stateText', 'propertyList'):
+        return converted
+    if len(converted) == 1:
+        return converted[0]
+    if not converted:
+        return None
+    return converted
+
+
+# Framing
+
+def encode_frame(apdu: bytes, expecting_reply: bool = False) -> bytes:
+    """Wrap an APDU in NPDU and BVLC headers for unicast delivery."""
+    npdu = bytes([NPDU_VERSION, NPDU_EXPECTING_REPLY if expecting_reply else 0x00])
+    length = 4 + len(npdu) + len(apdu)
+    return bytes([BVLC_TYPE, BVLC_ORIGINAL_UNICAST_NPDU]) + length.to_bytes(2, 'big') + npdu + apdu
+
+
+def decode_frame(data: bytes) -> APDU | None:
+    """Return the APDU carried by a BACnet/IP datagram, or None for anything else."""
+    if len(data) < 6 or data[0] != BVLC_TYPE:
+        return None
+
+    function = data[1]
+    position = 4
+    if function == BVLC_FORWARDED_NPDU:
+        position += 6
+    elif function not in (BVLC_ORIGINAL_UNICAST_NPDU, BVLC_ORIGINAL_BROADCAST_NPDU):
+        return None
+
+    if data[position] != NPDU_VERSION:
+        return None
+    control = data[position + 1]
+    position += 2
+
+    if control & 0x80:
+        # Network layer message, not for us
+        return None
+    if control & 0x20:
+        dlen = data[position + 2]
+        position += 3 + dlen
+    if control & 0x08:
+        slen = data[position + 2]
+        position += 3 + slen
+    if control & 0x20:
+        position += 1  # hop count
+
+    return decode_apdu(data[position:])
+
+
+def decode_apdu(apdu: bytes) -> APDU:
+    pdu_type = apdu[0] >> 4
+
+    if pdu_type == CONFIRMED_REQUEST:
+        segmented = bool(apdu[0] & 0x08)
+        return APDU(
+            pdu_type,
+            service=apdu[3],
+            invoke_id=apdu[2],
+            payload=apdu[4:],
+            max_apdu=MAX_APDU_DECODING.get(apdu[1] & 0x0F, 1476),
+            segmented=segmented,
+        )
+    if pdu_type == UNCONFIRMED_REQUEST:
+        return APDU(pdu_type, service=apdu[1], payload=apdu[2:])
+    if pdu_type == SIMPLE_ACK:
+        return APDU(pdu_type, service=apdu[2], invoke_id=apdu[1])
+    if pdu_type == COMPLEX_ACK:
+        if apdu[0] & 0x08:
+            return APDU(pdu_type, service=apdu[4], invoke_id=apdu[1], payload=apdu[5:], segmented=True)
+        return APDU(pdu_type, service=apdu[2], invoke_id=apdu[1], payload=apdu[3:])
+    if pdu_type == ERROR:
+        return APDU(pdu_type, service=apdu[2], invoke_id=apdu[1], payload=apdu[3:])
+    if pdu_type in (REJECT, ABORT):
+        return APDU(pdu_type, invoke_id=apdu[1], reason=apdu[2])
+    return APDU(pdu_type)
+
+
+def encode_confirmed_request(invoke_id: int, service: int, payload: bytes, max_apdu: int = 1476) -> bytes:
+    return bytes([CONFIRMED_REQUEST << 4, MAX_APDU_ENCODING[max_apdu], invoke_id, service]) + payload
+
+
+def encode_unconfirmed_request(service: int, payload: bytes) -> bytes:
+    return bytes([UNCONFIRMED_REQUEST << 4, service]) + payload
+
+
+def encode_simple_ack(invoke_id: int, service: int) -> bytes:
+    return bytes([SIMPLE_ACK << 4, invoke_id, service])
+
+
+def encode_complex_ack(invoke_id: int, service: int, payload: bytes) -> bytes:
+    return bytes([COMPLEX_ACK << 4, invoke_id, service]) + payload
+
+
+def encode_error(invoke_id: int, service: int, error_class: int, error_code: int) -> bytes:
+    return bytes([ERROR << 4, invoke_id, service]) + encode_application(TAG_ENUMERATED, error_class) \
+        + encode_application(TAG_ENUMERATED, error_code)
+
+
+def encode_reject(invoke_id: int, reason: int) -> bytes:
+    return bytes([REJECT << 4, invoke_id, reason])
+
+
+def encode_abort(invoke_id: int, reason: int, server: bool = True) -> bytes:
+    return bytes([(ABORT << 4) | (0x01 if server else 0x00), invoke_id, reason])
+
+
+def decode_error(payload: bytes) -> Tuple[int, int]:
+    """Return (error class, error code) of an Error PDU."""
+    reader = Reader(payload)
+    if reader.is_opening(0):
+        reader.expect_opening(0)
+    _, error_class = reader.read_application()
+    _, error_code = reader.read_application()
+    return error_class, error_code
+
+
+def raise_for_apdu(apdu: APDU):
+    """Raise the BACnetError matching an Error, Reject or Abort PDU."""
+    if apdu.pdu_type == ERROR:
+        error_class, error_code = decode_error(apdu.payload)
+        raise BACnetError(f'error class {error_class}, code {error_code}', error_class, error_code)
+    if apdu.pdu_type == REJECT:
+        raise BACnetReject(f'rejected, reason {apdu.reason}', reason=apdu.reason)
+    if apdu.pdu_type == ABORT:
+        raise BACnetAbort(f'aborted, reason {apdu.reason}', reason=apdu.reason)
+
+
+# ReadProperty
+
+def encode_read_property(object_identifier: ObjectIdentifier, property_name: str) -> bytes:
+    name, index = parse_property(property_name)
+    payload = encode_context_object_identifier(0, object_identifier) + encode_context_unsigned(1, property_id(name))
+    if index is not None:
+        payload += encode_context_unsigned(2, index)
+    return payload
+
+
+def decode_read_property(payload: bytes) -> Tuple[ObjectIdentifier, str]:
+    reader = Reader(payload)
+    object_identifier = reader.read_context_object_identifier(0)
+    name = property_name(reader.read_context_unsigned(1))
+    index = reader.read_context_unsigned(2) if reader.is_context(2) else None
+    return object_identifier, format_property(name, index)
+
+
+def encode_read_property_ack(object_identifier: ObjectIdentifier, property_name: str, value: Any) -> bytes:
+    name, index = parse_property(property_name)
+    payload = encode_context_object_identifier(0, object_identifier) + encode_context_unsigned(1, property_id(name))
+    if index is not None:
+        payload += encode_context_unsigned(2, index)
+    return payload + opening_tag(3) + encode_property_value(object_identifier[0], name, value) + closing_tag(3)
+
+
+def decode_read_property_ack(payload: bytes) -> Tuple[ObjectIdentifier, str, Any]:
+    reader = Reader(payload)
+    object_identifier = reader.read_context_object_identifier(0)
+    name = property_name(reader.read_context_unsigned(1))
+    index = reader.read_context_unsigned(2) if reader.is_context(2) else None
+    reader.expect_opening(3)
+    values = reader.read_values_until_closing(3)
+    return object_identifier, format_property(name, index), decode_property_value(object_identifier[0], name, values, index)
+
+
+# ReadPropertyMultiple
+
+def encode_read_property_multiple(objects: Dict[ObjectIdentifier, List[str]]) -> bytes:
+    payload = bytearray()
+    for object_identifier, property_names in objects.items():
+        payload += encode_context_object_identifier(0, object_identifier)
+        payload += opening_tag(1)
+        for property_name_ in property_names:
+            name, index = parse_property(property_name_)
+            payload += encode_context_unsigned(0, property_id(name))
+            if index is not None:
+                payload += encode_context_unsigned(1, index)
+        payload += closing_tag(1)
+    return bytes(payload)
+
+
+def decode_read_property_multiple(payload: bytes) -> Dict[ObjectIdentifier, List[str]]:
+    reader = Reader(payload)
+    objects: Dict[ObjectIdentifier, List[str]] = {}
+    while not reader.done:
+        object_identifier = reader.read_context_object_identifier(0)
+        reader.expect_opening(1)
+        properties = objects.setdefault(object_identifier, [])
+        while not reader.is_closing(1):
+            name = property_name(reader.read_context_unsigned(0))
+            index = reader.read_context_unsigned(1) if reader.is_context(1) else None
+            properties.append(format_property(name, index))
+        reader.expect_closing(1)
+    return objects
+
+
+def encode_read_property_multiple_ack(results: Dict[ObjectIdentifier, List[Tuple[str, Any]]]) -> bytes:
+    """Encode results; a value of BACnetError type is sent as a property access error."""
+    payload = bytearray()
+    for object_identifier, properties in results.items():
+        payload += encode_context_object_identifier(0, object_identifier)
+        payload += opening_tag(1)
+        for property_name_, value in properties:
+            name, index = parse_property(property_name_)
+            payload += encode_context_unsigned(2, property_id(name))
+            if index is not None:
+                payload += encode_context_unsigned(3, index)
+            if isinstance(value, PropertyError):
+                payload += opening_tag(5)
+                payload += encode_application(TAG_ENUMERATED, value.error_class)
+                payload += encode_application(TAG_ENUMERATED, value.error_code)
+                payload += closing_tag(5)
+            else:
+                payload += opening_tag(4)
+                payload += encode_property_value(object_identifier[0], name, value)
+                payload += closing_tag(4)
+        payload += closing_tag(1)
+    return bytes(payload)
+
+
+def decode_read_property_multiple_ack(payload: bytes) -> Dict[ObjectIdentifier, List[Tuple[str, Any]]]:
+    """Decode an RPM-ACK into BAC0's result layout. Properties read with an error are left out."""
+    reader = Reader(payload)
+    results: Dict[ObjectIdentifier, List[Tuple[str, Any]]] = {}
+    while not reader.done:
+        object_identifier = reader.read_context_object_identifier(0)
+        reader.expect_opening(1)
+        properties = results.setdefault(object_identifier, [])
+        while not reader.is_closing(1):
+            name = property_name(reader.read_context_unsigned(2))
+            index = reader.read_context_unsigned(3) if reader.is_context(3) else None
+            if reader.is_opening(4):
+                reader.expect_opening(4)
+                values = reader.read_values_until_closing(4)
+                properties.append((
+                    format_property(name, index),
+                    decode_property_value(object_identifier[0], name, values, index),
+                ))
+            else:
+                reader.expect_opening(5)
+                reader.read_values_until_closing(5)
+        reader.expect_closing(1)
+    return results
+
+
+@dataclass
+class PropertyError:
+    """Error returned for a single property inside an RPM-ACK."""
+
+    error_class: int = 2  # property
+    error_code: int = 32  # unknown-property
+
+
+# WriteProperty and WritePropertyMultiple
+
+def encode_write_property(
+    object_identifier: ObjectIdentifier,
+    property_name: str,
+    value: Any,
+    priority: int | None = None,
+) -> bytes:
+    name, index = parse_property(property_name)
+    payload = encode_context_object_identifier(0, object_identifier) + encode_context_unsigned(1, property_id(name))
+    if index is not None:
+        payload += encode_context_unsigned(2, index)
+    payload += opening_tag(3) + encode_property_value(object_identifier[0], name, value) + closing_tag(3)
+    if priority is not None:
+        payload += encode_context_unsigned(4, priority)
+    return payload
+
+
+def decode_write_property(payload: bytes) -> Tuple[ObjectIdentifier, str, Any, int | None]:
+    reader = Reader(payload)
+    object_identifier = reader.read_context_object_identifier(0)
+    name = property_name(reader.read_context_unsigned(1))
+    index = reader.read_context_unsigned(2) if reader.is_context(2) else None
+    reader.expect_opening(3)
+    values = reader.read_values_until_closing(3)
+    priority = reader.read_context_unsigned(4) if reader.is_context(4) else None
+    return (
+        object_identifier,
+        format_property(name, index),
+        decode_property_value(object_identifier[0], name, values, index),
+        priority,
+    )
+
+
+def encode_write_property_multiple(writes: List[Tuple[ObjectIdentifier, str, Any, int | None]]) -> bytes:
+    payload = bytearray()
+    for object_identifier, property_name_, value, priority in writes:
+        name, index = parse_property(property_name_)
+        payload += encode_context_object_identifier(0, object_identifier)
+        payload += opening_tag(1)
+        payload += encode_context_unsigned(0, property_id(name))
+        if index is not None:
+            payload += encode_context_unsigned(1, index)
+        payload += opening_tag(2) + encode_property_value(object_identifier[0], name, value) + closing_tag(2)
+        if priority is not None:
+            payload += encode_context_unsigned(3, priority)
+        payload += closing_tag(1)
+    return bytes(payload)
+
+
+def decode_write_property_multiple(payload: bytes) -> List[Tuple[ObjectIdentifier, str, Any, int | None]]:
+    reader = Reader(payload)
+    writes = []
+    while not reader.done:
+        object_identifier = reader.read_context_object_identifier(0)
+        reader.expect_opening(1)
+        while not reader.is_closing(1):
+            name = property_name(reader.read_context_unsigned(0))
+            index = reader.read_context_unsigned(1) if reader.is_context(1) else None
+            reader.expect_opening(2)
+            values = reader.read_values_until_closing(2)
+            priority = reader.read_context_unsigned(3) if reader.is_context(3) else None
+            writes.append((
+                object_identifier,
+                format_property(name, index),
+                decode_property_value(object_identifier[0], name, values, index),
+                priority,
+            ))
+        reader.expect_closing(1)
+    return writes
+
+
+# SubscribeCOV and notifications
+
+def encode_subscribe_cov(
+    process_id: int,
+    object_identifier: ObjectIdentifier,
+    confirmed: bool = False,
+    lifetime: int | None = None,
+    cancel: bool = False,
+) -> bytes:
+    payload = encode_context_unsigned(0, process_id) + encode_context_object_identifier(1, object_identifier)
+    if not cancel:
+        payload += encode_context_boolean(2, confirmed)
+        if lifetime is not None:
+            payload += encode_context_unsigned(3, lifetime)
+    return payload
+
+
+def decode_subscribe_cov(payload: bytes) -> Tuple[int, ObjectIdentifier, bool | None, int | None]:
+    """Return (process id, object, confirmed, lifetime). confirmed is None for a cancellation."""
+    reader = Reader(payload)
+    process_id = reader.read_context_unsigned(0)
+    object_identifier = reader.read_context_object_identifier(1)
+    confirmed = reader.read_context_boolean(2) if reader.is_context(2) else None
+    lifetime = reader.read_context_unsigned(3) if reader.is_context(3) else None
+    return process_id, object_identifier, confirmed, lifetime
+
+
+def encode_cov_notification(
+    process_id: int,
+    device_identifier: ObjectIdentifier,
+    object_identifier: ObjectIdentifier,
+    time_remaining: int,
+    properties: List[Tuple[str, Any]],
+) -> bytes:
+    payload = bytearray()
+    payload += encode_context_unsigned(0, process_id)
+    payload += encode_context_object_identifier(1, device_identifier)
+    payload += encode_context_object_identifier(2, object_identifier)
+    payload += encode_context_unsigned(3, time_remaining)
+    payload += opening_tag(4)
+    for name, value in properties:
+        payload += encode_context_unsigned(0, property_id(name))
+        payload += opening_tag(2) + encode_property_value(object_identifier[0], name, value) + closing_tag(2)
+    payload += closing_tag(4)
+    return bytes(payload)
+
+
+def decode_cov_notification(payload: bytes) -> Tuple[int, ObjectIdentifier, ObjectIdentifier, int, Dict[str, Any]]:
+    """Return (process id, device, object, time remaining, properties)."""
+    reader = Reader(payload)
+    process_id = reader.read_context_unsigned(0)
+    device_identifier = reader.read_context_object_identifier(1)
+    object_identifier = reader.read_context_object_identifier(2)
+    time_remaining = reader.read_context_unsigned(3)
+
+    properties: Dict[str, Any] = {}
+    reader.expect_opening(4)
+    while not reader.is_closing(4):
+        name = property_name(reader.read_context_unsigned(0))
+        index = reader.read_context_unsigned(1) if reader.is_context(1) else None
+        reader.expect_opening(2)
+        values = reader.read_values_until_closing(2)
+        if reader.is_context(3):
+            reader.read_context_unsigned(3)
+        properties[format_property(name, index)] = decode_property_value(object_identifier[0], name, values, index)
+    reader.expect_closing(4)
+
+    return process_id, device_identifier, object_identifier, time_remaining, properties
@@ -0,0 +1,114 @@
+import asyncio
+
+from functools import partial
+from typing import Any, Callable, Dict, List
+from logging import Logger, getLogger
+
+from .device_property import DeviceProperty
+from .session import BACnetSession
+from .typing import ObjectIdentifier
+
+LOGGER: Logger = getLogger(__package__)
+
+# Object types that support SubscribeCOV on the Nordic controllers
+COV_OBJECT_TYPES = ('analogInput', 'analogValue', 'binaryValue', 'multiStateValue')
+
+# Requested subscription lifetime in seconds
+DEFAULT_COV_LIFETIME = 300
+
+# Fraction of the lifetime after which subscriptions are renewed
+RENEWAL_RATIO = 0.75
+
+NotificationCallback = Callable[[ObjectIdentifier, Dict[str, Any]], None]
+
+
+def cov_properties(device_properties: List[DeviceProperty]) -> List[DeviceProperty]:
+    """Return the device properties that can be subscribed to."""
+    return [
+        dp
+        for dp in device_properties
+        if dp.object_type in COV_OBJECT_TYPES
+    ]
+
+
+class COVSubscriptions:
+    """Keeps SubscribeCOV registrations alive and routes notifications."""
+
+    def __init__(
+        self,
+        session: BACnetSession,
+        device_address: str,
+        device_properties: List[DeviceProperty],
+        on_notification: NotificationCallback,
+        lifetime: int = DEFAULT_COV_LIFETIME,
+        on_change: Callable[[], None] | None = None,
+    ):
+        self.session = session
+        self.device_address = device_address
+        self.device_properties = cov_properties(device_properties)
+        self.lifetime = lifetime
+        self._on_notification = on_notification
+        # Called whenever the set of subscribed objects changes
+        self._on_change = on_change
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._renewal: asyncio.TimerHandle | None = None
+        self._task: asyncio.Task | None = None
+
+        self.subscribed: set[ObjectIdentifier] = set()
+        self.notification_count: int = 0
+
+    async def async_start(self):
+        """Subscribe to all properties and schedule renewal."""
+        self._loop = asyncio.get_running_loop()
+        await self._async_subscribe_all()
+
+    async def async_stop(self):
+        """Cancel renewal and all subscriptions."""
+        if self._renewal is not None:
+            self._renewal.cancel()
+            self._renewal = None
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+        for dp in self.device_properties:
+            if dp.object_identifier not in self.subscribed:
+                continue
+            try:
+                await self.session.async_unsubscribe_cov(self.device_address, dp.object_identifier)
+            except Exception as e:
+                LOGGER.debug("Error cancelling COV subscription %s, %s", dp.object_path, e)
+        self.subscribed.clear()
+
+    async def _async_subscribe_all(self):
+        subscribed = set(self.subscribed)
+        for dp in self.device_properties:
+            try:
+                await self.session.async_subscribe_cov(
+                    self.device_address,
+                    dp.object_identifier,
+                    self.lifetime,
+                    partial(self._notification, dp.object_identifier),
+                )
+            except Exception as e:
+                LOGGER.warning("Error subscribing to COV %s, %s", dp.object_path, e)
+                self.subscribed.discard(dp.object_identifier)
+            else:
+                self.subscribed.add(dp.object_identifier)
+
+        LOGGER.debug("Subscribed to %s of %s objects", len(self.subscribed), len(self.device_properties))
+        if self.subscribed != subscribed and self._on_change is not None:
+            self._on_change()
+        self._renewal = self._loop.call_later(self.lifetime * RENEWAL_RATIO, self._renew)
+
+    def _renew(self):
+        self._renewal = None
+        self._task = self._loop.create_task(self._async_subscribe_all())
+
+    def _notification(self, object_identifier: ObjectIdentifier, properties: Dict[str, Any]):
+        """Called by the session, possibly from another thread, on every COV notification."""
+        self._loop.call_soon_threadsafe(self._dispatch, object_identifier, properties)
+
+    def _dispatch(self, object_identifier: ObjectIdentifier, properties: Dict[str, Any]):
+        self.notification_count += 1
+        self._on_notification(object_identifier, properties)
@@ -1,24 +1,153 @@
+import math
+import time
 import asyncio
+import concurrent.futures
 
-from typing import Any
+from functools import cached_property
+from typing import Any, Callable, Collection, Dict, List, Tuple, Union
 from logging import Logger, getLogger
 
-from . import bacnet
-from .device_property import PRESENT_VALUE
+from . import bacnet, discovery
+from .cov import COVSubscriptions, DEFAULT_COV_LIFETIME
+from .discovery import Catalogue
+from .health import CircuitBreaker
+from .device_property import PRESENT_VALUE, PRIORITY_ARRAY, POLL_TIER_NORMAL, POLL_TIER_SLOW, raw_value
 from .nordic import *
-from .typing import DeviceState
+from .priority import DEFAULT_PRIORITY, RELINQUISH_DEFAULT, PriorityState, check_priority, priority_value
+from .scheduler import PollScheduler
+from .session import (
+    TRANSPORT_BAC0,
+    BACnetSession,
+    async_get_session,
+    async_release_session,
+    async_resolve_local_ip,
+    invalidate_local_ips,
+    is_unreachable,
+)
+from .state import DeviceStateStore
+from .telemetry import Telemetry
+from .bacnet import DeviceLimits
+from .typing import ObjectIdentifier
+from .write_queue import WriteQueue, DEFAULT_WRITE_DEBOUNCE
 
 LOGGER: Logger = getLogger(__package__)
 
+# Seconds before device limits are read again after a failure, doubled up to the maximum
+LIMITS_INITIAL_BACKOFF = 60
+LIMITS_MAX_BACKOFF = 3600
+
+WriteFuture = Union['asyncio.Task[int]', 'concurrent.futures.Future[int]']
+
+# Device properties each FlexitBACnet attribute is derived from
+ATTRIBUTE_PROPERTIES: Dict[str, Tuple[DeviceProperty, ...]] = {
+    'outside_air_temperature': (OUTSIDE_AIR_TEMPERATURE,),
+    'supply_air_temperature': (SUPPLY_AIR_TEMPERATURE,),
+    'exhaust_air_temperature': (EXHAUST_AIR_TEMPERATURE,),
+    'extract_air_temperature': (EXTRACT_AIR_TEMPERATURE,),
+    'room_temperature': (ROOM_TEMPERATURE,),
+    'comfort_button': (COMFORT_BUTTON,),
+    'operation_mode': (OPERATION_MODE,),
+    'ventilation_mode': (VENTILATION_MODE,),
+    'air_temp_setpoint_away': (AIR_TEMP_SETPOINT_AWAY,),
+    'air_temp_setpoint_home': (AIR_TEMP_SETPOINT_HOME,),
+    'fireplace_ventilation_duration': (FIREPLACE_VENTILATION_RUNTIME,),
+    'fireplace_ventilation_remaining_duration': (FIREPLACE_VENTILATION_REMAINING_DURATION,),
+    'rapid_ventilation_duration': (RAPID_VENTILATION_RUNTIME,),
+    'rapid_ventilation_remaining_duration': (RAPID_VENTILATION_REMAINING_DURATION,),
+    'supply_air_fan_control_signal': (FAN_SPEED_SUPPLY_AIR,),
+    'supply_air_fan_rpm': (TACHO_SUPPLY_FAN,),
+    'exhaust_air_fan_control_signal': (FAN_SPEED_EXHAUST_AIR,),
+    'exhaust_air_fan_rpm': (TACHO_EXHAUST_FAN,),
+    'electric_heater': (ELECTRICAL_HEATER,),
+    'electric_heater_nominal_power': (ELECTRIC_HEATER_NOM_POWER,),
+    'electric_heater_power': (HEATING_COIL_ELECTRIC_POWER,),
+    'fan_setpoint_supply_air_home': (LINEAR_SETPOINT_SUPPLY_AIR_HOME,),
+    'fan_setpoint_extract_air_home': (LINEAR_SETPOINT_EXHAUST_AIR_HOME,),
+    'fan_setpoint_supply_air_high': (LINEAR_SETPOINT_SUPPLY_AIR_HIGH,),
+    'fan_setpoint_extract_air_high': (LINEAR_SETPOINT_EXHAUST_AIR_HIGH,),
+    'fan_setpoint_supply_air_away': (LINEAR_SETPOINT_SUPPLY_AIR_AWAY,),
+    'fan_setpoint_extract_air_away': (LINEAR_SETPOINT_EXHAUST_AIR_AWAY,),
+    'fan_setpoint_supply_air_cooker': (LINEAR_SETPOINT_SUPPLY_AIR_COOKER,),
+    'fan_setpoint_extract_air_cooker': (LINEAR_SETPOINT_EXHAUST_AIR_COOKER,),
+    'fan_setpoint_supply_air_fire': (LINEAR_SETPOINT_SUPPLY_AIR_FIRE,),
+    'fan_setpoint_extract_air_fire': (LINEAR_SETPOINT_EXHAUST_AIR_FIRE,),
+    'air_filter_operating_time': (AIR_FILTER_OPERATING_TIME,),
+    'air_filter_exchange_interval': (AIR_FILTER_TIME_PERIOD_FOR_EXCHANGE,),
+    'air_filter_polluted': (AIR_FILTER_OPERATING_TIME, AIR_FILTER_TIME_PERIOD_FOR_EXCHANGE),
+    'heat_exchanger_efficiency': (ROTATING_HEAT_EXCHANGER_EFFICIENCY,),
+    'heat_exchanger_speed': (ROTATING_HEAT_EXCHANGER_SPEED,),
+    'scheduler_override': (SCHEDULER_OVERRIDE,),
+}
+
+def _same_value(read: Any, written: Any) -> bool:
+    """Compare a value read back with the one written, allowing for REAL precision."""
+    if isinstance(read, float) and isinstance(written, (int, float)):
+        return math.isclose(read, written, rel_tol=1e-6, abs_tol=1e-6)
+    return read == written
+
+
+def _running_loop() -> asyncio.AbstractEventLoop | None:
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
 class FlexitBACnet:
-    def __init__(self, hass, device_address: str, device_id: int):
+    def __init__(
+        self,
+        hass,
+        device_address: str,
+        device_id: int,
+        poll_intervals: Dict[str, float] | None = None,
+        write_debounce: float = DEFAULT_WRITE_DEBOUNCE,
+        transport: str = TRANSPORT_BAC0,
+        interface: str | None = None,
+    ):
         self.hass = hass
         self.device_address = device_address
         self.device_id = device_id
-        self._state: DeviceState | None = None
+        self.transport = transport
+        self.interface = interface
+        self.session: BACnetSession | None = None
+        self.scheduler = PollScheduler(poll_intervals)
+        self.limits: DeviceLimits | None = None
+        self._limits_retry_at: float | None = None
+        self._limits_backoff: float = LIMITS_INITIAL_BACKOFF
+        self.batch_timings: List[float] = []
+        self.wpm_supported: bool = True
+        self.write_queue = WriteQueue(self._async_write, write_debounce)
+        self.health = CircuitBreaker()
+        self.health.add_listener(self._health_changed)
+        # Phases of refresh and write, see Telemetry.add_span_hook
+        self.telemetry = Telemetry()
+        self.cov: COVSubscriptions | None = None
+        # Seconds between polls of objects pushed over COV, see async_start_cov
+        self._cov_sweep_interval: float | None = None
+        self.catalogue: Catalogue | None = None
+        self._tracked: Dict[ObjectIdentifier, DeviceProperty] = {}
+        # Copies of properties with other read_values, see _read_property
+        self._read_property_cache: Dict[Tuple[ObjectIdentifier, Tuple[str, ...]], DeviceProperty] = {}
+        # Last priority array read of each commanded object
+        self.priorities: Dict[ObjectIdentifier, PriorityState] = {}
+        # Writes the device did not take, e.g. overridden at a higher priority
+        self.write_overrides: int = 0
+        # Known properties read on refresh, see set_read_objects
+        self._read_properties: List[DeviceProperty] = DEVICE_PROPERTIES
+        self._listeners: list[Callable[[], None]] = []
+        self._state = DeviceStateStore()
         self._available: bool = True
-        self._refreshing: bool = False
-        self._writing: bool = False
+        self._refresh_task: asyncio.Task | None = None
+        self._refresh_full: bool = False
+        self._writes_in_flight: int = 0
+        self._writes_done = asyncio.Event()
+        self._writes_done.set()
+
+        # Incremented after every completed write and every successful refresh
+        self.write_generation: int = 0
+        self.state_generation: int = 0
+        # Write generation that was complete when the current state was read
+        self.state_write_generation: int = 0
 
     def is_valid(self) -> bool:
         """Return True if device address and device ID point to a valid BACnet peer."""
@@ -27,54 +156,505 @@ class FlexitBACnet:
         except ConnectionError:
             return False
 
+    async def async_connect(self) -> BACnetSession:
+        """Attach to the shared BACnet session for this device's interface.
+
+        Uses the configured interface, or the one that reaches the device. If
+        that changed since the last call, the session is swapped.
+        """
+        local_ip = self.interface or await async_resolve_local_ip(self.hass, self.device_address)
+        if self.session is not None and self.session.local_ip != local_ip:
+            LOGGER.debug("Local interface changed to %s", local_ip)
+            session, self.session = self.session, None
+            await async_release_session(session)
+
+        if self.session is None:
+            self.session = await async_get_session(self.hass, local_ip, self.transport)
+            if self.cov is not None:
+                # Subscriptions move to the new session when they are renewed
+                self.cov.session = self.session
+        await self.session.async_connect()
+        return self.session
+
+    async def async_close(self):
+        """Detach from the shared BACnet session."""
+        await self.write_queue.async_flush()
+        await self.async_stop_cov()
+        session, self.session = self.session, None
+        if session is not None:
+            await async_release_session(session)
+
+    async def async_start_cov(self, lifetime: int = DEFAULT_COV_LIFETIME, sweep_interval: float | None = None):
+        """Subscribe to change-of-value notifications for all supported properties.
+
+        sweep_interval -- seconds between consistency polls of subscribed properties
+        """
+        if self.cov is not None:
+            return
+
+        session = await self.async_connect()
+        self.cov = COVSubscriptions(
+            session,
+            self.device_address,
+            DEVICE_PROPERTIES,
+            self._apply_notification,
+            lifetime,
+            self._apply_sweep_interval,
+        )
+        self._cov_sweep_interval = sweep_interval
+        await self.cov.async_start()
+
+    async def async_stop_cov(self):
+        """Cancel change-of-value subscriptions."""
+        if self.cov is None:
+            return
+
+        self.scheduler.override_interval(self.cov.device_properties, None)
+        cov, self.cov = self.cov, None
+        await cov.async_stop()
+
+    def _apply_sweep_interval(self):
+        """Poll subscribed objects every sweep interval, and the others at their tier again."""
+        if self.cov is None or self._cov_sweep_interval is None:
+            return
+
+        subscribed = [dp for dp in self.cov.device_properties if dp.object_identifier in self.cov.subscribed]
+        dropped = [dp for dp in self.cov.device_properties if dp.object_identifier not in self.cov.subscribed]
+        self.scheduler.override_interval(subscribed, self._cov_sweep_interval)
+        self.scheduler.override_interval(dropped, None)
+
+    async def async_load_catalogue(self, cached: Dict[str, dict] | None = None) -> Catalogue:
+        """Return the catalogue of the device's objects.
+
+        cached maps firmware revisions to Catalogue.as_dict() results. The
+        device is only asked for its object list if its firmware is not in it.
+        """
+        session = await self.async_connect()
+        limits = await self._async_get_limits(session)
+        firmware_revision = await discovery.read_firmware_revision(session, self.device_address, self.device_id)
+
+        if cached and firmware_revision in cached:
+            self.catalogue = Catalogue.from_dict(cached[firmware_revision])
+        else:
+            LOGGER.debug("Discovering objects of firmware %s", firmware_revision)
+            self.catalogue = await discovery.discover(
+                session,
+                self.device_address,
+                self.device_id,
+                limits,
+                firmware_revision,
+            )
+        return self.catalogue
+
     @property
+    def read_properties(self) -> List[DeviceProperty]:
+        return self._read_properties
+
+    def set_read_objects(self, object_identifiers: Collection[ObjectIdentifier] | None) -> bool:
+        """Limit refreshes to the known properties of object_identifiers.
+
+        None reads every known property. Returns True if some of the
+        properties now read have never been read, so a refresh is due.
+        """
+        if object_identifiers is None:
+            self._read_properties = DEVICE_PROPERTIES
+        else:
+            self._read_properties = [
+                dp
+                for dp in DEVICE_PROPERTIES
+                if dp.object_identifier in object_identifiers
+            ]
+        LOGGER.debug("Reading %s of %s known properties", len(self._read_properties), len(DEVICE_PROPERTIES))
+        return any(dp.object_identifier not in self._state for dp in self._read_properties)
+
+    def track(self, device_property: DeviceProperty):
+        """Read device_property on every refresh, in addition to the known ones."""
+        self._tracked[device_property.object_identifier] = device_property
+
+    def untrack(self, device_property: DeviceProperty):
+        self._tracked.pop(device_property.object_identifier, None)
+
+    def get_object_value(self, object_identifier: ObjectIdentifier, value_name: str = PRESENT_VALUE) -> Any:
+        """Return a value of any object read so far, or None."""
+        try:
+            return self._state.get(object_identifier, value_name)
+        except KeyError:
+            return None
+
+    def add_listener(self, listener: Callable[[], None]) -> Callable[[], None]:
+        """Call listener whenever state is pushed by the device. Returns a remove function."""
+        self._listeners.append(listener)
+        return lambda: self._listeners.remove(listener)
+
+    def _apply_notification(self, object_identifier: ObjectIdentifier, properties: Dict[str, Any]):
+        if not self._state or not properties:
+            return
+
+        self._state.update_object(object_identifier, properties.items())
+        LOGGER.debug("COV notification %s %s", object_identifier, properties)
+
+        for listener in list(self._listeners):
+            listener()
+
+    @property
+    def identified(self) -> bool:
+        """Return True once the device's name and serial number are known."""
+        return self._state.timestamp(self._device_property.object_identifier, 'description') is not None
+
+    async def async_read_identity(self) -> bool:
+        """Read the device object only. Returns True if the device answered."""
+        try:
+            session = await self.async_connect()
+            result = await bacnet.read_multiple(session, self.device_address, [self._device_property])
+        except Exception as e:
+            LOGGER.warning("Could not read device identity, %s", e)
+            return False
+
+        self._state.update(result)
+        return self.identified
+
+    def cache_data(self) -> dict:
+        """Return identity and last known state in a JSON friendly form."""
+        return {
+            "device_id": self.device_id,
+            "saved_at": time.time(),
+            "state": self._state.snapshot(),
+        }
+
+    def restore_cache(self, data: dict) -> bool:
+        """Restore state saved by cache_data(). Returns True if the identity was restored."""
+        if data.get("device_id") != self.device_id:
+            return False
+
+        self._state.restore(data.get("state", {}), data.get("saved_at"))
+        return self.identified
+
+    @cached_property
     def _device_property(self) -> DeviceProperty:
-        return DeviceProperty('device', self.device_id, read_values=['objectName', 'description'])
+        # Name and serial number do not change, so they are read with the slow tier
+        return DeviceProperty('device', self.device_id, read_values=['objectName', 'description'], poll_tier=POLL_TIER_SLOW)
+
+    async def refresh(self, full: bool = False) -> int:
+        """Refresh local device state.
 
-    async def refresh(self):
-        """Refresh local device state."""
-        device_properties = DEVICE_PROPERTIES + [self._device_property]
+        Only properties whose poll tier is due are read, unless full is True.
+        Concurrent callers share the read already in flight, except that a
+        full refresh requested during a partial one runs after it. A refresh
+        requested while a write is in flight runs right after the write.
+        While the device's circuit is open only the device object is probed,
+        see health.
+
+        Returns the write generation the state is known to include, to be
+        compared with the generation returned for a write.
+        """
+        while self._refresh_task is not None and not self._refresh_task.done():
+            if self._refresh_full or not full:
+                return await asyncio.shield(self._refresh_task)
+            # The partial read in flight leaves out what is not due
+            await asyncio.wait([self._refresh_task])
+
+        self._refresh_full = full
+        self._refresh_task = asyncio.get_running_loop().create_task(self._async_refresh(full))
+        return await asyncio.shield(self._refresh_task)
+
+    async def _async_refresh(self, full: bool) -> int:
+        with self.telemetry.span('refresh', full=full):
+            return await self._async_refresh_phases(full)
+
+    async def _async_refresh_phases(self, full: bool) -> int:
+        with self.telemetry.span('refresh.wait_for_writes'):
+            await self._writes_done.wait()
+        write_generation = self.write_generation
+
+        if self.health.is_open:
+            if not self.health.probe_due or not await self._async_probe():
+                return self.state_write_generation
+
+        device_properties = self._read_properties + [self._device_property] + list(self._tracked.values())
+        if not full and self._state:
+            device_properties = self.scheduler.due(device_properties)
+            if not device_properties:
+                return self.state_write_generation
 
         try:
             LOGGER.debug("bacnet device refresh()")
-            if self._refreshing == False and self._writing == False:
-                LOGGER.debug("Not already refreshing")
-                self._refreshing = True
-                self._state = await bacnet.read_multiple(self.hass, self.device_address, device_properties)
-                self._refreshing = False
-                LOGGER.debug("Finished bacnet.read_multiple")
+            with self.telemetry.span('refresh.connect'):
+                session = await self.async_connect()
+                limits = await self._async_get_limits(session)
+            batch_timings = []
+            with self.telemetry.span('refresh.read', objects=len(device_properties)):
+                result = await bacnet.read_multiple(
+                    session,
+                    self.device_address,
+                    device_properties,
+                    limits,
+                    batch_timings,
+                )
+            self.batch_timings = batch_timings
+            self._state.update(result)
+            self.scheduler.mark_read(device_properties)
+            LOGGER.debug("Finished bacnet.read_multiple")
         except Exception as e:
             LOGGER.warning("Refresh error %s", e)
             self._available = False
-            self._refreshing = False
+            self._record_health(e)
         else:
             LOGGER.debug("Refresh done")
             self._available = True
+            self.health.record_success()
+            self.state_generation += 1
+            self.state_write_generation = write_generation
+
+        return self.state_write_generation
+
+    def _record_health(self, error: Exception):
+        """Count error against the device's health if it did not answer.
+
+        An Error, Reject or Abort answer shows the device is reachable.
+        """
+        if is_unreachable(error):
+            self.health.record_failure()
+        else:
+            self.health.record_success()
+
+    def _health_changed(self):
+        # The network may have changed under an unreachable device, so its
+        # local interface is looked up again for the probes
+        if self.health.is_open:
+            invalidate_local_ips()
+
+    async def _async_probe(self) -> bool:
+        """Read the device object only, to learn whether an open circuit can close."""
+        try:
+            with self.telemetry.span('refresh.probe'):
+                session = await self.async_connect()
+                result = await bacnet.read_multiple(session, self.device_address, [self._device_property])
+        except Exception as e:
+            LOGGER.debug("Probe failed, %s", e)
+            self._record_health(e)
+            return not self.health.is_open
+
+        self._state.update(result)
+        self.health.record_success()
+        return True
+
+    async def _async_get_limits(self, session: BACnetSession) -> DeviceLimits:
+        """Return the device's APDU limits, asking the device the first time.
+
+        After a failed read the defaults are used, and the device is only
+        asked again once a backoff that doubles with every failure has passed.
+        """
+        if self.limits is not None:
+            return self.limits
+        if self._limits_retry_at is not None and time.monotonic() < self._limits_retry_at:
+            return DeviceLimits()
+
+        try:
+            self.limits = await bacnet.read_device_limits(session, self.device_address, self.device_id)
+        except Exception as e:
+            self._limits_retry_at = time.monotonic() + self._limits_backoff
+            LOGGER.warning("Could not read device limits, retrying in %.0fs, %s", self._limits_backoff, e)
+            self._limits_backoff = min(self._limits_backoff * 2, LIMITS_MAX_BACKOFF)
+            return DeviceLimits()
+
+        LOGGER.debug("Device limits %s", self.limits)
+        return self.limits
 
     def _get_value(self, device_property: DeviceProperty, value_name: str | None = None) -> Any:
-        if self._state is None:
+        if not self._state:
             return 'unavailable'
 
         if value_name is None:
             value_name = PRESENT_VALUE
 
-        return dict(self._state[device_property.object_identifier])[value_name]
+        return self._state.get(device_property.object_identifier, value_name)
 
-    def _set_value(self, device_property: DeviceProperty, value: Any):
-        LOGGER.debug("Setting value %s %s", device_property.object_identifier, value)
-        asyncio.run_coroutine_threadsafe(self._async_write(device_property, value), self.hass.loop)
+    def _set_value(self, device_property: DeviceProperty, value: Any, debounce: bool = False) -> WriteFuture:
+        return self._set_values([(device_property, value)], debounce)
 
-    async def _async_write(self, device_property: DeviceProperty, value: Any):
+    def _set_values(self, values: List[Tuple[DeviceProperty, Any]], debounce: bool = False) -> WriteFuture:
+        """Queue several values to be written together, in the given order.
+
+        Values are written right away, unless debounce is True. Setpoints
+        that a slider changes in quick steps are debounced, so only the last
+        step is written.
+
+        Returns a future of the write generation, which raises if the write
+        failed. Called on the event loop it is an asyncio task that can be
+        awaited, from other threads a concurrent.futures.Future.
+        """
+        LOGGER.debug("Setting values %s", [(dp.object_identifier, value) for dp, value in values])
+        if _running_loop() is self.hass.loop:
+            return self.hass.loop.create_task(self._async_set_values(values, debounce))
+        return asyncio.run_coroutine_threadsafe(self._async_set_values(values, debounce), self.hass.loop)
+
+    async def _async_set_values(self, values: List[Tuple[DeviceProperty, Any]], debounce: bool = False) -> int:
+        self.health.check()
+        return await self.write_queue.enqueue(values, None if debounce else 0)
+
+    async def _async_write(self, values: List[Tuple[DeviceProperty, Any]]) -> int:
+        """Write values and return the write generation they belong to."""
+        # The circuit may have opened while the write was queued
+        self.health.check()
+        with self.telemetry.span('write', objects=len(values)):
+            return await self._async_write_phases(values)
+
+    async def _async_write_phases(self, values: List[Tuple[DeviceProperty, Any]]) -> int:
+        self._writes_in_flight += 1
+        self._writes_done.clear()
         try:
-            self._writing = True
-            await bacnet.write(self.hass, self.device_address, device_property, value), self.hass.loop
+            with self.telemetry.span('write.connect'):
+                session = await self.async_connect()
+            with self.telemetry.span('write.send', objects=len(values)):
+                self.wpm_supported = await bacnet.write_multiple(
+                    session,
+                    self.device_address,
+                    values,
+                    self.wpm_supported,
+                )
         except Exception as e:
             LOGGER.warning("Write error %s", e)
+            self._record_health(e)
+            raise
         else:
-            if self._state is not None:
-                self._state[device_property.object_identifier] = [(PRESENT_VALUE, value)]
+            self.health.record_success()
+            for device_property, value in values:
+                if value is not None:
+                    self._state.set(device_property.object_identifier, PRESENT_VALUE, raw_value(value))
+            with self.telemetry.span('write.verify'):
+                await self._async_verify_write(session, values)
+            # The device recalculates modes and outputs after a command, so
+            # they are read on the next refresh instead of when their tier is due
+            self.scheduler.mark_due(
+                [dp for dp, _ in values]
+                + [dp for dp in self._read_properties if dp.poll_tier == POLL_TIER_NORMAL]
+            )
         finally:
-            self._writing = False
+            self.write_generation += 1
+            self._writes_in_flight -= 1
+            if self._writes_in_flight == 0:
+                self._writes_done.set()
+
+        return self.write_generation
+
+    def _read_property(self, device_property: DeviceProperty, *read_values: str) -> DeviceProperty:
+        """Return device_property reading read_values instead, built once per combination."""
+        key = (device_property.object_identifier, read_values)
+        read_property = self._read_property_cache.get(key)
+        if read_property is None:
+            read_property = self._read_property_cache[key] = DeviceProperty(
+                device_property.object_type,
+                device_property.instance_id,
+                read_values=read_values,
+            )
+        return read_property
+
+    def _verify_property(self, device_property: DeviceProperty) -> DeviceProperty:
+        """Return the property read back after writing device_property."""
+        if device_property.priority is None:
+            return self._read_property(device_property, PRESENT_VALUE)
+        return self._read_property(device_property, PRESENT_VALUE, PRIORITY_ARRAY)
+
+    def _update_priorities(self, object_identifier: ObjectIdentifier, properties: Dict[str, Any]):
+        if PRIORITY_ARRAY not in properties and RELINQUISH_DEFAULT not in properties:
+            return
+        priorities = self.priorities.setdefault(object_identifier, PriorityState())
+        if PRIORITY_ARRAY in properties:
+            priorities.priority_array = [priority_value(value) for value in properties[PRIORITY_ARRAY]]
+        if RELINQUISH_DEFAULT in properties:
+            priorities.relinquish_default = priority_value(properties[RELINQUISH_DEFAULT])
+
+    async def _async_verify_write(self, session: BACnetSession, values: List[Tuple[DeviceProperty, Any]]):
+        """Read the written objects back and replace the optimistic state.
+
+        Objects written at a priority are read with their priority array, so
+        a command at a higher priority that overrides ours shows right away
+        instead of at the next poll. A failed read keeps the written values.
+        """
+        try:
+            result = await bacnet.read_multiple(
+                session,
+                self.device_address,
+                [self._verify_property(dp) for dp, _ in values],
+                self.limits,
+            )
+        except Exception as e:
+            LOGGER.debug("Could not verify write, %s", e)
+            return
+
+        for device_property, value in values:
+            properties = dict(result.get(device_property.object_identifier, []))
+            if PRESENT_VALUE not in properties:
+                continue
+
+            present_value = properties[PRESENT_VALUE]
+            self._state.set(device_property.object_identifier, PRESENT_VALUE, present_value)
+            self._update_priorities(device_property.object_identifier, properties)
+
+            # A relinquished command hands over to whatever is next in line
+            if value is not None and not _same_value(present_value, raw_value(value)):
+                priorities = self.priorities.get(device_property.object_identifier)
+                self.write_overrides += 1
+                LOGGER.info(
+                    "%s is %s after writing %s, controlled by priority %s",
+                    device_property.object_path,
+                    present_value,
+                    raw_value(value),
+                    priorities.active_priority if priorities is not None else None,
+                )
+
+    async def async_read_priorities(
+        self,
+        device_properties: List[DeviceProperty] | None = None,
+    ) -> Dict[ObjectIdentifier, PriorityState]:
+        """Read priorityArray and relinquishDefault of commandable objects in bulk.
+
+        Defaults to every known property that is written at a priority. The
+        result is also kept in priorities, see controlling_priority.
+        """
+        if device_properties is None:
+            device_properties = [dp for dp in DEVICE_PROPERTIES if dp.priority is not None]
+
+        self.health.check()
+        session = await self.async_connect()
+        limits = await self._async_get_limits(session)
+        result = await bacnet.read_multiple(
+            session,
+            self.device_address,
+            [self._read_property(dp, PRESENT_VALUE, PRIORITY_ARRAY, RELINQUISH_DEFAULT) for dp in device_properties],
+            limits,
+        )
+
+        for device_property in device_properties:
+            properties = dict(result.get(device_property.object_identifier, []))
+            if PRESENT_VALUE in properties:
+                self._state.set(device_property.object_identifier, PRESENT_VALUE, properties[PRESENT_VALUE])
+            self._update_priorities(device_property.object_identifier, properties)
+
+        return {
+            dp.object_identifier: self.priorities[dp.object_identifier]
+            for dp in device_properties
+            if dp.object_identifier in self.priorities
+        }
+
+    def controlling_priority(self, device_property: DeviceProperty) -> int | None:
+        """Return the priority that controlled device_property when it was last read, None if unknown or relinquished."""
+        priorities = self.priorities.get(device_property.object_identifier)
+        return priorities.active_priority if priorities is not None else None
+
+    async def async_command(self, device_property: DeviceProperty, value: Any, priority: int | None = None) -> int:
+        """Write value at priority, by default the priority of device_property.
+
+        Returns the write generation of the write.
+        """
+        if priority is None:
+            priority = device_property.priority or DEFAULT_PRIORITY
+        check_priority(priority)
+        return await self._async_set_values([(device_property.with_priority(priority), value)])
+
+    async def async_relinquish(self, device_property: DeviceProperty, priority: int | None = None) -> int:
+        """Withdraw the command at priority, handing control to lower priorities or relinquishDefault."""
+        return await self.async_command(device_property, None, priority)
 
     @property
     def available(self) -> bool:
@@ -125,15 +705,17 @@ class FlexitBACnet:
 
     def activate_comfort_button(self):
         """Activate comfort button."""
-        self._set_value(COMFORT_BUTTON, COMFORT_BUTTON.ACTIVE)
+        return self._set_value(COMFORT_BUTTON, COMFORT_BUTTON.ACTIVE)
 
     def deactivate_comfort_button(self, delay: int = 0):
         """Deactivate comfort button with optional delay (in minutes)."""
         if delay < 0 or delay > 600:
             raise ValueError('delay must be between 0 and 600 minutes')
 
-        self._set_value(COMFORT_BUTTON_DELAY, delay)
-        self._set_value(COMFORT_BUTTON, COMFORT_BUTTON.INACTIVE)
+        return self._set_values([
+            (COMFORT_BUTTON_DELAY, delay),
+            (COMFORT_BUTTON, COMFORT_BUTTON.INACTIVE),
+        ])
 
     @property
     def operation_mode(self) -> str:
@@ -156,7 +738,14 @@ class FlexitBACnet:
         3 - Home (VENTILATION_MODE.HOME)
         4 - High (VENTILATION_MODE.HIGH)
         """
-        self._set_value(VENTILATION_MODE, mode)
+        return self._set_value(VENTILATION_MODE, mode)
+
+    def set_ventilation_mode_and_heater(self, mode: int, electric_heater: bool):
+        """Set ventilation mode and enable or disable the electric heater in one request."""
+        return self._set_values([
+            (VENTILATION_MODE, mode),
+            (ELECTRICAL_HEATER, ELECTRICAL_HEATER.ACTIVE if electric_heater else ELECTRICAL_HEATER.INACTIVE),
+        ])
 
     @property
     def air_temp_setpoint_away(self) -> float:
@@ -168,7 +757,7 @@ class FlexitBACnet:
 
         temperature -- temperature in degrees Celsius
         """
-        self._set_value(AIR_TEMP_SETPOINT_AWAY, temperature)
+        return self._set_value(AIR_TEMP_SETPOINT_AWAY, temperature, debounce=True)
 
     @property
     def air_temp_setpoint_home(self) -> float:
@@ -180,15 +769,17 @@ class FlexitBACnet:
 
         temperature -- temperature in degrees Celsius
         """
-        self._set_value(AIR_TEMP_SETPOINT_HOME, temperature)
+        return self._set_value(AIR_TEMP_SETPOINT_HOME, temperature, debounce=True)
 
     def start_fireplace_ventilation(self, minutes: int):
         """Trigger temporary fireplace ventilation mode.
 
         minutes -- duration of fireplace ventilation in minutes (1 - 360)
         """
-        self._set_value(FIREPLACE_VENTILATION_RUNTIME, minutes)
-        self._set_value(FIREPLACE_VENTILATION, FIREPLACE_VENTILATION.TRIGGER)
+        return self._set_values([
+            (FIREPLACE_VENTILATION_RUNTIME, minutes),
+            (FIREPLACE_VENTILATION, FIREPLACE_VENTILATION.TRIGGER),
+        ])
 
     @property
     def fireplace_ventilation_duration(self) -> int:
@@ -197,7 +788,7 @@ class FlexitBACnet:
 
     def set_fireplace_ventilation_duration(self, minutes: int) -> int:
         """Sets duration (in minutes) of fireplace ventilation mode."""
-        self._set_value(FIREPLACE_VENTILATION_RUNTIME, minutes)
+        return self._set_value(FIREPLACE_VENTILATION_RUNTIME, minutes, debounce=True)
 
     @property
     def fireplace_ventilation_remaining_duration(self) -> int:
@@ -209,18 +800,19 @@ class FlexitBACnet:
 
         minutes -- duration of rapid ventilation in minutes (1 - 360)
         """
-        self._set_value(RAPID_VENTILATION_RUNTIME, minutes)
-        self._set_value(RAPID_VENTILATION, RAPID_VENTILATION.TRIGGER)
+        return self._set_values([
+            (RAPID_VENTILATION_RUNTIME, minutes),
+            (RAPID_VENTILATION, RAPID_VENTILATION.TRIGGER),
+        ])
 
     @property
     def rapid_ventilation_duration(self) -> int:
         """Return duration (in minutes) of rapid ventilation mode."""
         return self._get_value(RAPID_VENTILATION_RUNTIME)
 
-    @property
     def set_rapid_ventilation_duration(self, minutes: int) -> int:
         """Sets duration (in minutes) of rapid ventilation mode."""
-        self._set_value(RAPID_VENTILATION_RUNTIME, minutes)
+        return self._set_value(RAPID_VENTILATION_RUNTIME, minutes, debounce=True)
 
     @property
     def rapid_ventilation_remaining_duration(self) -> int:
@@ -254,11 +846,11 @@ class FlexitBACnet:
 
     def enable_electric_heater(self):
         """Enables electric air heater."""
-        self._set_value(ELECTRICAL_HEATER, ELECTRICAL_HEATER.ACTIVE)
+        return self._set_value(ELECTRICAL_HEATER, ELECTRICAL_HEATER.ACTIVE)
 
     def disable_electric_heater(self):
         """Disables electric air heater."""
-        self._set_value(ELECTRICAL_HEATER, ELECTRICAL_HEATER.INACTIVE)
+        return self._set_value(ELECTRICAL_HEATER, ELECTRICAL_HEATER.INACTIVE)
 
     @property
     def electric_heater_nominal_power(self) -> float:
@@ -272,11 +864,11 @@ class FlexitBACnet:
 
     def activate_cooker_hood(self):
         """Activates cooker hood mode."""
-        self._set_value(COOKER_HOOD, COOKER_HOOD.ACTIVE)
+        return self._set_value(COOKER_HOOD, COOKER_HOOD.ACTIVE)
 
     def deactivate_cooker_hood(self):
         """Deactivates cooker hood mode."""
-        self._set_value(COOKER_HOOD, COOKER_HOOD.INACTIVE)
+        return self._set_value(COOKER_HOOD, COOKER_HOOD.INACTIVE)
 
     @property
     def fan_setpoint_supply_air_home(self) -> int:
@@ -285,7 +877,7 @@ class FlexitBACnet:
 
     def set_fan_setpoint_supply_air_home(self, percent: int):
         """Set fan setpoint for supply air HOME in percent."""
-        self._set_value(LINEAR_SETPOINT_SUPPLY_AIR_HOME, percent)
+        return self._set_value(LINEAR_SETPOINT_SUPPLY_AIR_HOME, percent, debounce=True)
 
     @property
     def fan_setpoint_extract_air_home(self) -> int:
@@ -294,7 +886,7 @@ class FlexitBACnet:
 
     def set_fan_setpoint_extract_air_home(self, percent: int):
         """Set fan setpoint for extract air HOME in percent."""
-        self._set_value(LINEAR_SETPOINT_EXHAUST_AIR_HOME, percent)
+        return self._set_value(LINEAR_SETPOINT_EXHAUST_AIR_HOME, percent, debounce=True)
 
     @property
     def fan_setpoint_supply_air_high(self) -> int:
@@ -303,7 +895,7 @@ class FlexitBACnet:
 
     def set_fan_setpoint_supply_air_high(self, percent: int):
         """Set fan setpoint for supply air HIGH in percent."""
-        self._set_value(LINEAR_SETPOINT_SUPPLY_AIR_HIGH, percent)
+        return self._set_value(LINEAR_SETPOINT_SUPPLY_AIR_HIGH, percent, debounce=True)
 
     @property
     def fan_setpoint_extract_air_high(self) -> int:
@@ -312,7 +904,7 @@ class FlexitBACnet:
 
     def set_fan_setpoint_extract_air_high(self, percent: int):
         """Set fan setpoint for extract air HIGH in percent."""
-        self._set_value(LINEAR_SETPOINT_EXHAUST_AIR_HIGH, percent)
+        return self._set_value(LINEAR_SETPOINT_EXHAUST_AIR_HIGH, percent, debounce=True)
 
     @property
     def fan_setpoint_supply_air_away(self) -> int:
@@ -321,7 +913,7 @@ class FlexitBACnet:
 
     def set_fan_setpoint_supply_air_away(self, percent: int):
         """Set fan setpoint for supply air AWAY in percent."""
-        self._set_value(LINEAR_SETPOINT_SUPPLY_AIR_AWAY, percent)
+        return self._set_value(LINEAR_SETPOINT_SUPPLY_AIR_AWAY, percent, debounce=True)
 
     @property
     def fan_setpoint_extract_air_away(self) -> int:
@@ -330,7 +922,7 @@ class FlexitBACnet:
 
     def set_fan_setpoint_extract_air_away(self, percent: int):
         """Set fan setpoint for extract air AWAY in percent."""
-        self._set_value(LINEAR_SETPOINT_EXHAUST_AIR_AWAY, percent)
+        return self._set_value(LINEAR_SETPOINT_EXHAUST_AIR_AWAY, percent, debounce=True)
 
     @property
     def fan_setpoint_supply_air_cooker(self) -> int:
@@ -339,7 +931,7 @@ class FlexitBACnet:
 
     def set_fan_setpoint_supply_air_cooker(self, percent: int):
         """Set fan setpoint for supply air COOKER in percent."""
-        self._set_value(LINEAR_SETPOINT_SUPPLY_AIR_COOKER, percent)
+        return self._set_value(LINEAR_SETPOINT_SUPPLY_AIR_COOKER, percent, debounce=True)
 
     @property
     def fan_setpoint_extract_air_cooker(self) -> int:
@@ -348,7 +940,7 @@ class FlexitBACnet:
 
     def set_fan_setpoint_extract_air_cooker(self, percent: int):
         """Set fan setpoint for extract air COOKER in percent."""
-        self._set_value(LINEAR_SETPOINT_EXHAUST_AIR_COOKER, percent)
+        return self._set_value(LINEAR_SETPOINT_EXHAUST_AIR_COOKER, percent, debounce=True)
 
     @property
     def fan_setpoint_supply_air_fire(self) -> int:
@@ -357,7 +949,7 @@ class FlexitBACnet:
 
     def set_fan_setpoint_supply_air_fire(self, percent: int):
         """Set fan setpoint for supply air FIRE in percent."""
-        self._set_value(LINEAR_SETPOINT_SUPPLY_AIR_FIRE, percent)
+        return self._set_value(LINEAR_SETPOINT_SUPPLY_AIR_FIRE, percent, debounce=True)
 
     @property
     def fan_setpoint_extract_air_fire(self) -> int:
@@ -366,7 +958,7 @@ class FlexitBACnet:
 
     def set_fan_setpoint_extract_air_fire(self, percent: int):
         """Set fan setpoint for extract air FIRE in percent."""
-        self._set_value(LINEAR_SETPOINT_EXHAUST_AIR_FIRE, percent)
+        return self._set_value(LINEAR_SETPOINT_EXHAUST_AIR_FIRE, percent, debounce=True)
 
     @property
     def air_filter_operating_time(self) -> float:
@@ -390,8 +982,8 @@ class FlexitBACnet:
     @property
     def air_filter_polluted(self) -> bool:
         """Returns True if filter is polluted."""
-        operating_time = self.air_filter_operating_time()
-        exchange_time = self.air_filter_exchange_interval()
+        operating_time = self.air_filter_operating_time
+        exchange_time = self.air_filter_exchange_interval
         return (exchange_time - operating_time) <= 0
 
     @property
@@ -401,11 +993,11 @@ class FlexitBACnet:
 
     def activate_schedule_override(self):
         """Returns True if scheduler is overridden."""
-        self._set_value(SCHEDULER_OVERRIDE, SCHEDULER_OVERRIDE.ACTIVE)
+        return self._set_value(SCHEDULER_OVERRIDE, SCHEDULER_OVERRIDE.ACTIVE)
 
     def deactivate_schedule_override(self):
         """Returns True if scheduler is overridden."""
-        self._set_value(SCHEDULER_OVERRIDE, SCHEDULER_OVERRIDE.INACTIVE)
+        return self._set_value(SCHEDULER_OVERRIDE, SCHEDULER_OVERRIDE.INACTIVE)
 
     @property
     def away_delay(self) -> bool:
@@ -1,27 +1,125 @@
+from enum import Enum, IntEnum
+from typing import Any, Iterable, Tuple, Type
+
 from .typing import ObjectIdentifier
 
 PRESENT_VALUE = 'presentValue'
+PRIORITY_ARRAY = 'priorityArray'
+
+# Poll tiers, from live measurements to nearly static configuration
+POLL_TIER_FAST = 'fast'
+POLL_TIER_NORMAL = 'normal'
+POLL_TIER_SLOW = 'slow'
+
+
+class BinaryState(str, Enum):
+    """presentValue of binary objects."""
+
+    INACTIVE = 'inactive'
+    ACTIVE = 'active'
+
+
+class Trigger(IntEnum):
+    """presentValue that starts a temporary mode."""
+
+    TRIGGER = 2
+
+
+def raw_value(value: Any) -> Any:
+    """Return the plain value of a named value, as sent to and stored from the device."""
+    return value.value if isinstance(value, Enum) else value
 
 
 class DeviceProperty:
+    """Immutable description of an object and the properties read from it.
+
+    The identifier, path and hash are computed once, so the property can be
+    used as a dict key and read on every poll without allocating. Named
+    values of the object are given as an Enum and are reachable as
+    attributes, e.g. COMFORT_BUTTON.ACTIVE.
+    """
+
+    __slots__ = (
+        'object_type',
+        'instance_id',
+        'values',
+        'value_map',
+        'read_values',
+        'priority',
+        'poll_tier',
+        'object_identifier',
+        'object_path',
+        '_key',
+        '_hash',
+    )
+
     def __init__(
-        self, 
-        object_type: str, 
-        instance_id: int, 
+        self,
+        object_type: str,
+        instance_id: int,
         value_map: dict[int, str] | None = None,
-        read_values: list[str] | None = None, 
-        priority: int | None = None
+        read_values: Iterable[str] | None = None,
+        priority: int | None = None,
+        poll_tier: str = POLL_TIER_NORMAL,
+        values: Type[Enum] | None = None,
     ):
-        self.object_type = object_type
-        self.instance_id = instance_id
-        self.value_map = value_map
-        self.read_values = read_values if read_values is not None else [PRESENT_VALUE]
-        self.priority = priority
-
-    @property
-    def object_identifier(self) -> ObjectIdentifier:
-        return self.object_type, self.instance_id
-
-    @property
-    def object_path(self) -> str:
-        return f'{self.object_type}:{self.instance_id}'
+        read_values = tuple(read_values) if read_values is not None else (PRESENT_VALUE,)
+        object_identifier: ObjectIdentifier = (object_type, instance_id)
+        key = (object_identifier, read_values, priority, poll_tier)
+
+        for name, value in (
+            ('object_type', object_type),
+            ('instance_id', instance_id),
+            ('values', values),
+            ('value_map', value_map),
+            ('read_values', read_values),
+            ('priority', priority),
+            ('poll_tier', poll_tier),
+            ('object_identifier', object_identifier),
+            ('object_path', f'{object_type}:{instance_id}'),
+            ('_key', key),
+            ('_hash', hash(key)),
+        ):
+            object.__setattr__(self, name, value)
+
+    def __setattr__(self, name: str, value: Any):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name: str):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __getattr__(self, name: str) -> Any:
+        # Only called for names that are not slots, i.e. named values
+        values = object.__getattribute__(self, 'values')
+        if values is None or name.startswith('_') or name not in values.__members__:
+            raise AttributeError(f"{self.object_path} has no value {name}")
+        return values[name]
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, DeviceProperty):
+            return NotImplemented
+        return self._key == other._key
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __repr__(self) -> str:
+        return f'DeviceProperty({self.object_path}, {list(self.read_values)})'
+
+    def with_priority(self, priority: int | None) -> 'DeviceProperty':
+        """Return a copy written at priority."""
+        return DeviceProperty(
+            self.object_type,
+            self.instance_id,
+            self.value_map,
+            self.read_values,
+            priority,
+            self.poll_tier,
+            self.values,
+        )
+
+    def __reduce__(self) -> Tuple:
+        return (
+            DeviceProperty,
+            (self.object_type, self.instance_id, self.value_map, self.read_values, self.priority, self.poll_tier, self.values),
+        )
@@ -0,0 +1,195 @@
+import asyncio
+
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, Iterator, List
+from logging import Logger, getLogger
+
+from . import bacnet
+from .bacnet import DeviceLimits, LOCAL_MAX_APDU, MAX_PIPELINED_REQUESTS
+from .codec import INDEX_SEPARATOR
+from .device_property import DeviceProperty, POLL_TIER_NORMAL
+from .session import BACnetSession
+from .typing import ObjectIdentifier
+
+LOGGER: Logger = getLogger(__package__)
+
+# Object types whose objects are added to the catalogue
+CATALOGUE_OBJECT_TYPES = (
+    'analogInput', 'analogOutput', 'analogValue',
+    'binaryInput', 'binaryOutput', 'binaryValue',
+    'multiStateInput', 'multiStateOutput', 'multiStateValue',
+    'positiveIntegerValue', 'integerValue',
+)
+
+# Estimated bytes one objectList element adds to a ReadPropertyMultiple-ACK
+OBJECT_LIST_ELEMENT_SIZE = bacnet.RPM_PROPERTY_SIZE + 2 + bacnet.VALUE_SIZE
+
+
+@dataclass
+class CatalogueEntry:
+    """What the device tells about one of its objects."""
+
+    object_type: str
+    instance_id: int
+    object_name: str
+    description: str = ''
+    units: str | None = None
+
+    @property
+    def object_identifier(self) -> ObjectIdentifier:
+        return self.object_type, self.instance_id
+
+    def device_property(self, poll_tier: str = POLL_TIER_NORMAL) -> DeviceProperty:
+        return DeviceProperty(self.object_type, self.instance_id, poll_tier=poll_tier)
+
+
+class Catalogue:
+    """Objects of one firmware version, indexed by identifier and by name."""
+
+    def __init__(self, firmware_revision: str, entries: List[CatalogueEntry]):
+        self.firmware_revision = firmware_revision
+        self._entries: Dict[ObjectIdentifier, CatalogueEntry] = {
+            entry.object_identifier: entry
+            for entry in entries
+        }
+        self._names: Dict[str, CatalogueEntry] = {
+            entry.object_name: entry
+            for entry in entries
+        }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __iter__(self) -> Iterator[CatalogueEntry]:
+        return iter(self._entries.values())
+
+    def __contains__(self, object_identifier: ObjectIdentifier) -> bool:
+        return object_identifier in self._entries
+
+    def get(self, object_identifier: ObjectIdentifier) -> CatalogueEntry | None:
+        return self._entries.get(object_identifier)
+
+    def find(self, object_name: str) -> CatalogueEntry | None:
+        return self._names.get(object_name)
+
+    def of_type(self, *object_types: str) -> List[CatalogueEntry]:
+        return [entry for entry in self if entry.object_type in object_types]
+
+    def as_dict(self) -> dict:
+        return {
+            "firmware_revision": self.firmware_revision,
+            "entries": [asdict(entry) for entry in self],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'Catalogue':
+        return cls(data["firmware_revision"], [CatalogueEntry(**entry) for entry in data["entries"]])
+
+
+def _device(device_id: int, read_values: List[str]) -> DeviceProperty:
+    return DeviceProperty('device', device_id, read_values=read_values)
+
+
+async def read_firmware_revision(session: BACnetSession, device_address: str, device_id: int) -> str:
+    device_property = _device(device_id, ['firmwareRevision', 'applicationSoftwareVersion'])
+    result = await bacnet.read_multiple(session, device_address, [device_property])
+    values = dict(result[device_property.object_identifier])
+    return f"{values.get('firmwareRevision', '')}/{values.get('applicationSoftwareVersion', '')}"
+
+
+async def read_object_list(
+    session: BACnetSession,
+    device_address: str,
+    device_id: int,
+    limits: DeviceLimits,
+) -> List[ObjectIdentifier]:
+    """Read the device's objectList.
+
+    Devices that can segment are asked for the whole list at once. Otherwise,
+    or if that fails, the list is read by index in chunks that fit one APDU.
+    """
+    object_identifier = ('device', device_id)
+
+    if limits.can_segment:
+        try:
+            result = await bacnet.read_multiple(session, device_address, [_device(device_id, ['objectList'])], limits)
+            return [tuple(item) for item in dict(result[object_identifier])['objectList']]
+        except asyncio.TimeoutError:
+            raise
+        except Exception as e:
+            LOGGER.debug("Could not read objectList at once, reading by index, %s", e)
+
+    result = await bacnet.read_multiple(
+        session,
+        device_address,
+        [_device(device_id, [f'objectList{INDEX_SEPARATOR}0'])],
+        limits,
+    )
+    length = int(dict(result[object_identifier])[f'objectList{INDEX_SEPARATOR}0'])
+
+    max_apdu = min(limits.max_apdu, LOCAL_MAX_APDU)
+    chunk_size = max(1, (max_apdu - bacnet.RPM_ACK_HEADER_SIZE - bacnet.RPM_OBJECT_SIZE) // OBJECT_LIST_ELEMENT_SIZE)
+    chunks = [
+        [f'objectList{INDEX_SEPARATOR}{index}' for index in range(start, min(start + chunk_size, length + 1))]
+        for start in range(1, length + 1, chunk_size)
+    ]
+
+    # Every chunk reads the same object, so chunks are separate requests
+    semaphore = asyncio.Semaphore(MAX_PIPELINED_REQUESTS)
+
+    async def read_chunk(read_values: List[str]) -> Dict[str, Any]:
+        async with semaphore:
+            chunk = await bacnet.read_multiple(session, device_address, [_device(device_id, read_values)], limits)
+            return dict(chunk[object_identifier])
+
+    object_list: List[ObjectIdentifier] = []
+    for values in await asyncio.gather(*(read_chunk(chunk) for chunk in chunks)):
+        object_list.extend(tuple(item) for item in values.values())
+
+    return object_list
+
+
+def _read_values(object_type: str) -> List[str]:
+    if object_type.startswith('analog'):
+        return ['objectName', 'description', 'units']
+    return ['objectName', 'description']
+
+
+async def discover(
+    session: BACnetSession,
+    device_address: str,
+    device_id: int,
+    limits: DeviceLimits | None = None,
+    firmware_revision: str | None = None,
+) -> Catalogue:
+    """Build the catalogue of the device's objects from its objectList."""
+    if limits is None:
+        limits = DeviceLimits()
+    if firmware_revision is None:
+        firmware_revision = await read_firmware_revision(session, device_address, device_id)
+
+    object_list = await read_object_list(session, device_address, device_id, limits)
+    device_properties = [
+        DeviceProperty(object_type, instance_id, read_values=_read_values(object_type))
+        for object_type, instance_id in object_list
+        if object_type in CATALOGUE_OBJECT_TYPES
+    ]
+    LOGGER.debug("Discovered %s objects, reading names of %s", len(object_list), len(device_properties))
+
+    result = await bacnet.read_multiple(session, device_address, device_properties, limits)
+
+    entries = []
+    for dp in device_properties:
+        values = dict(result.get(dp.object_identifier, []))
+        if 'objectName' not in values:
+            continue
+        units = values.get('units')
+        entries.append(CatalogueEntry(
+            dp.object_type,
+            dp.instance_id,
+            str(values['objectName']),
+            str(values.get('description', '')),
+            str(units) if units is not None else None,
+        ))
+
+    return Catalogue(firmware_revision, entries)
@@ -0,0 +1,103 @@
+import time
+import asyncio
+
+from dataclasses import asdict, dataclass
+from typing import Dict
+from logging import Logger, getLogger
+
+from .device import FlexitBACnet
+
+LOGGER: Logger = getLogger(__package__)
+
+# Upper bound of units polled at the same time
+DEFAULT_FLEET_CONCURRENCY = 8
+
+# Minimum seconds between the starts of two polls
+DEFAULT_FLEET_STAGGER = 0.1
+
+
+@dataclass
+class UnitMetrics:
+    polls: int = 0
+    failures: int = 0
+    last_duration: float | None = None
+    last_wait: float | None = None
+
+
+class FleetScheduler:
+    """Runs the polls of every unit on a site through one bounded pipeline.
+
+    Units set up together would otherwise poll in lockstep. Poll starts are
+    spread at least stagger seconds apart and at most concurrency polls run
+    at once, so the cost of polling many units follows network round trips
+    instead of arriving as a burst.
+    """
+
+    def __init__(self, concurrency: int = DEFAULT_FLEET_CONCURRENCY, stagger: float = DEFAULT_FLEET_STAGGER):
+        self.concurrency = concurrency
+        self.stagger = stagger
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self._next_start: float = 0.0
+        self._units: Dict[str, UnitMetrics] = {}
+
+        self.in_flight: int = 0
+        self.max_in_flight: int = 0
+        self.total_duration: float = 0.0
+
+    def add(self, device: FlexitBACnet):
+        self._units.setdefault(device.device_address, UnitMetrics())
+
+    def remove(self, device: FlexitBACnet):
+        self._units.pop(device.device_address, None)
+
+    def __len__(self) -> int:
+        return len(self._units)
+
+    async def _async_wait_for_slot(self):
+        now = time.monotonic()
+        start = max(now, self._next_start)
+        self._next_start = start + self.stagger
+        if start > now:
+            await asyncio.sleep(start - now)
+
+    async def async_refresh(self, device: FlexitBACnet, full: bool = False) -> int:
+        """Refresh device when the fleet has room for it."""
+        metrics = self._units.setdefault(device.device_address, UnitMetrics())
+        queued = time.monotonic()
+
+        await self._async_wait_for_slot()
+        async with self._semaphore:
+            start = time.monotonic()
+            metrics.last_wait = start - queued
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            try:
+                result = await device.refresh(full)
+                if not device.available:
+                    metrics.failures += 1
+                return result
+            except Exception:
+                metrics.failures += 1
+                raise
+            finally:
+                self.in_flight -= 1
+                metrics.polls += 1
+                metrics.last_duration = time.monotonic() - start
+                self.total_duration += metrics.last_duration
+
+    def as_dict(self) -> dict:
+        polls = sum(metrics.polls for metrics in self._units.values())
+        return {
+            "units": len(self._units),
+            "concurrency": self.concurrency,
+            "stagger": self.stagger,
+            "in_flight": self.in_flight,
+            "max_in_flight": self.max_in_flight,
+            "polls": polls,
+            "failures": sum(metrics.failures for metrics in self._units.values()),
+            "average_duration": self.total_duration / polls if polls else None,
+            "per_unit": {
+                address: asdict(metrics)
+                for address, metrics in self._units.items()
+            },
+        }
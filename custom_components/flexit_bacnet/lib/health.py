@@ -0,0 +1,126 @@
+import time
+
+from typing import Callable, List
+from logging import Logger, getLogger
+
+LOGGER: Logger = getLogger(__package__)
+
+# Health states of a device
+HEALTH_HEALTHY = 'healthy'
+HEALTH_DEGRADED = 'degraded'
+HEALTH_OPEN = 'open'
+
+HEALTH_STATES = [HEALTH_HEALTHY, HEALTH_DEGRADED, HEALTH_OPEN]
+
+# Consecutive failures after which requests stop being sent
+DEFAULT_OPEN_AFTER = 3
+
+# Seconds before the first probe of an open circuit, doubled after every failed probe
+DEFAULT_INITIAL_BACKOFF = 10.0
+DEFAULT_MAX_BACKOFF = 600.0
+BACKOFF_FACTOR = 2
+
+
+class CircuitOpenError(ConnectionError):
+    """Raised instead of sending a request to a device whose circuit is open."""
+
+
+class CircuitBreaker:
+    """Health of one device: healthy, degraded after a failure, open after several.
+
+    While the circuit is open no requests are sent, except a probe once the
+    backoff has passed, and writes fail at once. A failed probe doubles the
+    backoff, up to max_backoff, and any success closes the circuit again.
+    """
+
+    def __init__(
+        self,
+        open_after: int = DEFAULT_OPEN_AFTER,
+        initial_backoff: float = DEFAULT_INITIAL_BACKOFF,
+        max_backoff: float = DEFAULT_MAX_BACKOFF,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.open_after = open_after
+        self.initial_backoff = initial_backoff
+        self.max_backoff = max_backoff
+        self._clock = clock
+        self._listeners: List[Callable[[], None]] = []
+
+        self.state: str = HEALTH_HEALTHY
+        self.failures: int = 0
+        self.backoff: float = initial_backoff
+        self.retry_at: float | None = None
+        self.transition_count: int = 0
+        self.open_count: int = 0
+        self.last_transition: float | None = None
+
+    @property
+    def is_open(self) -> bool:
+        return self.state == HEALTH_OPEN
+
+    @property
+    def probe_due(self) -> bool:
+        """Return True if the circuit is open and the next probe may be sent."""
+        return self.is_open and self._clock() >= self.retry_at
+
+    @property
+    def retry_in(self) -> float | None:
+        if not self.is_open:
+            return None
+        return max(0.0, self.retry_at - self._clock())
+
+    def check(self):
+        """Raise CircuitOpenError while the circuit is open. Only probes are sent then."""
+        if self.is_open:
+            raise CircuitOpenError(f"Device unreachable, next probe in {self.retry_in:.0f}s")
+
+    def add_listener(self, listener: Callable[[], None]) -> Callable[[], None]:
+        """Call listener on every change of state. Returns a remove function."""
+        self._listeners.append(listener)
+        return lambda: self._listeners.remove(listener)
+
+    def record_success(self):
+        self.failures = 0
+        self.backoff = self.initial_backoff
+        self.retry_at = None
+        self._transition(HEALTH_HEALTHY)
+
+    def record_failure(self):
+        self.failures += 1
+        if self.is_open:
+            self.backoff = min(self.backoff * BACKOFF_FACTOR, self.max_backoff)
+            self.retry_at = self._clock() + self.backoff
+        elif self.failures >= self.open_after:
+            self.retry_at = self._clock() + self.backoff
+            self.open_count += 1
+            self._transition(HEALTH_OPEN)
+        else:
+            self._transition(HEALTH_DEGRADED)
+
+    def _transition(self, state: str):
+        if state == self.state:
+            return
+
+        if state == HEALTH_OPEN:
+            LOGGER.warning("Device unreachable after %s failures, retrying in %.0fs", self.failures, self.backoff)
+        elif state == HEALTH_HEALTHY and self.state == HEALTH_OPEN:
+            LOGGER.warning("Device reachable again")
+        else:
+            LOGGER.debug("Device health %s -> %s", self.state, state)
+
+        self.state = state
+        self.transition_count += 1
+        self.last_transition = time.time()
+        for listener in list(self._listeners):
+            listener()
+
+    def as_dict(self) -> dict:
+        return {
+            "state": self.state,
+            "failures": self.failures,
+            "backoff": self.backoff,
+            "retry_in": self.retry_in,
+            "transition_count": self.transition_count,
+            "open_count": self.open_count,
+            "last_transition": self.last_transition,
+        }
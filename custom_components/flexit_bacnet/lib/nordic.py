@@ -2,28 +2,39 @@
 
 Based on https://www.flexit.no/globalassets/catalog/documents/bacnet-nordic-basic_2963.xlsx
 """
-from .device_property import DeviceProperty
+from enum import IntEnum
+
+from .device_property import BinaryState, DeviceProperty, Trigger, POLL_TIER_FAST, POLL_TIER_SLOW
+
+
+class OperationMode(IntEnum):
+    OFF = 1
+    AWAY = 2
+    HOME = 3
+    HIGH = 4
+    FUME_HOOD = 5
+    FIREPLACE = 6
+    TEMPORARY_HIGH = 7
+
+
+class VentilationMode(IntEnum):
+    STOP = 1
+    AWAY = 2
+    HOME = 3
+    HIGH = 4
+
 
 # Comfort button [RW]
 # 0 = Ventilation mode Away after Away delay timer duration [Pintval,318].
 #     Also overrides Room operating mode PRESENT_VENTILATION_MODE.
 # 1 = Ventilation mode according to Room operating mode PRESENT_VENTILATION_MODE.
-COMFORT_BUTTON = DeviceProperty('binaryValue', 50, priority=13)
-COMFORT_BUTTON.ACTIVE = 'active'
-COMFORT_BUTTON.INACTIVE = 'inactive'
+COMFORT_BUTTON = DeviceProperty('binaryValue', 50, priority=13, values=BinaryState)
 
 # Sets the delay time in minutes for Comfort button
 COMFORT_BUTTON_DELAY = DeviceProperty('positiveIntegerValue', 318)
 
 # Heat recovery ventilation state
-OPERATION_MODE = DeviceProperty('multiStateValue', 361)
-OPERATION_MODE.OFF = 1
-OPERATION_MODE.AWAY = 2
-OPERATION_MODE.HOME = 3
-OPERATION_MODE.HIGH = 4
-OPERATION_MODE.FUME_HOOD = 5
-OPERATION_MODE.FIREPLACE = 6
-OPERATION_MODE.TEMPORARY_HIGH = 7
+OPERATION_MODE = DeviceProperty('multiStateValue', 361, values=OperationMode)
 OPERATION_MODES = {
     OPERATION_MODE.OFF: "Off",
     OPERATION_MODE.AWAY: "Away",
@@ -37,11 +48,7 @@ OPERATION_MODES = {
 # Ventilation mode [RW]
 # Only works if COMFORT_BUTTON == 1
 # If COMFORT_BUTTON == 0, this register is Away.
-VENTILATION_MODE = DeviceProperty('multiStateValue', 42, priority=13)
-VENTILATION_MODE.STOP = 1
-VENTILATION_MODE.AWAY = 2
-VENTILATION_MODE.HOME = 3
-VENTILATION_MODE.HIGH = 4
+VENTILATION_MODE = DeviceProperty('multiStateValue', 42, priority=13, values=VentilationMode)
 VENTILATION_MODES = {
     VENTILATION_MODE.STOP: "Stop",
     VENTILATION_MODE.AWAY: "Away",
@@ -56,8 +63,7 @@ AIR_TEMP_SETPOINT_AWAY = DeviceProperty('analogValue', 1985)
 AIR_TEMP_SETPOINT_HOME = DeviceProperty('analogValue', 1994)
 
 # Trigger temporary fireplace ventilation
-FIREPLACE_VENTILATION = DeviceProperty('multiStateValue', 360)
-FIREPLACE_VENTILATION.TRIGGER = 2
+FIREPLACE_VENTILATION = DeviceProperty('multiStateValue', 360, values=Trigger)
 
 # Fireplace ventilation runtime (e.g. 10 minutes)
 FIREPLACE_VENTILATION_RUNTIME = DeviceProperty('positiveIntegerValue', 270)
@@ -66,8 +72,7 @@ FIREPLACE_VENTILATION_RUNTIME = DeviceProperty('positiveIntegerValue', 270)
 FIREPLACE_VENTILATION_REMAINING_DURATION = DeviceProperty('analogValue', 2038)
 
 # Trigger temporary rapid ventilation
-RAPID_VENTILATION = DeviceProperty('multiStateValue', 357)
-RAPID_VENTILATION.TRIGGER = 2
+RAPID_VENTILATION = DeviceProperty('multiStateValue', 357, values=Trigger)
 
 # Rapid ventilation runtime (e.g. 10 minutes)
 RAPID_VENTILATION_RUNTIME = DeviceProperty('positiveIntegerValue', 293)
@@ -76,25 +81,25 @@ RAPID_VENTILATION_RUNTIME = DeviceProperty('positiveIntegerValue', 293)
 RAPID_VENTILATION_REMAINING_DURATION = DeviceProperty('analogValue', 2031)
 
 # Outside air temperature (e.g. 10.680000305175781 degreesCelsius)
-OUTSIDE_AIR_TEMPERATURE = DeviceProperty('analogInput', 1)
+OUTSIDE_AIR_TEMPERATURE = DeviceProperty('analogInput', 1, poll_tier=POLL_TIER_FAST)
 
 # Supply air temperature (e.g. 18.809999465942383 degreesCelsius)
-SUPPLY_AIR_TEMPERATURE = DeviceProperty('analogInput', 4)
+SUPPLY_AIR_TEMPERATURE = DeviceProperty('analogInput', 4, poll_tier=POLL_TIER_FAST)
 
 # Tacho, supply fan (e.g. 3120.0 revolutionsPerMinute)
-TACHO_SUPPLY_FAN = DeviceProperty('analogInput', 5)
+TACHO_SUPPLY_FAN = DeviceProperty('analogInput', 5, poll_tier=POLL_TIER_FAST)
 
 # Exhaust air temperature (e.g. 14.770000457763672 degreesCelsius)
-EXHAUST_AIR_TEMPERATURE = DeviceProperty('analogInput', 11)
+EXHAUST_AIR_TEMPERATURE = DeviceProperty('analogInput', 11, poll_tier=POLL_TIER_FAST)
 
 # Tacho, exhaust fan (e.g. 3090.0 revolutionsPerMinute)
-TACHO_EXHAUST_FAN = DeviceProperty('analogInput', 12)
+TACHO_EXHAUST_FAN = DeviceProperty('analogInput', 12, poll_tier=POLL_TIER_FAST)
 
 # Extract air temperature (e.g. 21.5 degreesCelsius)
-EXTRACT_AIR_TEMPERATURE = DeviceProperty('analogInput', 59)
+EXTRACT_AIR_TEMPERATURE = DeviceProperty('analogInput', 59, poll_tier=POLL_TIER_FAST)
 
 # Room temperature (e.g. 22.200000762939453 degreesCelsius)
-ROOM_TEMPERATURE = DeviceProperty('analogInput', 75)
+ROOM_TEMPERATURE = DeviceProperty('analogInput', 75, poll_tier=POLL_TIER_FAST)
 
 # Fan speed, supply air (e.g. 70.0 percent)
 FAN_SPEED_SUPPLY_AIR = DeviceProperty('analogOutput', 3)
@@ -106,64 +111,58 @@ FAN_SPEED_EXHAUST_AIR = DeviceProperty('analogOutput', 4)
 ROTATING_HEAT_EXCHANGER_SPEED = DeviceProperty('analogOutput', 0)
 
 # Rotating heat exchanger, efficiency (e.g. 61.461185455322266 percent)
-ROTATING_HEAT_EXCHANGER_EFFICIENCY = DeviceProperty('analogValue', 2023)
+ROTATING_HEAT_EXCHANGER_EFFICIENCY = DeviceProperty('analogValue', 2023, poll_tier=POLL_TIER_FAST)
 
 # Electrical heater, OFF/ON (e.g. inactive)
-ELECTRICAL_HEATER = DeviceProperty('binaryValue', 445)
-ELECTRICAL_HEATER.ACTIVE = 'active'
-ELECTRICAL_HEATER.INACTIVE = 'inactive'
+ELECTRICAL_HEATER = DeviceProperty('binaryValue', 445, values=BinaryState)
 
 # Electric heater, nom. Power (e.g. 0.800000011920929 kilowatts)
-ELECTRIC_HEATER_NOM_POWER = DeviceProperty('analogValue', 190)
+ELECTRIC_HEATER_NOM_POWER = DeviceProperty('analogValue', 190, poll_tier=POLL_TIER_SLOW)
 
 # Heating coil electric power (e.g. 0.0 kilowatts)
 HEATING_COIL_ELECTRIC_POWER = DeviceProperty('analogValue', 194)
 
 # Cooker hood, activate (e.g. inactive)
-COOKER_HOOD = DeviceProperty('binaryValue', 402, priority=13)
-COOKER_HOOD.ACTIVE = 'active'
-COOKER_HOOD.INACTIVE = 'inactive'
+COOKER_HOOD = DeviceProperty('binaryValue', 402, priority=13, values=BinaryState)
 
 # Linear, setpoint supply air HIGH (e.g. 100.0 percent)
-LINEAR_SETPOINT_SUPPLY_AIR_HIGH = DeviceProperty('analogValue', 1835)
+LINEAR_SETPOINT_SUPPLY_AIR_HIGH = DeviceProperty('analogValue', 1835, poll_tier=POLL_TIER_SLOW)
 
 # Linear, setpoint supply air HOME (e.g. 70.0 percent)
-LINEAR_SETPOINT_SUPPLY_AIR_HOME = DeviceProperty('analogValue', 1836)
+LINEAR_SETPOINT_SUPPLY_AIR_HOME = DeviceProperty('analogValue', 1836, poll_tier=POLL_TIER_SLOW)
 
 # Linear, setpoint supply air AWAY (e.g. 50.0 percent)
-LINEAR_SETPOINT_SUPPLY_AIR_AWAY = DeviceProperty('analogValue', 1837)
+LINEAR_SETPOINT_SUPPLY_AIR_AWAY = DeviceProperty('analogValue', 1837, poll_tier=POLL_TIER_SLOW)
 
 # Linear, setpoint supply air FIRE (e.g. 90.0 percent)
-LINEAR_SETPOINT_SUPPLY_AIR_FIRE = DeviceProperty('analogValue', 1838)
+LINEAR_SETPOINT_SUPPLY_AIR_FIRE = DeviceProperty('analogValue', 1838, poll_tier=POLL_TIER_SLOW)
 
 # Linear, setpoint supply air COOKER (e.g. 90.0 percent)
-LINEAR_SETPOINT_SUPPLY_AIR_COOKER = DeviceProperty('analogValue', 1839)
+LINEAR_SETPOINT_SUPPLY_AIR_COOKER = DeviceProperty('analogValue', 1839, poll_tier=POLL_TIER_SLOW)
 
 # Linear, setpoint exhaust air HIGH (e.g. 100.0 percent)
-LINEAR_SETPOINT_EXHAUST_AIR_HIGH = DeviceProperty('analogValue', 1840)
+LINEAR_SETPOINT_EXHAUST_AIR_HIGH = DeviceProperty('analogValue', 1840, poll_tier=POLL_TIER_SLOW)
 
 # Linear, setpoint exhaust air HOME (e.g. 70.0 percent)
-LINEAR_SETPOINT_EXHAUST_AIR_HOME = DeviceProperty('analogValue', 1841)
+LINEAR_SETPOINT_EXHAUST_AIR_HOME = DeviceProperty('analogValue', 1841, poll_tier=POLL_TIER_SLOW)
 
 # Linear, setpoint exhaust air AWAY (e.g. 50.0 percent)
-LINEAR_SETPOINT_EXHAUST_AIR_AWAY = DeviceProperty('analogValue', 1842)
+LINEAR_SETPOINT_EXHAUST_AIR_AWAY = DeviceProperty('analogValue', 1842, poll_tier=POLL_TIER_SLOW)
 
 # Linear, setpoint exhaust air FIRE (e.g. 50.0 percent)
-LINEAR_SETPOINT_EXHAUST_AIR_FIRE = DeviceProperty('analogValue', 1843)
+LINEAR_SETPOINT_EXHAUST_AIR_FIRE = DeviceProperty('analogValue', 1843, poll_tier=POLL_TIER_SLOW)
 
 # Linear, setpoint exhaust air COOKER (e.g. 50.0 percent)
-LINEAR_SETPOINT_EXHAUST_AIR_COOKER = DeviceProperty('analogValue', 1844)
+LINEAR_SETPOINT_EXHAUST_AIR_COOKER = DeviceProperty('analogValue', 1844, poll_tier=POLL_TIER_SLOW)
 
 # Air filter, operating time (e.g. 0.0 hours)
 AIR_FILTER_OPERATING_TIME = DeviceProperty('analogValue', 285)
 
 # Air filter, time period for exchange (e.g. 4380.0 hours)
-AIR_FILTER_TIME_PERIOD_FOR_EXCHANGE = DeviceProperty('analogValue', 286)
+AIR_FILTER_TIME_PERIOD_FOR_EXCHANGE = DeviceProperty('analogValue', 286, poll_tier=POLL_TIER_SLOW)
 
 # Scheduler override (e.g. inactive)
-SCHEDULER_OVERRIDE = DeviceProperty('binaryValue', 474)
-SCHEDULER_OVERRIDE.ACTIVE = 'active'
-SCHEDULER_OVERRIDE.INACTIVE = 'inactive'
+SCHEDULER_OVERRIDE = DeviceProperty('binaryValue', 474, values=BinaryState)
 
 # List of all DeviceProperties defined in this file
 DEVICE_PROPERTIES = [
@@ -0,0 +1,658 @@
+"""Point table generated from bac0_points_dump.txt by `python -m lib.points`. Do not edit."""
+
+# path, name, object_type, instance_id, description, units, example, value_range
+POINTS = (
+    ("R(1)'TOa", 'OUTSIDE_AIR_TEMPERATURE', 'analogInput', 1, 'Outside air temperature', 'degreesCelsius', 11.90999984741211, None),
+    ("R(1)'TSu", 'SUPPLY_AIR_TEMPERATURE', 'analogInput', 4, 'Supply air temperature', 'degreesCelsius', 21.799999237060547, None),
+    ("R(1)'FanSuSpdFb", 'TACHO_SUPPLY_FAN', 'analogInput', 5, 'Tacho, supply fan', 'revolutionsPerMinute', 3108.0, None),
+    ("R(1)'TEh", 'EXHAUST_AIR_TEMPERATURE', 'analogInput', 11, 'Exhaust air temperature', 'degreesCelsius', 15.079999923706055, None),
+    ("R(1)'FanEhSpdFb", 'TACHO_EXHAUST_FAN', 'analogInput', 12, 'Tacho, exhaust fan', 'revolutionsPerMinute', 3068.0, None),
+    ("R(1)'TEx", 'EXTRACT_AIR_TEMPERATURE', 'analogInput', 59, 'Extract air temperature', 'degreesCelsius', 21.90999984741211, None),
+    ("R(1)'IOExtnDevEcul'TSuAfHExg", 'TEMPERATURE_SUPPLY_AIR_AFTER_ROTOR', 'analogInput', 71, 'Temperature, supply air after rotor', 'degreesCelsius', 0.0, None),
+    ("R(1)'IOExtnDevEcul'DiffPFanEh", 'AIR_FLOW_PRESSURE_EXHAUST_FAN', 'analogInput', 72, 'Air flow, pressure exhaust fan', 'pascals', 0.0, None),
+    ("R(1)'IOExtnDevEcul'DiffPFanSu", 'AIR_FLOW_PRESSURE_SUPPLY_FAN', 'analogInput', 73, 'Air flow, pressure supply fan', 'pascals', 0.0, None),
+    ("R(1)'ROpUnDev'TR", 'ROOM_TEMPERATURE', 'analogInput', 75, 'Room temperature', 'degreesCelsius', 22.440000534057617, None),
+    ("R(1)'IOExtnDevEcul'AQualRIn", 'AIR_QUALITY_INPUT_VALUE', 'analogInput', 77, 'Air quality, input value', 'partsPerMillion', 0.0, None),
+    ("R(1)'PDuctDevQbm'PEx", 'EXTRACT_AIR_PRESSURE', 'analogInput', 78, 'Extract air pressure', 'pascals', 0.0, None),
+    ("R(1)'PDuctDevQbm'PSu", 'SUPPLY_AIR_PRESSURE', 'analogInput', 79, 'Supply air pressure', 'pascals', 0.0, None),
+    ("R(1)'FanNodeDev'TRMaxRfqs", 'MAXIMUM_ROOM_TEMPERATURE_RF_SYSTEM', 'analogInput', 80, 'Maximum room temperature RF system', 'degreesCelsius', 0.0, None),
+    ("R(1)'FanNodeDev'HuRMaxRfqs", 'MAXIMUM_ROOM_AIR_HUMIDITY_RF_SYSTEM', 'analogInput', 81, 'Maximum room air humidity RF system', 'percent', 0.0, (0.0, 100.0)),
+    ("R(1)'FanNodeDev'AQualRMaxRfqs", 'MAXIMUM_ROOM_AIR_QUALITY_RF_SYSTEM', 'analogInput', 82, 'Maximum room air quality RF system', 'partsPerMillion', 0.0, None),
+    ("R(1)'ROpUnDevVmsh1'TRVmsh1", 'ROOM_TEMPERATURE_VMSH_1', 'analogInput', 83, 'Room temperature VMSH 1', 'degreesCelsius', 0.0, None),
+    ("R(1)'ROpUnDevVmsh1'HuRVmsh1", 'ROOM_AIR_HUMIDITY_VMSH_1', 'analogInput', 84, 'Room air humidity VMSH 1', 'percent', 0.0, (0.0, 100.0)),
+    ("R(1)'ROpUnDevVmsh1'TDwpRVmsh1", 'ROOM_DEW_POINT_TEMPERATURE_VMSH_1', 'analogInput', 85, 'Room dew point temperature VMSH 1', 'degreesCelsius', 0.0, None),
+    ("R(1)'ROpUnDevVmsh2'TRVmsh2", 'ROOM_TEMPERATURE_VMSH_2', 'analogInput', 86, 'Room temperature VMSH 2', 'degreesCelsius', 0.0, None),
+    ("R(1)'ROpUnDevVmsh2'HuRVmsh2", 'ROOM_AIR_HUMIDITY_VMSH_2', 'analogInput', 87, 'Room air humidity VMSH 2', 'percent', 0.0, (0.0, 100.0)),
+    ("R(1)'ROpUnDevVmsh2'TDwpRVmsh2", 'ROOM_DEW_POINT_TEMPERATURE_VMSH_2', 'analogInput', 88, 'Room dew point temperature VMSH 2', 'degreesCelsius', 0.0, None),
+    ("R(1)'ROpUnDevVmsh3'TRVmsh3", 'ROOM_TEMPERATURE_VMSH_3', 'analogInput', 89, 'Room temperature VMSH 3', 'degreesCelsius', 0.0, None),
+    ("R(1)'ROpUnDevVmsh3'HuRVmsh3", 'ROOM_AIR_HUMIDITY_VMSH_3', 'analogInput', 90, 'Room air humidity VMSH 3', 'percent', 0.0, (0.0, 100.0)),
+    ("R(1)'ROpUnDevVmsh3'TDwpRVmsh3", 'ROOM_DEW_POINT_TEMPERATURE_VMSH_3', 'analogInput', 91, 'Room dew point temperature VMSH 3', 'degreesCelsius', 0.0, None),
+    ("R(1)'ROpUnDevVmsc'AQualRVmsc", 'AIR_QUALITY_MAX_VALUE_RF', 'analogInput', 92, 'Air quality, max value RF', 'partsPerMillion', 0.0, None),
+    ("R(1)'IOExtnDevVmc'InStaVmc", 'INPUTS_STATE_VMC', 'analogInput', 93, 'Inputs state VMC', 'noUnits', 0.0, None),
+    ("R(1)'RotHExgSpd", 'ROTATING_HEAT_EXCHANGER', 'analogOutput', 0, 'Rotating heat exchanger', 'percent', 100.0, (0.0, 100.0)),
+    ("R(1)'FanSuSpd", 'FAN_SPEED_SUPPLY_AIR', 'analogOutput', 3, 'Fan speed, supply air', 'percent', 70.0, (0.0, 100.0)),
+    ("R(1)'FanEhSpd", 'FAN_SPEED_EXHAUST_AIR', 'analogOutput', 4, 'Fan speed, exhaust air', 'percent', 70.0, (0.0, 100.0)),
+    ("R(1)'IOExtnDevEcul'CclVlvPos(1)", 'COOLING_VALVE_POSITION', 'analogOutput', 28, 'Cooling, valve position', 'percent', 0.0, (0.0, 100.0)),
+    ("R(1)'HclElPos", 'HEATING_BATTERY_ELECTRICAL', 'analogOutput', 29, 'Heating battery, electrical', 'percent', 59.90284729003906, (0.0, 100.0)),
+    ("Infra'DiagAs", 'DIAGNOSTICS_FOR_AUTOMATION_STATION', 'analogValue', 0, 'Diagnostics for automation station', 'noUnits', 2.0, None),
+    ("PlnkBus'DiagPlnkBus", 'DIAGNOSTICS_FOR_KNX_PL_LINK_BUS', 'analogValue', 3, 'Diagnostics for KNX PL-Link bus', 'noUnits', 1.0, None),
+    ("R(1)'RHvacCoo'TRCol'TRRs", 'RESULT_OF_ROOM_TEMPERATURE', 'analogValue', 5, 'Result of room temperature', 'degreesCelsius', 22.440000534057617, None),
+    ("R(1)'RHvacCoo'AlmFnct'AalmCode", 'ALARM_CODE_TYPE_A', 'analogValue', 8, 'Alarm, code type A', 'noUnits', 0.0, None),
+    ("R(1)'RHvacCoo'SftyCtl'TSuFireAlmLm", 'FIRE_ALARM_LIMIT_SUPPLY_AIR', 'analogValue', 56, 'Fire alarm, limit supply air', 'degreesCelsius', 72.0, None),
+    ("R(1)'RHvacCoo'SftyCtl'TSuHiAlmLm", 'MAINT_ALARM_MAX_LIMIT_SUPPLY_AIR', 'analogValue', 57, 'Maint.alarm, max limit supply air', 'degreesCelsius', 60.0, None),
+    ("R(1)'RHvacCoo'SftyCtl'TSuLoAlmLm", 'MAINT_ALARM_MIN_LIMIT_SUPPLY_AIR', 'analogValue', 58, 'Maint.alarm, min limit supply air', 'degreesCelsius', 0.0, None),
+    ("R(1)'RHvacCoo'SftyCtl'TExFireAlmLm", 'FIRE_ALARM_LIMIT_EXTRACT_AIR', 'analogValue', 59, 'Fire alarm, limit extract air', 'degreesCelsius', 72.0, None),
+    ("R(1)'RHvacCoo'TCtlC'PrSpCCmf", 'PRESENT_COOLING_SETPOINT_FOR_COMFORT', 'analogValue', 69, 'Present cooling setpoint for comfort', 'degreesCelsius', 24.5, None),
+    ("R(1)'RHvacCoo'TCtlC'PrSpCPcf", 'PRESENT_COOLING_SETPOINT_FOR_PRE_COMFORT', 'analogValue', 70, 'Present cooling setpoint for pre-comfort', 'degreesCelsius', 26.0, None),
+    ("R(1)'RHvacCoo'TCtlC'PrSpCEco", 'PRESENT_COOLING_SETPOINT_FOR_ECONOMY', 'analogValue', 71, 'Present cooling setpoint for economy', 'degreesCelsius', 30.0, None),
+    ("R(1)'RHvacCoo'TCtlC'PrSpCPrt", 'PRESENT_COOLING_SETPOINT_FOR_PROTECTION', 'analogValue', 72, 'Present cooling setpoint for protection', 'degreesCelsius', 32.0, None),
+    ("R(1)'RHvacCoo'TCtlC'PrSpC", 'PRESENT_COOLING_SETPOINT', 'analogValue', 73, 'Present cooling setpoint', 'degreesCelsius', 26.0, None),
+    ("R(1)'RHvacCoo'TCtlC'EndSpShftC", 'COOLING_SETPOINT_END_VALUE_SHIFT', 'analogValue', 75, 'Cooling, setpoint end value shift', 'degreesCelsius', 40.0, None),
+    ("R(1)'RHvacCoo'TCtlC'CLmCmf", 'COOLING_OUTDOOR_AIR_LIMIT_FOR_RELEASE', 'analogValue', 76, 'Cooling, outdoor air limit for release', 'degreesCelsius', 20.0, None),
+    ("R(1)'RHvacCoo'TCtlC'SttSpShftC", 'COOLING_SETPOINT_START_VALUE_SHIFT', 'analogValue', 78, 'Cooling setpoint start value shift', 'degreesCelsius', 30.0, None),
+    ("R(1)'RHvacCoo'TCtlC'SpShftC", 'COOLING_SETPOINT_FOR_SHIFT', 'analogValue', 79, 'Cooling, setpoint for shift', 'degreesKelvin', 0.0, None),
+    ("R(1)'RHvacCoo'TCtlH'PrSpHCmf", 'PRESENT_HEATING_SETPOINT_FOR_COMFORT', 'analogValue', 96, 'Present heating setpoint for comfort', 'degreesCelsius', 23.5, None),
+    ("R(1)'RHvacCoo'TCtlH'PrSpHPcf", 'PRESENT_HEATING_SETPOINT_FOR_PRE_COMFORT', 'analogValue', 97, 'Present heating setpoint for pre-comfort', 'degreesCelsius', 23.0, None),
+    ("R(1)'RHvacCoo'TCtlH'PrSpHEco", 'PRESENT_HEATING_SETPOINT_FOR_ECONOMY', 'analogValue', 98, 'Present heating setpoint for economy', 'degreesCelsius', 23.0, None),
+    ("R(1)'RHvacCoo'TCtlH'PrSpHPrt", 'PRESENT_HEATING_SETPOINT_FOR_PROTECTION', 'analogValue', 99, 'Present heating setpoint for protection', 'degreesCelsius', 10.0, None),
+    ("R(1)'RHvacCoo'TCtlH'PrSpH", 'PRESENT_HEATING_SETPOINT', 'analogValue', 100, 'Present heating setpoint', 'degreesCelsius', 23.0, None),
+    ("R(1)'RHvacCoo'TCtlH'EndSpShftH", 'HEATING_SETPOINT_END_VALUE_SHIFT', 'analogValue', 102, 'Heating, setpoint end value shift', 'degreesCelsius', -15.0, None),
+    ("R(1)'RHvacCoo'TCtlH'HLmCmf", 'HEATING_LIMIT_COMFORT', 'analogValue', 103, 'Heating limit comfort', 'degreesCelsius', 99.9000015258789, None),
+    ("R(1)'RHvacCoo'TCtlH'TOaLmSttCorr", 'OUTS_AIR_TEMP_LIMIT_TO_START_CORRECTION', 'analogValue', 104, 'Outs.air temp.limit to start correction', 'degreesCelsius', -5.0, None),
+    ("R(1)'RHvacCoo'TCtlH'SttSpShftH", 'HEATING_SETPOINT_START_VALUE_SHIFT', 'analogValue', 106, 'Heating, setpoint start value shift', 'degreesCelsius', -5.0, None),
+    ("R(1)'RHvacCoo'TCtlH'SpShftH", 'HEATING_SETPOINT_FOR_SHIFT', 'analogValue', 107, 'Heating, setpoint for shift', 'degreesKelvin', 0.0, None),
+    ("R(1)'RHvacCoo'SpTRDtr'SpTR", 'ROOM_TEMPERATURE_SETPOINT', 'analogValue', 126, 'Room temperature setpoint', 'degreesCelsius', 24.0, None),
+    ("R(1)'RHvacCoo'SpTRDtr'SpTRShft", 'ROOM_TEMPERATURE_SETPOINT_SHIFT', 'analogValue', 127, 'Room temperature setpoint shift', 'degreesKelvin', 0.0, None),
+    ("R(1)'RHvacCoo'MntnFnct'BalmCode", 'ALARM_STATE_CODE_B', 'analogValue', 130, 'Alarm, state code B', 'noUnits', 0.0, None),
+    ("R(1)'HVAC'TREff", 'EFFECTIVE_ROOM_TEMPERATURE', 'analogValue', 131, 'Effective room temperature', 'degreesCelsius', 21.90999984741211, None),
+    ("R(1)'HVAC'PrSpTSu", 'PRESENT_SETPOINT_SUPPLY_TEMPERATURE', 'analogValue', 132, 'Present setpoint supply temperature', 'degreesCelsius', 23.0, None),
+    ("R(1)'HVAC'Erc'GainRotHxCtrC", 'ROTATING_HEAT_EXCHANGER_COOLING_KP', 'analogValue', 134, 'Rotating heat exchanger, cooling Kp', 623, 10.0, None),
+    ("R(1)'HVAC'Erc'GainRotHxCtrH", 'ROTATING_HEAT_EXCHANGER_HEATING_KP', 'analogValue', 135, 'Rotating heat exchanger, heating Kp', 623, 10.0, None),
+    ("R(1)'HVAC'Erc'DiffTRTOaMinC", 'COOLING_DT_B3_B4_START', 'analogValue', 136, 'Cooling, dT B3-B4 start', 'degreesKelvin', 4.0, None),
+    ("R(1)'HVAC'Erc'SstHuCmpDeic", 'DE_ICING_HUMIDITY_COMP_START', 'analogValue', 140, 'De-icing, humidity comp. Start', 'percent', 80.0, (0.0, 100.0)),
+    ("R(1)'HVAC'Erc'EndHuCmpDeic", 'DE_ICING_HUMIDITY_COMP_END', 'analogValue', 142, 'De-icing, humidity comp. End', 'percent', 20.0, (0.0, 100.0)),
+    ("R(1)'HVAC'Erc'RotHExgHReq", 'ROTARY_HEAT_EXCHANGER_HEATING_REQUEST', 'analogValue', 144, 'Rotary heat exchanger heating request', 'percent', 100.0, (0.0, 100.0)),
+    ("R(1)'HVAC'Erc'RotHExgCReq", 'ROTARY_HEAT_EXCHANGER_COOLING_REQUEST', 'analogValue', 145, 'Rotary heat exchanger cooling request', 'percent', 0.0, (0.0, 100.0)),
+    ("R(1)'HVAC'Erc'RotHExgSpdMin", 'ROTATING_HEAT_EXCHANGER_MIN_SPEED', 'analogValue', 147, 'Rotating heat exchanger , min speed', 'percent', 0.0, (0.0, 100.0)),
+    ("R(1)'HVAC'Erc'RotHExgSpdMax", 'ROTATING_HEAT_EXCHANGER_MAX_SPEED', 'analogValue', 148, 'Rotating heat exchanger , max speed', 'percent', 100.0, (0.0, 100.0)),
+    ("R(1)'HVAC'Hcl'SwiOnAirFlHldH", 'SWITCH_ON_POINT_FOR_AIR_FLOW_HOLD_HEAT', 'analogValue', 189, 'Switch-on point for air flow hold heat.', 'percent', 4.0, (0.0, 100.0)),
+    ("R(1)'HVAC'Hcl'NomElPwr", 'ELECTRIC_HEATER_NOM_POWER', 'analogValue', 190, 'Electric heater, nom. Power', 'kilowatts', 0.800000011920929, None),
+    ("R(1)'HVAC'Hcl'HclElPwr", 'HEATING_COIL_ELECTRIC_POWER', 'analogValue', 194, 'Heating coil electric power', 'kilowatts', 0.47101864218711853, None),
+    ("R(1)'HVAC'Hcl'HclHReqMin", 'HEATING_COIL_HEATING_REQUEST_MINIMUM', 'analogValue', 195, 'Heating coil heating request minimum', 'percent', 35.45454406738281, (0.0, 100.0)),
+    ("R(1)'HVAC'Hcl'HclHReq", 'HEATING_COIL_HEATING_REQUEST', 'analogValue', 196, 'Heating coil heating request', 'percent', 59.09090805053711, (0.0, 100.0)),
+    ("R(1)'HVAC'Hcl'GainHclTSuCtrH", 'SUPPLY_HEATER_KP_ZONE_2', 'analogValue', 197, 'Supply, heater, Kp zone 2', 623, 5.0, None),
+    ("R(1)'HVAC'AlmBdl'TiOpFil", 'AIR_FILTER_OPERATING_TIME', 'analogValue', 285, 'Air filter, operating time', 'hours', 24.0, None),
+    ("R(1)'HVAC'AlmBdl'TiOpFilRpc", 'AIR_FILTER_TIME_PERIOD_FOR_EXCHANGE', 'analogValue', 286, 'Air filter, time period for exchange', 'hours', 4380.0, None),
+    ("ModBus'DiagModBus", 'DIAGNOSTICS_FOR_MODBUS', 'analogValue', 296, 'Diagnostics for Modbus', 'noUnits', 0.0, None),
+    ("IOBus'DiagIOBus", 'DIAGNOSTICS_FOR_I_O_BUS', 'analogValue', 297, 'Diagnostics for I/O bus', 'noUnits', 3.0, None),
+    ("R(1)'RHvacCoo'AlmFnct'PrAalmCode", 'PRESENT_A_ALARM_CODE', 'analogValue', 1794, 'Present A-Alarm code', 'noUnits', 0.0, None),
+    ("R(1)'IOExtnDevEcul'DiagEcul", 'DIAGNOSTICS_FOR_ECUL', 'analogValue', 1796, 'Diagnostics for ECUL', 'noUnits', 8.0, None),
+    ("R(1)'RHvacCoo'FplcVntOp'OphFplcVnt", 'TIME_COUNTER_FIRE', 'analogValue', 1814, 'Time counter, FIRE', 'hours', 0.0, None),
+    ("R(1)'RHvacCoo'FhVntOp'OphFhVnt", 'TIME_COUNTER_COOKER_HOOD', 'analogValue', 1820, 'Time counter, cooker hood', 'hours', 0.0, None),
+    ("R(1)'RHvacCoo'VntCtl'PrSpVnt", 'AIR_QUALITY_PRESENT_SETPOINT', 'analogValue', 1831, 'Air quality, present setpoint', 'partsPerMillion', 700.0, None),
+    ("R(1)'RHvacCoo'VntCtl'SpAQualRCmf", 'AIR_QUALITY_SETPOINT_HIGH', 'analogValue', 1832, 'Air quality, setpoint  HIGH', 'partsPerMillion', 1500.0, None),
+    ("R(1)'RHvacCoo'VntCtl'SpAQualRPcf", 'AIR_QUALITY_SETPOINT_HOME', 'analogValue', 1833, 'Air quality, setpoint  HOME', 'partsPerMillion', 700.0, None),
+    ("R(1)'RHvacCoo'VntCtl'SpAQualREco", 'AIR_QUALITY_SETPOINT_AWAY', 'analogValue', 1834, 'Air quality, setpoint  AWAY', 'partsPerMillion', 700.0, None),
+    ("R(1)'RHvacCoo'VntCtl'SpFanSuSpdHi", 'LINEAR_SETPOINT_SUPPLY_AIR_HIGH', 'analogValue', 1835, 'Linear, setpoint supply air HIGH', 'percent', 100.0, (0.0, 100.0)),
+    ("R(1)'RHvacCoo'VntCtl'SpFanSuSpdHome", 'LINEAR_SETPOINT_SUPPLY_AIR_HOME', 'analogValue', 1836, 'Linear, setpoint supply air HOME', 'percent', 70.0, (0.0, 100.0)),
+    ("R(1)'RHvacCoo'VntCtl'SpFanSuSpdAway", 'LINEAR_SETPOINT_SUPPLY_AIR_AWAY', 'analogValue', 1837, 'Linear, setpoint supply air AWAY', 'percent', 50.0, (0.0, 100.0)),
+    ("R(1)'RHvacCoo'VntCtl'SpFanSuSpdFplc", 'LINEAR_SETPOINT_SUPPLY_AIR_FIRE', 'analogValue', 1838, 'Linear, setpoint supply air FIRE', 'percent', 90.0, (0.0, 100.0)),
+    ("R(1)'RHvacCoo'VntCtl'SpFanSuSpdCkr", 'LINEAR_SETPOINT_SUPPLY_AIR_COOKER', 'analogValue', 1839, 'Linear, setpoint supply air COOKER', 'percent', 90.0, (0.0, 100.0)),
+    ("R(1)'RHvacCoo'VntCtl'SpFanEhSpdHi", 'LINEAR_SETPOINT_EXHAUST_AIR_HIGH', 'analogValue', 1840, 'Linear, setpoint exhaust air HIGH', 'percent', 100.0, (0.0, 100.0)),
+    ("R(1)'RHvacCoo'VntCtl'SpFanEhSpdHome", 'LINEAR_SETPOINT_EXHAUST_AIR_HOME', 'analogValue', 1841, 'Linear, setpoint exhaust air HOME', 'percent', 70.0, (0.0, 100.0)),
+    ("R(1)'RHvacCoo'VntCtl'SpFanEhSpdAway", 'LINEAR_SETPOINT_EXHAUST_AIR_AWAY', 'analogValue', 1842, 'Linear, setpoint exhaust air AWAY', 'percent', 50.0, (0.0, 100.0)),
+    ("R(1)'RHvacCoo'VntCtl'SpFanEhSpdFplc", 'LINEAR_SETPOINT_EXHAUST_AIR_FIRE', 'analogValue', 1843, 'Linear, setpoint exhaust air FIRE', 'percent', 50.0, (0.0, 100.0)),
+    ("R(1)'RHvacCoo'VntCtl'SpFanEhSpdCkr", 'LINEAR_SETPOINT_EXHAUST_AIR_COOKER', 'analogValue', 1844, 'Linear, setpoint exhaust air COOKER', 'percent', 50.0, (0.0, 100.0)),
+    ("R(1)'RHvacCoo'VntCtl'GainVntCtr", 'GAIN_FOR_VENTILATION_CONTROLLER', 'analogValue', 1845, 'Gain for ventilation controller', 625, 0.23000000417232513, None),
+    ("R(1)'RHvacCoo'MntnFnct'PrBalmCode", 'PRESENT_B_ALARM_CODE', 'analogValue', 1846, 'Present B-Alarm code', 'noUnits', 0.0, None),
+    ("R(1)'HVAC'AlmBdl'OphDev", 'OPERATING_HOURS_TOTAL_TIME', 'analogValue', 1847, 'Operating hours, total time', 'hours', 8760.0, None),
+    ("R(1)'HVAC'Erc'DiffTHuCmpDeic", 'DE_ICING_HUMIDITY_COMP_DELTA', 'analogValue', 1849, 'De-icing, humidity comp. Delta', 'degreesKelvin', 1.5, None),
+    ("R(1)'HVAC'Erc'DTRotHxBltFlt", 'BELT_BROKEN_DELTA_B3_B6', 'analogValue', 1850, 'Belt broken, delta B3-B6', 'degreesKelvin', 4.0, None),
+    ("R(1)'HVAC'Erc'OphErc", 'TIME_COUNTER_OP_TIME_RMC', 'analogValue', 1851, 'Time counter, op. time RMC', 'hours', 8096.0, None),
+    ("R(1)'HVAC'Erc'RotHExgSpdDeic", 'DE_ICING_ROTOR_SPEED', 'analogValue', 1852, 'De-icing, rotor speed', 'percent', 100.0, (0.0, 100.0)),
+    ("R(1)'HVAC'FanSu'FanVntReq", 'AIR_QUALITY_PRESENT_FAN_CONTROL', 'analogValue', 1869, 'Air quality, present fan control', 'percent', 0.0, (0.0, 100.0)),
+    ("R(1)'HVAC'FanSu'FanDhuReq", 'HUMIDITY_PRESENT_FAN_CONTROL', 'analogValue', 1870, 'Humidity, present fan control', 'percent', 0.0, (0.0, 100.0)),
+    ("R(1)'HVAC'FanSu'SpFanSuSpdDeic", 'DE_ICING_SETPOINT_SUPPLY_FAN_SPEED', 'analogValue', 1878, 'De-icing, setpoint supply fan speed', 'percent', 15.0, (0.0, 100.0)),
+    ("R(1)'HVAC'Hcl'OphHcl", 'TIME_COUNTER_OP_TIME_EL_HEATER', 'analogValue', 1879, 'Time counter, op. time - El. heater', 'hours', 4184.0, None),
+    ("R(1)'ROpModDtr'OphStop", 'TIME_COUNTER_STOP', 'analogValue', 1913, 'Time counter, STOP', 'hours', 0.0, None),
+    ("R(1)'ROpModDtr'OphAway", 'TIME_COUNTER_AWAY', 'analogValue', 1914, 'Time counter, AWAY', 'hours', 0.0, None),
+    ("R(1)'ROpModDtr'OphHome", 'TIME_COUNTER_HOME', 'analogValue', 1915, 'Time counter, HOME', 'hours', 7760.0, None),
+    ("R(1)'ROpModDtr'OphHi", 'TIME_COUNTER_HIGH', 'analogValue', 1916, 'Time counter, HIGH', 'hours', 980.0, None),
+    ("R(1)'RHvacCoo'AQualRCol'AQualRRs", 'AIR_QUALITY_MAX_VALUE', 'analogValue', 1919, 'Air quality, max value', 'partsPerMillion', 0.0, None),
+    ("R(1)'RHvacCoo'TCtlH'SpTHrv", 'AIR_TEMP_SETPOINT', 'analogValue', 1920, 'Air temp., setpoint', 'degreesCelsius', 24.0, None),
+    ("R(1)'RHvacCoo'TCtlH'DSpHHome", 'AIR_TEMP_DELTA_SETPOINT_HEATING_HOME', 'analogValue', 1921, 'Air temp., delta setpoint heating HOME', 'degreesKelvin', 1.0, None),
+    ("R(1)'RHvacCoo'TCtlH'NzTHrv", 'SUPPLY_DELTA_HOME', 'analogValue', 1922, 'Supply, delta HOME', 'degreesKelvin', 1.0, None),
+    ("R(1)'RHvacCoo'TCtlC'DSpCHome", 'AIR_TEMP_DELTA_SETPOINT_COOLING_HOME', 'analogValue', 1926, 'Air temp., delta setpoint cooling HOME', 'degreesKelvin', 2.0, None),
+    ("R(1)'RHvacCoo'FreeCDtr'HysSpTR", 'FREE_COOLING_D_B3_SETPOINT_START', 'analogValue', 1933, 'Free cooling, d B3-setpoint  start', 'degreesKelvin', 2.0, None),
+    ("R(1)'RHvacCoo'FreeCDtr'TOaLm", 'OUTSIDE_AIR_TEMP_LIMIT', 'analogValue', 1934, 'Outside air temp.limit', 'degreesCelsius', 14.0, None),
+    ("R(1)'RHvacCoo'FreeCDtr'HysTOaLm", 'FREE_COOLING_D_B4_SETPOINT', 'analogValue', 1935, 'Free cooling, d B4-setpoint', 'degreesKelvin', 2.0, None),
+    ("R(1)'RHvacCoo'FreeCDtr'DiffTRTOaSwiOn", 'FREE_COOLING_DT_B3_B4_START', 'analogValue', 1936, 'Free cooling, dT B3-B4 start', 'degreesKelvin', 4.0, None),
+    ("R(1)'RHvacCoo'FreeCDtr'DiffTRTOaSwiOf", 'FREE_COOLING_DT_B3_B4_STOP', 'analogValue', 1937, 'Free cooling, dT B3-B4 stop', 'degreesKelvin', 2.0, None),
+    ("R(1)'HVAC'Erc'SpTDeicFan", 'DE_ICING_SETPOINT_FAN_START', 'analogValue', 1938, 'De-icing, setpoint fan start', 'degreesCelsius', 0.0, None),
+    ("R(1)'HVAC'Erc'SpTDeicHExg", 'DE_ICING_SETPOINT_ROTOR_START', 'analogValue', 1939, 'De-icing, setpoint rotor start', 'degreesCelsius', 0.0, None),
+    ("R(1)'HVAC'Erc'RotHxSkipSpdHi", 'HEAT_EXCHANGER_SKIP_SPEED_END', 'analogValue', 1940, 'Heat exchanger, skip speed end', 'percent', 0.0, (0.0, 100.0)),
+    ("R(1)'HVAC'Erc'RotHxSkipSpdLo", 'HEAT_EXCHANGER_SKIP_SPEED_START', 'analogValue', 1941, 'Heat exchanger, skip speed start', 'percent', 0.0, (0.0, 100.0)),
+    ("R(1)'HVAC'Erc'TDeicTiOffStt", 'HEAT_EXCHANGER_RAMP_DOWN_START', 'analogValue', 1942, 'Heat exchanger, ramp down start', 'degreesCelsius', 0.0, None),
+    ("R(1)'HVAC'Erc'TDeicTiOffEnd", 'HEAT_EXCHANGER_RAMP_DOWN_END', 'analogValue', 1943, 'Heat exchanger, ramp down end', 'degreesCelsius', -9.0, None),
+    ("R(1)'HVAC'FanSu'FanSpdFbFltLm", 'TACHO_ALARM_LIMIT_FAN_SPEED', 'analogValue', 1948, 'Tacho, alarm limit fan speed', 'revolutionsPerMinute', 100.0, None),
+    ("R(1)'HVAC'FanEh'SpFanEhSpdDeic", 'DE_ICING_SETPOINT_EXHAUST_FAN_SPEED', 'analogValue', 1958, 'De-icing, setpoint exhaust fan speed', 'percent', 75.0, (0.0, 100.0)),
+    ("R(1)'HVAC'Hcl'SpTSuHcl", 'SUPPLY_AIR_SETPOINT_FOR_HEATING', 'analogValue', 1977, 'Supply air, setpoint for heating', 'degreesCelsius', 23.0, None),
+    ("R(1)'HVAC'Erc'DiffTExTOaMin", 'BELT_BROKEN_DELTA_B3_B4', 'analogValue', 1978, 'Belt broken, delta B3-B4', 'degreesKelvin', 10.0, None),
+    ("R(1)'HVAC'DiagVal", 'DIAGNOSTICS_VALUE', 'analogValue', 1983, 'Diagnostics value', 'noUnits', 0.0, None),
+    ("R(1)'RHvacCoo'TCtlH'PrSpShftH", 'HEATING_PRESENT_SETPOINT_SHIFT', 'analogValue', 1984, 'Heating, present setpoint shift', 'degreesKelvin', 0.0, None),
+    ("R(1)'RHvacCoo'TCtlH'SpTAway", 'AIR_TEMP_SETPOINT_AWAY', 'analogValue', 1985, 'Air temp., setpoint AWAY', 'degreesCelsius', 17.0, None),
+    ("R(1)'RHvacCoo'TCtlH'NzTAway", 'SUPPLY_DELTA_AWAY', 'analogValue', 1986, 'Supply, delta AWAY', 'degreesKelvin', 1.0, None),
+    ("R(1)'RHvacCoo'TCtlH'DSpHAway", 'AIR_TEMP_DELTA_SETPOINT_HEATING_AWAY', 'analogValue', 1987, 'Air temp., delta setpoint heating AWAY', 'degreesKelvin', 1.0, None),
+    ("R(1)'RHvacCoo'TCtlC'PrSpShftC", 'COOLING_PRESENT_SETPOINT_SHIFT', 'analogValue', 1991, 'Cooling, present setpoint shift', 'degreesKelvin', 0.0, None),
+    ("R(1)'RHvacCoo'TCtlC'DSpCAway", 'AIR_TEMP_DELTA_SETPOINT_COOLING_AWAY', 'analogValue', 1992, 'Air temp., delta setpoint cooling AWAY', 'degreesKelvin', 6.0, None),
+    ("R(1)'RHvacCoo'TCtlH'SpTHome", 'AIR_TEMP_SETPOINT_HOME', 'analogValue', 1994, 'Air temp., setpoint HOME', 'degreesCelsius', 24.0, None),
+    ("R(1)'HVAC'HclPos", 'HEATING_COIL_POSITION', 'analogValue', 1997, 'Heating coil position', 'percent', 59.18095397949219, (0.0, 100.0)),
+    ("R(1)'ROpUnDev'TiTmpRpdVnt", 'TIME_FOR_TEMPORARY_RAPID_VENTILATION', 'analogValue', 2004, 'Time for temporary rapid ventilation', 'noUnits', 0.0, None),
+    ("R(1)'ROpUnDev'TiRmgTmpVntOp", 'REMAINING_TIME_TEMPORARY_VENTILATION_OP', 'analogValue', 2005, 'Remaining time temporary ventilation op.', 'noUnits', 0.0, None),
+    ("R(1)'ROpUnDev'PrSpTRu", 'PRES_SETP_TEMP_FOR_ROOM_OPERATOR_UNIT', 'analogValue', 2006, 'Pres.setp.temp.for room operator unit', 'degreesCelsius', 24.0, None),
+    ("R(1)'ROpUnDev'TiTmpFplcVnt", 'TIME_FOR_TEMPORARY_FIREPLACE_VENTILATION', 'analogValue', 2007, 'Time for temporary fireplace ventilation', 'noUnits', 0.0, None),
+    ("R(1)'HVAC'Erc'PrHExgEfcy", 'ROTATING_HEAT_EXCHANGER_EFFICIENCY', 'analogValue', 2023, 'Rotating heat exchanger, efficiency', 'percent', 68.29999542236328, (0.0, 100.0)),
+    ("R(1)'RHvacCoo'AlmBdl'FltListNum", 'ALARM_NO_OF_DISPLAYED_ALARMS_IN_LIST', 'analogValue', 2025, 'Alarm, no of displayed alarms in list', 'noUnits', 1.0, None),
+    ("R(1)'RHvacCoo'AlmBdl'FltCnt", 'ALARM_NO_OF_ALARMS_IN_LIST', 'analogValue', 2026, 'Alarm, no of alarms in list', 'noUnits', 1.0, None),
+    ("R(1)'RHvacCoo'AlmBdl'DspyFltList", 'ALARM_ERROR_CODE', 'analogValue', 2027, 'Alarm, error code', 'noUnits', 1020.0, None),
+    ("R(1)'RHvacCoo'AlmBdl'FltCnt1", 'FAULT_COUNTER_1', 'analogValue', 2028, 'Fault counter 1', 'noUnits', 0.0, None),
+    ("R(1)'RHvacCoo'RpdVntOp'TiRmgRpdVnt", 'FORCED_VENTILATION_REMAINING_TIME', 'analogValue', 2031, 'Forced ventilation, remaining time', 'minutes', 1.0, None),
+    ("R(1)'RHvacCoo'FplcVntOp'TiRmgFplcVnt", 'SPEED_FIRE_REMAINING_TIME', 'analogValue', 2038, 'Speed FIRE, remaining time', 'minutes', 1.0, None),
+    ("R(1)'ROpUnDev'FltCodeRu", 'FAULT_CODE_FOR_ROOM_OPERATOR_UNIT', 'analogValue', 2039, 'Fault code for room operator unit', 'noUnits', 0.0, None),
+    ("R(1)'ROpUnDev'MntnCodeRu", 'MAINTENANCE_CODE_FOR_ROOM_OPERATOR_UNIT', 'analogValue', 2040, 'Maintenance code for room operator unit', 'noUnits', 0.0, None),
+    ("R(1)'Modbus'AQualR(2)", 'ROOM_AIR_QUALITY', 'analogValue', 2042, 'Room air quality', 'partsPerMillion', 0.0, None),
+    ("R(1)'PDuctDevQbm'DiagQbm", 'DIAGNOSTICS_FOR_QBM', 'analogValue', 2053, 'Diagnostics for QBM', 'noUnits', 8.0, None),
+    ("R(1)'HVAC'FanSu'SpFanSuSpdRel", 'RELATIVE_SETPOINT_F_SUPPLY_AIR_FAN_SPEED', 'analogValue', 2064, 'Relative setpoint f.supply air fan speed', 'percent', 70.0, (0.0, 100.0)),
+    ("R(1)'RHvacCoo'TCtlH'SpTRFreeC", 'FREE_COOLING_SETPOINT_ROOM', 'analogValue', 2071, 'Free cooling, setpoint room', 'degreesCelsius', 22.0, None),
+    ("R(1)'HVAC'Erc'SpTSuRotHExg", 'SETP_SUPPLY_AIR_TEMP_ROTARY_HEAT_EXCH', 'analogValue', 2076, 'Setp.supply air temp.rotary heat exch.', 'degreesCelsius', 23.5, None),
+    ("R(1)'ComItfDevBrdg'DiagBrdg", 'DIAGNOSTICS_BRDG', 'analogValue', 2078, 'Diagnostics BRDG', 'noUnits', 8.0, None),
+    ("R(1)'FanNodeDev'DiagFanNode", 'DIAGNOSTICS_FAN_NODE', 'analogValue', 2080, 'Diagnostics FAN node', 'noUnits', 9.0, None),
+    ("R(1)'FanNodeDev'TiTmpOpMOutRfq", 'TIME_FOR_TMP_OP_MODE_OUTP_FOR_RF_SYSTEM', 'analogValue', 2081, 'Time for tmp.op.mode outp.for RF system', 'minutes', 0.0, None),
+    ("R(1)'PshBtnDevVmn1'DiagVmn1", 'DIAGNOSTICS_VMN_1', 'analogValue', 2082, 'Diagnostics VMN 1', 'noUnits', 8.0, None),
+    ("R(1)'PshBtnDevVmn2'DiagVmn2", 'DIAGNOSTICS_VMN_2', 'analogValue', 2083, 'Diagnostics VMN 2', 'noUnits', 8.0, None),
+    ("R(1)'PshBtnDevVmn3'DiagVmn3", 'DIAGNOSTICS_VMN_3', 'analogValue', 2084, 'Diagnostics VMN 3', 'noUnits', 8.0, None),
+    ("R(1)'ROpUnDevVmsh1'DiagVmsh1", 'DIAGNOSTICS_VMSH_1', 'analogValue', 2085, 'Diagnostics VMSH 1', 'noUnits', 8.0, None),
+    ("R(1)'ROpUnDevVmsh2'DiagVmsh2", 'DIAGNOSTICS_VMSH_2', 'analogValue', 2086, 'Diagnostics VMSH 2', 'noUnits', 8.0, None),
+    ("R(1)'ROpUnDevVmsh3'DiagVmsh3", 'DIAGNOSTICS_VMSH_3', 'analogValue', 2087, 'Diagnostics VMSH 3', 'noUnits', 8.0, None),
+    ("R(1)'ROpUnDevVmsc'DiagVmsc", 'DIAGNOSTICS_VMSC', 'analogValue', 2088, 'Diagnostics VMSC', 'noUnits', 8.0, None),
+    ("R(1)'IOExtnDevVmc'DiagVmc", 'DIAGNOSTICS_VMC', 'analogValue', 2089, 'Diagnostics VMC', 'noUnits', 8.0, None),
+    ("R(1)'RHvacCoo'HuRelMax", 'HUMIDITY_LIMIT_MAX_VALUE', 'analogValue', 2090, 'Humidity, limit max value', 'percent', 0.0, (0.0, 100.0)),
+    ("R(1)'HVAC'FanSu'FanSpdMinRel", 'FAN_SPEED_MIN', 'analogValue', 2091, 'Fan speed,  min', 'percent', 30.0, (0.0, 100.0)),
+    ("R(1)'PrpyExtdCnf'AQualROnbPrcv1(OnbIO)", 'PROCESS_VAL_1_FOR_ROOM_AIR_QUAL_ON_BOARD', 'analogValue', 2098, 'Process val.1 for room air qual,on-board', 'partsPerMillion', 0.0, None),
+    ("R(1)'PrpyExtdCnf'AQualROnbPrcv2(OnbIO)", 'PROCESS_VAL_2_FOR_ROOM_AIR_QUAL_ON_BOARD', 'analogValue', 2099, 'Process val.2 for room air qual,on-board', 'partsPerMillion', 0.0, None),
+    ("R(1)'PrpyExtdCnf'AQualROnbSigv1(OnbIO)", 'SIGNAL_VAL_1_FOR_ROOM_AIR_QUAL_ON_BOARD', 'analogValue', 2100, 'Signal val.1 for room air qual.,on-board', 'volts', 0.0, None),
+    ("R(1)'PrpyExtdCnf'AQualROnbSigv2(OnbIO)", 'SIGNAL_VAL_2_FOR_ROOM_AIR_QUAL_ON_BOARD', 'analogValue', 2101, 'Signal val.2 for room air qual.,on-board', 'volts', 0.0, None),
+    ("R(1)'PrpyExtdCnf'AQualREcuPrcv1(Ecu)", 'PROCESS_VAL_1_FOR_ROOM_AIR_QUALITY_ECU', 'analogValue', 2102, 'Process val.1 for room air quality, ECU', 'partsPerMillion', 0.0, None),
+    ("R(1)'PrpyExtdCnf'AQualREcuPrcv2(Ecu)", 'PROCESS_VAL_2_FOR_ROOM_AIR_QUALITY_ECU', 'analogValue', 2103, 'Process val.2 for room air quality, ECU', 'partsPerMillion', 2000.0, None),
+    ("R(1)'PrpyExtdCnf'AQualREcuSigv1(Ecu)", 'SIGNAL_VALUE_1_FOR_ROOM_AIR_QUALITY_ECU', 'analogValue', 2104, 'Signal value 1 for room air quality, ECU', 'millivolts', 0.0, None),
+    ("R(1)'PrpyExtdCnf'AQualREcuSigv2(Ecu)", 'SIGNAL_VALUE_2_FOR_ROOM_AIR_QUALITY_ECU', 'analogValue', 2105, 'Signal value 2 for room air quality, ECU', 'millivolts', 10000.0, None),
+    ("R(1)'PrpyExtdCnf'HuRelExPrcv1", 'PROCESS_VAL_1_FOR_REL_HUMIDITY_EXTR_AIR', 'analogValue', 2106, 'Process val.1 for rel.humidity extr.air', 'percentRelativeHumidity', 0.0, (0.0, 100.0)),
+    ("R(1)'PrpyExtdCnf'HuRelExPrcv2", 'PROCESS_VAL_2_FOR_REL_HUMIDITY_EXTR_AIR', 'analogValue', 2107, 'Process val.2 for rel.humidity extr.air', 'percentRelativeHumidity', 0.0, (0.0, 100.0)),
+    ("R(1)'PrpyExtdCnf'HuRelExSigv1", 'SIGNAL_VALUE_1_FOR_REL_HUMIDITY_EXTR_AIR', 'analogValue', 2108, 'Signal value 1 for rel.humidity extr.air', 'volts', 0.0, None),
+    ("R(1)'PrpyExtdCnf'HuRelExSigv2", 'SIGNAL_VALUE_2_FOR_REL_HUMIDITY_EXTR_AIR', 'analogValue', 2109, 'Signal value 2 for rel.humidity extr.air', 'volts', 0.0, None),
+    ("R(1)'RHvacCoo'ActlCnfCtl1", 'ACTUAL_CONFIGURATION_OF_CONTROL_FUNCT_1', 'analogValue', 2113, 'Actual configuration of control funct.1', 'noUnits', 441.0, None),
+    ("R(1)'HVAC'ActlCnfCtl2", 'ACTUAL_CONFIGURATION_OF_CONTROL_FUNCT_2', 'analogValue', 2114, 'Actual configuration of control funct.2', 'noUnits', 1213.0, None),
+    ("R(1)'HVAC'ActlCnfCtl3", 'ACTUAL_CONFIGURATION_OF_CONTROL_FUNCT_3', 'analogValue', 2115, 'Actual configuration of control funct.3', 'noUnits', 2001.0, None),
+    ("R(1)'HdwCnf'ActlHdwCnf1", 'ACTUAL_HARDWARE_CONFIGURATION_1', 'analogValue', 2118, 'Actual hardware configuration 1', 'noUnits', 205.0, None),
+    ("R(1)'HdwCnf'ActlHdwCnf2", 'ACTUAL_HARDWARE_CONFIGURATION_2', 'analogValue', 2119, 'Actual hardware configuration 2', 'noUnits', 203.0, None),
+    ("R(1)'HdwCnf'ActlHdwCnf3", 'ACTUAL_HARDWARE_CONFIGURATION_3', 'analogValue', 2120, 'Actual hardware configuration 3', 'noUnits', 104.0, None),
+    ("R(1)'HdwCnf'ActlHdwCnf4", 'ACTUAL_HARDWARE_CONFIGURATION_4', 'analogValue', 2121, 'Actual hardware configuration 4', 'noUnits', 1212.0, None),
+    ("R(1)'HdwCnf'ActlHdwCnf5", 'ACTUAL_HARDWARE_CONFIGURATION_5', 'analogValue', 2122, 'Actual hardware configuration 5', 'noUnits', 111.0, None),
+    ("R(1)'FanNodeDev'OpModInRfqs", 'OPERATING_MODE_INPUT_FROM_RF_SYSTEM', 'analogValue', 2125, 'Operating mode input from RF system', 'noUnits', 0.0, None),
+    ("R(1)'AlmHdl'Alm1001'AlmCode", 'ALARM_CODE_ALM1001', 'analogValue', 2197, 'Alarm code', 'noUnits', 0.0, None),
+    ("R(1)'AlmHdl'Alm1002'AlmCode", 'ALARM_CODE_ALM1002', 'analogValue', 2198, 'Alarm code', 'noUnits', 0.0, None),
+    ("R(1)'AlmHdl'Alm1003'AlmCode", 'ALARM_CODE_ALM1003', 'analogValue', 2199, 'Alarm code', 'noUnits', 0.0, None),
+    ("R(1)'AlmHdl'Alm1004'AlmCode", 'ALARM_CODE_ALM1004', 'analogValue', 2200, 'Alarm code', 'noUnits', 0.0, None),
+    ("R(1)'AlmHdl'Alm1005'AlmCode", 'ALARM_CODE_ALM1005', 'analogValue', 2201, 'Alarm code', 'noUnits', 0.0, None),
+    ("R(1)'AlmHdl'Alm1006'AlmCode", 'ALARM_CODE_ALM1006', 'analogValue', 2202, 'Alarm code', 'noUnits', 0.0, None),
+    ("R(1)'AlmHdl'Alm1007'AlmCode", 'ALARM_CODE_ALM1007', 'analogValue', 2203, 'Alarm code', 'noUnits', 0.0, None),
+    ("R(1)'AlmHdl'Alm1008'AlmCode", 'ALARM_CODE_ALM1008', 'analogValue', 2204, 'Alarm code', 'noUnits', 0.0, None),
+    ("R(1)'AlmHdl'Alm1009'AlmCode", 'ALARM_CODE_ALM1009', 'analogValue', 2205, 'Alarm code', 'noUnits', 0.0, None),
+    ("R(1)'AlmHdl'Alm1010'AlmCode", 'ALARM_CODE_ALM1010', 'analogValue', 2206, 'Alarm code', 'noUnits', 0.0, None),
+    ("R(1)'AlmHdl'Alm1011'AlmCode", 'ALARM_CODE_ALM1011', 'analogValue', 2207, 'Alarm code', 'noUnits', 0.0, None),
+    ("R(1)'AlmHdl'Alm1020'AlmCode", 'ALARM_CODE_ALM1020', 'analogValue', 2208, 'Alarm code', 'noUnits', 0.0, None),
+    ("R(1)'AlmHdl'Alm1032'AlmCode", 'ALARM_CODE_ALM1032', 'analogValue', 2209, 'Alarm code', 'noUnits', 0.0, None),
+    ("R(1)'AlmHdl'Alm1033'AlmCode", 'ALARM_CODE_ALM1033', 'analogValue', 2210, 'Alarm code', 'noUnits', 0.0, None),
+    ("R(1)'AlmHdl'Alm1034'AlmCode", 'ALARM_CODE_ALM1034', 'analogValue', 2211, 'Alarm code', 'noUnits', 0.0, None),
+    ("R(1)'AlmHdl'Alm1035'AlmCode", 'ALARM_CODE_ALM1035', 'analogValue', 2212, 'Alarm code', 'noUnits', 0.0, None),
+    ("R(1)'AlmHdl'Alm1040'AlmCode", 'ALARM_CODE_ALM1040', 'analogValue', 2213, 'Alarm code', 'noUnits', 0.0, None),
+    ("R(1)'AlmHdl'Alm2001'AlmCode", 'ALARM_CODE_ALM2001', 'analogValue', 2214, 'Alarm code', 'noUnits', 0.0, None),
+    ("R(1)'AlmHdl'Alm2002'AlmCode", 'ALARM_CODE_ALM2002', 'analogValue', 2215, 'Alarm code', 'noUnits', 0.0, None),
+    ("R(1)'AlmHdl'Alm2003'AlmCode", 'ALARM_CODE_ALM2003', 'analogValue', 2216, 'Alarm code', 'noUnits', 0.0, None),
+    ("R(1)'AlmHdl'Alm2004'AlmCode", 'ALARM_CODE_ALM2004', 'analogValue', 2217, 'Alarm code', 'noUnits', 0.0, None),
+    ("R(1)'AlmHdl'Alm2005'AlmCode", 'ALARM_CODE_ALM2005', 'analogValue', 2218, 'Alarm code', 'noUnits', 0.0, None),
+    ("R(1)'AlmHdl'Alm2007'AlmCode", 'ALARM_CODE_ALM2007', 'analogValue', 2219, 'Alarm code', 'noUnits', 0.0, None),
+    ("R(1)'AlmHdl'Alm2010'AlmCode", 'ALARM_CODE_ALM2010', 'analogValue', 2220, 'Alarm code', 'noUnits', 0.0, None),
+    ("R(1)'AlmHdl'Alm3001'AlmCode", 'ALARM_CODE_ALM3001', 'analogValue', 2221, 'Alarm code', 'noUnits', 0.0, None),
+    ("R(1)'AlmHdl'Alm3002'AlmCode", 'ALARM_CODE_ALM3002', 'analogValue', 2222, 'Alarm code', 'noUnits', 0.0, None),
+    ("R(1)'AlmHdl'Alm3003'AlmCode", 'ALARM_CODE_ALM3003', 'analogValue', 2223, 'Alarm code', 'noUnits', 0.0, None),
+    ("R(1)'AlmHdl'Alm3004'AlmCode", 'ALARM_CODE_ALM3004', 'analogValue', 2224, 'Alarm code', 'noUnits', 0.0, None),
+    ("R(1)'AlmHdl'Alm3006'AlmCode", 'ALARM_CODE_ALM3006', 'analogValue', 2225, 'Alarm code', 'noUnits', 0.0, None),
+    ("R(1)'AlmHdl'Alm3007'AlmCode", 'ALARM_CODE_ALM3007', 'analogValue', 2226, 'Alarm code', 'noUnits', 0.0, None),
+    ("R(1)'AlmHdl'Alm2008'AlmCode", 'ALARM_CODE_ALM2008', 'analogValue', 2227, 'Alarm code', 'noUnits', 0.0, None),
+    ("R(1)'AlmHdl'Alm2009'AlmCode", 'ALARM_CODE_ALM2009', 'analogValue', 2228, 'Alarm code', 'noUnits', 0.0, None),
+    ("R(1)'AlmHdl'Alm2011'AlmCode", 'ALARM_CODE_ALM2011', 'analogValue', 2229, 'Alarm code', 'noUnits', 0.0, None),
+    ("R(1)'AlmHdl'Alm2014'AlmCode", 'ALARM_CODE_ALM2014', 'analogValue', 2230, 'Alarm code', 'noUnits', 0.0, None),
+    ("R(1)'AlmHdl'Alm2016'AlmCode", 'ALARM_CODE_ALM2016', 'analogValue', 2232, 'Alarm code', 'noUnits', 0.0, None),
+    ("R(1)'AlmHdl'Alm9001'AlmCode", 'ALARM_CODE_ALM9001', 'analogValue', 2233, 'Alarm code', 'noUnits', 0.0, None),
+    ("R(1)'AlmHdl'Alm9002'AlmCode", 'ALARM_CODE_ALM9002', 'analogValue', 2234, 'Alarm code', 'noUnits', 0.0, None),
+    ("R(1)'AlmHdl'Alm9003'AlmCode", 'ALARM_CODE_ALM9003', 'analogValue', 2235, 'Alarm code', 'noUnits', 0.0, None),
+    ("R(1)'AlmHdl'Alm9004'AlmCode", 'ALARM_CODE_ALM9004', 'analogValue', 2236, 'Alarm code', 'noUnits', 0.0, None),
+    ("R(1)'AlmHdl'Alm9005'AlmCode", 'ALARM_CODE_ALM9005', 'analogValue', 2237, 'Alarm code', 'noUnits', 0.0, None),
+    ("R(1)'AlmHdl'Alm9006'AlmCode", 'ALARM_CODE_ALM9006', 'analogValue', 2238, 'Alarm code', 'noUnits', 0.0, None),
+    ("R(1)'AlmHdl'Alm9007'AlmCode", 'ALARM_CODE_ALM9007', 'analogValue', 2239, 'Alarm code', 'noUnits', 0.0, None),
+    ("R(1)'AlmHdl'Alm9008'AlmCode", 'ALARM_CODE_ALM9008', 'analogValue', 2240, 'Alarm code', 'noUnits', 0.0, None),
+    ("R(1)'AlmHdl'Alm9009'AlmCode", 'ALARM_CODE_ALM9009', 'analogValue', 2241, 'Alarm code', 'noUnits', 0.0, None),
+    ("R(1)'AlmHdl'Alm9010'AlmCode", 'ALARM_CODE_ALM9010', 'analogValue', 2242, 'Alarm code', 'noUnits', 0.0, None),
+    ("R(1)'AlmHdl'Alm9011'AlmCode", 'ALARM_CODE_ALM9011', 'analogValue', 2243, 'Alarm code', 'noUnits', 0.0, None),
+    ("R(1)'AlmHdl'Alm9012'AlmCode", 'ALARM_CODE_ALM9012', 'analogValue', 2244, 'Alarm code', 'noUnits', 0.0, None),
+    ("R(1)'AlmHdl'Alm9013'AlmCode", 'ALARM_CODE_ALM9013', 'analogValue', 2245, 'Alarm code', 'noUnits', 0.0, None),
+    ("R(1)'AlmHdl'Alm9014'AlmCode", 'ALARM_CODE_ALM9014', 'analogValue', 2246, 'Alarm code', 'noUnits', 0.0, None),
+    ("R(1)'AlmHdl'Alm9015'AlmCode", 'ALARM_CODE_ALM9015', 'analogValue', 2247, 'Alarm code', 'noUnits', 0.0, None),
+    ("R(1)'AlmHdl'Alm9016'AlmCode", 'ALARM_CODE_ALM9016', 'analogValue', 2248, 'Alarm code', 'noUnits', 0.0, None),
+    ("R(1)'AlmHdl'Alm9017'AlmCode", 'ALARM_CODE_ALM9017', 'analogValue', 2249, 'Alarm code', 'noUnits', 0.0, None),
+    ("R(1)'AlmHdl'Alm9018'AlmCode", 'ALARM_CODE_ALM9018', 'analogValue', 2250, 'Alarm code', 'noUnits', 0.0, None),
+    ("R(1)'AlmHdl'Alm9019'AlmCode", 'ALARM_CODE_ALM9019', 'analogValue', 2251, 'Alarm code', 'noUnits', 0.0, None),
+    ("R(1)'AlmHdl'Alm9020'AlmCode", 'ALARM_CODE_ALM9020', 'analogValue', 2252, 'Alarm code', 'noUnits', 0.0, None),
+    ("R(1)'AlmHdl'Alm9021'AlmCode", 'ALARM_CODE_ALM9021', 'analogValue', 2253, 'Alarm code', 'noUnits', 0.0, None),
+    ("R(1)'AlmHdl'Alm9022'AlmCode", 'ALARM_CODE_ALM9022', 'analogValue', 2254, 'Alarm code', 'noUnits', 0.0, None),
+    ("R(1)'AlmHdl'Alm9023'AlmCode", 'ALARM_CODE_ALM9023', 'analogValue', 2255, 'Alarm code', 'noUnits', 0.0, None),
+    ("R(1)'AlmHdl'Alm9024'AlmCode", 'ALARM_CODE_ALM9024', 'analogValue', 2256, 'Alarm code', 'noUnits', 0.0, None),
+    ("R(1)'AlmHdl'Alm9025'AlmCode", 'ALARM_CODE_ALM9025', 'analogValue', 2257, 'Alarm code', 'noUnits', 0.0, None),
+    ("R(1)'AlmHdl'Alm9026'AlmCode", 'ALARM_CODE_ALM9026', 'analogValue', 2258, 'Alarm code', 'noUnits', 0.0, None),
+    ("R(1)'AlmHdl'Alm9027'AlmCode", 'ALARM_CODE_ALM9027', 'analogValue', 2259, 'Alarm code', 'noUnits', 0.0, None),
+    ("R(1)'AlmHdl'Alm9028'AlmCode", 'ALARM_CODE_ALM9028', 'analogValue', 2260, 'Alarm code', 'noUnits', 0.0, None),
+    ("R(1)'AlmHdl'Alm1022'AlmCode", 'ALARM_CODE_ALM1022', 'analogValue', 2261, 'Alarm code', 'noUnits', 0.0, None),
+    ("R(1)'AlmHdl'Alm1023'AlmCode", 'ALARM_CODE_ALM1023', 'analogValue', 2262, 'Alarm code', 'noUnits', 0.0, None),
+    ("R(1)'AlmHdl'Alm1024'AlmCode", 'ALARM_CODE_ALM1024', 'analogValue', 2263, 'Alarm code', 'noUnits', 0.0, None),
+    ("R(1)'AlmHdl'Alm1025'AlmCode", 'ALARM_CODE_ALM1025', 'analogValue', 2264, 'Alarm code', 'noUnits', 0.0, None),
+    ("R(1)'AlmHdl'Alm1026'AlmCode", 'ALARM_CODE_ALM1026', 'analogValue', 2265, 'Alarm code', 'noUnits', 0.0, None),
+    ("R(1)'AlmHdl'Alm1027'AlmCode", 'ALARM_CODE_ALM1027', 'analogValue', 2266, 'Alarm code', 'noUnits', 0.0, None),
+    ("R(1)'AlmHdl'Alm1028'AlmCode", 'ALARM_CODE_ALM1028', 'analogValue', 2267, 'Alarm code', 'noUnits', 0.0, None),
+    ("R(1)'AlmHdl'Alm1029'AlmCode", 'ALARM_CODE_ALM1029', 'analogValue', 2268, 'Alarm code', 'noUnits', 0.0, None),
+    ("R(1)'AlmHdl'Alm1030'AlmCode", 'ALARM_CODE_ALM1030', 'analogValue', 2269, 'Alarm code', 'noUnits', 0.0, None),
+    ("R(1)'AlmHdl'Alm1036'AlmCode", 'ALARM_CODE_ALM1036', 'analogValue', 2270, 'Alarm code', 'noUnits', 0.0, None),
+    ("R(1)'HdwCnf'Sta1", 'STATE_1', 'analogValue', 2275, 'State 1', 'noUnits', 0.0, None),
+    ("R(1)'HdwCnf'Sta2", 'STATE_2', 'analogValue', 2276, 'State 2', 'noUnits', 0.0, None),
+    ("R(1)'HdwCnf'Sta3", 'STATE_3', 'analogValue', 2277, 'State 3', 'noUnits', 0.0, None),
+    ("R(1)'HdwCnf'Sta4", 'STATE_4', 'analogValue', 2278, 'State 4', 'noUnits', 0.0, None),
+    ("R(1)'HdwCnf'Sta5", 'STATE_5', 'analogValue', 2279, 'State 5', 'noUnits', 0.0, None),
+    ("R(1)'HdwCnf'Sta6", 'STATE_6', 'analogValue', 2280, 'State 6', 'noUnits', 0.0, None),
+    ("R(1)'HdwCnf'Sta7", 'STATE_7', 'analogValue', 2281, 'State 7', 'noUnits', 0.0, None),
+    ("R(1)'HdwCnf'Sta8", 'STATE_8', 'analogValue', 2282, 'State 8', 'noUnits', 0.0, None),
+    ("R(1)'HdwCnf'Sta9", 'STATE_9', 'analogValue', 2283, 'State 9', 'noUnits', 0.0, None),
+    ("R(1)'HdwCnf'Sta10", 'STATE_10', 'analogValue', 2284, 'State 10', 'noUnits', 0.0, None),
+    ("R(1)'AlmHdl'Alm2013'AlmCode", 'ALARM_CODE_ALM2013', 'analogValue', 2285, 'Alarm code', 'noUnits', 0.0, None),
+    ("R(1)'AlmHdl'Alm2018'AlmCode", 'ALARM_CODE_ALM2018', 'analogValue', 2289, 'Alarm code', 'noUnits', 0.0, None),
+    ("R(1)'AlmHdl'Alm2019'AlmCode", 'ALARM_CODE_ALM2019', 'analogValue', 2290, 'Alarm code', 'noUnits', 0.0, None),
+    ("R(1)'HVAC'Erc'RotHExgSpdFb", 'ROTATING_HEAT_EXCHANGER_SPEED_FEEDBACK', 'analogValue', 2293, 'Rotating heat exchanger speed feedback', 'noUnits', 96.22673034667969, None),
+    ("R(1)'HVAC'Erc'RotHExgFailCnt", 'MOTOR_FAILURE_COUNT', 'analogValue', 2294, 'Motor failure count', 'noUnits', 0.0, None),
+    ("R(1)'AlmHdl'Alm1039'AlmCode", 'ALARM_CODE_ALM1039', 'analogValue', 2297, 'Alarm code', 'noUnits', 0.0, None),
+    ('RotHExgSpdcmdRPM', 'MONITOR_BA_TO_DAQ_VALUE', 'analogValue', 2299, 'Monitor BA to DAQ value', 'noUnits', 180.0, None),
+    ('RotHExgSpdABIRPM', 'MONITOR_HOST_MCU_HAL_SPEED_VALUE', 'analogValue', 2300, 'Monitor host MCU HAL speed value', 'noUnits', 102.0, None),
+    ('RotHExgSpdCOMUpCnt', 'MONITOR_HOST_MCU_AND_MOTOR_MCU_COMMUNICATION_COUNT', 'analogValue', 2301, 'Monitor host MCU and motor MCU communication count', 'noUnits', 30427.0, None),
+    ('RotHExgShortLoopState', 'MONITOR_MOTOR_SHORT_LOOP_STATE', 'analogValue', 2302, 'Monitor motor short loop state', 'noUnits', 0.0, None),
+    ('RotHExg8305R1', 'MONITOR_DRV8305_REGISTER_1', 'analogValue', 2303, 'Monitor DRV8305 register 1', 'noUnits', 0.0, None),
+    ('RotHExg8305R2', 'MONITOR_DRV8305_REGISTER_2', 'analogValue', 2304, 'Monitor DRV8305 register 2', 'noUnits', 0.0, None),
+    ('RotHExg8305R3', 'MONITOR_DRV8305_REGISTER_3', 'analogValue', 2305, 'Monitor DRV8305 register 3', 'noUnits', 0.0, None),
+    ('RotHExg8305R4', 'MONITOR_DRV8305_REGISTER_4', 'analogValue', 2306, 'Monitor DRV8305 register 4', 'noUnits', 0.0, None),
+    ('RotHExgFWRnTm', 'MONITOR_MOTOR_MCU_RUNNING_TIME', 'analogValue', 2307, 'Monitor Motor MCU running time', 'noUnits', 91221.0, None),
+    ("R(1)'FhVntIn", 'FUME_HOOD_VENTILATION_INPUT', 'binaryInput', 23, 'Fume hood ventilation input', None, 'inactive', ('inactive', 'active')),
+    ("R(1)'Away", 'SPEED_AWAY_ACTIVATE_DI', 'binaryInput', 31, 'Speed AWAY activate DI', None, 'inactive', ('inactive', 'active')),
+    ("R(1)'HclOvrTDet", 'FIRE_THERMOSTAT_STATE', 'binaryInput', 33, 'Fire thermostat, state', None, 'inactive', ('inactive', 'active')),
+    ("R(1)'High", 'SPEED_HIGH_ACTIVATE_DI', 'binaryInput', 82, 'Speed HIGH activate DI', None, 'inactive', ('inactive', 'active')),
+    ("R(1)'DmpOaCmd", 'DAMPER_OUTSIDE_AIR', 'binaryOutput', 18, 'Damper, outside air', None, 'active', ('inactive', 'active')),
+    ("R(1)'CmnAlmIndOut", 'ALARM_COMMON_OUTPUT', 'binaryOutput', 20, 'Alarm, common output', None, 'inactive', ('inactive', 'active')),
+    ("R(1)'IOExtnDevEcul'CclPuCmd(1)", 'COOLING_PUMP_STATE', 'binaryOutput', 71, 'Cooling, pump state', None, 'inactive', ('inactive', 'active')),
+    ("R(1)'RHvacCoo'SftyCtl'FireAlm", 'FIRE_ALARM', 'binaryValue', 11, 'Fire alarm', None, 'inactive', ('inactive', 'active')),
+    ("R(1)'RHvacCoo'RpdVntOp'RpdVntOp", 'FORCED_VENTILATION', 'binaryValue', 15, 'Forced ventilation', None, 'inactive', ('inactive', 'active')),
+    ("R(1)'RHvacCoo'TCtlH'EnLinTOaCmp", 'ENABLE_LINEAR_OUTSIDE_TEMP_COMPENSATION', 'binaryValue', 16, 'Enable linear outside temp.compensation', None, 'inactive', ('inactive', 'active')),
+    ("R(1)'RHvacCoo'PltModDtr'CoolDwnReq", 'COOL_DOWN_REQUEST', 'binaryValue', 17, 'Cool down request', None, 'inactive', ('inactive', 'active')),
+    ("R(1)'RHvacCoo'PltModDtr'WarmUpReq", 'WARM_UP_REQUEST', 'binaryValue', 18, 'Warm-up request', None, 'inactive', ('inactive', 'active')),
+    ("R(1)'HVAC'Erc'HExgEcmSta", 'ROTATING_HEAT_EXCHANGER_DEMAND_MODE', 'binaryValue', 22, 'Rotating heat exchanger , demand mode', None, 'inactive', ('inactive', 'active')),
+    ("R(1)'HVAC'Erc'RotHExgAvlH", 'ROTARY_HEAT_EXCHANGER_AVAILABLE_F_HEAT', 'binaryValue', 25, 'Rotary heat exchanger available f.heat.', None, 'active', ('inactive', 'active')),
+    ("R(1)'HVAC'Erc'RotHExgAvlC", 'ROTARY_HEAT_EXCHANGER_AVAILABLE_F_COOL', 'binaryValue', 26, 'Rotary heat exchanger available f.cool.', None, 'inactive', ('inactive', 'active')),
+    ("R(1)'HVAC'Hcl'HclAvlH", 'HEATING_COIL_AVAILABLE_FOR_HEATING', 'binaryValue', 38, 'Heating coil available for heating', None, 'active', ('inactive', 'active')),
+    ("R(1)'ROpModDtr'CmfBtn", 'HOME_AWAY_BUTTON_STATUS', 'binaryValue', 50, 'HOME/AWAY button status', None, 'active', ('inactive', 'active')),
+    ("R(1)'IOExtnDevEcul'DevMod", 'DEVICE_MODE', 'binaryValue', 62, 'Device mode', None, 'active', ('inactive', 'active')),
+    ("R(1)'HVAC'MntnCmd", 'MAINTENANCE_ACTIVATE', 'binaryValue', 395, 'Maintenance, activate', None, 'inactive', ('inactive', 'active')),
+    ("R(1)'RHvacCoo'FplcVntOp'FplcVnt", 'FIREPLACE_STATE_DI', 'binaryValue', 400, 'Fireplace, state DI', None, 'inactive', ('inactive', 'active')),
+    ("R(1)'RHvacCoo'FhVntOp'FhVnt", 'COOKER_HOOD_ACTIVATE', 'binaryValue', 402, 'Cooker hood, activate', None, 'inactive', ('inactive', 'active')),
+    ("R(1)'RHvacCoo'EnTExCtl", 'CACADE_CONTROL_SENSOR_SELECTION', 'binaryValue', 403, 'Cacade control, sensor selection', None, 'active', ('inactive', 'active')),
+    ("R(1)'HVAC'Erc'DeicReqHExg", 'DE_ICING_ROTOR_ACTIVE', 'binaryValue', 404, 'De-icing, rotor active', None, 'inactive', ('inactive', 'active')),
+    ("R(1)'HVAC'Erc'DeicReqFan", 'DE_ICING_FAN_ACTIVE', 'binaryValue', 405, 'De-icing, fan active', None, 'inactive', ('inactive', 'active')),
+    ("R(1)'HVAC'Erc'EnDeic", 'DE_ICING_ENABLE', 'binaryValue', 406, 'De-icing, enable', None, 'active', ('inactive', 'active')),
+    ("R(1)'HVAC'FanSu'FanAvlVnt", 'FAN_AVAILABLE_FOR_VENTILATION', 'binaryValue', 409, 'Fan available for ventilation', None, 'active', ('inactive', 'active')),
+    ("R(1)'HVAC'FanSu'FanAvlDhu", 'FAN_AVAILABLE_FOR_DEHUMIDIFICATION', 'binaryValue', 410, 'Fan available for dehumidification', None, 'active', ('inactive', 'active')),
+    ("R(1)'HVAC'FanSu'EnFanSpdFbIn", 'TACHO_ENABLE', 'binaryValue', 428, 'Tacho, enable', None, 'active', ('inactive', 'active')),
+    ("R(1)'IOExtnDevEcul'ZePClbTrgEcu", 'ZERO_PRESSURE_CALIBRATION_TRIGGER_ECU', 'binaryValue', 429, 'Zero pressure calibration trigger ECU', None, 'inactive', ('inactive', 'active')),
+    ("R(1)'RHvacCoo'SftyCtl'FdpAlm", 'FIRE_DAMPER_ALARM', 'binaryValue', 430, 'Fire damper, alarm', None, 'inactive', ('inactive', 'active')),
+    ("R(1)'RHvacCoo'SftyCtl'TDuctFireAlm", 'DUCT_AIR_TEMPERATURE_FIRE_ALARM', 'binaryValue', 431, 'Duct air temperature fire alarm', None, 'inactive', ('inactive', 'active')),
+    ("R(1)'HVAC'FanEhFlt", 'EXHAUST_AIR_FAN_FAULT', 'binaryValue', 434, 'Exhaust air fan fault', None, 'inactive', ('inactive', 'active')),
+    ("R(1)'HVAC'FanSuFlt", 'SUPPLY_AIR_FAN_FAULT', 'binaryValue', 435, 'Supply air fan fault', None, 'inactive', ('inactive', 'active')),
+    ("R(1)'HVAC'ErcBltBrk", 'ENERGY_RECOVERY_BELT_BROKEN', 'binaryValue', 436, 'Energy recovery belt broken', None, 'inactive', ('inactive', 'active')),
+    ("R(1)'HVAC'Erc'RotHExgSpmaSta", 'MAX_ROTARY_HEAT_EXCHANGER_SPEED_STATE', 'binaryValue', 438, 'Max.rotary heat exchanger speed state', None, 'active', ('inactive', 'active')),
+    ("R(1)'HVAC'HclSta", 'HEATING_COIL_STATE', 'binaryValue', 440, 'Heating coil state', None, 'active', ('inactive', 'active')),
+    ("R(1)'HVAC'Hcl'EnHclEl", 'ELECTRICAL_HEATER_OFF_ON', 'binaryValue', 445, 'Electrical heater, OFF/ON', None, 'active', ('inactive', 'active')),
+    ("R(1)'ROpUnDev'RstTmpVntOp", 'RESET_TEMPORARY_VENTILATION_OPERATION', 'binaryValue', 452, 'Reset temporary ventilation operation', None, 'inactive', ('inactive', 'active')),
+    ("R(1)'ROpUnDev'TmpFplcVnt", 'TEMPORARY_FIREPLACE_VENTILATION', 'binaryValue', 453, 'Temporary fireplace ventilation', None, 'inactive', ('inactive', 'active')),
+    ("R(1)'ROpUnDev'TmpRpdVnt", 'TEMPORARY_RAPID_VENTILATION', 'binaryValue', 454, 'Temporary rapid ventilation', None, 'inactive', ('inactive', 'active')),
+    ("R(1)'ROpUnDev'PscBtnRu", 'PRESENCE_BUTTON_FOR_ROOM_OPERATOR_UNIT', 'binaryValue', 455, 'Presence button for room operator unit', None, 'active', ('inactive', 'active')),
+    ("R(1)'ROpUnDev'PscBtnIn", 'PRESENCE_BUTTON_INPUT_VALUE', 'binaryValue', 456, 'Presence button input value', None, 'inactive', ('inactive', 'active')),
+    ("R(1)'RHvacCoo'MntnFnct'BalmAckd", 'ALARM_ACKNOWLEDGEMENT_TYPE_B', 'binaryValue', 466, 'Alarm, acknowledgement type B', None, 'inactive', ('inactive', 'active')),
+    ("R(1)'RHvacCoo'AlmBdl'FltListRst", 'FAULT_LIST_RESET', 'binaryValue', 467, 'Fault list reset', None, 'inactive', ('inactive', 'active')),
+    ("R(1)'RHvacCoo'AlmFnct'AalmAckd", 'A_ALARM_ACKNOWLEDGED', 'binaryValue', 468, 'A-Alarm acknowledged', None, 'inactive', ('inactive', 'active')),
+    ("R(1)'RHvacCoo'AlmFnct'AalmRst", 'A_ALARM_RESET', 'binaryValue', 469, 'A-Alarm reset', None, 'inactive', ('inactive', 'active')),
+    ("R(1)'PDuctDevQbm'ZePClbTrgQbm", 'ZERO_PRESSURE_CALIBRATION_TRIGGER_QBM', 'binaryValue', 473, 'Zero pressure calibration trigger QBM', None, 'inactive', ('inactive', 'active')),
+    ("R(1)'ROpModDtr'SchedRstManCnf", 'SCHEDULER_OVERRIDE', 'binaryValue', 474, 'Scheduler, override', None, 'inactive', ('inactive', 'active')),
+    ("R(1)'ROpModDtr'FplcOrFhVntIn", 'FIREPLACE_OR_FUME_HOOD_VENTILATION_INPUT', 'binaryValue', 475, 'Fireplace or fume hood ventilation input', None, 'inactive', ('inactive', 'active')),
+    ("R(1)'ROpModDtr'BckpCmfBtn", 'BACKUP_OF_COMFORT_BUTTON', 'binaryValue', 476, 'Backup of comfort button', None, 'inactive', ('inactive', 'active')),
+    ("R(1)'RHvacCoo'FreeCDtr'EnFreeC", 'ENABLE_FREE_COOLING', 'binaryValue', 478, 'Enable free cooling', None, 'inactive', ('inactive', 'active')),
+    ("R(1)'Modbus'IOExtnEcul'IOExtnEculCnf", 'CONFIGURATION_FOR_IO_EXTENSION_ECUL', 'binaryValue', 489, 'Configuration for IO extension ECUL', None, 'inactive', ('inactive', 'active')),
+    ("R(1)'PrpyExtdCnf'RoxStopBfRetry", 'ROT_EXCH_MOTOR_STUCK_STOP_BEFORE_RETRY', 'binaryValue', 491, 'Rot.exch.motor stuck, stop before retry', None, 'inactive', ('inactive', 'active')),
+    ("R(1)'RHvacCoo'AlmBdl'Alm2001", 'EMERGENCY_OFF_ACTIVATED', 'binaryValue', 495, 'Emergency off activated', None, 'inactive', ('inactive', 'active')),
+    ("R(1)'RHvacCoo'AlmBdl'Alm2002", 'SMOKE_DETECTOR_TRIPPED', 'binaryValue', 496, 'Smoke detector tripped', None, 'inactive', ('inactive', 'active')),
+    ("R(1)'RHvacCoo'AlmBdl'Alm2003", 'CO_DETECTOR_TRIPPED', 'binaryValue', 497, 'CO detector tripped', None, 'inactive', ('inactive', 'active')),
+    ("R(1)'RHvacCoo'AlmBdl'Alm2004", 'FIRE_ALARM_ACTIVATED', 'binaryValue', 498, 'Fire alarm activated', None, 'inactive', ('inactive', 'active')),
+    ("R(1)'RHvacCoo'AlmBdl'Alm1009", 'FIRE_DAMPER_POSITION_FEEDBACK_FAULT', 'binaryValue', 499, 'Fire damper, position feedback fault', None, 'inactive', ('inactive', 'active')),
+    ("R(1)'RHvacCoo'AlmBdl'Alm2005", 'SUPPLY_AIR_TEMP_OPERAT_LIMITS_EXCEEDED', 'binaryValue', 500, 'Supply air temp., operat.limits exceeded', None, 'inactive', ('inactive', 'active')),
+    ("R(1)'HVAC'AlmBdl'Alm1001", 'SUPPLY_AIR_TEMPERATURE_SENSOR_FAULT', 'binaryValue', 501, 'Supply air temperature, sensor fault', None, 'inactive', ('inactive', 'active')),
+    ("R(1)'HVAC'AlmBdl'Alm1005", 'FROST_PROT_TEMP_HEAT_COIL_SENSOR_FAULT', 'binaryValue', 502, 'Frost prot.temp.heat.coil, sensor fault', None, 'inactive', ('inactive', 'active')),
+    ("R(1)'HVAC'AlmBdl'Alm1010", 'SUPPLY_AIR_FAN_SPEED_FEEDBACK_FAULT', 'binaryValue', 503, 'Supply air fan, speed feedback fault', None, 'inactive', ('inactive', 'active')),
+    ("R(1)'HVAC'AlmBdl'Alm1011", 'EXHAUST_AIR_FAN_SPEED_FEEDBACK_FAULT', 'binaryValue', 504, 'Exhaust air fan, speed feedback fault', None, 'inactive', ('inactive', 'active')),
+    ("R(1)'HVAC'AlmBdl'Alm2007", 'HEATING_COIL_FROST_WARNING', 'binaryValue', 505, 'Heating coil, frost warning', None, 'inactive', ('inactive', 'active')),
+    ("R(1)'HVAC'AlmBdl'Alm2009", 'REHEATING_COIL_ZONE_OVERTEMPERATURE', 'binaryValue', 506, 'Reheating coil zone, overtemperature', None, 'inactive', ('inactive', 'active')),
+    ("R(1)'HVAC'AlmBdl'Alm2010", 'HEATING_COIL_OVERTEMPERATURE', 'binaryValue', 507, 'Heating coil, overtemperature', None, 'inactive', ('inactive', 'active')),
+    ("R(1)'HVAC'AlmBdl'Alm2011", 'REHEATING_COIL_ZONE_FROST_WARNING', 'binaryValue', 508, 'Reheating coil zone, frost warning', None, 'inactive', ('inactive', 'active')),
+    ("R(1)'HVAC'AlmBdl'Alm2014", 'HEAT_PUMP_AIR_DAMPER_STOPS_AIR_FLOW', 'binaryValue', 509, 'Heat pump air damper stops air flow', None, 'inactive', ('inactive', 'active')),
+    ("R(1)'HVAC'AlmBdl'Alm1029", 'FROST_PROT_TEMP_REHEAT_ZONE_SENSOR_FAULT', 'binaryValue', 510, 'Frost prot.temp.reheat.zone,sensor fault', None, 'inactive', ('inactive', 'active')),
+    ("R(1)'HVAC'AlmBdl'Alm1004", 'OUTSIDE_AIR_TEMPERATURE_SENSOR_FAULT', 'binaryValue', 511, 'Outside air temperature, sensor fault', None, 'inactive', ('inactive', 'active')),
+    ("R(1)'HVAC'AlmBdl'Alm1007", 'ROTARY_HEAT_EXCHANGER_MOTOR_STUCK', 'binaryValue', 512, 'Rotary heat exchanger, motor stuck', None, 'inactive', ('inactive', 'active')),
+    ("R(1)'HVAC'AlmBdl'Alm1008", 'ROTARY_HEAT_EXCHANGER_BELT_BROKEN', 'binaryValue', 513, 'Rotary heat exchanger, belt broken', None, 'inactive', ('inactive', 'active')),
+    ("R(1)'HVAC'AlmBdl'Alm2015", 'HEAT_PUMP_COMMON_ALARM', 'binaryValue', 514, 'Heat pump, common alarm', None, 'inactive', ('inactive', 'active')),
+    ("R(1)'HVAC'AlmBdl'Alm3001", 'HEAT_PUMP_CONTROLLER_MODBUS_COMM_ERROR', 'binaryValue', 515, 'Heat pump controller, Modbus comm.error', None, 'inactive', ('inactive', 'active')),
+    ("R(1)'HVAC'AlmBdl'Alm3002", 'I_O_EXTEN_MODULE_1_MODBUS_COMM_ERROR', 'binaryValue', 516, 'I/O exten.module 1, Modbus comm.error', None, 'inactive', ('inactive', 'active')),
+    ("R(1)'HVAC'AlmBdl'Alm3003", 'I_O_EXTEN_MODULE_2_MODBUS_COMM_ERROR', 'binaryValue', 517, 'I/O exten.module 2, Modbus comm.error', None, 'inactive', ('inactive', 'active')),
+    ("R(1)'HVAC'AlmBdl'Alm3004", 'DIFF_PRESSURE_SENSOR_MODBUS_COMM_ERROR', 'binaryValue', 518, 'Diff.pressure sensor, Modbus comm.error', None, 'inactive', ('inactive', 'active')),
+    ("R(1)'HVAC'AlmBdl'Alm1002", 'EXHAUST_AIR_TEMPERATURE_SENSOR_FAULT', 'binaryValue', 519, 'Exhaust air temperature, sensor fault', None, 'inactive', ('inactive', 'active')),
+    ("R(1)'HVAC'AlmBdl'Alm1003", 'EXTRACT_AIR_TEMPERATURE_SENSOR_FAULT', 'binaryValue', 520, 'Extract air temperature, sensor fault', None, 'inactive', ('inactive', 'active')),
+    ("R(1)'HVAC'AlmBdl'Alm1006", 'REL_HUMIDITY_EXTRACT_AIR_SENSOR_FAULT', 'binaryValue', 521, 'Rel.humidity extract air, sensor fault', None, 'inactive', ('inactive', 'active')),
+    ("R(1)'HVAC'AlmBdl'Alm1020", 'AIR_FILTER_POLLUTED', 'binaryValue', 522, 'Air filter polluted', None, 'inactive', ('inactive', 'active')),
+    ("R(1)'HVAC'AlmBdl'Alm1030", 'ZONE_SUPPLY_AIR_TEMP_SENSOR_FAULT', 'binaryValue', 523, 'Zone supply air temp., sensor fault', None, 'inactive', ('inactive', 'active')),
+    ("R(1)'HVAC'AlmBdl'Alm1032", 'SUPPLY_AIR_PRESSURE_SENSOR_FAULT', 'binaryValue', 524, 'Supply air pressure, sensor fault', None, 'inactive', ('inactive', 'active')),
+    ("R(1)'HVAC'AlmBdl'Alm1033", 'EXTRACT_AIR_PRESSURE_SENSOR_FAULT', 'binaryValue', 525, 'Extract air pressure, sensor fault', None, 'inactive', ('inactive', 'active')),
+    ("R(1)'HVAC'AlmBdl'Alm1034", 'DIFF_PRESS_SUPPLY_AIR_FAN_SENSOR_FAULT', 'binaryValue', 526, 'Diff.press.supply air fan, sensor fault', None, 'inactive', ('inactive', 'active')),
+    ("R(1)'HVAC'AlmBdl'Alm1035", 'DIFF_PRESS_EXHAUST_AIR_FAN_SENSOR_FAULT', 'binaryValue', 527, 'Diff.press.exhaust air fan, sensor fault', None, 'inactive', ('inactive', 'active')),
+    ("R(1)'HVAC'AlmBdl'Alm3006", 'RF_INTERFACE_DEVICE_MODBUS_COMM_ERROR', 'binaryValue', 528, 'RF interface device, Modbus comm.error', None, 'inactive', ('inactive', 'active')),
+    ("R(1)'HVAC'AlmBdl'Alm3007", 'RF_COMMUNICATION_ERROR', 'binaryValue', 529, 'RF communication error', None, 'inactive', ('inactive', 'active')),
+    ("R(1)'HVAC'AlmBdl'Alm1040", 'RF_DEVICE_BATTERY_LOW', 'binaryValue', 530, 'RF device, battery low', None, 'inactive', ('inactive', 'active')),
+    ("R(1)'ROpModDtr'DlyAwayAct", 'DELAY_FOR_AWAY_ACTIVE', 'binaryValue', 574, 'Delay for away active', None, 'inactive', ('inactive', 'active')),
+    ("R(1)'ROpUnDev'NxOpMod", 'NEXT_OPERATING_MODE', 'binaryValue', 575, 'Next operating mode', None, 'inactive', ('inactive', 'active')),
+    ("R(1)'ROpModDtr'SchedRstManTrg", 'BINARY_CALCULATED_VALUE', 'binaryValue', 576, 'Binary calculated value', None, 'inactive', ('inactive', 'active')),
+    ("R(1)'HVAC'AlmBdl'Alm2013", 'OUTSIDE_AIR_DAMPER_STOPS_AIR_FLOW', 'binaryValue', 580, 'Outside air damper stops air flow', None, 'inactive', ('inactive', 'active')),
+    ("R(1)'HVAC'PltShdn", 'PLANT_SHUTDOWN', 'binaryValue', 581, 'Plant shutdown', None, 'inactive', ('inactive', 'active')),
+    ("R(1)'HVAC'AlmBdl'Alm1039", 'ROTARY_HEAT_EXCH_MOTOR_SHORT_CIRCUIT', 'binaryValue', 587, 'Rotary heat exch. motor short circuit', None, 'inactive', ('inactive', 'active')),
+    ("R(1)'HVAC'Erc'RotHExgSpdRst", 'ROTATING_HEAT_EXCHANGER_MOTOR_RESET', 'binaryValue', 589, 'Rotating heat exchanger motor reset', None, 'inactive', ('inactive', 'active')),
+    ("R(1)'HVAC'Erc'BltBrkStopRMC", 'STOP_RMC_IF_BELTBROKEN', 'binaryValue', 590, 'Stop RMC if Beltbroken', None, 'inactive', ('inactive', 'active')),
+    ("IOBus'IOBusMgmt", 'I_O_BUS_MANAGEMENT', 'multiStateValue', 2, 'I/O bus management', None, 1, (1, None)),
+    ("PlnkBus'PlnkBusMgmt", 'KNX_PL_LINK_BUS_MANAGEMENT', 'multiStateValue', 4, 'KNX PL-Link bus management', None, 1, (1, None)),
+    ("R(1)'RHvacCoo'AlmFnct'AalmSta", 'ALARM_STATE_TYPE_A', 'multiStateValue', 7, 'Alarm, state type A', None, 1, (1, None)),
+    ("R(1)'RHvacCoo'SftyCtl'TSuSta", 'SUPPLY_AIR_TEMPERATURE_STATE', 'multiStateValue', 12, 'Supply air temperature state', None, 2, (1, None)),
+    ("R(1)'RHvacCoo'HCStaDtr'HCSta", 'HEATING_COOLING_STATE', 'multiStateValue', 13, 'Heating/cooling state', None, 2, (1, None)),
+    ("R(1)'RHvacCoo'PltModDtr'PltOpMod", 'PLANT_OPERATING_MODE', 'multiStateValue', 14, 'Plant operating mode', None, 4, (1, None)),
+    ("R(1)'RHvacCoo'AQualRInd", 'AIR_QUALITY_INDICATION', 'multiStateValue', 16, 'Air quality, indication', None, 1, (1, None)),
+    ("R(1)'RHvacCoo'HCDmd", 'HEATING_COOLING_DEMAND', 'multiStateValue', 17, 'Heating/cooling demand', None, 3, (1, None)),
+    ("R(1)'RHvacCoo'MntnFnct'BalmSta", 'ALARM_STATE_TYPE_B', 'multiStateValue', 18, 'Alarm, state type B', None, 1, (1, None)),
+    ("R(1)'HVAC'PrPltOpMod", 'ACTUAL_VENTILATION_MODE', 'multiStateValue', 19, 'Actual ventilation mode', None, 4, (1, None)),
+    ("R(1)'HVAC'DmpOa'DmpOaDevMod", 'OUTSIDE_AIR_DAMPER_DEVICE_MODE', 'multiStateValue', 20, 'Outside air damper device mode', None, 2, (1, None)),
+    ("R(1)'HVAC'Erc'RotHExgDevMod", 'ROTATING_HEAT_EXCHANGER_OPERATING_MODE', 'multiStateValue', 21, 'Rotating heat exchanger , operating mode', None, 2, (1, None)),
+    ("R(1)'HVAC'Hcl'HclDevMod", 'ELECTRICAL_HEATER_MODE', 'multiStateValue', 26, 'Electrical heater mode', None, 2, (1, None)),
+    ("R(1)'ROpModDtr'PrOpMod", 'PRESENT_OPERATING_MODE', 'multiStateValue', 41, 'Present operating mode', None, 3, (1, None)),
+    ("R(1)'ROpModDtr'ROpMod", 'PRESENT_VENTILATION_MODE', 'multiStateValue', 42, 'Present ventilation mode', None, 3, (1, None)),
+    ("R(1)'ROpModDtr'ManOpCnd", 'MANUAL_OPERATION_CONDITION', 'multiStateValue', 43, 'Manual operation condition', None, 1, (1, None)),
+    ("R(1)'ROpModDtr'CenCndTrg", 'CENTRAL_CONDITION_TRIGGER', 'multiStateValue', 44, 'Central condition trigger', None, 1, (1, None)),
+    ("R(1)'ROpModDtr'CmfCndTrg", 'COMFORT_CONDITION_TRIGGER', 'multiStateValue', 45, 'Comfort condition trigger', None, 1, (1, None)),
+    ("R(1)'ROpModDtr'EefCndTrg", 'ENERGY_EFFICIENCY_CONDITION_TRIGGER', 'multiStateValue', 46, 'Energy efficiency condition trigger', None, 1, (1, None)),
+    ("ModBus'ModBusMgmt", 'MODBUS_MANAGEMENT', 'multiStateValue', 60, 'Modbus management', None, 4, (1, None)),
+    ("OnbMdl4UI'OnbMdl", 'ON_BOARD_MODULE_ONBMDL4UI', 'multiStateValue', 61, 'On-board module', None, 1, (1, None)),
+    ("OnbMdl3AO'OnbMdl", 'ON_BOARD_MODULE_ONBMDL3AO', 'multiStateValue', 62, 'On-board module', None, 1, (1, None)),
+    ("OnbMdl4AI1UI'OnbMdl", 'ON_BOARD_MODULE_ONBMDL4AI1UI', 'multiStateValue', 63, 'On-board module', None, 1, (1, None)),
+    ("OnbMdl4BI'OnbMdl", 'ON_BOARD_MODULE_ONBMDL4BI', 'multiStateValue', 64, 'On-board module', None, 1, (1, None)),
+    ("OnbMdl4BO'OnbMdl", 'ON_BOARD_MODULE_ONBMDL4BO', 'multiStateValue', 65, 'On-board module', None, 1, (1, None)),
+    ('OnbMTR-V000514B0032', 'ON_BOARD_MODULE', 'multiStateValue', 66, 'On-board module', None, 1, (1, None)),
+    ("R(1)'IOExtnDevEcul'IOExtnEcul", 'IO_EXTENSION_MODULE_ECUL', 'multiStateValue', 284, 'IO extension module ECUL', None, 4, (1, None)),
+    ("R(1)'HVAC'FanSu'FanSuDevMod", 'SUPPLY_FAN_OPERATING_MODE', 'multiStateValue', 288, 'Supply fan, operating mode', None, 2, (1, None)),
+    ("R(1)'HVAC'FanSu'FanSuAirDmd", 'SUPPLY_AIR_FAN_AIR_DEMAND_FOR_PLANT_MODE', 'multiStateValue', 289, 'Supply air fan air demand for plant mode', None, 4, (1, None)),
+    ("R(1)'HVAC'FanEh'FanEhDevMod", 'EXHAUST_FAN_OPERATING_MODE', 'multiStateValue', 293, 'Exhaust fan, operating mode', None, 2, (1, None)),
+    ("R(1)'HVAC'PrMntnSta", 'MAINTENANCE_OPERATING_MODE', 'multiStateValue', 294, 'Maintenance, operating mode', None, 1, (1, None)),
+    ("R(1)'IOExtnDevEcul'DiffPFanSuRlb", 'RELIAB_OF_DIFF_PRESSURE_SUPPLY_AIR_FAN', 'multiStateValue', 295, 'Reliab.of diff.pressure supply air fan', None, 1, (1, None)),
+    ("R(1)'IOExtnDevEcul'DiffPFanEhRlb", 'RELIAB_OF_DIFF_PRESSURE_EXHAUST_AIR_FAN', 'multiStateValue', 296, 'Reliab.of diff.pressure exhaust air fan', None, 1, (1, None)),
+    ("R(1)'IOExtnDevEcul'AQualRRlb", 'RELIABILITY_OF_ROOM_AIR_QUALITY', 'multiStateValue', 307, 'Reliability of room air quality', None, 1, (1, None)),
+    ("R(1)'ROpUnDev'TmpVntOp", 'TEMPORARY_VENTILATION_OPERATION', 'multiStateValue', 319, 'Temporary ventilation operation', None, 1, (1, None)),
+    ("R(1)'ROpUnDev'RClmOpModRu", 'ROOM_CLIMATE_OP_MODE_FOR_ROOM_OP_UNIT', 'multiStateValue', 320, 'Room climate op.mode for room op.unit', None, 3, (1, None)),
+    ("R(1)'ROpUnDev'MntnIndRu", 'MAINTENANCE_INDICATION_FOR_ROOM_OP_UNIT', 'multiStateValue', 323, 'Maintenance indication for room op.unit', None, 1, (1, None)),
+    ("R(1)'ROpUnDev'FltIndRu", 'FAULT_INDICATION_FOR_ROOM_OPERATOR_UNIT', 'multiStateValue', 326, 'Fault indication for room operator unit', None, 1, (1, None)),
+    ("R(1)'ROpUnDev'ROpUn", 'ROOM_OPERATOR_UNIT', 'multiStateValue', 327, 'Room operator unit', None, 1, (1, None)),
+    ("R(1)'ROpUnDev'RClmOpModIn", 'ROOM_CLIMATE_OPERATING_MODE_INPUT_VALUE', 'multiStateValue', 328, 'Room climate operating mode input value', None, 1, (1, None)),
+    ("R(1)'HVAC'AlmBdl'AlmCnfXcu", 'ALARM_XCU_MODBUS', 'multiStateValue', 333, 'Alarm, XCU modbus', None, 2, (1, None)),
+    ("R(1)'HVAC'AlmBdl'AlmCnfEcu", 'ALARM_ECU_MODBUS', 'multiStateValue', 334, 'Alarm, ECU modbus', None, 1, (1, None)),
+    ("R(1)'HVAC'AlmBdl'AlmCnfEcul", 'ALARM_ECUL_MODBUS', 'multiStateValue', 335, 'Alarm, ECUL modbus', None, 2, (1, None)),
+    ("R(1)'HVAC'AlmBdl'AlmCnfQbm", 'ALARM_QBM_MODBUS', 'multiStateValue', 336, 'Alarm, QBM modbus', None, 2, (1, None)),
+    ("R(1)'HVAC'AlmBdl'AlmCnfTOa", 'ALARM_B4_SELECTION', 'multiStateValue', 337, 'Alarm, B4 selection', None, 1, (1, None)),
+    ("R(1)'HVAC'AlmBdl'AlmCnfRotHExg", 'ALARM_HEAT_EXCHANGER_SELECTION', 'multiStateValue', 338, 'Alarm, heat exchanger selection', None, 2, (1, None)),
+    ("R(1)'HVAC'AlmBdl'AlmCnfHpu", 'ALARM_HP_SELECTION', 'multiStateValue', 339, 'Alarm, HP selection', None, 3, (1, None)),
+    ("R(1)'RHvacCoo'MntnFnct'BalmInd", 'ALARM_INDICATION_TYPE_B', 'multiStateValue', 340, 'Alarm, indication type B', None, 1, (1, None)),
+    ("R(1)'RHvacCoo'MntnFnct'BalmAck", 'ALARM_ACKNOWLEDGEMENT_STATE_TYPE_B', 'multiStateValue', 341, 'Alarm, acknowledgement state type B', None, 1, (1, None)),
+    ("R(1)'RHvacCoo'AlmBdl'FltListOp", 'ALARM_OPERATION_OF_ALARMS_LIST', 'multiStateValue', 342, 'Alarm, operation of alarms list', None, 1, (1, None)),
+    ("R(1)'RHvacCoo'AlmFnct'AalmInd", 'ALARM_INDICATION_TYPE_A', 'multiStateValue', 343, 'Alarm, indication type A', None, 1, (1, None)),
+    ("R(1)'RHvacCoo'AlmFnct'AalmAck", 'ALARM_ACKNOWLEDGEMENT_STATE_TYPE_A', 'multiStateValue', 344, 'Alarm, acknowledgement state type A', None, 1, (1, None)),
+    ("R(1)'ROpUnDev'FltStaRu", 'CONTROL_PANEL_FAULT_STATE', 'multiStateValue', 345, 'Control panel, fault state', None, 1, (1, None)),
+    ("R(1)'ROpUnDev'FltAckIn", 'FAULT_ACKNOWLEDGEMENT_INPUT', 'multiStateValue', 346, 'Fault acknowledgement input', None, 1, (1, None)),
+    ("R(1)'ROpUnDev'MntnStaRu", 'MAINTENANCE_STATE_FOR_ROOM_OPERATOR_UNIT', 'multiStateValue', 347, 'Maintenance state for room operator unit', None, 1, (1, None)),
+    ("R(1)'ROpUnDev'MntnAckIn", 'MAINTENANCE_ACKNOWLEDGEMENT_INPUT', 'multiStateValue', 348, 'Maintenance acknowledgement input', None, 1, (1, None)),
+    ("R(1)'IOExtnDevEcul'TSuAfHExgRlb", 'RELIAB_OF_SUPPLY_AIR_TEMP_AF_HEAT_EXCH', 'multiStateValue', 349, 'Reliab.of supply air temp.af.heat exch.', None, 1, (1, None)),
+    ("R(1)'PDuctDevQbm'PDuctQbm", 'DUCT_PRESSURE_SENSOR_QBM', 'multiStateValue', 352, 'Duct pressure sensor QBM', None, 4, (1, None)),
+    ("R(1)'PDuctDevQbm'PSuRlb", 'RELIABILITY_OF_SUPPLY_AIR_PRESSURE', 'multiStateValue', 353, 'Reliability of supply air pressure', None, 1, (1, None)),
+    ("R(1)'PDuctDevQbm'PExRlb", 'RELIABILITY_OF_EXTRACT_AIR_PRESSURE', 'multiStateValue', 354, 'Reliability of extract air pressure', None, 1, (1, None)),
+    ("R(1)'RHvacCoo'RpdVntOp'TmpRpdVntTrg", 'FORCED_VENTILATION_STATE', 'multiStateValue', 357, 'Forced ventilation, state', None, 1, (1, None)),
+    ("R(1)'RHvacCoo'FplcVntOp'TmpFplcVntTrg", 'SPEED_FIRE_TRIGGER_APP', 'multiStateValue', 360, 'Speed FIRE, trigger APP', None, 1, (1, None)),
+    ("R(1)'ROpModDtr'HrvSta", 'ROTATING_HEAT_EXCHANGER_STATE', 'multiStateValue', 361, 'Rotating heat exchanger, state', None, 3, (1, None)),
+    ("R(1)'ComItfDevBrdg'ComItfBrdg", 'COMMUNICATION_INTERFACE_BRDG', 'multiStateValue', 364, 'Communication interface BRDG', None, 4, (1, None)),
+    ("R(1)'ComItfDevBrdg'ComStaRfqs", 'COMMUNICATION_STATE_RF_SYSTEM', 'multiStateValue', 365, 'Communication state RF system', None, 1, (1, None)),
+    ("R(1)'ComItfDevBrdg'BattStaRfqs", 'BATTERY_STATE_RF_SYSTEM', 'multiStateValue', 366, 'Battery state RF system', None, 1, (1, None)),
+    ("R(1)'ComItfDevBrdg'FltStaRfqs", 'FAULT_STATE_RF_SYSTEM', 'multiStateValue', 367, 'Fault state RF system', None, 1, (1, None)),
+    ("R(1)'ComItfDevBrdg'RmvRfqDev", 'REMOVE_RF_DEVICE', 'multiStateValue', 368, 'Remove RF device', None, 1, (1, None)),
+    ("R(1)'ComItfDevBrdg'CnctdRfqDev1", 'CONNECTED_RF_DEVICE_1', 'multiStateValue', 369, 'Connected RF device 1', None, 1, (1, None)),
+    ("R(1)'ComItfDevBrdg'CnctdRfqDev2", 'CONNECTED_RF_DEVICE_2', 'multiStateValue', 370, 'Connected RF device 2', None, 1, (1, None)),
+    ("R(1)'ComItfDevBrdg'CnctdRfqDev3", 'CONNECTED_RF_DEVICE_3', 'multiStateValue', 371, 'Connected RF device 3', None, 1, (1, None)),
+    ("R(1)'ComItfDevBrdg'CnctdRfqDev4", 'CONNECTED_RF_DEVICE_4', 'multiStateValue', 372, 'Connected RF device 4', None, 1, (1, None)),
+    ("R(1)'ComItfDevBrdg'CnctdRfqDev5", 'CONNECTED_RF_DEVICE_5', 'multiStateValue', 373, 'Connected RF device 5', None, 1, (1, None)),
+    ("R(1)'ComItfDevBrdg'CnctdRfqDev6", 'CONNECTED_RF_DEVICE_6', 'multiStateValue', 374, 'Connected RF device 6', None, 1, (1, None)),
+    ("R(1)'ComItfDevBrdg'CnctdRfqDev7", 'CONNECTED_RF_DEVICE_7', 'multiStateValue', 375, 'Connected RF device 7', None, 1, (1, None)),
+    ("R(1)'ComItfDevBrdg'CnctdRfqDev8", 'CONNECTED_RF_DEVICE_8', 'multiStateValue', 376, 'Connected RF device 8', None, 1, (1, None)),
+    ("R(1)'ComItfDevBrdg'CnctdRfqDev9", 'CONNECTED_RF_DEVICE_9', 'multiStateValue', 377, 'Connected RF device 9', None, 1, (1, None)),
+    ("R(1)'ComItfDevBrdg'CnctdRfqDev10", 'CONNECTED_RF_DEVICE_10', 'multiStateValue', 378, 'Connected RF device 10', None, 1, (1, None)),
+    ("R(1)'ComItfDevBrdg'RfqDevAddrOut", 'RF_DEVICE_ADDRESS_OUTPUT', 'multiStateValue', 379, 'RF device address output', None, 2, (1, None)),
+    ("R(1)'ComItfDevBrdg'RfqDevAddrIn", 'RF_DEVICE_ADDRESS_INPUT', 'multiStateValue', 381, 'RF device address input', None, 1, (1, None)),
+    ("R(1)'ComItfDevBrdg'BdgStaIn", 'BINDING_STATE_INPUT', 'multiStateValue', 382, 'Binding state input', None, 1, (1, None)),
+    ("R(1)'FanNodeDev'FanNode", 'FAN_NODE', 'multiStateValue', 384, 'FAN node', None, 4, (1, None)),
+    ("R(1)'FanNodeDev'OpModOutRfqs", 'OPERATING_MODE_OUTPUT_FOR_RF_SYSTEM', 'multiStateValue', 386, 'Operating mode output for RF system', None, 1, (1, None)),
+    ("R(1)'FanNodeDev'BdgCmd", 'BINDING_COMMAND', 'multiStateValue', 387, 'Binding command', None, 3, (1, None)),
+    ("R(1)'PshBtnDevVmn1'PshBtnVmn1", 'PUSHBUTTON_VMN_1', 'multiStateValue', 388, 'Pushbutton VMN 1', None, 4, (1, None)),
+    ("R(1)'PshBtnDevVmn1'BattStaVmn1", 'BATTERY_STATE_VMN_1', 'multiStateValue', 389, 'Battery state VMN 1', None, 1, (1, None)),
+    ("R(1)'PshBtnDevVmn2'PshBtnVmn2", 'PUSHBUTTON_VMN_2', 'multiStateValue', 390, 'Pushbutton VMN 2', None, 4, (1, None)),
+    ("R(1)'PshBtnDevVmn2'BattStaVmn2", 'BATTERY_STATE_VMN_2', 'multiStateValue', 391, 'Battery state VMN 2', None, 1, (1, None)),
+    ("R(1)'PshBtnDevVmn3'PshBtnVmn3", 'PUSHBUTTON_VMN_3', 'multiStateValue', 392, 'Pushbutton VMN 3', None, 4, (1, None)),
+    ("R(1)'PshBtnDevVmn3'BattStaVmn3", 'BATTERY_STATE_VMN_3', 'multiStateValue', 393, 'Battery state VMN 3', None, 1, (1, None)),
+    ("R(1)'ROpUnDevVmsh1'ROpUnVmsh1", 'ROOM_OPERATOR_UNIT_VMSH_1', 'multiStateValue', 394, 'Room operator unit VMSH 1', None, 4, (1, None)),
+    ("R(1)'ROpUnDevVmsh1'BattStaVmsh1", 'BATTERY_STATE_VMSH_1', 'multiStateValue', 395, 'Battery state VMSH 1', None, 1, (1, None)),
+    ("R(1)'ROpUnDevVmsh2'ROpUnVmsh2", 'ROOM_OPERATOR_UNIT_VMSH_2', 'multiStateValue', 396, 'Room operator unit VMSH 2', None, 4, (1, None)),
+    ("R(1)'ROpUnDevVmsh2'BattStaVmsh2", 'BATTERY_STATE_VMSH_2', 'multiStateValue', 397, 'Battery state VMSH 2', None, 1, (1, None)),
+    ("R(1)'ROpUnDevVmsh3'ROpUnVmsh3", 'ROOM_OPERATOR_UNIT_VMSH_3', 'multiStateValue', 398, 'Room operator unit VMSH 3', None, 4, (1, None)),
+    ("R(1)'ROpUnDevVmsh3'BattStaVmsh3", 'BATTERY_STATE_VMSH_3', 'multiStateValue', 399, 'Battery state VMSH 3', None, 1, (1, None)),
+    ("R(1)'ROpUnDevVmsc'ROpUnVmsc", 'ROOM_OPERATOR_UNIT_VMSC', 'multiStateValue', 400, 'Room operator unit VMSC', None, 4, (1, None)),
+    ("R(1)'IOExtnDevVmc'IOExtnVmc", 'I_O_EXTENSION_MODULE_VMC', 'multiStateValue', 401, 'I/O extension module VMC', None, 4, (1, None)),
+    ("R(1)'AlmHdl'AlmAck", 'ALARM_ACKNOWLEDGEMENT', 'multiStateValue', 434, 'Alarm acknowledgement', None, 1, (1, None)),
+    ("R(1)'AlmHdl'Alm1001'AlmSta", 'ALARM_STATE_ALM1001', 'multiStateValue', 435, 'Alarm state', None, 1, (1, None)),
+    ("R(1)'AlmHdl'Alm1001'AlmType", 'ALARM_TYPE_ALM1001', 'multiStateValue', 436, 'Alarm type', None, 1, (1, None)),
+    ("R(1)'AlmHdl'Alm1002'AlmSta", 'ALARM_STATE_ALM1002', 'multiStateValue', 437, 'Alarm state', None, 1, (1, None)),
+    ("R(1)'AlmHdl'Alm1002'AlmType", 'MULTISTATE_CALCULATED_VALUE_ALM1002', 'multiStateValue', 438, 'Multistate calculated value', None, 2, (1, None)),
+    ("R(1)'AlmHdl'Alm1003'AlmSta", 'ALARM_STATE_ALM1003', 'multiStateValue', 439, 'Alarm state', None, 1, (1, None)),
+    ("R(1)'AlmHdl'Alm1003'AlmType", 'MULTISTATE_CALCULATED_VALUE_ALM1003', 'multiStateValue', 440, 'Multistate calculated value', None, 2, (1, None)),
+    ("R(1)'AlmHdl'Alm1004'AlmSta", 'ALARM_STATE_ALM1004', 'multiStateValue', 441, 'Alarm state', None, 1, (1, None)),
+    ("R(1)'AlmHdl'Alm1004'AlmType", 'MULTISTATE_CALCULATED_VALUE_ALM1004', 'multiStateValue', 442, 'Multistate calculated value', None, 1, (1, None)),
+    ("R(1)'AlmHdl'Alm1005'AlmSta", 'ALARM_STATE_ALM1005', 'multiStateValue', 443, 'Alarm state', None, 1, (1, None)),
+    ("R(1)'AlmHdl'Alm1005'AlmType", 'MULTISTATE_CALCULATED_VALUE_ALM1005', 'multiStateValue', 444, 'Multistate calculated value', None, 1, (1, None)),
+    ("R(1)'AlmHdl'Alm1006'AlmSta", 'ALARM_STATE_ALM1006', 'multiStateValue', 445, 'Alarm state', None, 1, (1, None)),
+    ("R(1)'AlmHdl'Alm1006'AlmType", 'MULTISTATE_CALCULATED_VALUE_ALM1006', 'multiStateValue', 446, 'Multistate calculated value', None, 2, (1, None)),
+    ("R(1)'AlmHdl'Alm1007'AlmSta", 'ALARM_STATE_ALM1007', 'multiStateValue', 447, 'Alarm state', None, 1, (1, None)),
+    ("R(1)'AlmHdl'Alm1007'AlmType", 'MULTISTATE_CALCULATED_VALUE_ALM1007', 'multiStateValue', 448, 'Multistate calculated value', None, 2, (1, None)),
+    ("R(1)'AlmHdl'Alm1008'AlmSta", 'ALARM_STATE_ALM1008', 'multiStateValue', 449, 'Alarm state', None, 1, (1, None)),
+    ("R(1)'AlmHdl'Alm1008'AlmType", 'MULTISTATE_CALCULATED_VALUE_ALM1008', 'multiStateValue', 450, 'Multistate calculated value', None, 2, (1, None)),
+    ("R(1)'AlmHdl'Alm1009'AlmSta", 'ALARM_STATE_ALM1009', 'multiStateValue', 451, 'Alarm state', None, 1, (1, None)),
+    ("R(1)'AlmHdl'Alm1009'AlmType", 'MULTISTATE_CALCULATED_VALUE_ALM1009', 'multiStateValue', 452, 'Multistate calculated value', None, 1, (1, None)),
+    ("R(1)'AlmHdl'Alm1010'AlmSta", 'ALARM_STATE_ALM1010', 'multiStateValue', 453, 'Alarm state', None, 1, (1, None)),
+    ("R(1)'AlmHdl'Alm1010'AlmType", 'MULTISTATE_CALCULATED_VALUE_ALM1010', 'multiStateValue', 454, 'Multistate calculated value', None, 2, (1, None)),
+    ("R(1)'AlmHdl'Alm1011'AlmSta", 'ALARM_STATE_ALM1011', 'multiStateValue', 455, 'Alarm state', None, 1, (1, None)),
+    ("R(1)'AlmHdl'Alm1011'AlmType", 'MULTISTATE_CALCULATED_VALUE_ALM1011', 'multiStateValue', 456, 'Multistate calculated value', None, 2, (1, None)),
+    ("R(1)'AlmHdl'Alm1020'AlmSta", 'ALARM_STATE_ALM1020', 'multiStateValue', 457, 'Alarm state', None, 1, (1, None)),
+    ("R(1)'AlmHdl'Alm1020'AlmType", 'MULTISTATE_CALCULATED_VALUE_ALM1020', 'multiStateValue', 458, 'Multistate calculated value', None, 2, (1, None)),
+    ("R(1)'AlmHdl'Alm1032'AlmSta", 'ALARM_STATE_ALM1032', 'multiStateValue', 459, 'Alarm state', None, 1, (1, None)),
+    ("R(1)'AlmHdl'Alm1032'AlmType", 'MULTISTATE_CALCULATED_VALUE_ALM1032', 'multiStateValue', 460, 'Multistate calculated value', None, 2, (1, None)),
+    ("R(1)'AlmHdl'Alm1033'AlmSta", 'ALARM_STATE_ALM1033', 'multiStateValue', 461, 'Alarm state', None, 1, (1, None)),
+    ("R(1)'AlmHdl'Alm1033'AlmType", 'MULTISTATE_CALCULATED_VALUE_ALM1033', 'multiStateValue', 462, 'Multistate calculated value', None, 2, (1, None)),
+    ("R(1)'AlmHdl'Alm1034'AlmSta", 'ALARM_STATE_ALM1034', 'multiStateValue', 463, 'Alarm state', None, 1, (1, None)),
+    ("R(1)'AlmHdl'Alm1034'AlmType", 'MULTISTATE_CALCULATED_VALUE_ALM1034', 'multiStateValue', 464, 'Multistate calculated value', None, 2, (1, None)),
+    ("R(1)'AlmHdl'Alm1035'AlmSta", 'ALARM_STATE_ALM1035', 'multiStateValue', 465, 'Alarm state', None, 1, (1, None)),
+    ("R(1)'AlmHdl'Alm1035'AlmType", 'MULTISTATE_CALCULATED_VALUE_ALM1035', 'multiStateValue', 466, 'Multistate calculated value', None, 2, (1, None)),
+    ("R(1)'AlmHdl'Alm1040'AlmSta", 'ALARM_STATE_ALM1040', 'multiStateValue', 467, 'Alarm state', None, 1, (1, None)),
+    ("R(1)'AlmHdl'Alm1040'AlmType", 'MULTISTATE_CALCULATED_VALUE_ALM1040', 'multiStateValue', 468, 'Multistate calculated value', None, 2, (1, None)),
+    ("R(1)'AlmHdl'Alm2001'AlmSta", 'ALARM_STATE_ALM2001', 'multiStateValue', 469, 'Alarm state', None, 1, (1, None)),
+    ("R(1)'AlmHdl'Alm2001'AlmType", 'MULTISTATE_CALCULATED_VALUE_ALM2001', 'multiStateValue', 470, 'Multistate calculated value', None, 1, (1, None)),
+    ("R(1)'AlmHdl'Alm2002'AlmSta", 'ALARM_STATE_ALM2002', 'multiStateValue', 471, 'Alarm state', None, 1, (1, None)),
+    ("R(1)'AlmHdl'Alm2002'AlmType", 'MULTISTATE_CALCULATED_VALUE_ALM2002', 'multiStateValue', 472, 'Multistate calculated value', None, 1, (1, None)),
+    ("R(1)'AlmHdl'Alm2003'AlmSta", 'ALARM_STATE_ALM2003', 'multiStateValue', 473, 'Alarm state', None, 1, (1, None)),
+    ("R(1)'AlmHdl'Alm2003'AlmType", 'MULTISTATE_CALCULATED_VALUE_ALM2003', 'multiStateValue', 474, 'Multistate calculated value', None, 1, (1, None)),
+    ("R(1)'AlmHdl'Alm2004'AlmSta", 'ALARM_STATE_ALM2004', 'multiStateValue', 475, 'Alarm state', None, 1, (1, None)),
+    ("R(1)'AlmHdl'Alm2004'AlmType", 'MULTISTATE_CALCULATED_VALUE_ALM2004', 'multiStateValue', 476, 'Multistate calculated value', None, 1, (1, None)),
+    ("R(1)'AlmHdl'Alm2005'AlmSta", 'ALARM_STATE_ALM2005', 'multiStateValue', 477, 'Alarm state', None, 1, (1, None)),
+    ("R(1)'AlmHdl'Alm2005'AlmType", 'MULTISTATE_CALCULATED_VALUE_ALM2005', 'multiStateValue', 478, 'Multistate calculated value', None, 2, (1, None)),
+    ("R(1)'AlmHdl'Alm2007'AlmSta", 'ALARM_STATE_ALM2007', 'multiStateValue', 479, 'Alarm state', None, 1, (1, None)),
+    ("R(1)'AlmHdl'Alm2007'AlmType", 'MULTISTATE_CALCULATED_VALUE_ALM2007', 'multiStateValue', 480, 'Multistate calculated value', None, 1, (1, None)),
+    ("R(1)'AlmHdl'Alm2010'AlmSta", 'ALARM_STATE_ALM2010', 'multiStateValue', 481, 'Alarm state', None, 1, (1, None)),
+    ("R(1)'AlmHdl'Alm2010'AlmType", 'MULTISTATE_CALCULATED_VALUE_ALM2010', 'multiStateValue', 482, 'Multistate calculated value', None, 1, (1, None)),
+    ("R(1)'AlmHdl'Alm3001'AlmSta", 'ALARM_STATE_ALM3001', 'multiStateValue', 483, 'Alarm state', None, 1, (1, None)),
+    ("R(1)'AlmHdl'Alm3001'AlmType", 'MULTISTATE_CALCULATED_VALUE_ALM3001', 'multiStateValue', 484, 'Multistate calculated value', None, 2, (1, None)),
+    ("R(1)'AlmHdl'Alm3002'AlmSta", 'ALARM_STATE_ALM3002', 'multiStateValue', 485, 'Alarm state', None, 1, (1, None)),
+    ("R(1)'AlmHdl'Alm3002'AlmType", 'MULTISTATE_CALCULATED_VALUE_ALM3002', 'multiStateValue', 486, 'Multistate calculated value', None, 1, (1, None)),
+    ("R(1)'AlmHdl'Alm3003'AlmSta", 'ALARM_STATE_ALM3003', 'multiStateValue', 487, 'Alarm state', None, 1, (1, None)),
+    ("R(1)'AlmHdl'Alm3003'AlmType", 'MULTISTATE_CALCULATED_VALUE_ALM3003', 'multiStateValue', 488, 'Multistate calculated value', None, 2, (1, None)),
+    ("R(1)'AlmHdl'Alm3004'AlmSta", 'ALARM_STATE_ALM3004', 'multiStateValue', 489, 'Alarm state', None, 1, (1, None)),
+    ("R(1)'AlmHdl'Alm3004'AlmType", 'MULTISTATE_CALCULATED_VALUE_ALM3004', 'multiStateValue', 490, 'Multistate calculated value', None, 2, (1, None)),
+    ("R(1)'AlmHdl'Alm3006'AlmSta", 'ALARM_STATE_ALM3006', 'multiStateValue', 491, 'Alarm state', None, 1, (1, None)),
+    ("R(1)'AlmHdl'Alm3006'AlmType", 'MULTISTATE_CALCULATED_VALUE_ALM3006', 'multiStateValue', 492, 'Multistate calculated value', None, 2, (1, None)),
+    ("R(1)'AlmHdl'Alm3007'AlmSta", 'ALARM_STATE_ALM3007', 'multiStateValue', 493, 'Alarm state', None, 1, (1, None)),
+    ("R(1)'AlmHdl'Alm3007'AlmType", 'MULTISTATE_CALCULATED_VALUE_ALM3007', 'multiStateValue', 494, 'Multistate calculated value', None, 2, (1, None)),
+    ("R(1)'AlmHdl'Alm2008'AlmSta", 'ALARM_STATE_ALM2008', 'multiStateValue', 495, 'Alarm state', None, 1, (1, None)),
+    ("R(1)'AlmHdl'Alm2008'AlmType", 'MULTISTATE_CALCULATED_VALUE_ALM2008', 'multiStateValue', 496, 'Multistate calculated value', None, 1, (1, None)),
+    ("R(1)'AlmHdl'Alm2009'AlmSta", 'ALARM_STATE_ALM2009', 'multiStateValue', 497, 'Alarm state', None, 1, (1, None)),
+    ("R(1)'AlmHdl'Alm2009'AlmType", 'MULTISTATE_CALCULATED_VALUE_ALM2009', 'multiStateValue', 498, 'Multistate calculated value', None, 1, (1, None)),
+    ("R(1)'AlmHdl'Alm2011'AlmSta", 'ALARM_STATE_ALM2011', 'multiStateValue', 499, 'Alarm state', None, 1, (1, None)),
+    ("R(1)'AlmHdl'Alm2011'AlmType", 'MULTISTATE_CALCULATED_VALUE_ALM2011', 'multiStateValue', 500, 'Multistate calculated value', None, 1, (1, None)),
+    ("R(1)'AlmHdl'Alm2014'AlmSta", 'ALARM_STATE_ALM2014', 'multiStateValue', 501, 'Alarm state', None, 1, (1, None)),
+    ("R(1)'AlmHdl'Alm2014'AlmType", 'MULTISTATE_CALCULATED_VALUE_ALM2014', 'multiStateValue', 502, 'Multistate calculated value', None, 1, (1, None)),
+    ("R(1)'AlmHdl'Alm2016'AlmSta", 'ALARM_STATE_ALM2016', 'multiStateValue', 505, 'Alarm state', None, 1, (1, None)),
+    ("R(1)'AlmHdl'Alm2016'AlmType", 'MULTISTATE_CALCULATED_VALUE_ALM2016', 'multiStateValue', 506, 'Multistate calculated value', None, 2, (1, None)),
+    ("R(1)'AlmHdl'Alm9001'AlmSta", 'ALARM_STATE_ALM9001', 'multiStateValue', 507, 'Alarm state', None, 1, (1, None)),
+    ("R(1)'AlmHdl'Alm9001'AlmType", 'MULTISTATE_CALCULATED_VALUE_ALM9001', 'multiStateValue', 508, 'Multistate calculated value', None, 1, (1, None)),
+    ("R(1)'AlmHdl'Alm9002'AlmSta", 'ALARM_STATE_ALM9002', 'multiStateValue', 509, 'Alarm state', None, 1, (1, None)),
+    ("R(1)'AlmHdl'Alm9002'AlmType", 'MULTISTATE_CALCULATED_VALUE_ALM9002', 'multiStateValue', 510, 'Multistate calculated value', None, 1, (1, None)),
+    ("R(1)'AlmHdl'Alm9003'AlmSta", 'ALARM_STATE_ALM9003', 'multiStateValue', 511, 'Alarm state', None, 1, (1, None)),
+    ("R(1)'AlmHdl'Alm9003'AlmType", 'MULTISTATE_CALCULATED_VALUE_ALM9003', 'multiStateValue', 512, 'Multistate calculated value', None, 2, (1, None)),
+    ("R(1)'AlmHdl'Alm9004'AlmSta", 'ALARM_STATE_ALM9004', 'multiStateValue', 513, 'Alarm state', None, 1, (1, None)),
+    ("R(1)'AlmHdl'Alm9004'AlmType", 'MULTISTATE_CALCULATED_VALUE_ALM9004', 'multiStateValue', 514, 'Multistate calculated value', None, 2, (1, None)),
+    ("R(1)'AlmHdl'Alm9005'AlmSta", 'ALARM_STATE_ALM9005', 'multiStateValue', 515, 'Alarm state', None, 1, (1, None)),
+    ("R(1)'AlmHdl'Alm9005'AlmType", 'MULTISTATE_CALCULATED_VALUE_ALM9005', 'multiStateValue', 516, 'Multistate calculated value', None, 2, (1, None)),
+    ("R(1)'AlmHdl'Alm9006'AlmSta", 'ALARM_STATE_ALM9006', 'multiStateValue', 517, 'Alarm state', None, 1, (1, None)),
+    ("R(1)'AlmHdl'Alm9006'AlmType", 'MULTISTATE_CALCULATED_VALUE_ALM9006', 'multiStateValue', 518, 'Multistate calculated value', None, 1, (1, None)),
+    ("R(1)'AlmHdl'Alm9007'AlmSta", 'ALARM_STATE_ALM9007', 'multiStateValue', 519, 'Alarm state', None, 1, (1, None)),
+    ("R(1)'AlmHdl'Alm9007'AlmType", 'MULTISTATE_CALCULATED_VALUE_ALM9007', 'multiStateValue', 520, 'Multistate calculated value', None, 1, (1, None)),
+    ("R(1)'AlmHdl'Alm9008'AlmSta", 'ALARM_STATE_ALM9008', 'multiStateValue', 521, 'Alarm state', None, 1, (1, None)),
+    ("R(1)'AlmHdl'Alm9008'AlmType", 'MULTISTATE_CALCULATED_VALUE_ALM9008', 'multiStateValue', 522, 'Multistate calculated value', None, 2, (1, None)),
+    ("R(1)'AlmHdl'Alm9009'AlmSta", 'ALARM_STATE_ALM9009', 'multiStateValue', 523, 'Alarm state', None, 1, (1, None)),
+    ("R(1)'AlmHdl'Alm9009'AlmType", 'MULTISTATE_CALCULATED_VALUE_ALM9009', 'multiStateValue', 524, 'Multistate calculated value', None, 2, (1, None)),
+    ("R(1)'AlmHdl'Alm9010'AlmSta", 'ALARM_STATE_ALM9010', 'multiStateValue', 525, 'Alarm state', None, 1, (1, None)),
+    ("R(1)'AlmHdl'Alm9010'AlmType", 'MULTISTATE_CALCULATED_VALUE_ALM9010', 'multiStateValue', 526, 'Multistate calculated value', None, 2, (1, None)),
+    ("R(1)'AlmHdl'Alm9011'AlmSta", 'ALARM_STATE_ALM9011', 'multiStateValue', 527, 'Alarm state', None, 1, (1, None)),
+    ("R(1)'AlmHdl'Alm9011'AlmType", 'MULTISTATE_CALCULATED_VALUE_ALM9011', 'multiStateValue', 528, 'Multistate calculated value', None, 2, (1, None)),
+    ("R(1)'AlmHdl'Alm9012'AlmSta", 'ALARM_STATE_ALM9012', 'multiStateValue', 529, 'Alarm state', None, 1, (1, None)),
+    ("R(1)'AlmHdl'Alm9012'AlmType", 'MULTISTATE_CALCULATED_VALUE_ALM9012', 'multiStateValue', 530, 'Multistate calculated value', None, 2, (1, None)),
+    ("R(1)'AlmHdl'Alm9013'AlmSta", 'ALARM_STATE_ALM9013', 'multiStateValue', 531, 'Alarm state', None, 1, (1, None)),
+    ("R(1)'AlmHdl'Alm9013'AlmType", 'MULTISTATE_CALCULATED_VALUE_ALM9013', 'multiStateValue', 532, 'Multistate calculated value', None, 1, (1, None)),
+    ("R(1)'AlmHdl'Alm9014'AlmSta", 'ALARM_STATE_ALM9014', 'multiStateValue', 533, 'Alarm state', None, 1, (1, None)),
+    ("R(1)'AlmHdl'Alm9014'AlmType", 'MULTISTATE_CALCULATED_VALUE_ALM9014', 'multiStateValue', 534, 'Multistate calculated value', None, 2, (1, None)),
+    ("R(1)'AlmHdl'Alm9015'AlmSta", 'ALARM_STATE_ALM9015', 'multiStateValue', 535, 'Alarm state', None, 1, (1, None)),
+    ("R(1)'AlmHdl'Alm9015'AlmType", 'MULTISTATE_CALCULATED_VALUE_ALM9015', 'multiStateValue', 536, 'Multistate calculated value', None, 2, (1, None)),
+    ("R(1)'AlmHdl'Alm9016'AlmSta", 'ALARM_STATE_ALM9016', 'multiStateValue', 537, 'Alarm state', None, 1, (1, None)),
+    ("R(1)'AlmHdl'Alm9016'AlmType", 'MULTISTATE_CALCULATED_VALUE_ALM9016', 'multiStateValue', 538, 'Multistate calculated value', None, 2, (1, None)),
+    ("R(1)'AlmHdl'Alm9017'AlmSta", 'ALARM_STATE_ALM9017', 'multiStateValue', 539, 'Alarm state', None, 1, (1, None)),
+    ("R(1)'AlmHdl'Alm9017'AlmType", 'MULTISTATE_CALCULATED_VALUE_ALM9017', 'multiStateValue', 540, 'Multistate calculated value', None, 2, (1, None)),
+    ("R(1)'AlmHdl'Alm9018'AlmSta", 'ALARM_STATE_ALM9018', 'multiStateValue', 541, 'Alarm state', None, 1, (1, None)),
+    ("R(1)'AlmHdl'Alm9018'AlmType", 'MULTISTATE_CALCULATED_VALUE_ALM9018', 'multiStateValue', 542, 'Multistate calculated value', None, 2, (1, None)),
+    ("R(1)'AlmHdl'Alm9019'AlmSta", 'ALARM_STATE_ALM9019', 'multiStateValue', 543, 'Alarm state', None, 1, (1, None)),
+    ("R(1)'AlmHdl'Alm9019'AlmType", 'MULTISTATE_CALCULATED_VALUE_ALM9019', 'multiStateValue', 544, 'Multistate calculated value', None, 2, (1, None)),
+    ("R(1)'AlmHdl'Alm9020'AlmSta", 'ALARM_STATE_ALM9020', 'multiStateValue', 545, 'Alarm state', None, 1, (1, None)),
+    ("R(1)'AlmHdl'Alm9020'AlmType", 'MULTISTATE_CALCULATED_VALUE_ALM9020', 'multiStateValue', 546, 'Multistate calculated value', None, 2, (1, None)),
+    ("R(1)'AlmHdl'Alm9021'AlmSta", 'ALARM_STATE_ALM9021', 'multiStateValue', 547, 'Alarm state', None, 1, (1, None)),
+    ("R(1)'AlmHdl'Alm9021'AlmType", 'MULTISTATE_CALCULATED_VALUE_ALM9021', 'multiStateValue', 548, 'Multistate calculated value', None, 2, (1, None)),
+    ("R(1)'AlmHdl'Alm9022'AlmSta", 'ALARM_STATE_ALM9022', 'multiStateValue', 549, 'Alarm state', None, 1, (1, None)),
+    ("R(1)'AlmHdl'Alm9022'AlmType", 'MULTISTATE_CALCULATED_VALUE_ALM9022', 'multiStateValue', 550, 'Multistate calculated value', None, 2, (1, None)),
+    ("R(1)'AlmHdl'Alm9023'AlmSta", 'ALARM_STATE_ALM9023', 'multiStateValue', 551, 'Alarm state', None, 1, (1, None)),
+    ("R(1)'AlmHdl'Alm9023'AlmType", 'MULTISTATE_CALCULATED_VALUE_ALM9023', 'multiStateValue', 552, 'Multistate calculated value', None, 2, (1, None)),
+    ("R(1)'AlmHdl'Alm9024'AlmSta", 'ALARM_STATE_ALM9024', 'multiStateValue', 553, 'Alarm state', None, 1, (1, None)),
+    ("R(1)'AlmHdl'Alm9024'AlmType", 'MULTISTATE_CALCULATED_VALUE_ALM9024', 'multiStateValue', 554, 'Multistate calculated value', None, 1, (1, None)),
+    ("R(1)'AlmHdl'Alm9025'AlmSta", 'ALARM_STATE_ALM9025', 'multiStateValue', 555, 'Alarm state', None, 1, (1, None)),
+    ("R(1)'AlmHdl'Alm9025'AlmType", 'MULTISTATE_CALCULATED_VALUE_ALM9025', 'multiStateValue', 556, 'Multistate calculated value', None, 1, (1, None)),
+    ("R(1)'AlmHdl'Alm9026'AlmSta", 'ALARM_STATE_ALM9026', 'multiStateValue', 557, 'Alarm state', None, 1, (1, None)),
+    ("R(1)'AlmHdl'Alm9026'AlmType", 'MULTISTATE_CALCULATED_VALUE_ALM9026', 'multiStateValue', 558, 'Multistate calculated value', None, 1, (1, None)),
+    ("R(1)'AlmHdl'Alm9027'AlmSta", 'ALARM_STATE_ALM9027', 'multiStateValue', 559, 'Alarm state', None, 1, (1, None)),
+    ("R(1)'AlmHdl'Alm9027'AlmType", 'MULTISTATE_CALCULATED_VALUE_ALM9027', 'multiStateValue', 560, 'Multistate calculated value', None, 2, (1, None)),
+    ("R(1)'AlmHdl'Alm9028'AlmSta", 'ALARM_STATE_ALM9028', 'multiStateValue', 561, 'Alarm state', None, 1, (1, None)),
+    ("R(1)'AlmHdl'Alm9028'AlmType", 'MULTISTATE_CALCULATED_VALUE_ALM9028', 'multiStateValue', 562, 'Multistate calculated value', None, 1, (1, None)),
+    ("R(1)'AlmHdl'Alm1022'AlmSta", 'ALARM_STATE_ALM1022', 'multiStateValue', 563, 'Alarm state', None, 1, (1, None)),
+    ("R(1)'AlmHdl'Alm1022'AlmType", 'MULTISTATE_CALCULATED_VALUE_ALM1022', 'multiStateValue', 564, 'Multistate calculated value', None, 2, (1, None)),
+    ("R(1)'AlmHdl'Alm1023'AlmSta", 'ALARM_STATE_ALM1023', 'multiStateValue', 565, 'Alarm state', None, 1, (1, None)),
+    ("R(1)'AlmHdl'Alm1023'AlmType", 'MULTISTATE_CALCULATED_VALUE_ALM1023', 'multiStateValue', 566, 'Multistate calculated value', None, 2, (1, None)),
+    ("R(1)'AlmHdl'Alm1024'AlmSta", 'ALARM_STATE_ALM1024', 'multiStateValue', 567, 'Alarm state', None, 1, (1, None)),
+    ("R(1)'AlmHdl'Alm1024'AlmType", 'MULTISTATE_CALCULATED_VALUE_ALM1024', 'multiStateValue', 568, 'Multistate calculated value', None, 2, (1, None)),
+    ("R(1)'AlmHdl'Alm1025'AlmSta", 'ALARM_STATE_ALM1025', 'multiStateValue', 569, 'Alarm state', None, 1, (1, None)),
+    ("R(1)'AlmHdl'Alm1025'AlmType", 'MULTISTATE_CALCULATED_VALUE_ALM1025', 'multiStateValue', 570, 'Multistate calculated value', None, 2, (1, None)),
+    ("R(1)'AlmHdl'Alm1026'AlmSta", 'ALARM_STATE_ALM1026', 'multiStateValue', 571, 'Alarm state', None, 1, (1, None)),
+    ("R(1)'AlmHdl'Alm1026'AlmType", 'MULTISTATE_CALCULATED_VALUE_ALM1026', 'multiStateValue', 572, 'Multistate calculated value', None, 2, (1, None)),
+    ("R(1)'AlmHdl'Alm1027'AlmSta", 'ALARM_STATE_ALM1027', 'multiStateValue', 573, 'Alarm state', None, 1, (1, None)),
+    ("R(1)'AlmHdl'Alm1027'AlmType", 'MULTISTATE_CALCULATED_VALUE_ALM1027', 'multiStateValue', 574, 'Multistate calculated value', None, 2, (1, None)),
+    ("R(1)'AlmHdl'Alm1028'AlmSta", 'ALARM_STATE_ALM1028', 'multiStateValue', 575, 'Alarm state', None, 1, (1, None)),
+    ("R(1)'AlmHdl'Alm1028'AlmType", 'MULTISTATE_CALCULATED_VALUE_ALM1028', 'multiStateValue', 576, 'Multistate calculated value', None, 2, (1, None)),
+    ("R(1)'AlmHdl'Alm1029'AlmSta", 'ALARM_STATE_ALM1029', 'multiStateValue', 577, 'Alarm state', None, 1, (1, None)),
+    ("R(1)'AlmHdl'Alm1029'AlmType", 'MULTISTATE_CALCULATED_VALUE_ALM1029', 'multiStateValue', 578, 'Multistate calculated value', None, 1, (1, None)),
+    ("R(1)'AlmHdl'Alm1030'AlmSta", 'ALARM_STATE_ALM1030', 'multiStateValue', 579, 'Alarm state', None, 1, (1, None)),
+    ("R(1)'AlmHdl'Alm1030'AlmType", 'MULTISTATE_CALCULATED_VALUE_ALM1030', 'multiStateValue', 580, 'Multistate calculated value', None, 2, (1, None)),
+    ("R(1)'AlmHdl'Alm1036'AlmSta", 'ALARM_STATE_ALM1036', 'multiStateValue', 581, 'Alarm state', None, 1, (1, None)),
+    ("R(1)'AlmHdl'Alm1036'AlmType", 'MULTISTATE_CALCULATED_VALUE_ALM1036', 'multiStateValue', 582, 'Multistate calculated value', None, 1, (1, None)),
+    ("R(1)'ROpUnDev'NxROpMod", 'NEXT_ROOM_OPERATING_MODE', 'multiStateValue', 583, 'Next room operating mode', None, 5, (1, None)),
+    ("R(1)'ROpUnDev'ROpModDtrRu", 'ROOM_OP_MODE_DETERM_FOR_ROOM_OP_UNIT', 'multiStateValue', 584, 'Room op.mode determ.for room op.unit', None, 1, (1, None)),
+    ("R(1)'ROpUnDev'TmpROpModIn", 'TEMPORARY_ROOM_OPERATING_MODE_INPUT', 'multiStateValue', 585, 'Temporary room operating mode input', None, 1, (1, None)),
+    ("R(1)'AlmHdl'Alm2013'AlmSta", 'ALARM_STATE_ALM2013', 'multiStateValue', 605, 'Alarm state', None, 1, (1, None)),
+    ("R(1)'AlmHdl'Alm2013'AlmType", 'ALARM_TYPE_ALM2013', 'multiStateValue', 606, 'Alarm type', None, 1, (1, None)),
+    ("R(1)'AlmHdl'Alm2018'AlmSta", 'ALARM_STATE_ALM2018', 'multiStateValue', 607, 'Alarm state', None, 1, (1, None)),
+    ("R(1)'AlmHdl'Alm2018'AlmType", 'ALARM_TYPE_ALM2018', 'multiStateValue', 608, 'Alarm type', None, 2, (1, None)),
+    ("R(1)'AlmHdl'Alm2019'AlmSta", 'ALARM_STATE_ALM2019', 'multiStateValue', 609, 'Alarm state', None, 1, (1, None)),
+    ("R(1)'AlmHdl'Alm2019'AlmType", 'ALARM_TYPE_ALM2019', 'multiStateValue', 610, 'Alarm type', None, 2, (1, None)),
+    ("R(1)'AlmHdl'Alm1039'AlmSta", 'ALARM_STATE_ALM1039', 'multiStateValue', 611, 'Alarm state', None, 1, (1, None)),
+    ("R(1)'AlmHdl'Alm1039'AlmType", 'MULTISTATE_CALCULATED_VALUE_ALM1039', 'multiStateValue', 612, 'Multistate calculated value', None, 2, (1, None)),
+    ("R(1)'HVAC'AlmBdl'FilRpcRst", 'AIR_FILTER_REPLACE_TIMER_RESET', 'multiStateValue', 613, 'Air filter replace timer reset', None, 1, (1, None)),
+    ("R(1)'HVAC'AlmBdl'AlmCnfFanFb", 'ALARM_CONFIG_FOR_FAN_SPEED_FEEDBACK', 'multiStateValue', 614, 'Alarm config.for fan speed feedback', None, 2, (1, None)),
+    ("R(1)'HdwCnf'DevLwPwr", 'DEVICE_LOW_POWER', 'multiStateValue', 617, 'Device low power', None, 1, (1, None)),
+    ("R(1)'HVAC'Erc'MotorManRst", 'MOTOR_MANUAL_RESET', 'multiStateValue', 618, 'Motor manual reset ', None, 1, (1, None)),
+    ('RotHExgSpdState', 'MONITOR_MOTOR_MCU_STATE', 'multiStateValue', 619, 'Monitor motor MCU state', None, 1, (1, None)),
+)
@@ -0,0 +1,226 @@
+"""Typed table of the points of a Flexit Nordic controller.
+
+The table is generated from bac0_points_dump.txt into point_data.py, so the
+library looks points up by BACnet path, object identifier or name without
+parsing the dump or importing a module global per point. Regenerate it after
+updating the dump, from custom_components/flexit_bacnet:
+
+    python -m lib.points
+"""
+import re
+import argparse
+
+from collections import Counter
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Iterator, List, NamedTuple, Tuple
+from logging import Logger, getLogger
+
+from . import codec
+from .typing import ObjectIdentifier
+
+LOGGER: Logger = getLogger(__package__)
+
+DUMP_PATH = Path(__file__).resolve().parents[3] / 'bac0_points_dump.txt'
+DATA_PATH = Path(__file__).resolve().parent / 'point_data.py'
+
+# Value ranges known from the object type or units; the dump records no limits
+BINARY_RANGE = ('inactive', 'active')
+MULTI_STATE_RANGE = (1, None)
+PERCENT_RANGE = (0.0, 100.0)
+PERCENT_UNITS = ('percent', 'percentRelativeHumidity')
+
+_COMMENT = re.compile(r"^# (?P<description>.*) \(e\.g\. (?P<value>\S+) (?P<units>\S+)\)$")
+_POINT = re.compile(r"^(?P<name>\S+) = \(\('(?P<object_type>\w+)', (?P<instance_id>\d+)\), \"(?P<path>.*)\"\)$")
+_NOT_IDENTIFIER = re.compile(r'[^0-9A-Za-z]+')
+
+
+class Point(NamedTuple):
+    """One point of the controller."""
+
+    path: str
+    name: str
+    object_type: str
+    instance_id: int
+    description: str = ''
+    units: str | int | None = None
+    example: Any = None
+    value_range: Tuple[Any, Any] | None = None
+
+    @property
+    def object_identifier(self) -> ObjectIdentifier:
+        return self.object_type, self.instance_id
+
+
+class PointTable:
+    """Immutable point table with O(1) lookup by path, object identifier and name."""
+
+    __slots__ = ('_points', '_paths', '_objects', '_names')
+
+    def __init__(self, rows):
+        points = tuple(Point(*row) for row in rows)
+        object.__setattr__(self, '_points', points)
+        object.__setattr__(self, '_paths', {point.path: point for point in points})
+        object.__setattr__(self, '_objects', {point.object_identifier: point for point in points})
+        object.__setattr__(self, '_names', {point.name: point for point in points})
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __len__(self) -> int:
+        return len(self._points)
+
+    def __iter__(self) -> Iterator[Point]:
+        return iter(self._points)
+
+    def __contains__(self, path: str) -> bool:
+        return path in self._paths
+
+    def __getitem__(self, path: str) -> Point:
+        return self._paths[path]
+
+    def get(self, path: str) -> Point | None:
+        return self._paths.get(path)
+
+    def by_object(self, object_identifier: ObjectIdentifier) -> Point | None:
+        return self._objects.get(tuple(object_identifier))
+
+    def by_name(self, name: str) -> Point | None:
+        return self._names.get(name)
+
+    def of_type(self, *object_types: str) -> List[Point]:
+        return [point for point in self._points if point.object_type in object_types]
+
+
+@lru_cache(maxsize=None)
+def get_points() -> PointTable:
+    """Return the generated point table, loading it on first use."""
+    from .point_data import POINTS
+    return PointTable(POINTS)
+
+
+def parse_value(object_type: str, value: str) -> Any:
+    if object_type in codec.BINARY_TYPES:
+        return value
+    if object_type in codec.UNSIGNED_TYPES:
+        return int(float(value))
+    return float(value)
+
+
+def _parse_units(units: str) -> str | int | None:
+    if units == 'None':
+        return None
+    if units.isdigit():
+        return codec.ENGINEERING_UNITS.get(int(units), int(units))
+    return units
+
+
+def value_range(object_type: str, units: str | int | None) -> Tuple[Any, Any] | None:
+    if object_type in codec.BINARY_TYPES:
+        return BINARY_RANGE
+    if object_type.startswith('multiState'):
+        return MULTI_STATE_RANGE
+    if units in PERCENT_UNITS:
+        return PERCENT_RANGE
+    return None
+
+
+def _identifier(name: str) -> str:
+    identifier = _NOT_IDENTIFIER.sub('_', name).strip('_').upper()
+    if not identifier or identifier[0].isdigit():
+        identifier = f'_{identifier}'
+    return identifier
+
+
+def _parent(path: str) -> str:
+    segments = path.split("'")
+    return _identifier(segments[-2]) if len(segments) > 1 else ''
+
+
+def _deduplicate_names(points: List[Point]) -> List[Point]:
+    """Give points that share a name a unique one.
+
+    The name of their parent in the BACnet path is appended, then the
+    instance ID if that is still ambiguous.
+    """
+    counts = Counter(point.name for point in points)
+    points = [
+        point._replace(name=f'{point.name}_{_parent(point.path)}'.rstrip('_'))
+        if counts[point.name] > 1 else point
+        for point in points
+    ]
+
+    counts = Counter(point.name for point in points)
+    return [
+        point._replace(name=f'{point.name}_{point.instance_id}')
+        if counts[point.name] > 1 else point
+        for point in points
+    ]
+
+
+def parse_dump(path: Path = DUMP_PATH) -> List[Point]:
+    """Parse a BAC0 points dump into points with unique paths, objects and names."""
+    points: List[Point] = []
+    paths, objects = set(), set()
+    comment = None
+
+    for line in Path(path).read_text().splitlines():
+        line = line.strip()
+        if line.startswith('#'):
+            comment = _COMMENT.match(line)
+            continue
+
+        match = _POINT.match(line)
+        if match is None:
+            continue
+
+        object_type = match['object_type']
+        point = Point(match['path'], _identifier(match['name']), object_type, int(match['instance_id']))
+        if comment is not None:
+            units = _parse_units(comment['units'])
+            point = point._replace(
+                description=comment['description'],
+                units=units,
+                example=parse_value(object_type, comment['value']),
+                value_range=value_range(object_type, units),
+            )
+        else:
+            point = point._replace(value_range=value_range(object_type, None))
+        comment = None
+
+        if point.path in paths or point.object_identifier in objects:
+            LOGGER.debug("Skipping duplicate point %s %s", point.path, point.object_identifier)
+            continue
+        paths.add(point.path)
+        objects.add(point.object_identifier)
+        points.append(point)
+
+    return _deduplicate_names(points)
+
+
+def render(points: List[Point], source: str) -> str:
+    """Render points as the source of point_data.py."""
+    lines = [
+        f'"""Point table generated from {source} by `python -m lib.points`. Do not edit."""',
+        '',
+        '# ' + ', '.join(Point._fields),
+        'POINTS = (',
+    ]
+    lines.extend(f'    {tuple(point)!r},' for point in points)
+    lines.append(')')
+    return '\n'.join(lines) + '\n'
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate the point table from a BAC0 points dump")
+    parser.add_argument('--dump', type=Path, default=DUMP_PATH)
+    parser.add_argument('--output', type=Path, default=DATA_PATH)
+    args = parser.parse_args()
+
+    points = parse_dump(args.dump)
+    args.output.write_text(render(points, args.dump.name))
+    print(f"Wrote {len(points)} points to {args.output}")
+
+
+if __name__ == '__main__':
+    main()
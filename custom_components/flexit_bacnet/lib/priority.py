@@ -0,0 +1,76 @@
+from dataclasses import dataclass, field
+from typing import Any, List
+
+# Priority a command without an explicit priority is written at
+DEFAULT_PRIORITY = 16
+
+# Minimum on/off, set by the device itself and never written by clients
+MINIMUM_ON_OFF_PRIORITY = 6
+
+RELINQUISH_DEFAULT = 'relinquishDefault'
+
+
+def priority_value(value: Any) -> Any:
+    """Return the plain value of a priorityArray entry, None for a relinquished slot.
+
+    The native codec decodes NULL to None. Through BAC0 the entries are
+    bacpypes PriorityValue choices or Null objects, which are unwrapped
+    by name so bacpypes is not imported here.
+    """
+    if value is None:
+        return None
+    if type(value).__name__ == 'Null' or (isinstance(value, str) and value.lower() == 'null'):
+        return None
+    for element in getattr(value, 'choiceElements', ()):
+        choice = getattr(value, element.name, None)
+        if choice is not None:
+            return priority_value(choice)
+    if hasattr(value, 'choiceElements'):
+        return None
+    return getattr(value, 'value', value)
+
+
+def check_priority(priority: int):
+    if not 1 <= priority <= 16:
+        raise ValueError('priority must be between 1 and 16')
+    if priority == MINIMUM_ON_OFF_PRIORITY:
+        raise ValueError('priority 6 is reserved for minimum on/off')
+
+
+@dataclass
+class PriorityState:
+    """Commands of one commandable object, by priority."""
+
+    priority_array: List[Any] = field(default_factory=lambda: [None] * 16)
+    relinquish_default: Any = None
+
+    @property
+    def active_priority(self) -> int | None:
+        """Return the priority whose command controls the object, None if relinquished."""
+        for index, value in enumerate(self.priority_array):
+            if value is not None:
+                return index + 1
+        return None
+
+    @property
+    def active_value(self) -> Any:
+        priority = self.active_priority
+        if priority is None:
+            return self.relinquish_default
+        return self.priority_array[priority - 1]
+
+    def command(self, priority: int) -> Any:
+        """Return the value commanded at priority, None if it is relinquished."""
+        return self.priority_array[priority - 1]
+
+    def as_dict(self) -> dict:
+        return {
+            "active_priority": self.active_priority,
+            "active_value": self.active_value,
+            "relinquish_default": self.relinquish_default,
+            "commands": {
+                index + 1: value
+                for index, value in enumerate(self.priority_array)
+                if value is not None
+            },
+        }
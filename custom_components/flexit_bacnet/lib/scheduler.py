@@ -0,0 +1,76 @@
+import time
+
+from typing import Dict, List
+
+from .device_property import DeviceProperty, POLL_TIER_FAST, POLL_TIER_NORMAL, POLL_TIER_SLOW
+from .typing import ObjectIdentifier
+
+# Default seconds between reads of each poll tier
+DEFAULT_POLL_INTERVALS = {
+    POLL_TIER_FAST: 10,
+    POLL_TIER_NORMAL: 60,
+    POLL_TIER_SLOW: 3600,
+}
+
+
+class PollScheduler:
+    """Decides which device properties are due for a read in each poll cycle."""
+
+    def __init__(self, intervals: Dict[str, float] | None = None):
+        self.intervals = {**DEFAULT_POLL_INTERVALS, **(intervals or {})}
+        self._last_read: Dict[ObjectIdentifier, float] = {}
+        self._overrides: Dict[ObjectIdentifier, float] = {}
+
+    @property
+    def tick_interval(self) -> float:
+        """Return how often the scheduler should be asked for due properties."""
+        return min(self.intervals.values())
+
+    def interval(self, device_property: DeviceProperty) -> float:
+        """Return seconds between reads of device_property."""
+        return self._overrides.get(
+            device_property.object_identifier,
+            self.intervals.get(device_property.poll_tier, self.intervals[POLL_TIER_NORMAL]),
+        )
+
+    def override_interval(self, device_properties: List[DeviceProperty], interval: float | None):
+        """Read device_properties at most every interval seconds, e.g. while they are pushed over COV.
+
+        Passing None restores the tier interval.
+        """
+        for dp in device_properties:
+            if interval is None:
+                self._overrides.pop(dp.object_identifier, None)
+            else:
+                self._overrides[dp.object_identifier] = max(interval, self.interval(dp))
+
+    def due(self, device_properties: List[DeviceProperty], now: float | None = None) -> List[DeviceProperty]:
+        """Return the device properties whose interval has elapsed."""
+        if now is None:
+            now = time.monotonic()
+
+        # Small slack so a property is not pushed back a whole cycle by tick jitter
+        slack = self.tick_interval / 2
+
+        return [
+            dp
+            for dp in device_properties
+            if dp.object_identifier not in self._last_read
+            or now - self._last_read[dp.object_identifier] + slack >= self.interval(dp)
+        ]
+
+    def mark_read(self, device_properties: List[DeviceProperty], now: float | None = None):
+        if now is None:
+            now = time.monotonic()
+
+        for dp in device_properties:
+            self._last_read[dp.object_identifier] = now
+
+    def mark_due(self, device_properties: List[DeviceProperty]):
+        """Make device_properties due on the next cycle, whatever their tier."""
+        for dp in device_properties:
+            self._last_read.pop(dp.object_identifier, None)
+
+    def reset(self):
+        """Make every property due on the next cycle."""
+        self._last_read.clear()
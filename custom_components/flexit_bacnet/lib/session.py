@@ -0,0 +1,401 @@
+import time
+import socket
+import ipaddress
+import asyncio
+import async_timeout
+
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Sequence, Tuple
+from logging import Logger, getLogger
+
+from .telemetry import Telemetry
+from .typing import DeviceState, ObjectIdentifier
+
+if TYPE_CHECKING:
+    from BAC0.scripts import Lite
+
+LOGGER: Logger = getLogger(__package__)
+
+REQUEST_TIMEOUT = 10
+
+TRANSPORT_BAC0 = 'bac0'
+TRANSPORT_NATIVE = 'native'
+
+# Sessions shared by every device reachable through the same local interface,
+# keyed by transport and local IP address.
+_SESSIONS: Dict[Tuple[str, str | None], 'BACnetSession'] = {}
+
+# Local address that reaches each target network, see async_resolve_local_ip
+_LOCAL_IPS: Dict[str, str] = {}
+
+# Prefix length of the target networks local addresses are cached for
+LOCAL_IP_PREFIX = 24
+
+# (object, property, value, priority) of one write
+PropertyWrite = Tuple[ObjectIdentifier, str, Any, int | None]
+
+COVCallback = Callable[[Dict[str, Any]], None]
+
+# Names of the exceptions BAC0 raises when a device does not answer
+BAC0_NO_RESPONSE_ERRORS = ('NoResponseFromController',)
+
+# Telemetry name of each BAC0 call
+_BAC0_REQUESTS = {
+    'readMultiple': 'read_multiple',
+    'write': 'write',
+    'writeMultiple': 'write_multiple',
+    'cov': 'subscribe_cov',
+    'cancel_cov': 'subscribe_cov',
+}
+
+
+def get_local_ip(device_address: str) -> None | str:
+    """Get the local IP address used to connect to the remote one."""
+    s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    try:
+        s.connect((device_address, 0))
+    except socket.error as e:
+        LOGGER.warning("Socket error %s", e)
+        return None
+    else:
+        return s.getsockname()[0]
+    finally:
+        s.close()
+
+
+def _start_lite(local_ip: str | None) -> 'Lite':
+    """Import BAC0 and start a Lite application; runs in the executor.
+
+    BAC0 and bacpypes are imported here rather than at module level, so
+    loading the integration, its config flow and diagnostics never pays for
+    the BACnet stack, and the import runs off the event loop.
+    """
+    import BAC0
+
+    BAC0.log_level('silence')
+    return BAC0.lite(local_ip, None, None, None, 0, None, True)
+
+
+def _write_args(object_identifier: ObjectIdentifier, property_name: str, value: Any, priority: int | None) -> str:
+    # BAC0 writes NULL, i.e. relinquishes the command at priority, for 'null'
+    args = [*object_identifier, property_name, 'null' if value is None else value]
+    if priority is not None:
+        args += [f'- {priority}']
+    return " ".join(map(lambda arg: str(arg), args))
+
+
+def _target_network(host: str) -> str:
+    try:
+        return str(ipaddress.ip_network(f'{host}/{LOCAL_IP_PREFIX}', strict=False))
+    except ValueError:
+        return host
+
+
+async def async_resolve_local_ip(hass, device_address: str) -> str | None:
+    """Return the local IP address that reaches device_address.
+
+    The answer is cached per target network until invalidate_local_ips() is
+    called, so only the first lookup costs a socket and an executor job.
+    """
+    host = device_address.partition(':')[0]
+    network = _target_network(host)
+
+    local_ip = _LOCAL_IPS.get(network)
+    if local_ip is None:
+        local_ip = await hass.async_add_executor_job(get_local_ip, host)
+        if local_ip is not None:
+            _LOCAL_IPS[network] = local_ip
+
+    return local_ip
+
+
+def invalidate_local_ips():
+    """Forget resolved local addresses, e.g. after a network change."""
+    if _LOCAL_IPS:
+        LOGGER.debug("Invalidating cached local addresses")
+    _LOCAL_IPS.clear()
+
+
+def _is_socket_error(error: Exception) -> bool:
+    return isinstance(error, OSError) and not isinstance(error, TimeoutError)
+
+
+def _is_timeout(error: Exception) -> bool:
+    return isinstance(error, (TimeoutError, asyncio.TimeoutError))
+
+
+def is_unreachable(error: Exception) -> bool:
+    """Return True if error means the device did not answer, not that it refused a request.
+
+    Timeouts, socket errors and a closed socket count, BACnet Error, Reject
+    and Abort answers do not.
+    """
+    return _is_timeout(error) or isinstance(error, OSError) or type(error).__name__ in BAC0_NO_RESPONSE_ERRORS
+
+
+class BACnetSession(ABC):
+    """Long-lived BACnet client bound to one local interface, shared by every device on it.
+
+    Keeps the request statistics; subclasses implement the transport.
+    """
+
+    transport: str
+
+    def __init__(self, hass, local_ip: str | None):
+        self.hass = hass
+        self.local_ip = local_ip
+        self._lock = asyncio.Lock()
+        self._users = 0
+
+        self.startup_duration: float | None = None
+        self.request_count: int = 0
+        self.failure_count: int = 0
+        self.last_latency: float | None = None
+        self.total_latency: float = 0.0
+        self.telemetry = Telemetry()
+
+    @property
+    @abstractmethod
+    def connected(self) -> bool:
+        """Return True while the stack or socket is running."""
+
+    @property
+    def average_latency(self) -> float | None:
+        if self.request_count == 0:
+            return None
+        return self.total_latency / self.request_count
+
+    @abstractmethod
+    async def async_connect(self) -> Any:
+        """Start the stack or socket unless it is already running."""
+
+    @abstractmethod
+    async def async_close(self):
+        """Stop the stack or socket."""
+
+    def _record_latency(self, request: str, start: float):
+        self.last_latency = time.monotonic() - start
+        self.request_count += 1
+        self.total_latency += self.last_latency
+        self.telemetry.observe(request, self.last_latency)
+
+    def _record_failure(self, error: Exception):
+        self.failure_count += 1
+        self.telemetry.increment('failures')
+        if _is_timeout(error):
+            self.telemetry.increment('timeouts')
+
+    @abstractmethod
+    async def async_read_multiple(
+        self,
+        device_address: str,
+        objects: Dict[ObjectIdentifier, Sequence[str]],
+    ) -> DeviceState:
+        """Read the listed properties of every object in one ReadPropertyMultiple request."""
+
+    @abstractmethod
+    async def async_write(
+        self,
+        device_address: str,
+        object_identifier: ObjectIdentifier,
+        property_name: str,
+        value: Any,
+        priority: int | None = None,
+    ):
+        """Write one property, relinquishing the command at priority if value is None."""
+
+    @abstractmethod
+    async def async_write_multiple(self, device_address: str, writes: List[PropertyWrite]):
+        """Write several properties in one WritePropertyMultiple request."""
+
+    @abstractmethod
+    async def async_subscribe_cov(
+        self,
+        device_address: str,
+        object_identifier: ObjectIdentifier,
+        lifetime: int,
+        callback: COVCallback,
+        confirmed: bool = True,
+    ):
+        """Subscribe to COV notifications. callback may be called from any thread."""
+
+    @abstractmethod
+    async def async_unsubscribe_cov(self, device_address: str, object_identifier: ObjectIdentifier):
+        """Cancel a COV subscription."""
+
+    def as_dict(self) -> dict:
+        return {
+            "transport": self.transport,
+            "local_ip": self.local_ip,
+            "connected": self.connected,
+            "users": self._users,
+            "startup_duration": self.startup_duration,
+            "request_count": self.request_count,
+            "failure_count": self.failure_count,
+            "last_latency": self.last_latency,
+            "average_latency": self.average_latency,
+            "telemetry": self.telemetry.as_dict(),
+        }
+
+
+class BAC0Session(BACnetSession):
+    """BACnet session running a BAC0 application.
+
+    Requests go through BAC0, whose blocking calls run in the executor.
+    """
+
+    transport = TRANSPORT_BAC0
+
+    def __init__(self, hass, local_ip: str | None):
+        super().__init__(hass, local_ip)
+        self._bacnet: 'Lite | None' = None
+        # BAC0 calls running in the executor, and whether the stack must be
+        # restarted once they are done
+        self._calls_in_flight = 0
+        self._restart_pending = False
+
+    @property
+    def connected(self) -> bool:
+        return self._bacnet is not None
+
+    async def async_connect(self) -> 'Lite':
+        """Start the BACnet stack unless it is already running."""
+        async with self._lock:
+            if self._bacnet is None:
+                LOGGER.debug("Starting BACnet stack on %s", self.local_ip)
+                start = time.monotonic()
+                async with async_timeout.timeout(REQUEST_TIMEOUT):
+                    self._bacnet = await self.hass.async_add_executor_job(_start_lite, self.local_ip)
+                self.startup_duration = time.monotonic() - start
+                self.telemetry.observe('startup', self.startup_duration)
+                LOGGER.debug("BACnet stack started in %.3fs", self.startup_duration)
+            return self._bacnet
+
+    async def async_close(self):
+        """Stop the BACnet stack."""
+        async with self._lock:
+            bacnet, self._bacnet = self._bacnet, None
+            if bacnet is not None:
+                LOGGER.debug("Stopping BACnet stack on %s", self.local_ip)
+                try:
+                    await self.hass.async_add_executor_job(bacnet.disconnect)
+                except Exception as e:
+                    LOGGER.warning("Error on bacnet.disconnect, %s", e)
+
+    async def async_reconnect(self) -> 'Lite':
+        """Restart the BACnet stack."""
+        await self.async_close()
+        return await self.async_connect()
+
+    async def async_call(self, method: str, *args) -> Any:
+        """Run a blocking BAC0 call on the running stack.
+
+        The stack is started on demand and shared by every device on the
+        interface. A socket error restarts it, so that the next request
+        gets a fresh socket, but only once no other call is running on it.
+        BACnet errors and timeouts leave it running.
+        """
+        bacnet = await self.async_connect()
+        start = time.monotonic()
+
+        self._calls_in_flight += 1
+        try:
+            async with async_timeout.timeout(REQUEST_TIMEOUT):
+                result = await self.hass.async_add_executor_job(getattr(bacnet, method), *args)
+        except Exception as e:
+            self._record_failure(e)
+            if _is_socket_error(e):
+                invalidate_local_ips()
+                self._restart_pending = True
+            raise
+        finally:
+            self._calls_in_flight -= 1
+            if self._calls_in_flight == 0 and self._restart_pending:
+                self._restart_pending = False
+                LOGGER.debug("Restarting BACnet stack on %s after a socket error", self.local_ip)
+                await self.async_close()
+
+        self._record_latency(_BAC0_REQUESTS.get(method, method), start)
+        LOGGER.debug("bacnet.%s took %.3fs", method, self.last_latency)
+        return result
+
+    async def async_read_multiple(
+        self,
+        device_address: str,
+        objects: Dict[ObjectIdentifier, Sequence[str]],
+    ) -> DeviceState:
+        request = {
+            'address': device_address,
+            'objects': {
+                f'{object_type}:{instance_id}': list(property_names)
+                for (object_type, instance_id), property_names in objects.items()
+            },
+        }
+
+        result: DeviceState = await self.async_call('readMultiple', device_address, request)
+        if result == ['']:
+            raise ConnectionError
+        return result
+
+    async def async_write(
+        self,
+        device_address: str,
+        object_identifier: ObjectIdentifier,
+        property_name: str,
+        value: Any,
+        priority: int | None = None,
+    ):
+        args = f'{device_address} {_write_args(object_identifier, property_name, value, priority)}'
+        LOGGER.debug("bacnet.write %s", args)
+        await self.async_call('write', args)
+
+    async def async_write_multiple(self, device_address: str, writes: List[PropertyWrite]):
+        args = [_write_args(*write) for write in writes]
+        LOGGER.debug("bacnet.writeMultiple %s", args)
+        await self.async_call('writeMultiple', device_address, args)
+
+    async def async_subscribe_cov(
+        self,
+        device_address: str,
+        object_identifier: ObjectIdentifier,
+        lifetime: int,
+        callback: COVCallback,
+        confirmed: bool = True,
+    ):
+        def notification(elements: dict | None = None, **kwargs):
+            callback(dict((elements or {}).get('properties', {})))
+
+        await self.async_call('cov', device_address, object_identifier, confirmed, lifetime, notification)
+
+    async def async_unsubscribe_cov(self, device_address: str, object_identifier: ObjectIdentifier):
+        await self.async_call('cancel_cov', device_address, object_identifier)
+
+
+def _session_class(transport: str) -> type:
+    if transport == TRANSPORT_NATIVE:
+        from .transport import NativeSession
+        return NativeSession
+    return BAC0Session
+
+
+async def async_get_session(hass, local_ip: str | None, transport: str = TRANSPORT_BAC0) -> BACnetSession:
+    """Return the shared session bound to local_ip."""
+    key = (transport, local_ip)
+    session = _SESSIONS.get(key)
+    if session is None:
+        session = _SESSIONS[key] = _session_class(transport)(hass, local_ip)
+
+    session._users += 1
+    return session
+
+
+async def async_release_session(session: BACnetSession):
+    """Release a session, stopping the stack when its last user is gone."""
+    session._users -= 1
+    if session._users > 0:
+        return
+
+    key = (session.transport, session.local_ip)
+    if _SESSIONS.get(key) is session:
+        del _SESSIONS[key]
+    await session.async_close()
@@ -0,0 +1,464 @@
+"""Simulated Flexit Nordic controller for offline testing and benchmarking.
+
+Loads the object space recorded in bac0_points_dump.txt and serves
+ReadProperty, ReadPropertyMultiple, WriteProperty, WritePropertyMultiple and
+SubscribeCOV on a local UDP port. Latency, packet loss and the APDU limit are
+configurable. Run from custom_components/flexit_bacnet:
+
+    python -m lib.simulator --port 47808 --latency 0.02
+"""
+import time
+import random
+import asyncio
+import argparse
+
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Tuple
+from logging import Logger, getLogger
+
+from . import codec
+from .codec import APDU, PropertyError
+from .points import DUMP_PATH, Point, get_points, parse_dump, parse_value
+from .typing import ObjectIdentifier
+
+LOGGER: Logger = getLogger(__package__)
+
+DEFAULT_DEVICE_ID = 2
+
+# Error classes and codes answered by the simulator
+ERROR_CLASS_OBJECT = 1
+ERROR_CLASS_PROPERTY = 2
+ERROR_CODE_UNKNOWN_OBJECT = 31
+ERROR_CODE_UNKNOWN_PROPERTY = 32
+ERROR_CODE_WRITE_ACCESS_DENIED = 40
+ERROR_CODE_INVALID_DATA_TYPE = 9
+
+REJECT_UNRECOGNIZED_SERVICE = 9
+ABORT_SEGMENTATION_NOT_SUPPORTED = 4
+
+# Priority used by WriteProperty without a priority
+DEFAULT_PRIORITY = 16
+
+COMMANDABLE_TYPES = (
+    'analogOutput', 'analogValue', 'binaryOutput', 'binaryValue',
+    'multiStateValue', 'positiveIntegerValue',
+)
+WRITABLE_PROPERTIES = ('presentValue', 'description', 'outOfService', 'relinquishDefault')
+
+
+class PropertyAccessError(Exception):
+    def __init__(self, error_class: int, error_code: int):
+        super().__init__(f'error class {error_class}, code {error_code}')
+        self.error_class = error_class
+        self.error_code = error_code
+
+
+@dataclass
+class SimulatedObject:
+    """One BACnet object with its properties."""
+
+    object_type: str
+    instance_id: int
+    properties: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def object_identifier(self) -> ObjectIdentifier:
+        return self.object_type, self.instance_id
+
+    @property
+    def commandable(self) -> bool:
+        return 'priorityArray' in self.properties
+
+    def present_value(self) -> Any:
+        if self.commandable:
+            for value in self.properties['priorityArray']:
+                if value is not None:
+                    return value
+            return self.properties['relinquishDefault']
+        return self.properties['presentValue']
+
+
+def default_value(object_type: str) -> Any:
+    if object_type in codec.BINARY_TYPES:
+        return 'inactive'
+    if object_type in codec.UNSIGNED_TYPES:
+        return 1
+    return 0.0
+
+
+def create_object(
+    object_type: str,
+    instance_id: int,
+    value: Any = None,
+    object_name: str | None = None,
+    description: str = '',
+    units: Any = None,
+) -> SimulatedObject:
+    if value is None:
+        value = default_value(object_type)
+
+    properties: Dict[str, Any] = {
+        'objectIdentifier': (object_type, instance_id),
+        'objectName': object_name or f'{object_type}:{instance_id}',
+        'objectType': object_type,
+        'description': description,
+        'presentValue': value,
+        'statusFlags': [0, 0, 0, 0],
+        'eventState': 0,
+        'outOfService': False,
+    }
+    if units is not None:
+        properties['units'] = units
+    if object_type in COMMANDABLE_TYPES:
+        properties['priorityArray'] = [None] * 16
+        properties['relinquishDefault'] = value
+
+    return SimulatedObject(object_type, instance_id, properties)
+
+
+def load_points(points: Iterable[Point]) -> List[SimulatedObject]:
+    """Create objects from points, using their example values."""
+    return [
+        create_object(
+            point.object_type,
+            point.instance_id,
+            value=point.example,
+            object_name=point.path,
+            description=point.description,
+            units=point.units,
+        )
+        for point in points
+    ]
+
+
+def load_dump(path: Path = DUMP_PATH) -> List[SimulatedObject]:
+    """Create objects from a BAC0 points dump, using its example values."""
+    return load_points(parse_dump(path))
+
+
+@dataclass
+class Subscription:
+    peer: Tuple[str, int]
+    process_id: int
+    object_identifier: ObjectIdentifier
+    confirmed: bool
+    expires: float | None
+
+
+class DeviceSimulator(asyncio.DatagramProtocol):
+    """Serves a set of simulated objects as one BACnet/IP device."""
+
+    def __init__(
+        self,
+        objects: Iterable[SimulatedObject] | None = None,
+        device_id: int = DEFAULT_DEVICE_ID,
+        latency: float = 0.0,
+        loss: float = 0.0,
+        max_apdu: int = 1476,
+        segmentation: str = 'noSegmentation',
+        seed: int | None = None,
+    ):
+        self.device_id = device_id
+        self.latency = latency
+        self.loss = loss
+        self.max_apdu = max_apdu
+        self._random = random.Random(seed)
+        self._transport: asyncio.DatagramTransport | None = None
+        self._subscriptions: Dict[Tuple[Tuple[str, int], int, ObjectIdentifier], Subscription] = {}
+        self._invoke_id = 0
+
+        self.objects: Dict[ObjectIdentifier, SimulatedObject] = {}
+        for obj in objects if objects is not None else load_points(get_points()):
+            self.objects[obj.object_identifier] = obj
+
+        device = create_object('device', device_id, object_name='HvacFnct21y_A', description='800220-000000')
+        device.properties.update({
+            'vendorName': 'Flexit',
+            'modelName': 'Nordic',
+            'firmwareRevision': '1.0.0',
+            'maxApduLengthAccepted': max_apdu,
+            'segmentationSupported': segmentation,
+            'protocolVersion': 1,
+            'protocolRevision': 14,
+        })
+        del device.properties['presentValue']
+        self.objects[device.object_identifier] = device
+
+        self.request_count: int = 0
+        self.dropped_count: int = 0
+        self.notification_count: int = 0
+        self.service_counts: Dict[int, int] = {}
+
+    @property
+    def address(self) -> str:
+        """Return 'host:port' the simulator listens on."""
+        host, port = self._transport.get_extra_info('sockname')[:2]
+        return f'{host}:{port}'
+
+    def ensure_objects(self, object_identifiers: Iterable[ObjectIdentifier]):
+        """Create objects that are missing from the dump with default values."""
+        for object_type, instance_id in object_identifiers:
+            if (object_type, instance_id) not in self.objects:
+                self.objects[(object_type, instance_id)] = create_object(object_type, instance_id)
+
+    async def async_start(self, host: str = '127.0.0.1', port: int = 0) -> str:
+        loop = asyncio.get_running_loop()
+        self._transport, _ = await loop.create_datagram_endpoint(lambda: self, local_addr=(host, port))
+        LOGGER.debug("Simulator for device %s listening on %s", self.device_id, self.address)
+        return self.address
+
+    async def async_stop(self):
+        if self._transport is not None:
+            self._transport.close()
+            self._transport = None
+
+    def set_value(self, object_identifier: ObjectIdentifier, value: Any, property_name: str = 'presentValue'):
+        """Change a value as the controller would and notify COV subscribers."""
+        obj = self.objects[object_identifier]
+        if property_name == 'presentValue' and obj.commandable:
+            obj.properties['relinquishDefault'] = value
+        else:
+            obj.properties[property_name] = value
+        self._notify(obj)
+
+    def as_dict(self) -> dict:
+        return {
+            "objects": len(self.objects),
+            "latency": self.latency,
+            "loss": self.loss,
+            "max_apdu": self.max_apdu,
+            "request_count": self.request_count,
+            "dropped_count": self.dropped_count,
+            "notification_count": self.notification_count,
+            "subscriptions": len(self._subscriptions),
+        }
+
+    # Datagram handling
+
+    def datagram_received(self, data: bytes, addr: Tuple[str, int]):
+        if self.loss and self._random.random() < self.loss:
+            self.dropped_count += 1
+            return
+
+        if self.latency:
+            asyncio.get_running_loop().call_later(self.latency, self._handle, data, addr)
+        else:
+            self._handle(data, addr)
+
+    def _send(self, apdu: bytes, peer: Tuple[str, int], expecting_reply: bool = False):
+        if self._transport is not None:
+            self._transport.sendto(codec.encode_frame(apdu, expecting_reply), peer)
+
+    def _handle(self, data: bytes, peer: Tuple[str, int]):
+        try:
+            apdu = codec.decode_frame(data)
+        except (IndexError, ValueError):
+            return
+        if apdu is None or apdu.pdu_type != codec.CONFIRMED_REQUEST:
+            return
+
+        self.request_count += 1
+        self.service_counts[apdu.service] = self.service_counts.get(apdu.service, 0) + 1
+
+        if apdu.segmented:
+            self._send(codec.encode_abort(apdu.invoke_id, ABORT_SEGMENTATION_NOT_SUPPORTED), peer)
+            return
+
+        handler = {
+            codec.READ_PROPERTY: self._read_property,
+            codec.READ_PROPERTY_MULTIPLE: self._read_property_multiple,
+            codec.WRITE_PROPERTY: self._write_property,
+            codec.WRITE_PROPERTY_MULTIPLE: self._write_property_multiple,
+            codec.SUBSCRIBE_COV: self._subscribe_cov,
+        }.get(apdu.service)
+
+        if handler is None:
+            self._send(codec.encode_reject(apdu.invoke_id, REJECT_UNRECOGNIZED_SERVICE), peer)
+            return
+
+        try:
+            response = handler(apdu, peer)
+        except PropertyAccessError as e:
+            response = codec.encode_error(apdu.invoke_id, apdu.service, e.error_class, e.error_code)
+        except (IndexError, ValueError) as e:
+            LOGGER.debug("Rejecting malformed request, %s", e)
+            response = codec.encode_reject(apdu.invoke_id, 0)
+
+        # Without segmentation, responses must fit in what both ends accept
+        if len(response) > min(self.max_apdu, apdu.max_apdu):
+            response = codec.encode_abort(apdu.invoke_id, ABORT_SEGMENTATION_NOT_SUPPORTED)
+
+        self._send(response, peer)
+
+    # Services
+
+    def _get(self, object_identifier: ObjectIdentifier, property_name: str) -> Any:
+        obj = self.objects.get(object_identifier)
+        if obj is None:
+            raise PropertyAccessError(ERROR_CLASS_OBJECT, ERROR_CODE_UNKNOWN_OBJECT)
+
+        name, index = codec.parse_property(property_name)
+        if name == 'objectList' and obj.object_type == 'device':
+            value = list(self.objects)
+        elif name == 'presentValue' and obj.commandable:
+            value = obj.present_value()
+        elif name in obj.properties:
+            value = obj.properties[name]
+        else:
+            raise PropertyAccessError(ERROR_CLASS_PROPERTY, ERROR_CODE_UNKNOWN_PROPERTY)
+
+        if index is None:
+            return value
+        if index == 0:
+            return len(value)
+        return value[index - 1]
+
+    def _read_property(self, apdu: APDU, peer) -> bytes:
+        object_identifier, property_name = codec.decode_read_property(apdu.payload)
+        value = self._get(object_identifier, property_name)
+        return codec.encode_complex_ack(
+            apdu.invoke_id,
+            apdu.service,
+            codec.encode_read_property_ack(object_identifier, property_name, value),
+        )
+
+    def _read_property_multiple(self, apdu: APDU, peer) -> bytes:
+        results: Dict[ObjectIdentifier, List[Tuple[str, Any]]] = {}
+        for object_identifier, property_names in codec.decode_read_property_multiple(apdu.payload).items():
+            if 'all' in property_names and object_identifier in self.objects:
+                property_names = list(self.objects[object_identifier].properties)
+
+            values = results.setdefault(object_identifier, [])
+            for property_name in property_names:
+                try:
+                    values.append((property_name, self._get(object_identifier, property_name)))
+                except PropertyAccessError as e:
+                    values.append((property_name, PropertyError(e.error_class, e.error_code)))
+
+        return codec.encode_complex_ack(
+            apdu.invoke_id,
+            apdu.service,
+            codec.encode_read_property_multiple_ack(results),
+        )
+
+    def _check_write(self, object_identifier: ObjectIdentifier, property_name: str) -> SimulatedObject:
+        obj = self.objects.get(object_identifier)
+        if obj is None:
+            raise PropertyAccessError(ERROR_CLASS_OBJECT, ERROR_CODE_UNKNOWN_OBJECT)
+        if property_name not in WRITABLE_PROPERTIES or property_name not in obj.properties:
+            raise PropertyAccessError(ERROR_CLASS_PROPERTY, ERROR_CODE_WRITE_ACCESS_DENIED)
+        if property_name == 'presentValue' and not obj.commandable and not obj.properties['outOfService']:
+            raise PropertyAccessError(ERROR_CLASS_PROPERTY, ERROR_CODE_WRITE_ACCESS_DENIED)
+        return obj
+
+    def _apply_write(self, obj: SimulatedObject, property_name: str, value: Any, priority: int | None):
+        if property_name == 'presentValue' and obj.commandable:
+            if value is not None:
+                try:
+                    value = parse_value(obj.object_type, str(value))
+                except ValueError:
+                    raise PropertyAccessError(ERROR_CLASS_PROPERTY, ERROR_CODE_INVALID_DATA_TYPE)
+            obj.properties['priorityArray'][(priority or DEFAULT_PRIORITY) - 1] = value
+        else:
+            obj.properties[property_name] = value
+        self._notify(obj)
+
+    def _write_property(self, apdu: APDU, peer) -> bytes:
+        object_identifier, property_name, value, priority = codec.decode_write_property(apdu.payload)
+        obj = self._check_write(object_identifier, property_name)
+        self._apply_write(obj, property_name, value, priority)
+        return codec.encode_simple_ack(apdu.invoke_id, apdu.service)
+
+    def _write_property_multiple(self, apdu: APDU, peer) -> bytes:
+        writes = codec.decode_write_property_multiple(apdu.payload)
+        checked = [
+            (self._check_write(object_identifier, property_name), property_name, value, priority)
+            for object_identifier, property_name, value, priority in writes
+        ]
+        for write in checked:
+            self._apply_write(*write)
+        return codec.encode_simple_ack(apdu.invoke_id, apdu.service)
+
+    def _subscribe_cov(self, apdu: APDU, peer) -> bytes:
+        process_id, object_identifier, confirmed, lifetime = codec.decode_subscribe_cov(apdu.payload)
+        obj = self.objects.get(object_identifier)
+        if obj is None:
+            raise PropertyAccessError(ERROR_CLASS_OBJECT, ERROR_CODE_UNKNOWN_OBJECT)
+
+        key = (peer, process_id, object_identifier)
+        if confirmed is None:
+            self._subscriptions.pop(key, None)
+        else:
+            expires = time.monotonic() + lifetime if lifetime else None
+            subscription = self._subscriptions[key] = Subscription(peer, process_id, object_identifier, confirmed, expires)
+            # Subscribers get the current value right after subscribing
+            asyncio.get_running_loop().call_soon(self._send_notification, subscription, obj)
+
+        return codec.encode_simple_ack(apdu.invoke_id, apdu.service)
+
+    def _notify(self, obj: SimulatedObject):
+        now = time.monotonic()
+        for key, subscription in list(self._subscriptions.items()):
+            if subscription.expires is not None and subscription.expires < now:
+                del self._subscriptions[key]
+            elif subscription.object_identifier == obj.object_identifier:
+                self._send_notification(subscription, obj)
+
+    def _send_notification(self, subscription: Subscription, obj: SimulatedObject):
+        remaining = 0
+        if subscription.expires is not None:
+            remaining = max(0, int(subscription.expires - time.monotonic()))
+
+        payload = codec.encode_cov_notification(
+            subscription.process_id,
+            ('device', self.device_id),
+            obj.object_identifier,
+            remaining,
+            [('presentValue', obj.present_value()), ('statusFlags', obj.properties['statusFlags'])],
+        )
+
+        if subscription.confirmed:
+            self._invoke_id = (self._invoke_id + 1) % 256
+            apdu = codec.encode_confirmed_request(self._invoke_id, codec.CONFIRMED_COV_NOTIFICATION, payload)
+            self._send(apdu, subscription.peer, expecting_reply=True)
+        else:
+            self._send(codec.encode_unconfirmed_request(codec.UNCONFIRMED_COV_NOTIFICATION, payload), subscription.peer)
+        self.notification_count += 1
+
+
+async def _async_main(args: argparse.Namespace):
+    simulator = DeviceSimulator(
+        load_dump(args.dump),
+        device_id=args.device_id,
+        latency=args.latency,
+        loss=args.loss,
+        max_apdu=args.max_apdu,
+    )
+    address = await simulator.async_start(args.host, args.port)
+    print(f"Simulating device {args.device_id} with {len(simulator.objects)} objects on {address}")
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await simulator.async_stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=codec.BACNET_PORT)
+    parser.add_argument('--device-id', type=int, default=DEFAULT_DEVICE_ID)
+    parser.add_argument('--latency', type=float, default=0.0, help="seconds added to every response")
+    parser.add_argument('--loss', type=float, default=0.0, help="fraction of requests dropped")
+    parser.add_argument('--max-apdu', type=int, default=1476, choices=sorted(codec.MAX_APDU_ENCODING))
+    parser.add_argument('--dump', type=Path, default=DUMP_PATH)
+    args = parser.parse_args()
+
+    try:
+        asyncio.run(_async_main(args))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,85 @@
+import time
+
+from typing import Any, Dict, Iterable, Set, Tuple
+
+from .device_property import PRESENT_VALUE
+from .typing import DeviceState, ObjectIdentifier, PropertyKey
+
+
+class DeviceStateStore:
+    """Device state indexed by (object_type, instance, property).
+
+    Reads are a single dict lookup, updates replace individual values in place
+    and every value remembers when it was last received. Objects whose values
+    changed are collected until pop_changed() is called.
+    """
+
+    __slots__ = ('_values', '_timestamps', '_changed')
+
+    def __init__(self):
+        self._values: Dict[PropertyKey, Any] = {}
+        self._timestamps: Dict[PropertyKey, float] = {}
+        self._changed: Set[ObjectIdentifier] = set()
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __contains__(self, object_identifier: ObjectIdentifier) -> bool:
+        return (*object_identifier, PRESENT_VALUE) in self._values
+
+    def get(self, object_identifier: ObjectIdentifier, property_name: str = PRESENT_VALUE) -> Any:
+        """Return a value, raising KeyError if it was never received."""
+        return self._values[(*object_identifier, property_name)]
+
+    def timestamp(self, object_identifier: ObjectIdentifier, property_name: str = PRESENT_VALUE) -> float | None:
+        """Return the time (seconds since the epoch) a value was last received."""
+        return self._timestamps.get((*object_identifier, property_name))
+
+    def set(
+        self,
+        object_identifier: ObjectIdentifier,
+        property_name: str,
+        value: Any,
+        timestamp: float | None = None,
+    ):
+        key = (*object_identifier, property_name)
+        if key not in self._values or self._values[key] != value:
+            self._values[key] = value
+            self._changed.add(object_identifier)
+        self._timestamps[key] = time.time() if timestamp is None else timestamp
+
+    def update_object(
+        self,
+        object_identifier: ObjectIdentifier,
+        properties: Iterable[Tuple[str, Any]],
+        timestamp: float | None = None,
+    ):
+        if timestamp is None:
+            timestamp = time.time()
+        for property_name, value in properties:
+            self.set(object_identifier, property_name, value, timestamp)
+
+    def update(self, state: DeviceState, timestamp: float | None = None):
+        """Merge a ReadPropertyMultiple result."""
+        if timestamp is None:
+            timestamp = time.time()
+        for object_identifier, properties in state.items():
+            self.update_object(object_identifier, properties, timestamp)
+
+    def restore(self, snapshot: Dict[str, Dict[str, Any]], timestamp: float | None = None):
+        """Merge a snapshot() taken earlier, e.g. loaded from disk."""
+        for object_path, properties in snapshot.items():
+            object_type, _, instance_id = object_path.partition(':')
+            self.update_object((object_type, int(instance_id)), properties.items(), timestamp)
+
+    def pop_changed(self) -> Set[ObjectIdentifier]:
+        """Return the objects changed since the last call and start over."""
+        changed, self._changed = self._changed, set()
+        return changed
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Return a compact, JSON friendly copy, e.g. {'analogInput:1': {'presentValue': 14.3}}."""
+        snapshot: Dict[str, Dict[str, Any]] = {}
+        for (object_type, instance_id, property_name), value in self._values.items():
+            snapshot.setdefault(f'{object_type}:{instance_id}', {})[property_name] = value
+        return snapshot
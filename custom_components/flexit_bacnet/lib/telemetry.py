@@ -0,0 +1,121 @@
+import time
+import bisect
+
+from collections import Counter
+from contextlib import ExitStack, contextmanager
+from typing import Any, Callable, ContextManager, Dict, Iterator, List, Sequence
+from logging import Logger, getLogger
+
+LOGGER: Logger = getLogger(__package__)
+
+# Upper bounds, in seconds, of the latency histogram buckets
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Upper bounds of the histogram buckets of objects per request
+COUNT_BUCKETS = (1, 2, 5, 10, 20, 50, 100)
+
+# Called with a span name and its attributes, returns a context manager that
+# is entered for the duration of the span, e.g. an OpenTelemetry tracer's
+# start_as_current_span.
+SpanHook = Callable[[str, Dict[str, Any]], ContextManager]
+
+
+class Histogram:
+    """Observations counted in fixed buckets, with their count, sum, min and max."""
+
+    __slots__ = ('bounds', 'buckets', 'count', 'total', 'min', 'max')
+
+    def __init__(self, bounds: Sequence[float] = LATENCY_BUCKETS):
+        self.bounds = tuple(bounds)
+        # One bucket per bound, and one for everything above the last
+        self.buckets: List[int] = [0] * (len(self.bounds) + 1)
+        self.count: int = 0
+        self.total: float = 0.0
+        self.min: float | None = None
+        self.max: float | None = None
+
+    def observe(self, value: float):
+        self.buckets[bisect.bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.total += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    @property
+    def mean(self) -> float | None:
+        if self.count == 0:
+            return None
+        return self.total / self.count
+
+    def as_dict(self) -> dict:
+        return {
+            "count": self.count,
+            "sum": self.total,
+            "mean": self.mean,
+            "min": self.min,
+            "max": self.max,
+            "buckets": {
+                **{f"le_{bound}": count for bound, count in zip(self.bounds, self.buckets)},
+                "inf": self.buckets[-1],
+            },
+        }
+
+
+class Telemetry:
+    """Counters, histograms and spans of one session or device.
+
+    Spans time a phase of work into the histogram of the same name and
+    count its errors. Hooks added with add_span_hook are entered around
+    every span, so a profiler can attach its own spans to the phases.
+    """
+
+    def __init__(self):
+        self.counters: Counter[str] = Counter()
+        self.histograms: Dict[str, Histogram] = {}
+        self._span_hooks: List[SpanHook] = []
+
+    def increment(self, name: str, value: int = 1):
+        self.counters[name] += value
+
+    def observe(self, name: str, value: float, bounds: Sequence[float] = LATENCY_BUCKETS):
+        histogram = self.histograms.get(name)
+        if histogram is None:
+            histogram = self.histograms[name] = Histogram(bounds)
+        histogram.observe(value)
+
+    def mean(self, name: str) -> float | None:
+        histogram = self.histograms.get(name)
+        return histogram.mean if histogram is not None else None
+
+    def add_span_hook(self, hook: SpanHook) -> Callable[[], None]:
+        """Enter hook around every span. Returns a remove function."""
+        self._span_hooks.append(hook)
+        return lambda: self._span_hooks.remove(hook)
+
+    @contextmanager
+    def span(self, name: str, **attributes: Any) -> Iterator[None]:
+        """Time the body as phase name, inside the context of every span hook."""
+        with ExitStack() as stack:
+            for hook in list(self._span_hooks):
+                try:
+                    stack.enter_context(hook(name, attributes))
+                except Exception as e:
+                    LOGGER.debug("Span hook failed on %s, %s", name, e)
+
+            start = time.monotonic()
+            try:
+                yield
+            except Exception:
+                self.increment(f"{name}.errors")
+                raise
+            finally:
+                self.observe(name, time.monotonic() - start)
+
+    def as_dict(self) -> dict:
+        return {
+            "counters": dict(self.counters),
+            "histograms": {
+                name: histogram.as_dict()
+                for name, histogram in self.histograms.items()
+            },
+        }
@@ -0,0 +1,290 @@
+import time
+import asyncio
+import async_timeout
+
+from typing import Any, Dict, List, Sequence, Tuple
+from logging import Logger, getLogger
+
+from . import codec
+from .codec import APDU, BACnetAbort
+from .session import (
+    REQUEST_TIMEOUT,
+    TRANSPORT_NATIVE,
+    BACnetSession,
+    COVCallback,
+    PropertyWrite,
+    invalidate_local_ips,
+)
+from .typing import DeviceState, ObjectIdentifier
+
+# Telemetry name of each confirmed service
+_SERVICE_REQUESTS = {
+    codec.READ_PROPERTY_MULTIPLE: 'read_multiple',
+    codec.WRITE_PROPERTY: 'write',
+    codec.WRITE_PROPERTY_MULTIPLE: 'write_multiple',
+    codec.SUBSCRIBE_COV: 'subscribe_cov',
+}
+
+LOGGER: Logger = getLogger(__package__)
+
+# Seconds to wait for an answer before the request is sent again
+APDU_TIMEOUT = 3
+
+# Number of times a request is sent again before giving up
+APDU_RETRIES = 2
+
+# Largest APDU this client accepts in a response
+LOCAL_MAX_APDU = 1476
+
+# Subscriber process identifier used for all COV subscriptions of a session
+SUBSCRIBER_PROCESS_ID = 1
+
+Peer = Tuple[str, int]
+
+
+def parse_address(device_address: str) -> Peer:
+    """Split 'host[:port]' into (host, port)."""
+    host, _, port = device_address.partition(':')
+    return host, int(port) if port else codec.BACNET_PORT
+
+
+class BACnetIPProtocol(asyncio.DatagramProtocol):
+    """Hands datagrams from the event loop to the session."""
+
+    def __init__(self, session: 'NativeSession'):
+        self.session = session
+
+    def datagram_received(self, data: bytes, addr: Tuple[str, int]):
+        self.session._datagram_received(data, addr)
+
+    def error_received(self, exc: Exception):
+        LOGGER.debug("BACnet/IP socket error, %s", exc)
+        invalidate_local_ips()
+
+
+class NativeSession(BACnetSession):
+    """BACnet/IP client running directly on the event loop.
+
+    Requests are encoded by the codec module and sent from one UDP socket,
+    without BAC0 or executor threads. Requests in flight are told apart by
+    their invoke ID, so any number of them can share the socket.
+    """
+
+    transport = TRANSPORT_NATIVE
+
+    def __init__(self, hass, local_ip: str | None):
+        super().__init__(hass, local_ip)
+        self._endpoint: asyncio.DatagramTransport | None = None
+        self._pending: Dict[Tuple[Peer, int], asyncio.Future] = {}
+        self._next_invoke_ids: Dict[Peer, int] = {}
+        self._cov_callbacks: Dict[Tuple[Peer, ObjectIdentifier], COVCallback] = {}
+
+        self.retry_count: int = 0
+
+    @property
+    def connected(self) -> bool:
+        return self._endpoint is not None
+
+    async def async_connect(self) -> asyncio.DatagramTransport:
+        """Open the UDP socket unless it is already open."""
+        async with self._lock:
+            if self._endpoint is None:
+                LOGGER.debug("Opening BACnet/IP socket on %s", self.local_ip)
+                start = time.monotonic()
+                loop = asyncio.get_running_loop()
+                self._endpoint, _ = await loop.create_datagram_endpoint(
+                    lambda: BACnetIPProtocol(self),
+                    local_addr=(self.local_ip or '0.0.0.0', 0),
+                )
+                self.startup_duration = time.monotonic() - start
+                self.telemetry.observe('startup', self.startup_duration)
+            return self._endpoint
+
+    async def async_close(self):
+        """Close the socket and fail every request still waiting for an answer."""
+        async with self._lock:
+            endpoint, self._endpoint = self._endpoint, None
+            if endpoint is not None:
+                LOGGER.debug("Closing BACnet/IP socket on %s", self.local_ip)
+                endpoint.close()
+
+            pending, self._pending = self._pending, {}
+            for future in pending.values():
+                if not future.done():
+                    future.set_exception(ConnectionError("BACnet/IP socket closed"))
+
+    def _allocate_invoke_id(self, peer: Peer) -> int:
+        start = self._next_invoke_ids.get(peer, 0)
+        for offset in range(256):
+            invoke_id = (start + offset) % 256
+            if (peer, invoke_id) not in self._pending:
+                self._next_invoke_ids[peer] = (invoke_id + 1) % 256
+                return invoke_id
+        raise ConnectionError(f"No free invoke ID for {peer[0]}")
+
+    async def _async_request(self, device_address: str, service: int, payload: bytes) -> APDU:
+        """Send a confirmed request and return the acknowledgement.
+
+        The request is repeated every APDU_TIMEOUT seconds, up to APDU_RETRIES
+        times. Error, Reject and Abort answers raise a BACnetError.
+        """
+        endpoint = await self.async_connect()
+        peer = parse_address(device_address)
+        invoke_id = self._allocate_invoke_id(peer)
+        frame = codec.encode_frame(
+            codec.encode_confirmed_request(invoke_id, service, payload, LOCAL_MAX_APDU),
+            expecting_reply=True,
+        )
+
+        future = asyncio.get_running_loop().create_future()
+        key = (peer, invoke_id)
+        self._pending[key] = future
+        start = time.monotonic()
+
+        try:
+            async with async_timeout.timeout(REQUEST_TIMEOUT):
+                for attempt in range(APDU_RETRIES + 1):
+                    if attempt:
+                        self.retry_count += 1
+                        self.telemetry.increment('retries')
+                        LOGGER.debug("Retrying invoke ID %s to %s", invoke_id, device_address)
+                    endpoint.sendto(frame, peer)
+                    self.telemetry.increment('bytes_sent', len(frame))
+                    try:
+                        apdu = await asyncio.wait_for(asyncio.shield(future), APDU_TIMEOUT)
+                        break
+                    except asyncio.TimeoutError:
+                        if attempt == APDU_RETRIES:
+                            raise
+        except Exception as e:
+            self._record_failure(e)
+            raise
+        finally:
+            self._pending.pop(key, None)
+
+        try:
+            codec.raise_for_apdu(apdu)
+        except codec.BACnetError:
+            # Answered, but not a success, so kept out of the latencies
+            self.telemetry.increment('errors')
+            raise
+
+        self._record_latency(_SERVICE_REQUESTS.get(service, str(service)), start)
+        return apdu
+
+    def _datagram_received(self, data: bytes, addr: Tuple[str, int]):
+        self.telemetry.increment('bytes_received', len(data))
+        try:
+            apdu = codec.decode_frame(data)
+        except (IndexError, ValueError) as e:
+            LOGGER.debug("Dropping malformed datagram from %s, %s", addr[0], e)
+            return
+
+        if apdu is None:
+            return
+
+        peer = (addr[0], addr[1])
+
+        if apdu.pdu_type in (codec.CONFIRMED_REQUEST, codec.UNCONFIRMED_REQUEST):
+            self._request_received(apdu, peer)
+            return
+
+        future = self._pending.get((peer, apdu.invoke_id))
+        if future is None or future.done():
+            return
+
+        if apdu.segmented:
+            future.set_exception(BACnetAbort("segmented responses are not supported"))
+        else:
+            future.set_result(apdu)
+
+    def _request_received(self, apdu: APDU, peer: Peer):
+        """Handle COV notifications; other requests are not served."""
+        if apdu.service not in (codec.CONFIRMED_COV_NOTIFICATION, codec.UNCONFIRMED_COV_NOTIFICATION):
+            return
+
+        if apdu.pdu_type == codec.CONFIRMED_REQUEST and self._endpoint is not None:
+            frame = codec.encode_frame(codec.encode_simple_ack(apdu.invoke_id, apdu.service))
+            self._endpoint.sendto(frame, peer)
+            self.telemetry.increment('bytes_sent', len(frame))
+
+        try:
+            _, _, object_identifier, _, properties = codec.decode_cov_notification(apdu.payload)
+        except (IndexError, ValueError) as e:
+            LOGGER.debug("Dropping malformed COV notification from %s, %s", peer[0], e)
+            return
+
+        callback = self._cov_callbacks.get((peer, object_identifier))
+        if callback is not None:
+            callback(properties)
+
+    async def async_read_multiple(
+        self,
+        device_address: str,
+        objects: Dict[ObjectIdentifier, Sequence[str]],
+    ) -> DeviceState:
+        apdu = await self._async_request(
+            device_address,
+            codec.READ_PROPERTY_MULTIPLE,
+            codec.encode_read_property_multiple(objects),
+        )
+        return codec.decode_read_property_multiple_ack(apdu.payload)
+
+    async def async_write(
+        self,
+        device_address: str,
+        object_identifier: ObjectIdentifier,
+        property_name: str,
+        value: Any,
+        priority: int | None = None,
+    ):
+        LOGGER.debug("WriteProperty %s %s %s %s", object_identifier, property_name, value, priority)
+        await self._async_request(
+            device_address,
+            codec.WRITE_PROPERTY,
+            codec.encode_write_property(object_identifier, property_name, value, priority),
+        )
+
+    async def async_write_multiple(self, device_address: str, writes: List[PropertyWrite]):
+        LOGGER.debug("WritePropertyMultiple %s", writes)
+        await self._async_request(
+            device_address,
+            codec.WRITE_PROPERTY_MULTIPLE,
+            codec.encode_write_property_multiple(writes),
+        )
+
+    async def async_subscribe_cov(
+        self,
+        device_address: str,
+        object_identifier: ObjectIdentifier,
+        lifetime: int,
+        callback: COVCallback,
+        confirmed: bool = True,
+    ):
+        key = (parse_address(device_address), object_identifier)
+        self._cov_callbacks[key] = callback
+        try:
+            await self._async_request(
+                device_address,
+                codec.SUBSCRIBE_COV,
+                codec.encode_subscribe_cov(SUBSCRIBER_PROCESS_ID, object_identifier, confirmed, lifetime),
+            )
+        except Exception:
+            self._cov_callbacks.pop(key, None)
+            raise
+
+    async def async_unsubscribe_cov(self, device_address: str, object_identifier: ObjectIdentifier):
+        self._cov_callbacks.pop((parse_address(device_address), object_identifier), None)
+        await self._async_request(
+            device_address,
+            codec.SUBSCRIBE_COV,
+            codec.encode_subscribe_cov(SUBSCRIBER_PROCESS_ID, object_identifier, cancel=True),
+        )
+
+    def as_dict(self) -> dict:
+        return {
+            **super().as_dict(),
+            "in_flight": len(self._pending),
+            "retry_count": self.retry_count,
+            "cov_subscriptions": len(self._cov_callbacks),
+        }
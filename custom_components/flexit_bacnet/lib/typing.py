@@ -3,3 +3,4 @@ from typing import Tuple, Any, List, Dict
 ObjectIdentifier = Tuple[str, int]
 ObjectProperties = List[Tuple[str, Any]]
 DeviceState = Dict[ObjectIdentifier, ObjectProperties]
+PropertyKey = Tuple[str, int, str]
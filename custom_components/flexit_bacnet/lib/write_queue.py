@@ -0,0 +1,122 @@
+import time
+import asyncio
+
+from typing import Any, Awaitable, Callable, Dict, List, Tuple
+from logging import Logger, getLogger
+
+from .device_property import DeviceProperty
+from .typing import ObjectIdentifier
+
+LOGGER: Logger = getLogger(__package__)
+
+# Seconds pending writes are held back so that rapid changes coalesce
+DEFAULT_WRITE_DEBOUNCE = 0.5
+
+WriteValues = List[Tuple[DeviceProperty, Any]]
+
+
+class WriteQueue:
+    """Coalesces writes per device property and flushes them after a debounce window.
+
+    Only the latest value of each object and priority is kept, so commands
+    and relinquishes at different priorities are all written. Values are
+    flushed in the order they were last set, all in one call to flush.
+    """
+
+    def __init__(
+        self,
+        flush: Callable[[WriteValues], Awaitable[Any]],
+        debounce: float = DEFAULT_WRITE_DEBOUNCE,
+    ):
+        self.debounce = debounce
+        self._flush = flush
+        self._pending: Dict[Tuple[ObjectIdentifier, int | None], Tuple[DeviceProperty, Any]] = {}
+        self._waiters: List[asyncio.Future] = []
+        self._timer: asyncio.TimerHandle | None = None
+        self._flush_lock = asyncio.Lock()
+
+        self.flush_count: int = 0
+        self.coalesced_count: int = 0
+        self.last_flush_latency: float | None = None
+
+    @property
+    def depth(self) -> int:
+        """Return the number of device properties waiting to be written."""
+        return len(self._pending)
+
+    def enqueue(self, values: WriteValues, debounce: float | None = None) -> asyncio.Future:
+        """Queue values for writing. Must be called from the event loop.
+
+        debounce -- seconds to hold the values back, by default self.debounce.
+        A shorter window than the pending one brings the flush forward.
+
+        Returns a future that resolves to the result of flush once the values
+        have been written.
+        """
+        loop = asyncio.get_running_loop()
+
+        for device_property, value in values:
+            key = (device_property.object_identifier, device_property.priority)
+            if self._pending.pop(key, None) is not None:
+                self.coalesced_count += 1
+            self._pending[key] = (device_property, value)
+
+        future = loop.create_future()
+        self._waiters.append(future)
+
+        if debounce is None:
+            debounce = self.debounce
+        if self._timer is not None and self._timer.when() > loop.time() + debounce:
+            self._timer.cancel()
+            self._timer = None
+
+        # The window starts with the first pending write, so a continuous
+        # stream of changes cannot postpone the flush indefinitely.
+        if self._timer is None:
+            self._timer = loop.call_later(debounce, self._schedule_flush)
+
+        return future
+
+    def _schedule_flush(self):
+        self._timer = None
+        asyncio.get_running_loop().create_task(self.async_flush())
+
+    async def async_flush(self):
+        """Write all pending values now."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        async with self._flush_lock:
+            values = list(self._pending.values())
+            waiters, self._waiters = self._waiters, []
+            self._pending = {}
+
+            result: Any = None
+            error: Exception | None = None
+            if values:
+                start = time.monotonic()
+                try:
+                    result = await self._flush(values)
+                except Exception as e:
+                    LOGGER.warning("Error flushing writes, %s", e)
+                    error = e
+                self.last_flush_latency = time.monotonic() - start
+                self.flush_count += 1
+
+            for waiter in waiters:
+                if waiter.done():
+                    continue
+                if error is None:
+                    waiter.set_result(result)
+                else:
+                    waiter.set_exception(error)
+
+    def as_dict(self) -> dict:
+        return {
+            "depth": self.depth,
+            "debounce": self.debounce,
+            "flush_count": self.flush_count,
+            "coalesced_count": self.coalesced_count,
+            "last_flush_latency": self.last_flush_latency,
+        }
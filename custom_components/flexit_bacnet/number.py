@@ -2,8 +2,6 @@
 
 from __future__ import annotations
 
-import time
-
 from dataclasses import dataclass
 from typing import Any, Tuple, Literal
 
@@ -184,7 +182,10 @@ class FlexitNumber(CoordinatorEntity, NumberEntity):
     ) -> None:
         """Initialize."""
 
-        super().__init__(coordinator)
+        super().__init__(
+            coordinator,
+            context=coordinator.property_context(description.key),
+        )
         self.coordinator = coordinator
         self.entity_description = description
         self._attr_unique_id = f"{description.key}"
@@ -195,11 +196,6 @@ class FlexitNumber(CoordinatorEntity, NumberEntity):
         self._attr_native_min_value = description.native_min_value or DEFAULT_MIN_VALUE
         self._attr_native_max_value = description.native_max_value or DEFAULT_MAX_VALUE
 
-    def _update(self) -> None:
-        """Refresh unit state."""
-        time.sleep(1)
-        self.schedule_update_ha_state()
-
     @property
     def available(self) -> bool:
         """Entity is available"""
@@ -212,61 +208,49 @@ class FlexitNumber(CoordinatorEntity, NumberEntity):
         )
 
 class FlexitSetpointHomeExtractNumber(FlexitNumber):
-    def set_native_value(self, value: float) -> None:
-        self.coordinator.device.set_fan_setpoint_extract_air_home(value)
-        self._update()
+    async def async_set_native_value(self, value: float) -> None:
+        await self.coordinator.async_write(self.coordinator.device.set_fan_setpoint_extract_air_home(value))
 
 class FlexitSetpointHomeSupplyNumber(FlexitNumber):
-    def set_native_value(self, value: float) -> None:
-        self.coordinator.device.set_fan_setpoint_supply_air_home(value)
-        self._update()
+    async def async_set_native_value(self, value: float) -> None:
+        await self.coordinator.async_write(self.coordinator.device.set_fan_setpoint_supply_air_home(value))
 
 class FlexitSetpointAwayExtractNumber(FlexitNumber):
-    def set_native_value(self, value: float) -> None:
-        self.coordinator.device.set_fan_setpoint_supply_air_away(value)
-        self._update()
+    async def async_set_native_value(self, value: float) -> None:
+        await self.coordinator.async_write(self.coordinator.device.set_fan_setpoint_supply_air_away(value))
 
 class FlexitSetpointAwaySupplyNumber(FlexitNumber):
-    def set_native_value(self, value: float) -> None:
-        self.coordinator.device.set_fan_setpoint_supply_air_away(value)
-        self._update()
+    async def async_set_native_value(self, value: float) -> None:
+        await self.coordinator.async_write(self.coordinator.device.set_fan_setpoint_supply_air_away(value))
 
 class FlexitSetpointHighExtractNumber(FlexitNumber):
-    def set_native_value(self, value: float) -> None:
-        self.coordinator.device.set_fan_setpoint_supply_air_high(value)
-        self._update()
+    async def async_set_native_value(self, value: float) -> None:
+        await self.coordinator.async_write(self.coordinator.device.set_fan_setpoint_supply_air_high(value))
 
 class FlexitSetpointHighSupplyNumber(FlexitNumber):
-    def set_native_value(self, value: float) -> None:
-        self.coordinator.device.set_fan_setpoint_supply_air_high(value)
-        self._update()
+    async def async_set_native_value(self, value: float) -> None:
+        await self.coordinator.async_write(self.coordinator.device.set_fan_setpoint_supply_air_high(value))
 
 class FlexitSetpointFireExtractNumber(FlexitNumber):
-    def set_native_value(self, value: float) -> None:
-        self.coordinator.device.set_fan_setpoint_supply_air_fire(value)
-        self._update()
+    async def async_set_native_value(self, value: float) -> None:
+        await self.coordinator.async_write(self.coordinator.device.set_fan_setpoint_supply_air_fire(value))
 
 class FlexitSetpointFireSupplyNumber(FlexitNumber):
-    def set_native_value(self, value: float) -> None:
-        self.coordinator.device.set_fan_setpoint_supply_air_fire(value)
-        self._update()
+    async def async_set_native_value(self, value: float) -> None:
+        await self.coordinator.async_write(self.coordinator.device.set_fan_setpoint_supply_air_fire(value))
 
 class FlexitSetpointCookerExtractNumber(FlexitNumber):
-    def set_native_value(self, value: float) -> None:
-        self.coordinator.device.set_fan_setpoint_supply_air_cooker(value)
-        self._update()
+    async def async_set_native_value(self, value: float) -> None:
+        await self.coordinator.async_write(self.coordinator.device.set_fan_setpoint_supply_air_cooker(value))
 
 class FlexitSetpointCookerSupplyNumber(FlexitNumber):
-    def set_native_value(self, value: float) -> None:
-        self.coordinator.device.set_fan_setpoint_supply_air_cooker(value)
-        self._update()
+    async def async_set_native_value(self, value: float) -> None:
+        await self.coordinator.async_write(self.coordinator.device.set_fan_setpoint_supply_air_cooker(value))
 
 class FlexitBoostDelayNumber(FlexitNumber):
-    def set_native_value(self, value: float) -> None:
-        self.coordinator.device.set_rapid_ventilation_duration(value)
-        self._update()
+    async def async_set_native_value(self, value: float) -> None:
+        await self.coordinator.async_write(self.coordinator.device.set_rapid_ventilation_duration(value))
 
 class FlexitFireplaceDelayNumber(FlexitNumber):
-    def set_native_value(self, value: float) -> None:
-        self.coordinator.device.set_fireplace_ventilation_duration(int(value))
-        self._update()
+    async def async_set_native_value(self, value: float) -> None:
+        await self.coordinator.async_write(self.coordinator.device.set_fireplace_ventilation_duration(int(value)))
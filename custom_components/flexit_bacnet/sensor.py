@@ -1,5 +1,6 @@
 
-from typing import Any, cast
+from dataclasses import dataclass
+from typing import Any, Callable, Mapping, cast
 
 from homeassistant.components.sensor import (
     SensorEntity,
@@ -9,20 +10,46 @@ from homeassistant.components.sensor import (
 )
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import PERCENTAGE, TEMP_CELSIUS, REVOLUTIONS_PER_MINUTE, TIME_HOURS, TIME_MINUTES, POWER_KILO_WATT
+from homeassistant.const import (
+    DATA_BYTES,
+    PERCENTAGE,
+    TEMP_CELSIUS,
+    REVOLUTIONS_PER_MINUTE,
+    TIME_HOURS,
+    TIME_MILLISECONDS,
+    TIME_MINUTES,
+    TIME_SECONDS,
+    POWER_KILO_WATT,
+)
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.typing import StateType
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN, LOGGER
+from .const import DOMAIN, LOGGER, SIGNAL_CATALOGUE_LOADED
 from .coordinator import FlexitDataUpdateCoordinator
+from .lib import FlexitBACnet
+from .lib.discovery import CatalogueEntry
+from .lib.nordic import DEVICE_PROPERTIES
 
 TEMPERATURE_ICON = "mdi:thermometer"
 FAN_ICON = "mdi:fan"
 HEATING_ICON = "mdi:radiator"
 
+# Object types of discovered objects that become sensors
+DISCOVERED_SENSOR_TYPES = ('analogInput', 'analogOutput', 'analogValue')
+
+DISCOVERED_UNITS = {
+    "degreesCelsius": TEMP_CELSIUS,
+    "percent": PERCENTAGE,
+    "revolutionsPerMinute": REVOLUTIONS_PER_MINUTE,
+    "hours": TIME_HOURS,
+    "minutes": TIME_MINUTES,
+    "kilowatts": POWER_KILO_WATT,
+}
+
 SENSORS = [
     SensorEntityDescription(
         name="Mode Operation",
@@ -138,6 +165,105 @@ SENSORS = [
     ),
 ]
 
+HEALTH_SENSOR = SensorEntityDescription(
+    name="Connection health",
+    key="connection_health",
+    icon="mdi:lan-connect",
+    entity_category=EntityCategory.DIAGNOSTIC,
+)
+
+
+
+@dataclass
+class FlexitTelemetrySensorEntityDescription(SensorEntityDescription):
+    """A class that describes telemetry sensors."""
+
+    value_fn: Callable[[FlexitBACnet], StateType] | None = None
+
+
+def _milliseconds(seconds: float | None) -> float | None:
+    return round(seconds * 1000, 1) if seconds is not None else None
+
+
+def _session_mean(device: FlexitBACnet, name: str) -> float | None:
+    return device.session.telemetry.mean(name) if device.session is not None else None
+
+
+def _session_counter(device: FlexitBACnet, name: str) -> int | None:
+    return device.session.telemetry.counters[name] if device.session is not None else None
+
+
+# Request cost, shared by every device on the same BACnet session
+TELEMETRY_SENSORS = [
+    FlexitTelemetrySensorEntityDescription(
+        name="BACnet stack startup",
+        key="bacnet_stack_startup",
+        native_unit_of_measurement=TIME_SECONDS,
+        value_fn=lambda device: device.session.startup_duration if device.session is not None else None,
+    ),
+    FlexitTelemetrySensorEntityDescription(
+        name="BACnet read round trip",
+        key="bacnet_read_round_trip",
+        native_unit_of_measurement=TIME_MILLISECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda device: _milliseconds(_session_mean(device, 'read_multiple')),
+    ),
+    FlexitTelemetrySensorEntityDescription(
+        name="BACnet objects per read",
+        key="bacnet_objects_per_read",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda device: _session_mean(device, 'objects_per_read'),
+    ),
+    FlexitTelemetrySensorEntityDescription(
+        name="BACnet write duration",
+        key="bacnet_write_duration",
+        native_unit_of_measurement=TIME_MILLISECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda device: _milliseconds(device.telemetry.mean('write')),
+    ),
+    FlexitTelemetrySensorEntityDescription(
+        name="BACnet refresh duration",
+        key="bacnet_refresh_duration",
+        native_unit_of_measurement=TIME_MILLISECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda device: _milliseconds(device.telemetry.mean('refresh')),
+    ),
+    FlexitTelemetrySensorEntityDescription(
+        name="BACnet requests",
+        key="bacnet_requests",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda device: device.session.request_count if device.session is not None else None,
+    ),
+    FlexitTelemetrySensorEntityDescription(
+        name="BACnet timeouts",
+        key="bacnet_timeouts",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda device: _session_counter(device, 'timeouts'),
+    ),
+    FlexitTelemetrySensorEntityDescription(
+        name="BACnet retries",
+        key="bacnet_retries",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda device: _session_counter(device, 'retries'),
+    ),
+    FlexitTelemetrySensorEntityDescription(
+        name="BACnet bytes sent",
+        key="bacnet_bytes_sent",
+        native_unit_of_measurement=DATA_BYTES,
+        device_class=SensorDeviceClass.DATA_SIZE,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda device: _session_counter(device, 'bytes_sent'),
+    ),
+    FlexitTelemetrySensorEntityDescription(
+        name="BACnet bytes received",
+        key="bacnet_bytes_received",
+        native_unit_of_measurement=DATA_BYTES,
+        device_class=SensorDeviceClass.DATA_SIZE,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda device: _session_counter(device, 'bytes_received'),
+    ),
+]
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: ConfigEntry,
@@ -148,6 +274,32 @@ async def async_setup_entry(
         FlexitSensor(coordinator, description)
         for description in SENSORS
     )
+    async_add_entities([FlexitHealthSensor(coordinator, HEALTH_SENSOR)])
+    async_add_entities(
+        FlexitTelemetrySensor(coordinator, description)
+        for description in TELEMETRY_SENSORS
+    )
+
+    known = {dp.object_identifier for dp in DEVICE_PROPERTIES}
+    added = False
+
+    @callback
+    def _async_add_discovered() -> None:
+        nonlocal added
+        catalogue = coordinator.device.catalogue
+        if added or catalogue is None:
+            return
+        added = True
+        async_add_entities(
+            FlexitDiscoveredSensor(coordinator, catalogue_entry)
+            for catalogue_entry in catalogue.of_type(*DISCOVERED_SENSOR_TYPES)
+            if catalogue_entry.object_identifier not in known
+        )
+
+    entry.async_on_unload(
+        async_dispatcher_connect(hass, SIGNAL_CATALOGUE_LOADED.format(entry.entry_id), _async_add_discovered)
+    )
+    _async_add_discovered()
 
 class FlexitSensor(CoordinatorEntity, SensorEntity):
 
@@ -159,7 +311,10 @@ class FlexitSensor(CoordinatorEntity, SensorEntity):
         description: SensorEntityDescription,
     ) -> None:
 
-        super().__init__(coordinator)
+        super().__init__(
+            coordinator,
+            context=coordinator.property_context(description.key),
+        )
         self.coordinator = coordinator
         self.entity_description = description
         self._attr_unique_id = f"{description.key}"
@@ -174,3 +329,128 @@ class FlexitSensor(CoordinatorEntity, SensorEntity):
     def native_value(self) -> StateType:
         sensor_data = self.coordinator.device.__getattribute__(self.entity_description.key)
         return cast(StateType, sensor_data)
+
+
+class FlexitDiscoveredSensor(CoordinatorEntity, SensorEntity):
+    """Sensor for an object found in the device's object list."""
+
+    coordinator: FlexitDataUpdateCoordinator
+
+    _attr_entity_registry_enabled_default = False
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+
+    def __init__(
+        self,
+        coordinator: FlexitDataUpdateCoordinator,
+        catalogue_entry: CatalogueEntry,
+    ) -> None:
+
+        super().__init__(
+            coordinator,
+            context=frozenset({catalogue_entry.object_identifier}),
+        )
+        self.coordinator = coordinator
+        self.catalogue_entry = catalogue_entry
+        self._device_property = catalogue_entry.device_property()
+        self._attr_name = catalogue_entry.description or catalogue_entry.object_name
+        self._attr_unique_id = f"{coordinator.device.serial_number}_{catalogue_entry.object_type}_{catalogue_entry.instance_id}"
+        self._attr_device_info = coordinator._attr_device_info
+        self._attr_native_unit_of_measurement = DISCOVERED_UNITS.get(catalogue_entry.units)
+
+    async def async_added_to_hass(self) -> None:
+        """Start reading the object once the entity is enabled."""
+        await super().async_added_to_hass()
+        self.coordinator.device.track(self._device_property)
+        self.async_on_remove(lambda: self.coordinator.device.untrack(self._device_property))
+
+    @property
+    def available(self) -> bool:
+        """Entity is available"""
+        return self.coordinator.device.available
+
+    @property
+    def native_value(self) -> StateType:
+        return cast(StateType, self.coordinator.device.get_object_value(self.catalogue_entry.object_identifier))
+
+
+class FlexitHealthSensor(CoordinatorEntity, SensorEntity):
+    """Health of the connection to the device: healthy, degraded or open."""
+
+    coordinator: FlexitDataUpdateCoordinator
+
+    def __init__(
+        self,
+        coordinator: FlexitDataUpdateCoordinator,
+        description: SensorEntityDescription,
+    ) -> None:
+
+        # Shows no device state, so nothing is read for it
+        super().__init__(coordinator, context=frozenset())
+        self.coordinator = coordinator
+        self.entity_description = description
+        self._attr_unique_id = f"{coordinator.device.serial_number}_{description.key}"
+        self._attr_device_info = coordinator._attr_device_info
+
+    async def async_added_to_hass(self) -> None:
+        """Update on every health transition, not only on coordinator updates."""
+        await super().async_added_to_hass()
+        self.async_on_remove(self.coordinator.device.health.add_listener(self.async_write_ha_state))
+
+    @property
+    def available(self) -> bool:
+        """Entity is available, also when the device is not"""
+        return True
+
+    @property
+    def native_value(self) -> StateType:
+        return self.coordinator.device.health.state
+
+    @property
+    def extra_state_attributes(self) -> Mapping[str, Any]:
+        health = self.coordinator.device.health
+        return {
+            "failures": health.failures,
+            "backoff": health.backoff,
+            "transition_count": health.transition_count,
+            "open_count": health.open_count,
+        }
+
+
+class FlexitTelemetrySensor(CoordinatorEntity, SensorEntity):
+    """Request cost of the BACnet client, sampled on the entity's own poll."""
+
+    coordinator: FlexitDataUpdateCoordinator
+    entity_description: FlexitTelemetrySensorEntityDescription
+
+    _attr_entity_registry_enabled_default = False
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+
+    def __init__(
+        self,
+        coordinator: FlexitDataUpdateCoordinator,
+        description: FlexitTelemetrySensorEntityDescription,
+    ) -> None:
+
+        # Shows no device state, so nothing is read for it
+        super().__init__(coordinator, context=frozenset())
+        self.coordinator = coordinator
+        self.entity_description = description
+        self._attr_unique_id = f"{coordinator.device.serial_number}_{description.key}"
+        self._attr_device_info = coordinator._attr_device_info
+
+    @property
+    def should_poll(self) -> bool:
+        """Poll to sample the telemetry, which changes without coordinator updates."""
+        return True
+
+    async def async_update(self) -> None:
+        """Nothing to fetch, unlike CoordinatorEntity this must not request a refresh."""
+
+    @property
+    def available(self) -> bool:
+        """Entity is available, also when the device is not"""
+        return True
+
+    @property
+    def native_value(self) -> StateType:
+        return self.entity_description.value_fn(self.coordinator.device)
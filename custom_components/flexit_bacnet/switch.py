@@ -2,8 +2,6 @@
 
 from __future__ import annotations
 
-import time
-
 from typing import Any, Tuple
 
 from homeassistant.components.switch import (
@@ -56,17 +54,15 @@ class FlexitSwitch(CoordinatorEntity, SwitchEntity):
     ) -> None:
         """Initialize a Flexit switch."""
 
-        super().__init__(coordinator)
+        super().__init__(
+            coordinator,
+            context=coordinator.property_context(description.key),
+        )
         self.coordinator = coordinator
         self.entity_description = description
         self._attr_unique_id = f"{description.key}"
         self._attr_device_info = coordinator._attr_device_info
 
-    def _update(self) -> None:
-        """Refresh unit state."""
-        time.sleep(1)
-        self.schedule_update_ha_state()
-
     @property
     def available(self) -> bool:
         """Entity is available"""
@@ -78,23 +74,19 @@ class FlexitSwitch(CoordinatorEntity, SwitchEntity):
         return self.coordinator.device.__getattribute__(self.entity_description.key)
 
 class FlexitComfortSwitch(FlexitSwitch):
-    def turn_on(self, **kwargs: Any) -> None:
+    async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn the entity on."""
-        self.coordinator.device.activate_comfort_button()
-        self._update()
+        await self.coordinator.async_write(self.coordinator.device.activate_comfort_button())
 
-    def turn_off(self, **kwargs: Any) -> None:
+    async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn the entity off."""
-        self.coordinator.device.deactivate_comfort_button()
-        self._update()
+        await self.coordinator.async_write(self.coordinator.device.deactivate_comfort_button())
 
 class FlexitCalendarOverrideSwitch(FlexitSwitch):
-    def turn_on(self, **kwargs: Any) -> None:
+    async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn the entity on."""
-        self.coordinator.device.activate_schedule_override()
-        self._update()
+        await self.coordinator.async_write(self.coordinator.device.activate_schedule_override())
 
-    def turn_off(self, **kwargs: Any) -> None:
+    async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn the entity off."""
-        self.coordinator.device.deactivate_schedule_override()
-        self._update()
+        await self.coordinator.async_write(self.coordinator.device.deactivate_schedule_override())
@@ -0,0 +1,42 @@
+"""Shared fixtures of the library tests.
+
+The library under custom_components/flexit_bacnet/lib does not depend on
+Home Assistant, so it is imported as the top level package 'lib', the same
+way the benchmarks import it.
+"""
+import sys
+import asyncio
+
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / 'custom_components' / 'flexit_bacnet'))
+
+from lib import transport  # noqa: E402
+
+# Seconds the transport waits for an answer in tests, instead of APDU_TIMEOUT
+TEST_APDU_TIMEOUT = 0.05
+
+
+class FakeHass:
+    """The parts of HomeAssistant the library uses: the loop and the executor."""
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        return asyncio.get_running_loop()
+
+    async def async_add_executor_job(self, target, *args):
+        return await self.loop.run_in_executor(None, target, *args)
+
+
+@pytest.fixture
+def fast_timeouts(monkeypatch):
+    """Shorten the transport timeouts so that retries and timeouts take milliseconds."""
+    monkeypatch.setattr(transport, 'APDU_TIMEOUT', TEST_APDU_TIMEOUT)
+    monkeypatch.setattr(transport, 'REQUEST_TIMEOUT', 2)
+
+
+@pytest.fixture
+def hass():
+    return FakeHass()
@@ -0,0 +1,298 @@
+"""Round trips of the BACnet codec, one per encode/decode pair."""
+import pytest
+
+from lib import codec
+from lib.codec import APDU, BACnetAbort, BACnetError, BACnetReject, PropertyError, Reader
+
+ANALOG_VALUE = ('analogValue', 1994)
+BINARY_VALUE = ('binaryValue', 50)
+MULTI_STATE_VALUE = ('multiStateValue', 42)
+DEVICE = ('device', 2)
+
+
+def _application_round_trip(tag: int, value):
+    reader = Reader(codec.encode_application(tag, value))
+    decoded = reader.read_application()
+    assert reader.done
+    return decoded
+
+
+@pytest.mark.parametrize('tag, value', [
+    (codec.TAG_NULL, None),
+    (codec.TAG_BOOLEAN, True),
+    (codec.TAG_BOOLEAN, False),
+    (codec.TAG_UNSIGNED, 0),
+    (codec.TAG_UNSIGNED, 255),
+    (codec.TAG_UNSIGNED, 2 ** 32 - 1),
+    (codec.TAG_SIGNED, 0),
+    (codec.TAG_SIGNED, -1),
+    (codec.TAG_SIGNED, -128),
+    (codec.TAG_SIGNED, -129),
+    (codec.TAG_SIGNED, 32768),
+    (codec.TAG_SIGNED, -(2 ** 31)),
+    (codec.TAG_REAL, 21.5),
+    (codec.TAG_REAL, -40.25),
+    (codec.TAG_DOUBLE, 0.1),
+    (codec.TAG_OCTET_STRING, b'\x00\x01\x02'),
+    (codec.TAG_CHARACTER_STRING, ''),
+    (codec.TAG_CHARACTER_STRING, 'Nordic S4'),
+    (codec.TAG_BIT_STRING, [0, 1, 0, 0]),
+    (codec.TAG_BIT_STRING, [1, 0, 1, 1, 0, 0, 1, 0, 1]),
+    (codec.TAG_ENUMERATED, 0),
+    (codec.TAG_ENUMERATED, 98),
+    (codec.TAG_DATE, (124, 10, 18, 5)),
+    (codec.TAG_TIME, (12, 30, 0, 0)),
+    (codec.TAG_OBJECT_IDENTIFIER, ANALOG_VALUE),
+    (codec.TAG_OBJECT_IDENTIFIER, DEVICE),
+])
+def test_application_round_trip(tag, value):
+    assert _application_round_trip(tag, value) == (tag, value)
+
+
+@pytest.mark.parametrize('length, header', [
+    (4, b'\x74'),
+    (5, b'\x75\x05'),
+    (253, b'\x75\xfd'),
+    (254, b'\x75\xfe\x00\xfe'),
+    (65535, b'\x75\xfe\xff\xff'),
+    (65536, b'\x75\xff\x00\x01\x00\x00'),
+])
+def test_tag_length_encodings(length, header):
+    # The character set byte takes one of the length's bytes
+    value = 'x' * (length - 1)
+    encoded = codec.encode_application(codec.TAG_CHARACTER_STRING, value)
+    assert encoded.startswith(header)
+    assert len(encoded) == len(header) + length
+    assert _application_round_trip(codec.TAG_CHARACTER_STRING, value) == (codec.TAG_CHARACTER_STRING, value)
+
+
+@pytest.mark.parametrize('number', [0, 1, 4, 14, 15, 200])
+@pytest.mark.parametrize('value', [0, 1, 300, 2 ** 24])
+def test_context_unsigned_round_trip(number, value):
+    reader = Reader(codec.encode_context_unsigned(number, value))
+    assert reader.is_context(number)
+    assert reader.read_context_unsigned(number) == value
+    assert reader.done
+
+
+def test_context_boolean_and_object_identifier_round_trip():
+    reader = Reader(
+        codec.encode_context_boolean(2, True)
+        + codec.encode_context_object_identifier(1, MULTI_STATE_VALUE)
+    )
+    assert reader.read_context_boolean(2) is True
+    assert reader.read_context_object_identifier(1) == MULTI_STATE_VALUE
+    assert reader.done
+
+
+def test_context_tag_number_mismatch_raises():
+    reader = Reader(codec.encode_context_unsigned(1, 5))
+    assert not reader.is_context(2)
+    with pytest.raises(ValueError):
+        reader.read_context_unsigned(2)
+
+
+def test_opening_and_closing_tags():
+    reader = Reader(codec.opening_tag(3) + codec.encode_value([1.5, -2]) + codec.closing_tag(3))
+    assert reader.is_opening(3)
+    reader.expect_opening(3)
+    assert reader.read_values_until_closing(3) == [(codec.TAG_REAL, 1.5), (codec.TAG_SIGNED, -2)]
+    assert reader.done
+
+
+@pytest.mark.parametrize('value, tag', [
+    (None, codec.TAG_NULL),
+    (True, codec.TAG_BOOLEAN),
+    (7, codec.TAG_UNSIGNED),
+    (-7, codec.TAG_SIGNED),
+    (20.0, codec.TAG_REAL),
+    ('text', codec.TAG_CHARACTER_STRING),
+    (ANALOG_VALUE, codec.TAG_OBJECT_IDENTIFIER),
+])
+def test_encode_value_picks_application_tag(value, tag):
+    reader = Reader(codec.encode_value(value))
+    assert reader.read_application() == (tag, value)
+    assert reader.done
+
+
+def test_encode_value_rejects_unknown_types():
+    with pytest.raises(ValueError):
+        codec.encode_value(object())
+
+
+@pytest.mark.parametrize('object_identifier, property_name, value', [
+    (ANALOG_VALUE, 'presentValue', 20.5),
+    (ANALOG_VALUE, 'relinquishDefault', -3.0),
+    (BINARY_VALUE, 'presentValue', 'active'),
+    (BINARY_VALUE, 'presentValue', 'inactive'),
+    (MULTI_STATE_VALUE, 'presentValue', 3),
+    (('integerValue', 1), 'presentValue', -12),
+    (ANALOG_VALUE, 'units', 'degreesCelsius'),
+    (DEVICE, 'segmentationSupported', 'noSegmentation'),
+    (ANALOG_VALUE, 'statusFlags', [0, 0, 1, 0]),
+    (ANALOG_VALUE, 'objectType', 'analogValue'),
+    (ANALOG_VALUE, 'objectIdentifier', ANALOG_VALUE),
+    (DEVICE, 'objectName', 'HvacFnct21y_A'),
+    (BINARY_VALUE, 'priorityArray', [None] * 7 + ['active'] + [None] * 8),
+    (ANALOG_VALUE, 'priorityArray', [None] * 15 + [21.0]),
+])
+def test_property_value_round_trip(object_identifier, property_name, value):
+    object_type = object_identifier[0]
+    reader = Reader(codec.encode_property_value(object_type, property_name, value))
+    values = []
+    while not reader.done:
+        values.append(reader.read_application())
+    assert codec.decode_property_value(object_type, property_name, values) == value
+
+
+def test_frame_round_trip():
+    apdu = codec.encode_confirmed_request(17, codec.READ_PROPERTY, b'\x0c\x00', max_apdu=480)
+    decoded = codec.decode_frame(codec.encode_frame(apdu, expecting_reply=True))
+    assert decoded == APDU(codec.CONFIRMED_REQUEST, service=codec.READ_PROPERTY, invoke_id=17, payload=b'\x0c\x00', max_apdu=480)
+
+
+def test_decode_frame_ignores_other_datagrams():
+    assert codec.decode_frame(b'\x00\x01') is None
+    assert codec.decode_frame(b'\x82\x0a\x00\x08\x01\x00\x10\x08') is None
+
+
+@pytest.mark.parametrize('apdu, expected', [
+    (codec.encode_unconfirmed_request(codec.UNCONFIRMED_COV_NOTIFICATION, b'\x09\x01'),
+     APDU(codec.UNCONFIRMED_REQUEST, service=codec.UNCONFIRMED_COV_NOTIFICATION, payload=b'\x09\x01')),
+    (codec.encode_simple_ack(3, codec.WRITE_PROPERTY),
+     APDU(codec.SIMPLE_ACK, service=codec.WRITE_PROPERTY, invoke_id=3)),
+    (codec.encode_complex_ack(4, codec.READ_PROPERTY_MULTIPLE, b'\x0c'),
+     APDU(codec.COMPLEX_ACK, service=codec.READ_PROPERTY_MULTIPLE, invoke_id=4, payload=b'\x0c')),
+    (codec.encode_reject(5, codec.REJECT_UNRECOGNIZED_SERVICE),
+     APDU(codec.REJECT, invoke_id=5, reason=codec.REJECT_UNRECOGNIZED_SERVICE)),
+    (codec.encode_abort(6, 4),
+     APDU(codec.ABORT, invoke_id=6, reason=4)),
+])
+def test_apdu_round_trip(apdu, expected):
+    assert codec.decode_apdu(apdu) == expected
+
+
+def test_error_round_trip():
+    apdu = codec.decode_apdu(codec.encode_error(7, codec.WRITE_PROPERTY, 2, 40))
+    assert (apdu.pdu_type, apdu.invoke_id, apdu.service) == (codec.ERROR, 7, codec.WRITE_PROPERTY)
+    assert codec.decode_error(apdu.payload) == (2, 40)
+
+
+def test_raise_for_apdu_error():
+    apdu = codec.decode_apdu(codec.encode_error(
+        1,
+        codec.WRITE_PROPERTY_MULTIPLE,
+        codec.ERROR_CLASS_SERVICES,
+        codec.ERROR_CODE_OPTIONAL_FUNCTIONALITY_NOT_SUPPORTED,
+    ))
+    with pytest.raises(BACnetError) as info:
+        codec.raise_for_apdu(apdu)
+    assert type(info.value) is BACnetError
+    assert (info.value.error_class, info.value.error_code) == (5, 45)
+    assert info.value.unsupported_service
+
+
+def test_raise_for_apdu_error_refusing_a_value():
+    apdu = codec.decode_apdu(codec.encode_error(1, codec.WRITE_PROPERTY_MULTIPLE, 2, 40))
+    with pytest.raises(BACnetError) as info:
+        codec.raise_for_apdu(apdu)
+    assert not info.value.unsupported_service
+
+
+@pytest.mark.parametrize('reason, unsupported', [(codec.REJECT_UNRECOGNIZED_SERVICE, True), (0, False)])
+def test_raise_for_apdu_reject(reason, unsupported):
+    with pytest.raises(BACnetReject) as info:
+        codec.raise_for_apdu(codec.decode_apdu(codec.encode_reject(1, reason)))
+    assert info.value.reason == reason
+    assert info.value.unsupported_service is unsupported
+
+
+def test_raise_for_apdu_abort():
+    with pytest.raises(BACnetAbort) as info:
+        codec.raise_for_apdu(codec.decode_apdu(codec.encode_abort(1, 4)))
+    assert info.value.reason == 4
+    assert not info.value.unsupported_service
+
+
+def test_raise_for_apdu_acknowledgements():
+    codec.raise_for_apdu(codec.decode_apdu(codec.encode_simple_ack(1, codec.WRITE_PROPERTY)))
+    codec.raise_for_apdu(codec.decode_apdu(codec.encode_complex_ack(1, codec.READ_PROPERTY, b'')))
+
+
+@pytest.mark.parametrize('property_name', ['presentValue', 'objectList@idx:0', 'objectList@idx:300', '4000'])
+def test_read_property_round_trip(property_name):
+    payload = codec.encode_read_property(DEVICE, property_name)
+    assert codec.decode_read_property(payload) == (DEVICE, property_name)
+
+
+@pytest.mark.parametrize('object_identifier, property_name, value', [
+    (ANALOG_VALUE, 'presentValue', -12.5),
+    (DEVICE, 'objectList@idx:0', 2),
+    (DEVICE, 'objectList@idx:1', ANALOG_VALUE),
+    (DEVICE, 'objectList', [DEVICE, ANALOG_VALUE]),
+])
+def test_read_property_ack_round_trip(object_identifier, property_name, value):
+    payload = codec.encode_read_property_ack(object_identifier, property_name, value)
+    assert codec.decode_read_property_ack(payload) == (object_identifier, property_name, value)
+
+
+def test_read_property_multiple_round_trip():
+    objects = {
+        ANALOG_VALUE: ['presentValue', 'priorityArray', 'relinquishDefault'],
+        DEVICE: ['objectName', 'objectList@idx:0'],
+    }
+    assert codec.decode_read_property_multiple(codec.encode_read_property_multiple(objects)) == objects
+
+
+def test_read_property_multiple_ack_round_trip():
+    results = {
+        ANALOG_VALUE: [('presentValue', 20.5), ('units', 'degreesCelsius')],
+        BINARY_VALUE: [('presentValue', 'active'), ('priorityArray', [None] * 16)],
+        MULTI_STATE_VALUE: [('presentValue', 2), ('description', PropertyError())],
+    }
+    decoded = codec.decode_read_property_multiple_ack(codec.encode_read_property_multiple_ack(results))
+
+    # Properties read with an error are left out
+    assert decoded == {
+        ANALOG_VALUE: results[ANALOG_VALUE],
+        BINARY_VALUE: results[BINARY_VALUE],
+        MULTI_STATE_VALUE: [('presentValue', 2)],
+    }
+
+
+@pytest.mark.parametrize('write', [
+    (ANALOG_VALUE, 'presentValue', 21.0, 13),
+    (ANALOG_VALUE, 'presentValue', None, 13),
+    (BINARY_VALUE, 'presentValue', 'active', None),
+    (MULTI_STATE_VALUE, 'presentValue', 4, 16),
+    (DEVICE, 'description', 'attic', None),
+])
+def test_write_property_round_trip(write):
+    assert codec.decode_write_property(codec.encode_write_property(*write)) == write
+
+
+def test_write_property_multiple_round_trip():
+    writes = [
+        (ANALOG_VALUE, 'presentValue', 21.0, 13),
+        (BINARY_VALUE, 'presentValue', 'inactive', 13),
+        (MULTI_STATE_VALUE, 'presentValue', None, 16),
+        (DEVICE, 'objectList@idx:1', ANALOG_VALUE, None),
+    ]
+    assert codec.decode_write_property_multiple(codec.encode_write_property_multiple(writes)) == writes
+
+
+@pytest.mark.parametrize('confirmed, lifetime', [(True, 300), (False, None), (True, 70000)])
+def test_subscribe_cov_round_trip(confirmed, lifetime):
+    payload = codec.encode_subscribe_cov(1, ANALOG_VALUE, confirmed, lifetime)
+    assert codec.decode_subscribe_cov(payload) == (1, ANALOG_VALUE, confirmed, lifetime)
+
+
+def test_subscribe_cov_cancellation_round_trip():
+    payload = codec.encode_subscribe_cov(1, ANALOG_VALUE, cancel=True)
+    assert codec.decode_subscribe_cov(payload) == (1, ANALOG_VALUE, None, None)
+
+
+def test_cov_notification_round_trip():
+    properties = [('presentValue', 'active'), ('statusFlags', [0, 0, 0, 0])]
+    payload = codec.encode_cov_notification(1, DEVICE, BINARY_VALUE, 295, properties)
+    assert codec.decode_cov_notification(payload) == (1, DEVICE, BINARY_VALUE, 295, dict(properties))
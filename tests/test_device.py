@@ -0,0 +1,130 @@
+"""FlexitBACnet end to end against the device simulator, with packet loss."""
+import asyncio
+
+import pytest
+
+from lib.device import FlexitBACnet
+from lib.nordic import (
+    AIR_FILTER_OPERATING_TIME,
+    AIR_FILTER_TIME_PERIOD_FOR_EXCHANGE,
+    DEVICE_PROPERTIES,
+    OUTSIDE_AIR_TEMPERATURE,
+    VENTILATION_MODE,
+)
+from lib.session import TRANSPORT_BAC0, TRANSPORT_NATIVE
+from lib.simulator import DeviceSimulator
+from lib.write_queue import DEFAULT_WRITE_DEBOUNCE
+
+# Share of requests the simulator drops, so that some of them are retried
+PACKET_LOSS = 0.2
+
+
+async def _async_simulator(**kwargs) -> DeviceSimulator:
+    simulator = DeviceSimulator(**kwargs)
+    simulator.ensure_objects(dp.object_identifier for dp in DEVICE_PROPERTIES)
+    await simulator.async_start()
+    return simulator
+
+
+@pytest.mark.parametrize('transport', [TRANSPORT_NATIVE, TRANSPORT_BAC0])
+def test_refresh_and_write_with_packet_loss(hass, fast_timeouts, transport):
+    if transport == TRANSPORT_BAC0:
+        pytest.importorskip('BAC0')
+
+    async def run():
+        simulator = await _async_simulator(loss=PACKET_LOSS, seed=1)
+        simulator.set_value(OUTSIDE_AIR_TEMPERATURE.object_identifier, -7.5)
+        device = FlexitBACnet(hass, simulator.address, simulator.device_id, transport=transport, write_debounce=0)
+        try:
+            await device.refresh(full=True)
+            assert device.available
+            assert device.serial_number == '800220-000000'
+            assert device.outside_air_temperature == -7.5
+
+            generation = await device.set_ventilation_mode(VENTILATION_MODE.HIGH)
+            assert await device.refresh(full=True) >= generation
+            assert device.available
+            assert device.ventilation_mode == 'High'
+            assert simulator.objects[VENTILATION_MODE.object_identifier].present_value() == VENTILATION_MODE.HIGH
+        finally:
+            await device.async_close()
+            await simulator.async_stop()
+
+        # Lost requests were sent again instead of failing the refresh or write
+        assert simulator.dropped_count > 0
+        assert device.health.failures == 0
+
+    asyncio.run(run())
+
+
+def test_refresh_reads_only_due_tiers(hass):
+    async def run():
+        simulator = await _async_simulator()
+        device = FlexitBACnet(hass, simulator.address, simulator.device_id, transport=TRANSPORT_NATIVE)
+        try:
+            await device.refresh(full=True)
+            requests = simulator.request_count
+            # Nothing is due right after a full refresh
+            await device.refresh()
+            assert simulator.request_count == requests
+        finally:
+            await device.async_close()
+            await simulator.async_stop()
+
+    asyncio.run(run())
+
+
+def test_mode_changes_skip_the_write_debounce(hass):
+    async def run():
+        simulator = await _async_simulator()
+        device = FlexitBACnet(hass, simulator.address, simulator.device_id, transport=TRANSPORT_NATIVE)
+        loop = asyncio.get_running_loop()
+        try:
+            await device.refresh(full=True)
+            start = loop.time()
+            await device.set_ventilation_mode(VENTILATION_MODE.HIGH)
+            assert loop.time() - start < DEFAULT_WRITE_DEBOUNCE
+
+            start = loop.time()
+            await device.set_air_temp_setpoint_home(21.5)
+            assert loop.time() - start >= DEFAULT_WRITE_DEBOUNCE
+        finally:
+            await device.async_close()
+            await simulator.async_stop()
+
+    asyncio.run(run())
+
+
+def test_full_refresh_does_not_join_a_partial_one(hass):
+    async def run():
+        simulator = await _async_simulator()
+        device = FlexitBACnet(hass, simulator.address, simulator.device_id, transport=TRANSPORT_NATIVE)
+        try:
+            await device.refresh(full=True)
+            simulator.set_value(OUTSIDE_AIR_TEMPERATURE.object_identifier, 3.5)
+            # Nothing is due for the partial refresh, the full one reads everything
+            await asyncio.gather(device.refresh(), device.refresh(full=True))
+            assert device.outside_air_temperature == 3.5
+            assert device.telemetry.histograms['refresh'].count == 3
+        finally:
+            await device.async_close()
+            await simulator.async_stop()
+
+    asyncio.run(run())
+
+
+@pytest.mark.parametrize('operating_time, polluted', [(1000.0, False), (4380.0, True), (5000.0, True)])
+def test_air_filter_polluted(hass, operating_time, polluted):
+    async def run():
+        simulator = await _async_simulator()
+        simulator.set_value(AIR_FILTER_OPERATING_TIME.object_identifier, operating_time)
+        simulator.set_value(AIR_FILTER_TIME_PERIOD_FOR_EXCHANGE.object_identifier, 4380.0)
+        device = FlexitBACnet(hass, simulator.address, simulator.device_id, transport=TRANSPORT_NATIVE)
+        try:
+            await device.refresh(full=True)
+            assert device.air_filter_polluted is polluted
+        finally:
+            await device.async_close()
+            await simulator.async_stop()
+
+    asyncio.run(run())
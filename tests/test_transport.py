@@ -0,0 +1,121 @@
+"""NativeSession against the device simulator over localhost UDP."""
+import asyncio
+
+import pytest
+
+from lib import transport
+from lib.codec import BACnetError
+from lib.simulator import DeviceSimulator
+from lib.transport import NativeSession
+
+from conftest import TEST_APDU_TIMEOUT
+
+
+async def _async_session(hass, simulator: DeviceSimulator) -> NativeSession:
+    await simulator.async_start()
+    return NativeSession(hass, '127.0.0.1')
+
+
+def test_read_multiple(hass):
+    async def run():
+        simulator = DeviceSimulator()
+        session = await _async_session(hass, simulator)
+        objects = list(simulator.objects)[:3]
+        try:
+            result = await session.async_read_multiple(simulator.address, {oid: ['presentValue'] for oid in objects})
+        finally:
+            await session.async_close()
+            await simulator.async_stop()
+
+        assert list(result) == objects
+        assert session.request_count == 1
+        assert session.telemetry.histograms['read_multiple'].count == 1
+
+    asyncio.run(run())
+
+
+def test_concurrent_requests_get_their_own_invoke_ids(hass):
+    async def run():
+        simulator = DeviceSimulator(latency=0.05)
+        session = await _async_session(hass, simulator)
+        objects = [oid for oid in simulator.objects if oid[0] != 'device'][:20]
+        try:
+            tasks = [
+                asyncio.create_task(session.async_read_multiple(simulator.address, {oid: ['presentValue']}))
+                for oid in objects
+            ]
+            await asyncio.sleep(0.01)
+            # All requests are in flight at once, told apart by invoke ID only
+            invoke_ids = [invoke_id for _, invoke_id in session._pending]
+            results = await asyncio.gather(*tasks)
+        finally:
+            await session.async_close()
+            await simulator.async_stop()
+
+        assert sorted(invoke_ids) == list(range(len(objects)))
+        assert [list(result) for result in results] == [[oid] for oid in objects]
+        assert simulator.request_count == len(objects)
+        assert session.retry_count == 0
+
+    asyncio.run(run())
+
+
+def test_retry_then_success(hass, fast_timeouts):
+    async def run():
+        simulator = DeviceSimulator(loss=1.0)
+        session = await _async_session(hass, simulator)
+        device = ('device', simulator.device_id)
+        # Only the first transmission is lost
+        asyncio.get_running_loop().call_later(TEST_APDU_TIMEOUT / 2, setattr, simulator, 'loss', 0.0)
+        try:
+            result = await session.async_read_multiple(simulator.address, {device: ['objectName']})
+        finally:
+            await session.async_close()
+            await simulator.async_stop()
+
+        assert result == {device: [('objectName', 'HvacFnct21y_A')]}
+        assert simulator.dropped_count == 1
+        assert session.retry_count == 1
+        assert session.telemetry.counters['failures'] == 0
+
+    asyncio.run(run())
+
+
+def test_retry_then_timeout(hass, fast_timeouts):
+    async def run():
+        simulator = DeviceSimulator(loss=1.0)
+        session = await _async_session(hass, simulator)
+        try:
+            with pytest.raises(asyncio.TimeoutError):
+                await session.async_read_multiple(simulator.address, {('device', simulator.device_id): ['objectName']})
+        finally:
+            await session.async_close()
+            await simulator.async_stop()
+
+        assert simulator.dropped_count == transport.APDU_RETRIES + 1
+        assert session.retry_count == transport.APDU_RETRIES
+        assert session.telemetry.counters['failures'] == 1
+        assert session.telemetry.counters['timeouts'] == 1
+        assert session.request_count == 0
+        assert not session._pending
+
+    asyncio.run(run())
+
+
+def test_error_answer_is_not_a_latency_sample(hass):
+    async def run():
+        simulator = DeviceSimulator()
+        session = await _async_session(hass, simulator)
+        try:
+            with pytest.raises(BACnetError):
+                await session.async_write(simulator.address, ('analogValue', 999999), 'presentValue', 1.0)
+        finally:
+            await session.async_close()
+            await simulator.async_stop()
+
+        assert session.telemetry.counters['errors'] == 1
+        assert session.telemetry.counters['failures'] == 0
+        assert session.request_count == 0
+        assert 'write' not in session.telemetry.histograms
+
+    asyncio.run(run())
@@ -0,0 +1,64 @@
+"""Debouncing and coalescing of the WriteQueue."""
+import asyncio
+
+from lib.nordic import AIR_TEMP_SETPOINT_HOME, VENTILATION_MODE
+from lib.write_queue import WriteQueue
+
+# Debounce window long enough to tell a debounced write from an immediate one
+DEBOUNCE = 0.2
+
+
+def _queue(flushed: list) -> WriteQueue:
+    async def flush(values):
+        flushed.append((asyncio.get_running_loop().time(), values))
+        return len(flushed)
+
+    return WriteQueue(flush, DEBOUNCE)
+
+
+def test_debounced_writes_coalesce():
+    async def run():
+        flushed = []
+        queue = _queue(flushed)
+        start = asyncio.get_running_loop().time()
+        futures = [queue.enqueue([(AIR_TEMP_SETPOINT_HOME, temperature)]) for temperature in (20.0, 20.5, 21.0)]
+        assert await asyncio.gather(*futures) == [1, 1, 1]
+
+        [(flushed_at, values)] = flushed
+        assert flushed_at - start >= DEBOUNCE
+        assert values == [(AIR_TEMP_SETPOINT_HOME, 21.0)]
+        assert queue.coalesced_count == 2
+
+    asyncio.run(run())
+
+
+def test_immediate_write_does_not_wait_for_the_window():
+    async def run():
+        flushed = []
+        queue = _queue(flushed)
+        start = asyncio.get_running_loop().time()
+        debounced = queue.enqueue([(AIR_TEMP_SETPOINT_HOME, 21.0)])
+        assert await queue.enqueue([(VENTILATION_MODE, 4)], debounce=0) == 1
+        assert await debounced == 1
+
+        # The pending setpoint goes out with the immediate write
+        [(flushed_at, values)] = flushed
+        assert flushed_at - start < DEBOUNCE
+        assert values == [(AIR_TEMP_SETPOINT_HOME, 21.0), (VENTILATION_MODE, 4)]
+
+    asyncio.run(run())
+
+
+def test_commands_at_different_priorities_are_kept():
+    async def run():
+        flushed = []
+        queue = _queue(flushed)
+        await queue.enqueue([
+            (VENTILATION_MODE.with_priority(8), 4),
+            (VENTILATION_MODE.with_priority(13), None),
+        ], debounce=0)
+
+        [(_, values)] = flushed
+        assert [(dp.priority, value) for dp, value in values] == [(8, 4), (13, None)]
+
+    asyncio.run(run())